@@ -15,9 +15,12 @@ from immuneML.data_model.dataset.Dataset import Dataset
 from immuneML.data_model.dataset.ReceptorDataset import ReceptorDataset
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.data_model.dataset.SequenceDataset import SequenceDataset
+from immuneML.data_model.receptor.ElementBatchFile import ElementBatchFile
+from immuneML.data_model.repertoire.MaskedRepertoire import MaskedRepertoire
 from immuneML.data_model.repertoire.Repertoire import Repertoire
 from immuneML.environment.Constants import Constants
 from immuneML.util.PathBuilder import PathBuilder
+from immuneML.util.SequenceMatrixHelper import SequenceMatrixHelper
 
 
 class PickleExporter(DataExporter):
@@ -88,6 +91,10 @@ class PickleExporter(DataExporter):
         for filename_old in filenames_old:
             filename_new = PickleExporter._copy_if_exists(filename_old, path)
             filenames_new.append(filename_new)
+            if ElementBatchFile.is_indexed(filename_old):
+                PickleExporter._copy_if_exists(ElementBatchFile.get_index_filename(filename_old), path)
+            for sequence_matrix_filename in SequenceMatrixHelper.get_stored_filenames(filename_old):
+                PickleExporter._copy_if_exists(sequence_matrix_filename, path)
         return filenames_new
 
     @staticmethod
@@ -95,9 +102,14 @@ class PickleExporter(DataExporter):
         new_repertoires = []
 
         for repertoire_old in repertoires:
+            if isinstance(repertoire_old, MaskedRepertoire):
+                new_repertoires.append(repertoire_old.materialize(repertoires_path))
+                continue
             repertoire = copy.deepcopy(repertoire_old)
             repertoire.data_filename = PickleExporter._copy_if_exists(repertoire_old.data_filename, repertoires_path)
             repertoire.metadata_filename = PickleExporter._copy_if_exists(repertoire_old.metadata_filename, repertoires_path)
+            for sequence_matrix_filename in repertoire_old.get_sequence_matrix_filenames():
+                PickleExporter._copy_if_exists(sequence_matrix_filename, repertoires_path)
             new_repertoires.append(repertoire)
 
         return new_repertoires
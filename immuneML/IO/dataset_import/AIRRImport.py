@@ -1,8 +1,10 @@
 import airr
 import pandas as pd
+from airr.schema import RearrangementSchema
 
 from immuneML.IO.dataset_import.DataImport import DataImport
 from immuneML.IO.dataset_import.DatasetImportParams import DatasetImportParams
+from immuneML.IO.dataset_import.ImportEngine import ImportEngine
 from immuneML.data_model.dataset.Dataset import Dataset
 from immuneML.data_model.receptor.ChainPair import ChainPair
 from immuneML.data_model.receptor.RegionType import RegionType
@@ -36,6 +38,11 @@ class AIRRImport(DataImport):
         Only the AIRR files included under the column 'filename' are imported into the RepertoireDataset.
         For setting SequenceDataset metadata, metadata_file is ignored, see metadata_column_mapping instead.
 
+        incremental (bool): If True, the repertoires imported from each source file are recorded in an import manifest in the result path, so
+        that importing the dataset again to the same result_path (e.g., after new files were added to the metadata file or after the import
+        was interrupted) only imports the files which are new or changed, and reuses the repertoires imported before. Only used for
+        repertoire datasets. By default, incremental is False.
+
         paired (str): Required for Sequence- or ReceptorDatasets. This parameter determines whether to import a
         SequenceDataset (paired = False) or a ReceptorDataset (paired = True).
         In a ReceptorDataset, two sequences with chain types specified by receptor_chains are paired together
@@ -103,6 +110,25 @@ class AIRRImport(DataImport):
 
         separator (str): Column separator, for AIRR this is by default "\\t".
 
+        import_engine (str): Which library to use to parse the AIRR files: pandas or arrow. With arrow, the files are parsed in parallel by
+        the multithreaded CSV reader of pyarrow and the values are typed according to the AIRR rearrangement schema while parsing (the default,
+        pandas, uses the airr package); this requires the optional dependency pyarrow (pip install immuneML[Arrow]). By default, import_engine
+        is pandas.
+
+        import_chunk_size (int): If set, each repertoire file is read and stored in parts of this many rows instead of loading the whole
+        file into memory, which allows importing repertoires larger than the available memory. The memory use is bounded by the chunk size
+        only when the repertoires are stored in the Arrow format; with the default NumPy format, the parts are combined when the repertoire
+        is stored (see the environment variable repertoire_storage_format). The AIRR files can only be read in parts with the arrow engine;
+        with pandas, the whole file is loaded at once. For Sequence- and ReceptorDatasets, the files are only read in parts when
+        number_of_processes is larger than 1, so that the parts are imported in parallel; the chains of a receptor can be in different
+        parts, so the files of ReceptorDatasets are not split. By default, import_chunk_size is not set.
+
+        number_of_processes (int): How many files to import in parallel. For Sequence- and ReceptorDatasets, each process builds the
+        sequences or receptors from a file (or from a part of a file, see import_chunk_size) and stores them directly in batch files. To keep
+        the batch files full, import_chunk_size is then rounded up to a multiple of sequence_file_size, so that only the last batch file of
+        each file (and of each part from which rows were filtered out) can have fewer than sequence_file_size elements. By default,
+        number_of_processes is 1.
+
 
     YAML specification:
 
@@ -172,7 +198,7 @@ class AIRRImport(DataImport):
                     df.rename(columns={"cdr3": "sequences"}, inplace=True)
                 if "cdr3_aa" in df.columns:
                     df.rename(columns={"cdr3_aa": "sequence_aas"}, inplace=True)
-                df.loc[:, "region_types"] = params.region_type.name
+                df["region_types"] = params.region_type.name
             elif "junction" in params.column_mapping or "junction_aa" in params.column_mapping:
                 ImportHelper.junction_to_cdr3(df, params.region_type)
         # todo else: support "full_sequence" import through regiontype?
@@ -184,13 +210,54 @@ class AIRRImport(DataImport):
 
         return df
 
+    SCHEMA_TYPES = {"boolean": bool, "integer": int, "number": float, "string": str}
+
     @staticmethod
     def alternative_load_func(filename, params):
-        df = airr.load_rearrangement(filename)
-        ImportHelper.standardize_none_values(df)
+        if ImportHelper.get_import_engine(params) == ImportEngine.ARROW:
+            df = AIRRImport._load_with_arrow(filename, params)
+        else:
+            df = airr.load_rearrangement(filename)
+            ImportHelper.standardize_none_values(df)
         df.dropna(axis="columns", how="all", inplace=True)
         return df
 
+    @staticmethod
+    def alternative_chunk_load_func(filename, params):
+        if ImportHelper.get_import_engine(params) == ImportEngine.ARROW:
+            from immuneML.util.ArrowImportHelper import ArrowImportHelper
+
+            column_types = AIRRImport._get_column_types()
+            for df in ArrowImportHelper.iterate_dataframes(filename, params, params.import_chunk_size, column_types):
+                AIRRImport._shift_start_coordinates(df, column_types)
+                df.dropna(axis="columns", how="all", inplace=True)
+                yield df
+        else:
+            # airr.load_rearrangement() reads the whole file, so the file can only be read in parts with the arrow engine
+            yield AIRRImport.alternative_load_func(filename, params)
+
+    @staticmethod
+    def _load_with_arrow(filename, params):
+        from immuneML.util.ArrowImportHelper import ArrowImportHelper
+
+        column_types = AIRRImport._get_column_types()
+        df = ArrowImportHelper.load_dataframe(filename, params, column_types)
+        AIRRImport._shift_start_coordinates(df, column_types)
+
+        return df
+
+    @staticmethod
+    def _get_column_types() -> dict:
+        return {field: AIRRImport.SCHEMA_TYPES.get(RearrangementSchema.type(field), str) for field in RearrangementSchema.properties}
+
+    @staticmethod
+    def _shift_start_coordinates(df: pd.DataFrame, column_types: dict):
+        # as in airr.load_rearrangement(), the coordinates are converted from 1-based to 0-based
+        for column in df.columns:
+            if column.endswith("_start") and column_types.get(column) == int:
+                values = df[column].values
+                df[column] = values - 1 if values.dtype != object else [value - 1 if value is not None else None for value in values]
+
     @staticmethod
     def import_receptors(df, params):
         df["receptor_identifiers"] = df["cell_id"]
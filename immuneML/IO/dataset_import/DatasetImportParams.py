@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from pathlib import Path
 
+from immuneML.IO.dataset_import.ImportEngine import ImportEngine
 from immuneML.data_model.receptor.ChainPair import ChainPair
 from immuneML.data_model.receptor.RegionType import RegionType
 
@@ -29,15 +30,20 @@ class DatasetImportParams:
     organism: str = None
     import_empty_nt_sequences: bool = None
     import_empty_aa_sequences: bool = None
+    import_engine: ImportEngine = ImportEngine.PANDAS
+    import_chunk_size: int = None
+    incremental: bool = False
 
     @classmethod
-    def build_object(cls, path: Path = None, metadata_file: Path = None, result_path: Path = None, region_type: str = None, receptor_chains: str = None, **kwargs):
+    def build_object(cls, path: Path = None, metadata_file: Path = None, result_path: Path = None, region_type: str = None, receptor_chains: str = None,
+                     import_engine: str = None, **kwargs):
         params = {
             "path": Path(path) if path is not None else None,
             "metadata_file": Path(metadata_file) if metadata_file is not None else None,
             "result_path": Path(result_path) if result_path is not None else None,
             "region_type": RegionType[region_type.upper()] if region_type else None,
             "receptor_chains": ChainPair[receptor_chains.upper()] if receptor_chains else None,
+            "import_engine": ImportEngine[import_engine.upper()] if import_engine else ImportEngine.PANDAS,
         }
         params = {**kwargs, **params}
         return DatasetImportParams(**params)
@@ -36,6 +36,11 @@ class IGoRImport(DataImport):
         Only the IGoR files included under the column 'filename' are imported into the RepertoireDataset.
         For setting SequenceDataset metadata, metadata_file is ignored, see metadata_column_mapping instead.
 
+        incremental (bool): If True, the repertoires imported from each source file are recorded in an import manifest in the result path, so
+        that importing the dataset again to the same result_path (e.g., after new files were added to the metadata file or after the import
+        was interrupted) only imports the files which are new or changed, and reuses the repertoires imported before. Only used for
+        repertoire datasets. By default, incremental is False.
+
         import_with_stop_codon (bool): Whether sequences with stop codons should be included in the imported sequences.
         By default, import_with_stop_codon is False.
 
@@ -145,7 +150,7 @@ class IGoRImport(DataImport):
 
         if not params.import_with_stop_codon:
             no_stop_codon = ["*" not in seq for seq in df.sequence_aas]
-            df = df[no_stop_codon]
+            df = df.loc[no_stop_codon]
 
         ImportHelper.junction_to_cdr3(df, params.region_type)
         # note: import_empty_aa_sequences is set to true here; since IGoR doesnt output aa, this parameter is insensible
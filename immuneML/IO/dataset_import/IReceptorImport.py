@@ -1,14 +1,13 @@
-import copy
 import json
-import shutil
 import zipfile
+from multiprocessing.pool import Pool
 from pathlib import Path
 
-import airr
 import pandas as pd
 
 from immuneML.IO.dataset_import.AIRRImport import AIRRImport
 from immuneML.IO.dataset_import.DataImport import DataImport
+from immuneML.IO.dataset_import.DatasetImportParams import DatasetImportParams
 from immuneML.data_model.dataset.Dataset import Dataset
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.data_model.receptor.ChainPair import ChainPair
@@ -27,6 +26,9 @@ class IReceptorImport(DataImport):
     * This importer takes in a list of .zip files, which must contain one or more AIRR tsv files, and for each AIRR file, a corresponding metadata json file must be present.
     * This importer does not require a metadata csv file for RepertoireDataset import, it is generated automatically from the metadata json files.
 
+    * The AIRR files and the metadata json files are read directly from the .zip files without extracting them to disk, and the .zip files are
+      imported in parallel (one .zip file per process, see number_of_processes).
+
     RepertoireDatasets should be used when making predictions per repertoire, such as predicting a disease state.
     SequenceDatasets or ReceptorDatasets should be used when predicting values for unpaired (single-chain) and paired
     immune receptors respectively, like antigen specificity.
@@ -112,6 +114,13 @@ class IReceptorImport(DataImport):
 
         separator (str): Column separator, for AIRR this is by default "\\t".
 
+        import_engine (str): Which library to use to parse the AIRR files: pandas or arrow. With arrow, the files are parsed in parallel by
+        the multithreaded CSV reader of pyarrow and the values are typed according to the AIRR rearrangement schema while parsing (the default,
+        pandas, uses the airr package); this requires the optional dependency pyarrow (pip install immuneML[Arrow]). By default, import_engine
+        is pandas.
+
+        number_of_processes (int): How many .zip files to import in parallel. By default, number_of_processes is 1.
+
 
     YAML specification:
 
@@ -149,79 +158,96 @@ class IReceptorImport(DataImport):
 
     @staticmethod
     def import_dataset(params: dict, dataset_name: str) -> Dataset:
-        if params["is_repertoire"]:
-            dataset = IReceptorImport.import_repertoire_dataset(params, dataset_name)
-        else:
-            dataset = IReceptorImport.import_sequence_dataset(params, dataset_name)
-
-        return dataset
-
-    @staticmethod
-    def import_repertoire_dataset(params: dict, dataset_name: str) -> RepertoireDataset:
-        base_result_path = params['result_path'] / "tmp_airr"
-        metadata_file_path = base_result_path / "metadata.csv"
-
-        IReceptorImport._create_airr_repertoiredataset(params['path'], base_result_path, metadata_file_path)
+        import_params = DatasetImportParams.build_object(**params)
 
-        airr_params = copy.deepcopy(params)
-        airr_params["path"] = base_result_path
-        airr_params["metadata_file"] = metadata_file_path
-
-        dataset = ImportHelper.import_dataset(AIRRImport, airr_params, dataset_name)
-
-        shutil.rmtree(base_result_path)
+        dataset = ImportHelper.load_dataset_if_exists(params, import_params, dataset_name)
+        if dataset is None:
+            if import_params.is_repertoire:
+                dataset = IReceptorImport.import_repertoire_dataset(import_params, dataset_name)
+            else:
+                dataset = IReceptorImport.import_sequence_dataset(import_params, dataset_name)
 
         return dataset
 
     @staticmethod
-    def import_sequence_dataset(params: dict, dataset_name: str) -> RepertoireDataset:
-        base_result_path = params['result_path'] / "tmp_airr"
-
-        unzipped_path = base_result_path / "tmp_unzipped"
-        IReceptorImport._unzip_files(params['path'], unzipped_path, unzip_metadata=False)
+    def import_repertoire_dataset(params: DatasetImportParams, dataset_name: str) -> RepertoireDataset:
+        PathBuilder.build(params.result_path / IReceptorImport.REPERTOIRES_FOLDER)
 
-        airr_params = copy.deepcopy(params)
-        airr_params["path"] = unzipped_path
+        arguments = [(zip_filename, params) for zip_filename in IReceptorImport._get_zip_filenames(params.path)]
+        with Pool(params.number_of_processes) as pool:
+            results = pool.starmap(IReceptorImport._import_repertoires_from_zip, arguments)
 
-        dataset = ImportHelper.import_dataset(AIRRImport, airr_params, dataset_name)
-
-        shutil.rmtree(unzipped_path)
+        repertoires = [repertoire for zip_repertoires, _ in results for repertoire in zip_repertoires]
+        metadata_df = pd.concat([zip_metadata_df for _, zip_metadata_df in results], join="outer", ignore_index=True)
+        metadata_df.fillna("NA", inplace=True)
 
-        return dataset
+        return ImportHelper.build_repertoire_dataset(repertoires, metadata_df, params, dataset_name)
 
     @staticmethod
-    def _create_airr_repertoiredataset(input_zips_path: Path, base_result_path: Path, metadata_file_path: Path):
-        unzipped_path = base_result_path / "tmp_unzipped/"
-        PathBuilder.build(base_result_path / IReceptorImport.REPERTOIRES_FOLDER)
-
-        IReceptorImport._unzip_files(input_zips_path, unzipped_path)
+    def import_sequence_dataset(params: DatasetImportParams, dataset_name: str) -> Dataset:
+        arguments = [(zip_filename, params) for zip_filename in IReceptorImport._get_zip_filenames(params.path)]
+        with Pool(params.number_of_processes) as pool:
+            items_per_zip = pool.starmap(IReceptorImport._import_items_from_zip, arguments)
 
-        all_metadata_dfs = []
+        return ImportHelper.build_sequence_dataset((items for zip_items in items_per_zip for items in zip_items), params, dataset_name)
 
-        for airr_filename in unzipped_path.glob("*.tsv"):
-            metadata_filename = unzipped_path / f"{airr_filename.stem}-metadata.json"
+    @staticmethod
+    def _get_zip_filenames(path: Path) -> list:
+        zip_filenames = sorted(path.glob("*.zip"))
+        assert len(zip_filenames) > 0, f"{IReceptorImport.__name__}: no .zip files were found in {path}."
+        return zip_filenames
 
-            sub_metadata_df = IReceptorImport._create_metadata_df(metadata_filename)
-            files_written = IReceptorImport._split_airr_files(airr_filename, sub_metadata_df, base_result_path)
-            sub_metadata_df = sub_metadata_df[files_written]
+    @staticmethod
+    def _import_repertoires_from_zip(zip_filename: Path, params: DatasetImportParams) -> tuple:
+        """
+        Imports the repertoires from the AIRR files in the zip file, reading the AIRR files and the corresponding metadata json files directly
+        from the zip file, and returns the repertoires and the metadata with one row per repertoire
+        """
+        repertoires, metadata_dfs = [], []
+
+        with zipfile.ZipFile(zip_filename, "r") as zip_object:
+            for airr_filename in IReceptorImport._get_airr_filenames(zip_object):
+                with zip_object.open(f"{airr_filename[:-len('.tsv')]}-metadata.json") as metadata_file:
+                    metadata_df = IReceptorImport._create_metadata_df(metadata_file)
+                with zip_object.open(airr_filename) as airr_file:
+                    airr_df = ImportHelper.load_sequence_dataframe(airr_file, params, AIRRImport.alternative_load_func)
+
+                files_written = []
+                for _, metadata_row in metadata_df.iterrows():
+                    subset = IReceptorImport._get_repertoire_subset(airr_df, metadata_row)
+                    files_written.append(not subset.empty)
+                    if not subset.empty:
+                        subset = AIRRImport.preprocess_dataframe(subset.copy(), params)
+                        repertoires.append(Repertoire.build_from_dataframe(subset, params.result_path / IReceptorImport.REPERTOIRES_FOLDER,
+                                                                           metadata_row.to_dict(), Path(metadata_row["filename"]).stem))
+
+                metadata_dfs.append(metadata_df[files_written])
+
+        return repertoires, pd.concat(metadata_dfs, join="outer", ignore_index=True) if len(metadata_dfs) > 0 else pd.DataFrame()
 
-            all_metadata_dfs.append(sub_metadata_df)
+    @staticmethod
+    def _import_items_from_zip(zip_filename: Path, params: DatasetImportParams) -> list:
+        with zipfile.ZipFile(zip_filename, "r") as zip_object:
+            items = []
+            for airr_filename in IReceptorImport._get_airr_filenames(zip_object):
+                with zip_object.open(airr_filename) as airr_file:
+                    items.append(ImportHelper.import_items(AIRRImport, airr_file, params))
+            return items
 
-        metadata_df = pd.concat(all_metadata_dfs, join="outer", ignore_index=True)
-        metadata_df.fillna("NA", inplace=True)
-        metadata_df.to_csv(metadata_file_path, index=False)
+    @staticmethod
+    def _get_airr_filenames(zip_object: zipfile.ZipFile) -> list:
+        return [file.filename for file in zip_object.filelist if file.filename.endswith(".tsv")]
 
-        shutil.rmtree(unzipped_path)
+    @staticmethod
+    def _get_repertoire_subset(airr_df: pd.DataFrame, metadata_row) -> pd.DataFrame:
+        subset = airr_df[airr_df["repertoire_id"] == metadata_row["repertoire_id"]]
 
+        if "sample_processing_id" in subset.columns and any(subset["sample_processing_id"].str.len() > 0):
+            subset = subset[subset["sample_processing_id"] == str(metadata_row["sample_processing_id"])]
+        if "data_processing_id" in subset.columns and any(subset["data_processing_id"].str.len() > 0):
+            subset = subset[subset["data_processing_id"] == str(metadata_row["data_processing_id"])]
 
-    @staticmethod
-    def _unzip_files(path: Path, unzipped_path: Path, unzip_metadata=True) -> Dataset:
-        for zip_filename in path.glob("*.zip"):
-            with zipfile.ZipFile(zip_filename, "r") as zip_object:
-                for file in zip_object.filelist:
-                    file.filename = f"{zip_filename.stem}_{file.filename}"
-                    if file.filename.endswith(".tsv") or (file.filename.endswith("-metadata.json") and unzip_metadata):
-                        zip_object.extract(file, path=unzipped_path)
+        return subset
 
     @staticmethod
     def _safe_get_field(dict, nested_fields):
@@ -321,39 +347,14 @@ class IReceptorImport(DataImport):
         return metadata_df
 
     @staticmethod
-    def _create_metadata_df(metadata_json):
-        with open(metadata_json) as json_file:
-            metadata_dict = json.load(json_file)
+    def _create_metadata_df(metadata_file):
+        metadata_dict = json.load(metadata_file)
 
         metadata_df = IReceptorImport._get_static_metadata_df(metadata_dict)
         metadata_df = IReceptorImport._add_diagnosis_columns(metadata_df, metadata_dict)
 
         return metadata_df
 
-    @staticmethod
-    def _split_airr_files(airr_file: Path, metadata_df: pd.DataFrame, result_path: Path):
-        airr_df = airr.load_rearrangement(airr_file)
-        files_written = []
-
-        for filename, repertoire_id, sample_processing_id, data_processing_id in metadata_df[
-            ["filename", "repertoire_id", "sample_processing_id", "data_processing_id"]].itertuples(index=False):
-
-            subset = airr_df[airr_df["repertoire_id"] == repertoire_id]
-
-            if "sample_processing_id" in subset.columns and any(subset["sample_processing_id"].str.len() > 0):
-                subset = subset[subset["sample_processing_id"] == str(sample_processing_id)]
-            if "data_processing_id" in subset.columns and any(subset["data_processing_id"].str.len() > 0):
-                subset = subset[subset["data_processing_id"] == str(data_processing_id)]
-
-            if subset.empty:
-                files_written.append(False)
-            else:
-                subset.to_csv(result_path / filename, index=False, sep="\t")
-                files_written.append(True)
-
-        return files_written
-
-
     @staticmethod
     def get_documentation():
         doc = str(IReceptorImport.__doc__)
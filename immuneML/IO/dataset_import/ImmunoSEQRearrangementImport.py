@@ -37,6 +37,11 @@ class ImmunoSEQRearrangementImport(DataImport):
         Only the files included under the column 'filename' are imported into the RepertoireDataset.
         For setting SequenceDataset metadata, metadata_file is ignored, see metadata_column_mapping instead.
 
+        incremental (bool): If True, the repertoires imported from each source file are recorded in an import manifest in the result path, so
+        that importing the dataset again to the same result_path (e.g., after new files were added to the metadata file or after the import
+        was interrupted) only imports the files which are new or changed, and reuses the repertoires imported before. Only used for
+        repertoire datasets. By default, incremental is False.
+
         import_productive (bool): Whether productive sequences (with value 'In' in column frame_type) should be included
         in the imported sequences. By default, import_productive is True.
 
@@ -106,6 +111,23 @@ class ImmunoSEQRearrangementImport(DataImport):
 
         separator (str): Column separator, for ImmunoSEQ files this is by default "\\t".
 
+        import_engine (str): Which library to use to parse the files: pandas or arrow. With arrow, the files are parsed in parallel by the
+        multithreaded CSV reader of pyarrow, only the columns which will be used are parsed, and counts are parsed as integers; this requires
+        the optional dependency pyarrow (pip install immuneML[Arrow]). By default, import_engine is pandas.
+
+        import_chunk_size (int): If set, each repertoire file is read and stored in parts of this many rows instead of loading the whole
+        file into memory, which allows importing repertoires larger than the available memory. The memory use is bounded by the chunk size
+        only when the repertoires are stored in the Arrow format; with the default NumPy format, the parts are combined when the repertoire
+        is stored (see the environment variable repertoire_storage_format). For Sequence- and ReceptorDatasets, the files are only read in
+        parts when number_of_processes is larger than 1, so that the parts are imported in parallel; the chains of a receptor can be in
+        different parts, so the files of ReceptorDatasets are not split. By default, import_chunk_size is not set.
+
+        number_of_processes (int): How many files to import in parallel. For Sequence- and ReceptorDatasets, each process builds the
+        sequences or receptors from a file (or from a part of a file, see import_chunk_size) and stores them directly in batch files. To keep
+        the batch files full, import_chunk_size is then rounded up to a multiple of sequence_file_size, so that only the last batch file of
+        each file (and of each part from which rows were filtered out) can have fewer than sequence_file_size elements. By default,
+        number_of_processes is 1.
+
         import_empty_nt_sequences (bool): imports sequences which have an empty nucleotide sequence field; can be True or False
 
         import_empty_aa_sequences (bool): imports sequences which have an empty amino acid sequence field; can be True or False; for analysis on
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class ImportEngine(Enum):
+
+    PANDAS = "pandas"
+    ARROW = "arrow"
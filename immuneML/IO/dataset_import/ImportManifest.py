@@ -0,0 +1,100 @@
+import json
+import os
+from pathlib import Path
+
+from immuneML.data_model.repertoire.Repertoire import Repertoire
+from immuneML.util.FingerprintHelper import FingerprintHelper
+
+
+class ImportManifest:
+    """
+    Records which source files were imported into which repertoires when a repertoire dataset is imported incrementally (import parameter
+    incremental set to True), so that importing the dataset again to the same result path only imports the files which were added or changed.
+
+    The manifest is a file with one JSON object per line. Each line describes one imported repertoire: the source file name as given in the
+    metadata file, the size, modification time and fingerprint of the source file, the fingerprint of the import settings (the metadata row of
+    the file and the import parameters), and the repertoire identifier and file names. A line is appended as soon as a repertoire is imported,
+    so an interrupted import continues from the last completed repertoire; a line cut off by the interruption is ignored.
+
+    A repertoire from the manifest is reused if its files exist, the import settings are the same and the source file is unchanged: if the
+    size and the modification time are the same, the file is assumed to be unchanged without reading it, otherwise its fingerprint is compared.
+
+    When the manifest is saved, the repertoire files of the entries which are no longer used (the source file was removed from the metadata
+    or imported again to a new repertoire) are removed from the repertoires directory.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries = self._load()
+        self.replaced_entries = []
+
+    def _load(self) -> dict:
+        entries = {}
+        if self.path.is_file():
+            with self.path.open("r") as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                        entries[entry["filename"]] = entry
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        continue
+        return entries
+
+    def find_repertoire(self, filename: str, source_file: Path, settings_fingerprint: str, repertoires_path: Path):
+        """Returns the repertoire imported from the source file if it can be reused and None otherwise"""
+        entry = self.entries.get(filename)
+        if entry is None or entry["settings_fingerprint"] != settings_fingerprint or not source_file.is_file():
+            return None
+
+        data_filename, metadata_filename = repertoires_path / entry["data_filename"], repertoires_path / entry["metadata_filename"]
+        if not data_filename.is_file() or not metadata_filename.is_file():
+            return None
+
+        stat = source_file.stat()
+        if entry["size"] != stat.st_size:
+            return None
+        if entry["modified"] != stat.st_mtime_ns:
+            if FingerprintHelper.fingerprint_file(source_file) != entry["source_fingerprint"]:
+                return None
+            entry["modified"] = stat.st_mtime_ns
+
+        return Repertoire(data_filename, metadata_filename, entry["identifier"])
+
+    def add(self, filename: str, source_file: Path, source_fingerprint: str, settings_fingerprint: str, repertoire: Repertoire,
+            source_stat: os.stat_result):
+        """
+        Records the repertoire imported from the source file and appends it to the manifest file; source_fingerprint and source_stat have to
+        be computed before the file is imported, so that a file changed during import is imported again the next time
+        """
+        entry = {"filename": filename, "size": source_stat.st_size, "modified": source_stat.st_mtime_ns, "source_fingerprint": source_fingerprint,
+                 "settings_fingerprint": settings_fingerprint, "identifier": repertoire.identifier, "data_filename": repertoire.data_filename.name,
+                 "metadata_filename": repertoire.metadata_filename.name}
+        if filename in self.entries:
+            self.replaced_entries.append(self.entries[filename])
+        self.entries[filename] = entry
+
+        with self.path.open("a") as file:
+            file.write(json.dumps(entry) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+    def save(self, filenames: list, repertoires_path: Path):
+        """
+        Rewrites the manifest file with the entries of the given source files only (e.g., removing the files no longer in the dataset) and
+        removes the repertoire files of the other entries and of the replaced entries from repertoires_path
+        """
+        kept_filenames = set(filenames)
+        removed_entries = self.replaced_entries + [entry for filename, entry in self.entries.items() if filename not in kept_filenames]
+        self.entries = {filename: self.entries[filename] for filename in filenames if filename in self.entries}
+        self.replaced_entries = []
+
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with tmp_path.open("w") as file:
+            file.writelines(json.dumps(entry) + "\n" for entry in self.entries.values())
+        os.replace(tmp_path, self.path)
+
+        used_filenames = {entry[key] for entry in self.entries.values() for key in ("data_filename", "metadata_filename")}
+        for entry in removed_entries:
+            for key in ("data_filename", "metadata_filename"):
+                if entry[key] not in used_filenames:
+                    (repertoires_path / entry[key]).unlink(missing_ok=True)
@@ -29,6 +29,11 @@ class OLGAImport(DataImport):
         Only the OLGA files included under the column 'filename' are imported into the RepertoireDataset.
         SequenceDataset metadata is currently not supported.
 
+        incremental (bool): If True, the repertoires imported from each source file are recorded in an import manifest in the result path, so
+        that importing the dataset again to the same result_path (e.g., after new files were added to the metadata file or after the import
+        was interrupted) only imports the files which are new or changed, and reuses the repertoires imported before. Only used for
+        repertoire datasets. By default, incremental is False.
+
         import_illegal_characters (bool): Whether to import sequences that contain illegal characters, i.e., characters
         that do not appear in the sequence alphabet (amino acids including stop codon '*', or nucleotides). When set to false, filtering is only
         applied to the sequence type of interest (when running immuneML in amino acid mode, only entries with illegal
@@ -11,7 +11,9 @@ from immuneML.IO.dataset_import.DatasetImportParams import DatasetImportParams
 from immuneML.data_model.dataset.Dataset import Dataset
 from immuneML.data_model.dataset.ElementDataset import ElementDataset
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
+from immuneML.data_model.repertoire.storage.RepertoireStorageFormat import RepertoireStorageFormat
 from immuneML.environment.Constants import Constants
+from immuneML.util.SequenceMatrixHelper import SequenceMatrixHelper
 
 
 class PickleImport(DataImport):
@@ -127,11 +129,16 @@ class PickleImport(DataImport):
     def _discover_repertoire_path(pickle_params, dataset):
         dataset_dir = PickleImport._discover_dataset_dir(pickle_params)
 
-        if len(list(dataset_dir.glob("*.npy"))) == len(dataset.repertoires):
+        if PickleImport._count_repertoire_files(dataset_dir) == len(dataset.repertoires):
             path = dataset_dir
-        elif len(list(dataset_dir.glob("repertoires/*.npy"))) == len(dataset.repertoires):
+        elif PickleImport._count_repertoire_files(dataset_dir / "repertoires/") == len(dataset.repertoires):
             path = dataset_dir / "repertoires/"
         else:
             path = None
 
         return path
+
+    @staticmethod
+    def _count_repertoire_files(path: Path) -> int:
+        return sum(len([filename for filename in path.glob(f"*.{storage_format.value}") if not SequenceMatrixHelper.is_sequence_matrix_file(filename)])
+                   for storage_format in RepertoireStorageFormat)
@@ -1,3 +1,4 @@
+from multiprocessing.pool import Pool
 from typing import List
 
 import pandas as pd
@@ -76,6 +77,9 @@ class SingleLineReceptorImport(DataImport):
 
         organism (str): The organism that the receptors came from. This will be set as a parameter in the ReceptorDataset object.
 
+        number_of_processes (int): How many files to import in parallel; each process builds the receptors from a file and stores them
+        directly in batch files. By default, number_of_processes is 1.
+
 
     YAML specification:
 
@@ -125,7 +129,10 @@ class SingleLineReceptorImport(DataImport):
 
         PathBuilder.build(generic_params.result_path, warn_if_exists=True)
 
-        dataset = SingleLineReceptorImport._import_from_files(filenames, generic_params)
+        if generic_params.number_of_processes > 1:
+            dataset = SingleLineReceptorImport._import_from_files_in_parallel(filenames, generic_params)
+        else:
+            dataset = SingleLineReceptorImport._import_from_files(filenames, generic_params)
         dataset.name = dataset_name
         dataset.labels = ImportHelper.extract_sequence_dataset_params(params=generic_params)
 
@@ -138,46 +145,69 @@ class SingleLineReceptorImport(DataImport):
         elements = []
 
         for file in filenames:
-            df = pd.read_csv(file, sep=generic_params.separator, usecols=generic_params.columns_to_load)
-            df.dropna()
-            df.drop_duplicates()
-            df.rename(columns=generic_params.column_mapping, inplace=True)
-
-            if "alpha_amino_acid_sequence" in df:
-                df["alpha_amino_acid_sequence"] = df["alpha_amino_acid_sequence"].str[1:-1]
-            if "beta_amino_acid_sequence" in df:
-                df["beta_amino_acid_sequence"] = df["beta_amino_acid_sequence"].str[1:-1]
-            if "alpha_nucleotide_sequence" in df:
-                df["alpha_nucleotide_sequence"] = df["alpha_nucleotide_sequence"].str[3:-3]
-            if "beta_nucleotide_sequence" in df:
-                df["beta_nucleotide_sequence"] = df["beta_nucleotide_sequence"].str[3:-3]
-
-            chain_vals = [ch for ch in generic_params.receptor_chains.value]
-            chain_names = [Chain.get_chain(ch).name.lower() for ch in generic_params.receptor_chains.value]
-
-            for chain_name in chain_names:
-                df = SingleLineReceptorImport.make_gene_columns(df, ["v", "j"], chain_name)
-
-            for index, row in df.iterrows():
-                sequences = {chain_vals[i]: ReceptorSequence(amino_acid_sequence=row[
-                                     chain_name + "_amino_acid_sequence"] if chain_name + "_amino_acid_sequence" in row else None,
-                                                  nucleotide_sequence=row[
-                                                      chain_name + "_nucleotide_sequence"] if chain_name + "_nucleotide_sequence" in row else None,
-                                                  metadata=SequenceMetadata(
-                                                      v_gene=row[f"{chain_name}_v_gene"], v_allele=row[f"{chain_name}_v_allele"],
-                                                      v_subgroup=row[f'{chain_name}_v_subgroup'],
-                                                      j_gene=row[f"{chain_name}_j_gene"], j_allele=row[f"{chain_name}_j_allele"],
-                                                      j_subgroup=row[f'{chain_name}_j_subgroup'],
-                                                      chain=chain_name, count=row["count"], region_type=generic_params.region_type.value))
-                             for i, chain_name in enumerate(chain_names)}
-
-                elements.append(ReceptorBuilder.build_object(sequences, row["identifier"],
-                                                             {key: row[key] for key in row.keys()
-                                                              if all(item not in key for item in
-                                                                     ["v_gene", 'j_gene', "count", "identifier"] + chain_names)}))
+            elements.extend(SingleLineReceptorImport._import_from_file(file, generic_params))
 
         return ReceptorDataset.build(elements, generic_params.sequence_file_size, generic_params.result_path)
 
+    @staticmethod
+    def _import_from_files_in_parallel(filenames: List[str], generic_params: DatasetImportParams) -> ReceptorDataset:
+        """Each process imports one file and stores its receptors directly in batch files, which are then merged into one dataset"""
+        arguments = [(file, generic_params, f"batch_{index:06d}") for index, file in enumerate(filenames)]
+        with Pool(generic_params.number_of_processes) as pool:
+            batch_filenames = pool.starmap(SingleLineReceptorImport._import_file_to_batch_files, arguments)
+
+        return ReceptorDataset(filenames=[filename for filenames in batch_filenames for filename in filenames],
+                               file_size=generic_params.sequence_file_size)
+
+    @staticmethod
+    def _import_file_to_batch_files(file, generic_params: DatasetImportParams, batch_name: str) -> list:
+        elements = SingleLineReceptorImport._import_from_file(file, generic_params)
+        return ImportHelper.store_items_in_batch_files(elements, generic_params, batch_name)
+
+    @staticmethod
+    def _import_from_file(file, generic_params: DatasetImportParams) -> list:
+        elements = []
+
+        df = pd.read_csv(file, sep=generic_params.separator, usecols=generic_params.columns_to_load)
+        df.dropna()
+        df.drop_duplicates()
+        df.rename(columns=generic_params.column_mapping, inplace=True)
+
+        if "alpha_amino_acid_sequence" in df:
+            df["alpha_amino_acid_sequence"] = df["alpha_amino_acid_sequence"].str[1:-1]
+        if "beta_amino_acid_sequence" in df:
+            df["beta_amino_acid_sequence"] = df["beta_amino_acid_sequence"].str[1:-1]
+        if "alpha_nucleotide_sequence" in df:
+            df["alpha_nucleotide_sequence"] = df["alpha_nucleotide_sequence"].str[3:-3]
+        if "beta_nucleotide_sequence" in df:
+            df["beta_nucleotide_sequence"] = df["beta_nucleotide_sequence"].str[3:-3]
+
+        chain_vals = [ch for ch in generic_params.receptor_chains.value]
+        chain_names = [Chain.get_chain(ch).name.lower() for ch in generic_params.receptor_chains.value]
+
+        for chain_name in chain_names:
+            df = SingleLineReceptorImport.make_gene_columns(df, ["v", "j"], chain_name)
+
+        for index, row in df.iterrows():
+            sequences = {chain_vals[i]: ReceptorSequence(amino_acid_sequence=row[
+                                 chain_name + "_amino_acid_sequence"] if chain_name + "_amino_acid_sequence" in row else None,
+                                              nucleotide_sequence=row[
+                                                  chain_name + "_nucleotide_sequence"] if chain_name + "_nucleotide_sequence" in row else None,
+                                              metadata=SequenceMetadata(
+                                                  v_gene=row[f"{chain_name}_v_gene"], v_allele=row[f"{chain_name}_v_allele"],
+                                                  v_subgroup=row[f'{chain_name}_v_subgroup'],
+                                                  j_gene=row[f"{chain_name}_j_gene"], j_allele=row[f"{chain_name}_j_allele"],
+                                                  j_subgroup=row[f'{chain_name}_j_subgroup'],
+                                                  chain=chain_name, count=row["count"], region_type=generic_params.region_type.value))
+                         for i, chain_name in enumerate(chain_names)}
+
+            elements.append(ReceptorBuilder.build_object(sequences, row["identifier"],
+                                                         {key: row[key] for key in row.keys()
+                                                          if all(item not in key for item in
+                                                                 ["v_gene", 'j_gene', "count", "identifier"] + chain_names)}))
+
+        return elements
+
     @staticmethod
     def make_gene_columns(df: pd.DataFrame, genes: list, chain_name=None):
         for gene in genes:
@@ -37,6 +37,11 @@ class TenxGenomicsImport(DataImport):
         This is a csv file with columns filename, subject_id and arbitrary other columns which can be used as labels in instructions.
         For setting Sequence- or ReceptorDataset metadata, metadata_file is ignored, see metadata_column_mapping instead.
 
+        incremental (bool): If True, the repertoires imported from each source file are recorded in an import manifest in the result path, so
+        that importing the dataset again to the same result_path (e.g., after new files were added to the metadata file or after the import
+        was interrupted) only imports the files which are new or changed, and reuses the repertoires imported before. Only used for
+        repertoire datasets. By default, incremental is False.
+
         paired (str): Required for Sequence- or ReceptorDatasets. This parameter determines whether to import a
         SequenceDataset (paired = False) or a ReceptorDataset (paired = True).
         In a ReceptorDataset, two sequences with chain types specified by receptor_chains are paired together
@@ -94,6 +99,23 @@ class TenxGenomicsImport(DataImport):
 
         separator (str): Column separator, for 10xGenomics this is by default ",".
 
+        import_engine (str): Which library to use to parse the files: pandas or arrow. With arrow, the files are parsed in parallel by the
+        multithreaded CSV reader of pyarrow, only the columns which will be used are parsed, and counts are parsed as integers; this requires
+        the optional dependency pyarrow (pip install immuneML[Arrow]). By default, import_engine is pandas.
+
+        import_chunk_size (int): If set, each repertoire file is read and stored in parts of this many rows instead of loading the whole
+        file into memory, which allows importing repertoires larger than the available memory. The memory use is bounded by the chunk size
+        only when the repertoires are stored in the Arrow format; with the default NumPy format, the parts are combined when the repertoire
+        is stored (see the environment variable repertoire_storage_format). For Sequence- and ReceptorDatasets, the files are only read in
+        parts when number_of_processes is larger than 1, so that the parts are imported in parallel; the chains of a receptor can be in
+        different parts, so the files of ReceptorDatasets are not split. By default, import_chunk_size is not set.
+
+        number_of_processes (int): How many files to import in parallel. For Sequence- and ReceptorDatasets, each process builds the
+        sequences or receptors from a file (or from a part of a file, see import_chunk_size) and stores them directly in batch files. To keep
+        the batch files full, import_chunk_size is then rounded up to a multiple of sequence_file_size, so that only the last batch file of
+        each file (and of each part from which rows were filtered out) can have fewer than sequence_file_size elements. By default,
+        number_of_processes is 1.
+
 
     YAML specification:
 
@@ -33,6 +33,11 @@ class VDJdbImport(DataImport):
         This is a csv file with columns filename, subject_id and arbitrary other columns which can be used as labels in instructions.
         For setting Sequence- or ReceptorDataset metadata, metadata_file is ignored, see metadata_column_mapping instead.
 
+        incremental (bool): If True, the repertoires imported from each source file are recorded in an import manifest in the result path, so
+        that importing the dataset again to the same result_path (e.g., after new files were added to the metadata file or after the import
+        was interrupted) only imports the files which are new or changed, and reuses the repertoires imported before. Only used for
+        repertoire datasets. By default, incremental is False.
+
         paired (str): Required for Sequence- or ReceptorDatasets. This parameter determines whether to import a
         SequenceDataset (paired = False) or a ReceptorDataset (paired = True).
         In a ReceptorDataset, two sequences with chain types specified by receptor_chains are paired together
@@ -97,6 +102,9 @@ class VDJdbImport(DataImport):
 
         separator (str): Column separator, for VDJdb this is by default "\\t".
 
+        number_of_processes (int): How many files to import in parallel. For Sequence- and ReceptorDatasets, each process builds the
+        sequences or receptors from a file and stores them directly in batch files. By default, number_of_processes is 1.
+
 
     YAML specification:
 
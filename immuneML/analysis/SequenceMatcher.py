@@ -4,9 +4,12 @@ import numpy as np
 from editdistance import eval as edit_distance
 
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
+from immuneML.data_model.receptor.receptor_sequence.Chain import Chain
 from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
+from immuneML.data_model.repertoire.CategoricalVocabulary import CategoricalVocabulary
 from immuneML.data_model.repertoire.Repertoire import Repertoire
 from immuneML.encodings.reference_encoding.SequenceMatchingSummaryType import SequenceMatchingSummaryType
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 
 
 class SequenceMatcher:
@@ -32,14 +35,16 @@ class SequenceMatcher:
     """
 
     CORES = 4
+    MATCHING_FIELDS = ("chains", "v_genes", "j_genes")
 
     def match(self, dataset: RepertoireDataset, reference_sequences: list, max_distance: int, summary_type: SequenceMatchingSummaryType) -> dict:
 
         matched = {"repertoires": []}
+        vocabularies = {field: dataset.get_categorical_vocabulary(field) for field in SequenceMatcher.MATCHING_FIELDS}
 
         for index, repertoire in enumerate(dataset.get_data()):
             matched["repertoires"].append(self.match_repertoire(repertoire, index,
-                                                                reference_sequences, max_distance, summary_type))
+                                                                reference_sequences, max_distance, summary_type, vocabularies))
 
         return matched
 
@@ -62,26 +67,76 @@ class SequenceMatcher:
             and edit_distance(original_sequence.get_sequence(), reference_sequence.get_sequence()) <= max_distance
 
     def match_repertoire(self, repertoire: Repertoire, index: int, reference_sequences: list, max_distance: int,
-                         summary_type: SequenceMatchingSummaryType) -> dict:
+                         summary_type: SequenceMatchingSummaryType, vocabularies: dict = None) -> dict:
+        """
+        Matches the sequences of the repertoire to the reference sequences. Chains and genes are compared as integer codes of the vocabularies
+        (typically shared across the dataset, see RepertoireDataset.get_categorical_vocabulary()): the comparison is computed once per pair of
+        distinct values and edit distances are computed only for the pairs of sequences with matching chains and genes.
+        """
+        vocabularies = {} if vocabularies is None else vocabularies
+        vocabularies = {field: vocabularies[field] if field in vocabularies else CategoricalVocabulary(field, repertoire.get_unique_values(field))
+                        for field in SequenceMatcher.MATCHING_FIELDS}
 
-        matched = {"sequences": [], "repertoire": repertoire.identifier, "repertoire_index": index}
-        arguments = [(seq, reference_sequences, max_distance) for seq in repertoire.sequences]
+        candidates = np.ones((repertoire.get_element_count(), len(reference_sequences)), dtype=bool)
+        for field, compatibility in self._make_compatibility_tables(vocabularies, reference_sequences).items():
+            candidates &= compatibility[repertoire.get_categorical_codes(field, vocabularies[field])]
+
+        sequences = repertoire.get_attribute(EnvironmentSettings.get_sequence_type().value)
+        reference_strings = [reference_sequence.get_sequence() for reference_sequence in reference_sequences]
+        arguments = [(sequences[i], [reference_strings[j] for j in np.flatnonzero(candidates[i])], max_distance) for i in range(len(sequences))]
 
         with Pool(SequenceMatcher.CORES) as pool:
-            matched["sequences"] = pool.starmap(self.match_sequence, arguments)
+            matching_sequences = pool.starmap(SequenceMatcher._match_to_candidates, arguments)
+
+        metadata = repertoire.get_attributes(["v_genes", "j_genes"])
+        chains = repertoire.get_chains()
+        matched = {"sequences": [{"matching_sequences": matching_sequences[i], "sequence": sequences[i],
+                                  "v_gene": metadata["v_genes"][i] if "v_genes" in metadata else None,
+                                  "j_gene": metadata["j_genes"][i] if "j_genes" in metadata else None,
+                                  "chain": chains[i] if chains is not None else None} for i in range(len(sequences))],
+                   "repertoire": repertoire.identifier, "repertoire_index": index}
 
+        is_matched = np.array([len(sequence_matches) > 0 for sequence_matches in matching_sequences], dtype=bool)
         if summary_type == SequenceMatchingSummaryType.CLONAL_PERCENTAGE:
-            total_count = np.sum([sequence.metadata.count for sequence in repertoire.sequences])
-            matched["clonal_percentage"] = np.sum([sequence.metadata.count for index, sequence in enumerate(repertoire.sequences) if len(matched["sequences"][index]["matching_sequences"]) > 0]) / total_count
+            counts = repertoire.get_counts()
+            matched["clonal_percentage"] = np.sum(counts[is_matched]) / np.sum(counts)
         else:
-            matched["count"] = len([r for r in matched["sequences"] if len(r["matching_sequences"]) > 0])
+            matched["count"] = int(np.sum(is_matched))
             matched["percentage"] = matched["count"] / len(matched["sequences"])
         matched["metadata"] = repertoire.metadata
         matched["patient_id"] = repertoire.identifier
-        matched["chains"] = list(set([sequence.metadata.chain for sequence in repertoire.sequences]))
+        matched["chains"] = list(set(chains)) if chains is not None else [None]
 
         return matched
 
+    def _make_compatibility_tables(self, vocabularies: dict, reference_sequences: list) -> dict:
+        """
+        For each field, creates a boolean table of shape (vocabulary size + 1, number of reference sequences) where the entry is True if the
+        vocabulary value matches the value of the reference sequence; the last row corresponds to missing values (CategoricalVocabulary.MISSING_CODE)
+        """
+        reference_values = {"chains": [sequence.metadata.chain for sequence in reference_sequences],
+                            "v_genes": [sequence.metadata.v_gene for sequence in reference_sequences],
+                            "j_genes": [sequence.metadata.j_gene for sequence in reference_sequences]}
+        tables = {}
+        for field, vocabulary in vocabularies.items():
+            values = list(vocabulary.values) + [None]
+            if field == "chains":
+                values = [Chain.get_chain(value) if value is not None else None for value in values]
+                tables[field] = np.array([[value == reference for reference in reference_values[field]] for value in values], dtype=bool)
+            else:
+                tables[field] = np.array([[self._matches_gene_or_missing(value, reference) for reference in reference_values[field]]
+                                          for value in values], dtype=bool)
+        return tables
+
+    def _matches_gene_or_missing(self, gene1, gene2) -> bool:
+        if gene1 is None or gene2 is None:
+            return gene1 is None and gene2 is None
+        return self.matches_gene(gene1, gene2)
+
+    @staticmethod
+    def _match_to_candidates(sequence: str, candidate_sequences: list, max_distance: int) -> list:
+        return [candidate for candidate in candidate_sequences if edit_distance(sequence, candidate) <= max_distance]
+
     def match_sequence(self, sequence: ReceptorSequence, reference_sequences: list, max_distance: int) -> dict:
         matching_sequences = [seq.get_sequence() for seq in reference_sequences
                               if self.matches_sequence(sequence, seq, max_distance)]
@@ -6,7 +6,9 @@ import shutil
 import warnings
 from pathlib import Path
 
+from immuneML.caching.CacheStatistics import CacheStatistics
 from immuneML.caching.CacheType import CacheType
+from immuneML.caching.PersistentCache import PersistentCache
 from immuneML.dsl.ImmuneMLParser import ImmuneMLParser
 from immuneML.dsl.semantic_model.SemanticModel import SemanticModel
 from immuneML.dsl.symbol_table.SymbolType import SymbolType
@@ -14,6 +16,7 @@ from immuneML.environment.Constants import Constants
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.util.PathBuilder import PathBuilder
 from immuneML.util.ReflectionHandler import ReflectionHandler
+from immuneML.util.SizeHelper import SizeHelper
 
 
 class ImmuneMLApp:
@@ -29,12 +32,22 @@ class ImmuneMLApp:
     def set_cache(self):
         os.environ[Constants.CACHE_TYPE] = CacheType.PRODUCTION.value
         EnvironmentSettings.set_cache_path(self._cache_path)
+        EnvironmentSettings.set_cache_statistics_path(self._cache_path / "statistics")
+        CacheStatistics.reset()
 
     def clear_cache(self):
+        CacheStatistics.export(self._result_path / "cache_statistics.json")
+        EnvironmentSettings.set_cache_statistics_path(None)
         shutil.rmtree(self._cache_path, ignore_errors=True)
         EnvironmentSettings.reset_cache_path()
         del os.environ[Constants.CACHE_TYPE]
 
+        persistent_cache_path = EnvironmentSettings.get_persistent_cache_path()
+        if persistent_cache_path is not None and persistent_cache_path.is_dir():
+            result = PersistentCache.prune(persistent_cache_path, max_bytes=EnvironmentSettings.get_persistent_cache_size())
+            print(f"{datetime.datetime.now()}: ImmuneML: removed {result['removed_files']} least recently used files "
+                  f"({SizeHelper.format_size(result['removed_bytes'])}) from the persistent cache {persistent_cache_path}.\n", flush=True)
+
     def run(self):
 
         self.set_cache()
@@ -62,6 +75,9 @@ def run_immuneML(namespace: argparse.Namespace):
         raise ValueError(f"Directory {namespace.result_path} already exists. Please specify a new output directory for the analysis.")
     PathBuilder.build(namespace.result_path)
 
+    if getattr(namespace, "cache_path", None) is not None:
+        EnvironmentSettings.set_persistent_cache(namespace.cache_path, getattr(namespace, "cache_size", None))
+
     logging.basicConfig(filename=Path(namespace.result_path) / "log.txt", level=logging.INFO, format='%(asctime)s %(levelname)s: %(message)s')
     warnings.showwarning = lambda message, category, filename, lineno, file=None, line=None: logging.warning(message)
 
@@ -80,6 +96,12 @@ def main():
     parser.add_argument("result_path", help="Output directory path.")
     parser.add_argument("--tool", help="Name of the tool which calls immuneML. This name will be used to invoke appropriate API call, "
                                        "which will then do additional work in tool-dependent way before running standard immuneML.")
+    parser.add_argument("--cache_path", help="Path to the persistent cache shared between runs, where the encoded repertoires are stored so "
+                                             "that they can be reused by the next runs; if not set, the cache is removed at the end of the run. "
+                                             "Can also be set by the environment variable 'persistent_cache_path'.")
+    parser.add_argument("--cache_size", type=SizeHelper.parse_size,
+                        help="Size budget of the persistent cache, e.g., 500M or 20G (default: 20G). At the end of the run, the least recently "
+                             "used files are removed to fit it.")
     namespace = parser.parse_args()
     namespace.specification_path = Path(namespace.specification_path)
     namespace.result_path = Path(namespace.result_path)
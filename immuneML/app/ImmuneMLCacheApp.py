@@ -0,0 +1,117 @@
+import argparse
+import datetime
+import json
+import os
+import shutil
+from pathlib import Path
+
+from immuneML.caching.CacheType import CacheType
+from immuneML.caching.PersistentCache import PersistentCache
+from immuneML.environment.Constants import Constants
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.PathBuilder import PathBuilder
+from immuneML.util.SizeHelper import SizeHelper
+
+
+def show_info(cache_path: Path, namespace: argparse.Namespace):
+    entries = PersistentCache.get_entries(cache_path)
+    print(f"Cache: {cache_path}\nFiles: {entries.shape[0]}\nSize: {SizeHelper.format_size(int(entries['size'].sum()))}")
+    for object_type, group in entries.groupby("object_type"):
+        print(f"  {object_type.lower()}: {group.shape[0]} files, {SizeHelper.format_size(int(group['size'].sum()))}")
+    if entries.shape[0] > 0:
+        print(f"Least recently accessed: {datetime.datetime.fromtimestamp(entries['last_access'].min())}\n"
+              f"Most recently accessed: {datetime.datetime.fromtimestamp(entries['last_access'].max())}")
+
+
+def list_entries(cache_path: Path, namespace: argparse.Namespace):
+    entries = PersistentCache.get_entries(cache_path).iloc[::-1]
+    entries = entries.head(namespace.limit) if namespace.limit is not None else entries
+    for _, entry in entries.iterrows():
+        print(f"{datetime.datetime.fromtimestamp(entry['last_access'])}\t{entry['access_count']}\t{SizeHelper.format_size(entry['size'])}\t"
+              f"{entry['key']}")
+
+
+def prune(cache_path: Path, namespace: argparse.Namespace):
+    max_bytes = namespace.max_size if namespace.max_size is not None or namespace.max_age is not None \
+        else EnvironmentSettings.get_persistent_cache_size()
+    result = PersistentCache.prune(cache_path, max_bytes=max_bytes, max_age_days=namespace.max_age)
+    print(f"Removed {result['removed_files']} files ({SizeHelper.format_size(result['removed_bytes'])}) from the cache {cache_path}.")
+
+
+def clear(cache_path: Path, namespace: argparse.Namespace):
+    result = PersistentCache.clear(cache_path)
+    print(f"Removed {result['removed_files']} files ({SizeHelper.format_size(result['removed_bytes'])}) from the cache {cache_path}.")
+
+
+def warm_up(cache_path: Path, namespace: argparse.Namespace):
+    from immuneML.caching.CacheWarmUp import CacheWarmUp
+
+    result_path = Path(namespace.result_path)
+    if result_path.is_dir() and len(os.listdir(result_path)) != 0:
+        raise ValueError(f"Directory {result_path} already exists. Please specify a new output directory for the warm-up.")
+    PathBuilder.build(result_path)
+
+    EnvironmentSettings.set_persistent_cache(PathBuilder.build(cache_path))
+    os.environ[Constants.CACHE_TYPE] = CacheType.PRODUCTION.name
+    EnvironmentSettings.set_cache_path(result_path / "cache")
+
+    try:
+        report = CacheWarmUp.run(Path(namespace.specification_path), result_path, namespace.instruction)
+    finally:
+        shutil.rmtree(result_path / "cache", ignore_errors=True)
+        EnvironmentSettings.reset_cache_path()
+        PersistentCache.prune(cache_path, max_bytes=EnvironmentSettings.get_persistent_cache_size())
+
+    with (result_path / "cache_warm_up_report.json").open("w") as file:
+        json.dump(report, file, indent=2)
+
+    print(f"Warmed up the cache {cache_path} for the dataset {report['dataset']} ({report['examples']} examples):")
+    for encoding in report["encodings"]:
+        print(f"  {encoding['encoding']}: {encoding['status']}" + (f" in {encoding['seconds']}s" if "seconds" in encoding else ""))
+        for object_type, counts in encoding.get("cached_objects", {}).items():
+            print(f"    {object_type}: {counts['written']} objects written ({SizeHelper.format_size(counts['bytes_written'])}), "
+                  f"{counts['already_cached']} already cached"
+                  + ("" if counts["persistent"] else "; not kept, since this object type is not in the persistent cache"))
+    print(f"The report is stored in {result_path / 'cache_warm_up_report.json'}.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and prune the persistent immuneML cache shared between runs")
+    parser.add_argument("--cache_path", help="Path to the persistent cache; if not set, the environment variable 'persistent_cache_path' is used.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("info", help="Show the number and the size of the cached files per object type.").set_defaults(function=show_info)
+
+    list_parser = subparsers.add_parser("list", help="List the cached files from the most to the least recently accessed.")
+    list_parser.add_argument("--limit", type=int, help="Maximum number of files to list.")
+    list_parser.set_defaults(function=list_entries)
+
+    prune_parser = subparsers.add_parser("prune", help="Remove the least recently accessed files. If neither --max_size nor --max_age are "
+                                                       "set, the files are removed until the cache fits the size set by the environment "
+                                                       "variable 'persistent_cache_size' (20G by default).")
+    prune_parser.add_argument("--max_size", type=SizeHelper.parse_size, help="Maximum total size of the cache, e.g., 500M or 20G.")
+    prune_parser.add_argument("--max_age", type=float, help="Remove the files which were not accessed in this many days.")
+    prune_parser.set_defaults(function=prune)
+
+    subparsers.add_parser("clear", help="Remove all cached files.").set_defaults(function=clear)
+
+    warm_up_parser = subparsers.add_parser("warmup", help="Encode the dataset with the encodings of a TrainMLModel instruction to fill the "
+                                                          "cache without training any models.")
+    warm_up_parser.add_argument("specification_path", help="Path to the YAML specification with the TrainMLModel instruction.")
+    warm_up_parser.add_argument("result_path", help="Output directory for the warm-up report and the files created during encoding.")
+    warm_up_parser.add_argument("--instruction", help="Name of the TrainMLModel instruction if the specification includes more than one.")
+    warm_up_parser.set_defaults(function=warm_up)
+
+    namespace = parser.parse_args()
+    cache_path = Path(namespace.cache_path) if namespace.cache_path is not None else EnvironmentSettings.get_persistent_cache_path()
+    if cache_path is not None and namespace.command == "warmup":
+        PathBuilder.build(cache_path)
+    if cache_path is None or not cache_path.is_dir():
+        parser.error(f"The persistent cache path is not set or does not exist: {cache_path}. Use --cache_path or set the environment variable "
+                     f"'persistent_cache_path'.")
+
+    namespace.function(cache_path, namespace)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+import importlib
+from enum import Enum
+
+
+class CacheCompression(Enum):
+    """Compression of the cache files of the objects which are stored with dill (see CacheHandler); LZ4 and ZSTD require optional dependencies"""
+
+    NONE = "none"
+    LZ4 = "lz4"
+    ZSTD = "zstd"
+
+    def get_module_name(self) -> str:
+        return {CacheCompression.NONE: None, CacheCompression.LZ4: "lz4.frame", CacheCompression.ZSTD: "zstandard"}[self]
+
+    def is_available(self) -> bool:
+        """Returns True if the optional dependency needed for the compression is installed"""
+        if self.get_module_name() is None:
+            return True
+        try:
+            importlib.import_module(self.get_module_name())
+            return True
+        except ImportError:
+            return False
@@ -1,17 +1,117 @@
-import hashlib
 import logging
 import os
-import pickle
+import time
+from functools import partial
+from multiprocessing.pool import Pool
 from pathlib import Path
+from uuid import uuid4
 
-import dill
-
+from immuneML.caching.CacheCompression import CacheCompression
+from immuneML.caching.CacheKeyBuilder import CacheKeyBuilder
+from immuneML.caching.CacheLock import CacheLock
+from immuneML.caching.CacheMemoryPolicy import CacheMemoryPolicy
 from immuneML.caching.CacheObjectType import CacheObjectType
+from immuneML.caching.CacheStatistics import CacheStatistics
+from immuneML.caching.LRUMemoryCache import LRUMemoryCache
+from immuneML.caching.PersistentCache import PersistentCache
+from immuneML.caching.codec.LZ4PickleCacheCodec import LZ4PickleCacheCodec
+from immuneML.caching.codec.NumpyCacheCodec import NumpyCacheCodec
+from immuneML.caching.codec.PickleCacheCodec import PickleCacheCodec
+from immuneML.caching.codec.SparseCacheCodec import SparseCacheCodec
+from immuneML.caching.codec.ZstdPickleCacheCodec import ZstdPickleCacheCodec
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.util.PathBuilder import PathBuilder
 
 
 class CacheHandler:
+    """
+    Two-tier cache of computed objects (e.g., encoded repertoires, comparison data, fitted models): the objects are stored in files in the
+    cache folder, named by the hash of the parameters they were computed from (see CacheKeyBuilder), and, depending on the CacheMemoryPolicy set for their
+    CacheObjectType in EnvironmentSettings, are also kept in an in-memory LRU tier, so that repeated lookups in the same process do not load
+    and deserialize the files again. The memory tier has a budget in bytes (see EnvironmentSettings.set_cache_memory_size()), where the size of
+    an object is estimated by the size of its file, and each process has its own memory tier. Per-example objects computed by the workers of
+    a multiprocessing pool are memoized with memo_in_pool(), which looks them up in the memory tier of the calling process before starting the
+    pool and keeps the results there, since the memory tiers of the workers are lost when the pool is closed.
+
+    The objects returned from the memory tier are shared between the callers and must not be modified.
+
+    The format of a cache file is chosen by the type of the object (see the codec package): numpy arrays without object elements are stored
+    as .npy files and memory-mapped (copy-on-write) when loaded, scipy sparse matrices are stored as .npz files, and all other objects are
+    stored with dill, optionally compressed with LZ4 or Zstandard (see EnvironmentSettings.set_cache_compression()).
+
+    The cache can be used by multiple processes at the same time: the files are written to a temporary file and renamed, so that other
+    processes never see a partially written file, and memo() locks the cache key (see CacheLock), so that if multiple processes need the same
+    object, one of them computes it and the others load it from the cache. Cache files which cannot be read are removed and recomputed.
+
+    The hits, misses, and the bytes and time of loading and storing the objects are counted per object type and call site by CacheStatistics.
+
+    If the persistent cache is set (see EnvironmentSettings.set_persistent_cache()), the files of the object types it includes are stored in
+    its folder instead of the cache folder of the run, and each file added or loaded is recorded in its manifest (see PersistentCache).
+    """
+
+    _memory_cache = None
+    SPECIALIZED_CODECS = [NumpyCacheCodec, SparseCacheCodec]
+    PICKLE_CODECS = {CacheCompression.NONE: PickleCacheCodec, CacheCompression.LZ4: LZ4PickleCacheCodec,
+                     CacheCompression.ZSTD: ZstdPickleCacheCodec}
+
+    @staticmethod
+    def _get_memory_cache() -> LRUMemoryCache:
+        max_bytes = EnvironmentSettings.get_cache_memory_size()
+        if CacheHandler._memory_cache is None:
+            CacheHandler._memory_cache = LRUMemoryCache(max_bytes)
+        elif CacheHandler._memory_cache.max_bytes != max_bytes:
+            CacheHandler._memory_cache.set_max_bytes(max_bytes)
+        return CacheHandler._memory_cache
+
+    @staticmethod
+    def _add_to_memory(cache_key: str, filename: Path, caching_object, object_type: CacheObjectType, policies: list):
+        if EnvironmentSettings.get_cache_memory_policy(object_type) in policies and filename.is_file():
+            CacheHandler._get_memory_cache().put(CacheHandler._get_memory_key(filename.parent, cache_key), caching_object,
+                                                 size=filename.stat().st_size)
+
+    @staticmethod
+    def _get_memory_key(path: Path, cache_key: str) -> str:
+        return str(path / cache_key)
+
+    @staticmethod
+    def _get_codec(caching_object):
+        for codec in CacheHandler.SPECIALIZED_CODECS:
+            if codec.can_write(caching_object):
+                return codec
+        return CacheHandler.PICKLE_CODECS[EnvironmentSettings.get_cache_compression()]
+
+    @staticmethod
+    def _find_file(cache_key: str, object_type: CacheObjectType, cache_type=None):
+        """Returns the cache file with the given key and the codec it was written with, or (None, None) if the object is not cached"""
+        for codec in [PickleCacheCodec] + CacheHandler.SPECIALIZED_CODECS + [LZ4PickleCacheCodec, ZstdPickleCacheCodec]:
+            filename = CacheHandler._build_filename(cache_key, object_type, cache_type, codec)
+            if filename.is_file():
+                return filename, codec
+        return None, None
+
+    @staticmethod
+    def _get_persistent_cache_path(object_type: CacheObjectType, cache_type=None):
+        """Returns the folder of the persistent cache if the objects of the given type are stored there or None otherwise"""
+        persistent_cache_path = EnvironmentSettings.get_persistent_cache_path()
+        if persistent_cache_path is not None and EnvironmentSettings.get_cache_path(cache_type, object_type) == persistent_cache_path:
+            return persistent_cache_path
+        return None
+
+    @staticmethod
+    def _record_add(filename: Path, object_type: CacheObjectType, cache_type=None):
+        persistent_cache_path = CacheHandler._get_persistent_cache_path(object_type, cache_type)
+        if persistent_cache_path is not None:
+            PersistentCache.record_add(filename, object_type, persistent_cache_path)
+
+    @staticmethod
+    def clear_memory():
+        """Removes all objects from the in-memory tier; the cache files are kept"""
+        CacheHandler._get_memory_cache().clear()
+
+    @staticmethod
+    def get_memory_stats() -> dict:
+        """Returns the number of hits, misses, evictions and entries, and the current size and the budget in bytes of the in-memory tier"""
+        return CacheHandler._get_memory_cache().get_stats()
 
     @staticmethod
     def get_file_path(cache_type=None):
@@ -26,50 +126,109 @@ class CacheHandler:
 
     @staticmethod
     def get_by_key(cache_key: str, object_type, cache_type=None):
-        filename = CacheHandler._build_filename(cache_key, object_type, cache_type)
-        obj = None
-        if filename.is_file():
-            with filename.open("rb") as file:
-                obj = dill.load(file)
+        obj = CacheHandler._load(cache_key, object_type, cache_type)
+        if obj is None:
+            CacheStatistics.record_miss(object_type)
         return obj
 
     @staticmethod
-    def _build_filename(cache_key: str, object_type: CacheObjectType, cache_type=None) -> Path:
-        path = EnvironmentSettings.get_cache_path(cache_type) / object_type.name.lower()
+    def _load_from_memory(cache_key: str, object_type, cache_type=None):
+        if EnvironmentSettings.get_cache_memory_policy(object_type) != CacheMemoryPolicy.NONE:
+            path = CacheHandler._build_filename(cache_key, object_type, cache_type).parent
+            obj = CacheHandler._get_memory_cache().get(CacheHandler._get_memory_key(path, cache_key))
+            if obj is not None:
+                CacheStatistics.record_hit(object_type, memory=True)
+                return obj
+        return None
+
+    @staticmethod
+    def _load(cache_key: str, object_type, cache_type=None):
+        obj = CacheHandler._load_from_memory(cache_key, object_type, cache_type)
+        if obj is not None:
+            return obj
+
+        filename, codec = CacheHandler._find_file(cache_key, object_type, cache_type)
+        if filename is not None:
+            try:
+                start = time.perf_counter()
+                obj = codec.read(filename)
+                CacheStatistics.record_hit(object_type, memory=False, size=filename.stat().st_size, seconds=time.perf_counter() - start)
+            except ImportError as e:
+                # the file was written with a compression whose library is not installed here, it is valid and is kept
+                logging.warning(f"CacheHandler: could not load the cached object from {filename}, it will be recomputed: {e}")
+                return None
+            except Exception as e:
+                logging.warning(f"CacheHandler: could not load the cached object from {filename}, it will be recomputed: {e}")
+                if filename.is_file():
+                    os.remove(filename)
+                return None
+            persistent_cache_path = CacheHandler._get_persistent_cache_path(object_type, cache_type)
+            if persistent_cache_path is not None:
+                PersistentCache.record_access(filename, object_type, persistent_cache_path)
+            CacheHandler._add_to_memory(cache_key, filename, obj, object_type, [CacheMemoryPolicy.READ, CacheMemoryPolicy.READ_WRITE])
+        return obj
+
+    @staticmethod
+    def _build_filename(cache_key: str, object_type: CacheObjectType, cache_type=None, codec=PickleCacheCodec) -> Path:
+        path = EnvironmentSettings.get_cache_path(cache_type, object_type) / object_type.name.lower()
         PathBuilder.build(path)
-        return path / f"{cache_key}.pickle"
+        return path / f"{cache_key}{codec.EXTENSION}"
 
     @staticmethod
     def add(params: tuple, caching_object, object_type: CacheObjectType = CacheObjectType.OTHER, cache_type=None):
         PathBuilder.build(EnvironmentSettings.get_cache_path(cache_type))
         h = CacheHandler.generate_cache_key(params)
-        filename = CacheHandler._build_filename(cache_key=h, object_type=object_type, cache_type=cache_type)
-        with filename.open("wb") as file:
-            dill.dump(caching_object, file, protocol=pickle.HIGHEST_PROTOCOL)
+        codec = CacheHandler._get_codec(caching_object)
+        filename = CacheHandler._build_filename(cache_key=h, object_type=object_type, cache_type=cache_type, codec=codec)
+        CacheHandler._write(codec, filename, caching_object, object_type)
+        CacheHandler._record_add(filename, object_type, cache_type)
+        CacheHandler._add_to_memory(h, filename, caching_object, object_type, [CacheMemoryPolicy.READ_WRITE])
 
     @staticmethod
     def add_by_key(cache_key: str, caching_object, object_type: CacheObjectType = CacheObjectType.OTHER, cache_type=None):
         PathBuilder.build(EnvironmentSettings.get_cache_path(cache_type))
-        filename = CacheHandler._build_filename(cache_key=cache_key, object_type=object_type, cache_type=cache_type)
+        codec = CacheHandler._get_codec(caching_object)
+        filename = CacheHandler._build_filename(cache_key=cache_key, object_type=object_type, cache_type=cache_type, codec=codec)
         try:
-            with filename.open("wb") as file:
-                dill.dump(caching_object, file, protocol=pickle.HIGHEST_PROTOCOL)
+            CacheHandler._write(codec, filename, caching_object, object_type)
+            CacheHandler._record_add(filename, object_type, cache_type)
+            CacheHandler._add_to_memory(cache_key, filename, caching_object, object_type, [CacheMemoryPolicy.READ_WRITE])
         except AttributeError:
-            os.remove(filename)
             logging.warning(f"CacheHandler: could not cache object of class {type(caching_object).__name__} with key {cache_key}. "
                             f"Object: {caching_object}\n"
                             f"Next time this object is needed, it will be recomputed which will take more time but should not influence results.")
 
+    @staticmethod
+    def _write(codec, filename: Path, caching_object, object_type: CacheObjectType):
+        """Writes the object to a temporary file in the same folder and renames it to the final filename, which is atomic"""
+        tmp_filename = filename.parent / f".{filename.name}.{uuid4().hex}.tmp"
+        try:
+            start = time.perf_counter()
+            codec.write(tmp_filename, caching_object)
+            os.replace(tmp_filename, filename)
+            CacheStatistics.record_write(object_type, size=filename.stat().st_size, seconds=time.perf_counter() - start)
+        finally:
+            if tmp_filename.is_file():
+                os.remove(tmp_filename)
+
+    @staticmethod
+    def _build_lock_filename(cache_key: str, object_type: CacheObjectType, cache_type=None) -> Path:
+        return CacheHandler._build_filename(cache_key, object_type, cache_type).parent / f".{cache_key}.lock"
+
     @staticmethod
     def generate_cache_key(params: tuple):
-        return hashlib.sha256(str(params).encode('utf-8')).hexdigest()
+        return CacheKeyBuilder.build(params)
 
     @staticmethod
     def memo(cache_key: str, fn, object_type: CacheObjectType = CacheObjectType.OTHER, cache_type=None):
-        result = CacheHandler.get_by_key(cache_key, object_type, cache_type)
+        result = CacheHandler._load(cache_key, object_type, cache_type)
         if result is None:
-            result = fn()
-            CacheHandler.add_by_key(cache_key, result, object_type, cache_type)
+            with CacheLock(CacheHandler._build_lock_filename(cache_key, object_type, cache_type)):
+                result = CacheHandler._load(cache_key, object_type, cache_type)
+                if result is None:
+                    CacheStatistics.record_miss(object_type)
+                    result = fn()
+                    CacheHandler.add_by_key(cache_key, result, object_type, cache_type)
         return result
 
     @staticmethod
@@ -77,6 +236,36 @@ class CacheHandler:
         cache_key = CacheHandler.generate_cache_key(params)
         return CacheHandler.memo(cache_key, fn, object_type, cache_type)
 
+    @staticmethod
+    def memo_in_pool(params_list: list, fn, arguments: list, pool_size: int, object_type: CacheObjectType = CacheObjectType.OTHER,
+                     cache_type=None, chunksize: int = None) -> list:
+        """
+        Returns the cached object for each params in params_list, where the missing objects are computed as fn(*arguments[index]) by a pool of
+        pool_size processes. The memory tier is checked in the current process and only the objects not found there are sent to the pool; the
+        objects the workers load or compute are added to the memory tier of the current process, since the memory tiers of the workers are
+        lost when the pool is closed. If all objects are in the memory tier, no pool is created.
+        """
+        cache_keys = [CacheHandler.generate_cache_key(params) for params in params_list]
+        results = [CacheHandler._load_from_memory(cache_key, object_type, cache_type) for cache_key in cache_keys]
+        missing = [index for index, result in enumerate(results) if result is None]
+
+        if len(missing) > 0:
+            with Pool(pool_size) as pool:
+                computed = pool.starmap(partial(CacheHandler._memo_with_arguments, fn, object_type, cache_type),
+                                        [(cache_keys[index], arguments[index]) for index in missing], chunksize=chunksize)
+            for index, result in zip(missing, computed):
+                results[index] = result
+                filename, _ = CacheHandler._find_file(cache_keys[index], object_type, cache_type)
+                if filename is not None:
+                    CacheHandler._add_to_memory(cache_keys[index], filename, result, object_type,
+                                                [CacheMemoryPolicy.READ, CacheMemoryPolicy.READ_WRITE])
+
+        return results
+
+    @staticmethod
+    def _memo_with_arguments(fn, object_type: CacheObjectType, cache_type, cache_key: str, arguments: tuple):
+        return CacheHandler.memo(cache_key, partial(fn, *arguments), object_type, cache_type)
+
     @staticmethod
     def _hash(params: tuple) -> str:
-        return hashlib.sha256(str(params).encode('utf-8')).hexdigest()
+        return CacheKeyBuilder.build(params)
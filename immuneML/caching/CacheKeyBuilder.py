@@ -0,0 +1,147 @@
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from immuneML.util.FingerprintHelper import FingerprintHelper
+
+
+class CacheKeyBuilder:
+    """
+    Builds cache keys (see CacheHandler) by hashing a canonical serialization of the parameters the cached object is computed from. Unlike
+    hashing str(params), the contents of numpy arrays, scipy sparse matrices and pandas data frames and series are hashed from their memory
+    buffers (str() of a large array is truncated with '...', so different arrays would give the same key), dicts and sets are hashed in sorted
+    order, and values of different types (e.g., 1, 1.0, '1' and True) give different keys.
+
+    Supported values:
+
+    - None, bool, int, float, str, bytes, numpy scalars, enums and paths,
+    - tuples, lists, dicts, sets and frozensets of supported values,
+    - numpy arrays, scipy sparse matrices, pandas data frames and series,
+    - objects with get_fingerprint() (e.g., datasets and repertoires), which are represented by their fingerprint,
+    - other objects, which are represented by their class and attributes: the ones in __dict__ and the ones declared in __slots__ of the
+      class and its base classes (e.g., ReceptorSequence and Receptor),
+    - objects without attributes, which are represented by str() if their class defines it; objects with the default str() of object
+      include their memory address, which would give a different key in each run, so a TypeError is raised for them.
+    """
+
+    @staticmethod
+    def build(params) -> str:
+        hasher = FingerprintHelper.new_hasher()
+        CacheKeyBuilder._update(hasher, params, set())
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _update(hasher, value, visited: set):
+        if isinstance(value, Enum):
+            CacheKeyBuilder._add(hasher, "enum", f"{type(value).__module__}.{type(value).__qualname__}.{value.name}")
+        elif value is None or isinstance(value, (bool, int, float, str, bytes, np.generic)):
+            CacheKeyBuilder._update_scalar(hasher, value)
+        elif isinstance(value, Path):
+            CacheKeyBuilder._add(hasher, "path", value.as_posix())
+        elif isinstance(value, np.ndarray):
+            CacheKeyBuilder._update_array(hasher, value)
+        elif sparse.issparse(value):
+            CacheKeyBuilder._update_sparse(hasher, value)
+        elif isinstance(value, (pd.DataFrame, pd.Series)):
+            CacheKeyBuilder._update_pandas(hasher, value)
+        elif not isinstance(value, type) and callable(getattr(value, "get_fingerprint", None)):
+            CacheKeyBuilder._add(hasher, f"fingerprint:{type(value).__name__}", value.get_fingerprint())
+        elif id(value) in visited:
+            CacheKeyBuilder._add(hasher, "cycle", type(value).__qualname__)
+        else:
+            visited.add(id(value))
+            CacheKeyBuilder._update_container(hasher, value, visited)
+            visited.remove(id(value))
+
+    @staticmethod
+    def _update_container(hasher, value, visited: set):
+        if isinstance(value, (tuple, list)):
+            CacheKeyBuilder._add(hasher, type(value).__name__, str(len(value)))
+            for element in value:
+                CacheKeyBuilder._update(hasher, element, visited)
+        elif isinstance(value, (dict, set, frozenset)):
+            items = value.items() if isinstance(value, dict) else [(element, None) for element in value]
+            digests = sorted((CacheKeyBuilder._digest(key, visited), CacheKeyBuilder._digest(element, visited)) for key, element in items)
+            CacheKeyBuilder._add(hasher, type(value).__name__, str(len(digests)))
+            for key_digest, element_digest in digests:
+                CacheKeyBuilder._add(hasher, key_digest, element_digest)
+        elif (hasattr(value, "__dict__") or CacheKeyBuilder._get_slots(type(value))) and not callable(value):
+            CacheKeyBuilder._add(hasher, "object", f"{type(value).__module__}.{type(value).__qualname__}")
+            CacheKeyBuilder._update_container(hasher, CacheKeyBuilder._get_attributes(value), visited)
+        elif callable(value) and hasattr(value, "__qualname__"):
+            CacheKeyBuilder._add(hasher, "callable", f"{getattr(value, '__module__', '')}.{value.__qualname__}")
+        elif type(value).__str__ is object.__str__ and type(value).__repr__ is object.__repr__:
+            raise TypeError(f"CacheKeyBuilder: objects of type {type(value).__qualname__} have no attributes or string representation which "
+                            f"could be used to build a cache key.")
+        else:
+            CacheKeyBuilder._add(hasher, "str", str(value))
+
+    @staticmethod
+    def _get_attributes(value) -> dict:
+        attributes = dict(vars(value)) if hasattr(value, "__dict__") else {}
+        for name in CacheKeyBuilder._get_slots(type(value)):
+            if hasattr(value, name):
+                attributes[name] = getattr(value, name)
+        return attributes
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_slots(cls: type) -> tuple:
+        slots = []
+        for base in cls.__mro__:
+            base_slots = base.__dict__.get("__slots__", ())
+            for name in [base_slots] if isinstance(base_slots, str) else base_slots:
+                if name not in ("__dict__", "__weakref__"):
+                    # private slot names are stored under the mangled name
+                    mangled = f"_{base.__name__.lstrip('_')}{name}" if name.startswith("__") and not name.endswith("__") else name
+                    if mangled not in slots:
+                        slots.append(mangled)
+        return tuple(slots)
+
+    @staticmethod
+    def _digest(value, visited: set) -> str:
+        hasher = FingerprintHelper.new_hasher()
+        CacheKeyBuilder._update(hasher, value, visited)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _update_scalar(hasher, value):
+        if isinstance(value, np.generic):
+            CacheKeyBuilder._add(hasher, f"numpy:{value.dtype.str}", value.tobytes())
+        elif isinstance(value, bytes):
+            CacheKeyBuilder._add(hasher, "bytes", value)
+        else:
+            CacheKeyBuilder._add(hasher, type(value).__name__, repr(value))
+
+    @staticmethod
+    def _update_array(hasher, array: np.ndarray):
+        CacheKeyBuilder._add(hasher, "ndarray", str(array.shape))
+        FingerprintHelper.update_with_array(hasher, array.ravel())
+
+    @staticmethod
+    def _update_sparse(hasher, matrix):
+        matrix = matrix.tocsr()
+        if not matrix.has_canonical_format:
+            matrix = matrix.copy()
+            matrix.sum_duplicates()
+        CacheKeyBuilder._add(hasher, "sparse", str(matrix.shape))
+        for array in [matrix.data, matrix.indices, matrix.indptr]:
+            FingerprintHelper.update_with_array(hasher, array)
+
+    @staticmethod
+    def _update_pandas(hasher, value):
+        frame = value.to_frame() if isinstance(value, pd.Series) else value
+        CacheKeyBuilder._add(hasher, type(value).__name__, str(frame.shape))
+        FingerprintHelper.update_with_array(hasher, frame.index.values)
+        FingerprintHelper.update_with_array(hasher, np.array([str(column) for column in frame.columns], dtype=object))
+        for column_index in range(frame.shape[1]):
+            FingerprintHelper.update_with_array(hasher, frame.iloc[:, column_index].values)
+
+    @staticmethod
+    def _add(hasher, tag: str, value):
+        FingerprintHelper.update_with_bytes(hasher, tag.encode("utf-8"))
+        FingerprintHelper.update_with_bytes(hasher, value if isinstance(value, bytes) else str(value).encode("utf-8"))
@@ -0,0 +1,94 @@
+import logging
+import os
+from pathlib import Path
+
+
+class CacheLock:
+    """
+    Exclusive lock on a cache key shared between processes (e.g., the workers of a multiprocessing pool or two immuneML runs using the same
+    persistent cache), used by CacheHandler.memo() so that only one process computes an object while the others wait for it and then load it
+    from the cache.
+
+    The lock is an advisory lock (flock) on a hidden, empty lock file next to the cache file; it is released when the lock is exited or when
+    the process holding it ends. The lock file is removed when the lock is exited; processes which were waiting on the removed file notice
+    that it is no longer the lock file of the key once they get the lock and lock the new file instead. Lock files left by processes which
+    ended without exiting the lock are removed by remove_unused() (called by PersistentCache.prune()).
+    On systems without fcntl (Windows), the lock does nothing and the same object might be computed by multiple processes.
+
+    Usage:
+
+    .. code-block:: python
+
+        with CacheLock(path / f".{cache_key}.lock"):
+            ...
+
+    """
+
+    def __init__(self, filename: Path):
+        self.filename = filename
+        self._file = None
+
+    def __enter__(self):
+        try:
+            import fcntl
+        except ImportError:
+            return self
+
+        try:
+            while self._file is None:
+                self._file = self.filename.open("a")
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+                if not CacheLock._is_current(self._file, self.filename):
+                    self._release()
+        except OSError as e:
+            logging.warning(f"CacheLock: could not lock {self.filename}, continuing without the lock: {e}")
+            self._release()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._file is not None:
+            CacheLock._remove(self._file, self.filename)
+        self._release()
+
+    def _release(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @staticmethod
+    def _is_current(file, filename: Path) -> bool:
+        """Checks if the locked file is still the lock file of the key, i.e., it was not removed by the previous holder of the lock"""
+        try:
+            return os.stat(filename).st_ino == os.fstat(file.fileno()).st_ino
+        except FileNotFoundError:
+            return False
+
+    @staticmethod
+    def _remove(file, filename: Path):
+        # the lock file is removed only while it is locked, so that no other process holds a lock on a file which is no longer used
+        try:
+            if CacheLock._is_current(file, filename):
+                os.remove(filename)
+        except OSError as e:
+            logging.warning(f"CacheLock: could not remove the lock file {filename}: {e}")
+
+    @staticmethod
+    def remove_unused(path: Path) -> int:
+        """Removes the lock files in the folder which are not locked by any process and returns their number"""
+        try:
+            import fcntl
+        except ImportError:
+            return 0
+
+        removed = 0
+        for filename in path.glob(".*.lock"):
+            try:
+                with filename.open("a") as file:
+                    fcntl.flock(file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    if CacheLock._is_current(file, filename):
+                        os.remove(filename)
+                        removed += 1
+            except OSError:
+                # the file is locked by another process or was already removed
+                pass
+        return removed
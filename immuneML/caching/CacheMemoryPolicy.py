@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class CacheMemoryPolicy(Enum):
+    """
+    Defines if the objects of a CacheObjectType are kept in the in-memory tier of CacheHandler in addition to the files in the cache folder:
+
+    - NONE: the objects are always loaded from the files,
+    - READ: the objects loaded from the files are kept in memory, so repeated lookups in the same process do not deserialize them again,
+    - READ_WRITE: the objects are kept in memory also when they are added to the cache, so the lookups after the object was computed are served from memory.
+    """
+
+    NONE = "none"
+    READ = "read"
+    READ_WRITE = "read_write"
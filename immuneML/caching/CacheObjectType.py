@@ -6,3 +6,4 @@ class CacheObjectType(Enum):
     ENCODING_STEP = 0
     ENCODING = 1
     OTHER = 2
+    COMPARISON_DATA = 3
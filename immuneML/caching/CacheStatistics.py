@@ -0,0 +1,217 @@
+import atexit
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from uuid import uuid4
+
+from immuneML.caching.CacheObjectType import CacheObjectType
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+
+
+class CacheStatistics:
+    """
+    Counts the cache operations of CacheHandler per CacheObjectType: hits in the in-memory tier, hits on disk, misses, writes, the number of
+    bytes read and written and the time spent on loading and storing the objects. If enabled (see
+    EnvironmentSettings.set_cache_statistics_call_sites()), the operations are also counted per call site (the module and the function which
+    called CacheHandler); call sites with writes but without hits indicate cache keys which are never reused. Finding the call site requires
+    inspecting the call stack, so it is disabled by default to keep the cost of the cache lookups low.
+
+    Each process counts in memory. If the statistics path is set (see EnvironmentSettings.set_cache_statistics_path(), done by ImmuneMLApp),
+    each process also stores its counters in a JSON file in that folder, so that the counters of the worker processes (e.g., of the encoders
+    using multiprocessing) are included in the summary. The main process stores its counters every FLUSH_COUNT operations or FLUSH_SECONDS
+    seconds and when it exits. Worker processes are terminated by the pool without running any exit handlers, so they overwrite their file in
+    place after each operation instead (without creating a new file and renaming it, which would be slower); a file cut off by the termination
+    is still read correctly, since only the JSON value at the start of the file is read.
+    """
+
+    COUNTERS = ["memory_hits", "disk_hits", "misses", "writes", "bytes_read", "bytes_written", "read_seconds", "write_seconds"]
+    SKIPPED_MODULES = ["CacheHandler", "CacheStatistics"]
+    UNKNOWN_CALL_SITE = "not recorded"
+    FLUSH_COUNT = 1000
+    FLUSH_SECONDS = 5
+
+    _counters = {}
+    _pid = None
+    _process_id = None
+    _is_worker = False
+    _worker_file = None
+    _unflushed = 0
+    _last_flush = 0
+    _lock = threading.Lock()
+
+    @staticmethod
+    def record_hit(object_type: CacheObjectType, memory: bool, size: int = 0, seconds: float = 0):
+        CacheStatistics._record(object_type, {"memory_hits" if memory else "disk_hits": 1, "bytes_read": size, "read_seconds": seconds})
+
+    @staticmethod
+    def record_miss(object_type: CacheObjectType):
+        CacheStatistics._record(object_type, {"misses": 1})
+
+    @staticmethod
+    def record_write(object_type: CacheObjectType, size: int, seconds: float):
+        CacheStatistics._record(object_type, {"writes": 1, "bytes_written": size, "write_seconds": seconds})
+
+    @staticmethod
+    def reset():
+        """Removes the counters of the current process; the files of other processes in the statistics folder are kept"""
+        with CacheStatistics._lock:
+            if CacheStatistics._pid != os.getpid():
+                CacheStatistics._start_process()
+            CacheStatistics._close_worker_file()
+            CacheStatistics._process_id, CacheStatistics._counters = uuid4().hex, {}
+            CacheStatistics._unflushed, CacheStatistics._last_flush = 0, time.monotonic()
+
+    @staticmethod
+    def _record(object_type: CacheObjectType, values: dict):
+        call_site = CacheStatistics._get_call_site() if EnvironmentSettings.get_cache_statistics_call_sites() else CacheStatistics.UNKNOWN_CALL_SITE
+        with CacheStatistics._lock:
+            if CacheStatistics._pid != os.getpid():
+                # a forked worker process starts with the counters of its parent, which are already counted by the parent
+                CacheStatistics._start_process()
+            counters = CacheStatistics._counters.setdefault((object_type.name, call_site), {counter: 0 for counter in CacheStatistics.COUNTERS})
+            for counter, value in values.items():
+                counters[counter] += value
+
+            CacheStatistics._unflushed += 1
+            if CacheStatistics._is_worker:
+                CacheStatistics._store_in_place()
+            elif CacheStatistics._unflushed >= CacheStatistics.FLUSH_COUNT \
+                    or time.monotonic() - CacheStatistics._last_flush >= CacheStatistics.FLUSH_SECONDS:
+                CacheStatistics._store()
+
+    @staticmethod
+    def _start_process():
+        CacheStatistics._pid, CacheStatistics._process_id, CacheStatistics._counters = os.getpid(), uuid4().hex, {}
+        CacheStatistics._unflushed, CacheStatistics._last_flush, CacheStatistics._worker_file = 0, time.monotonic(), None
+        CacheStatistics._is_worker = multiprocessing.parent_process() is not None
+        if not CacheStatistics._is_worker:
+            atexit.register(CacheStatistics._flush)
+
+    @staticmethod
+    def _get_call_site() -> str:
+        frame = sys._getframe(1)
+        while frame is not None and Path(frame.f_code.co_filename).stem in CacheStatistics.SKIPPED_MODULES:
+            frame = frame.f_back
+        return f"{Path(frame.f_code.co_filename).stem}.{frame.f_code.co_name}" if frame is not None else "unknown"
+
+    @staticmethod
+    def _flush():
+        """Stores the counters of the current process if they changed since they were last stored"""
+        with CacheStatistics._lock:
+            if CacheStatistics._unflushed > 0 and CacheStatistics._pid == os.getpid():
+                CacheStatistics._store_in_place() if CacheStatistics._is_worker else CacheStatistics._store()
+
+    @staticmethod
+    def _store():
+        CacheStatistics._unflushed, CacheStatistics._last_flush = 0, time.monotonic()
+        path = EnvironmentSettings.get_cache_statistics_path()
+        if path is None:
+            return
+
+        filename = path / f"{CacheStatistics._process_id}.json"
+        try:
+            path.mkdir(parents=True, exist_ok=True)
+            tmp_filename = path / f".{filename.name}.tmp"
+            tmp_filename.write_text(json.dumps(CacheStatistics._to_list(CacheStatistics._counters)))
+            os.replace(tmp_filename, filename)
+        except OSError as e:
+            logging.warning(f"CacheStatistics: could not store the cache statistics in {path}: {e}")
+
+    @staticmethod
+    def _store_in_place():
+        CacheStatistics._unflushed = 0
+        path = EnvironmentSettings.get_cache_statistics_path()
+        if path is None:
+            CacheStatistics._close_worker_file()
+            return
+
+        filename = path / f"{CacheStatistics._process_id}.json"
+        try:
+            if CacheStatistics._worker_file is None or CacheStatistics._worker_file[0] != filename:
+                CacheStatistics._close_worker_file()
+                path.mkdir(parents=True, exist_ok=True)
+                CacheStatistics._worker_file = filename, os.open(filename, os.O_WRONLY | os.O_CREAT, 0o644)
+            content = json.dumps(CacheStatistics._to_list(CacheStatistics._counters)).encode("utf-8")
+            os.pwrite(CacheStatistics._worker_file[1], content, 0)
+            os.ftruncate(CacheStatistics._worker_file[1], len(content))
+        except OSError as e:
+            logging.warning(f"CacheStatistics: could not store the cache statistics in {path}: {e}")
+
+    @staticmethod
+    def _close_worker_file():
+        if CacheStatistics._worker_file is not None:
+            try:
+                os.close(CacheStatistics._worker_file[1])
+            except OSError:
+                pass
+            CacheStatistics._worker_file = None
+
+    @staticmethod
+    def _to_list(counters: dict) -> list:
+        return [{"object_type": object_type, "call_site": call_site, **values} for (object_type, call_site), values in counters.items()]
+
+    @staticmethod
+    def _collect() -> dict:
+        """Returns the counters of the current process summed with the counters stored by the other processes"""
+        with CacheStatistics._lock:
+            own_filename = f"{CacheStatistics._process_id}.json"
+            collected = {key: dict(values) for key, values in CacheStatistics._counters.items()}
+
+        path = EnvironmentSettings.get_cache_statistics_path()
+        if path is not None and path.is_dir():
+            for filename in path.glob("*.json"):
+                if filename.name != own_filename:
+                    for entry in CacheStatistics._read_file(filename):
+                        counters = collected.setdefault((entry["object_type"], entry["call_site"]),
+                                                        {counter: 0 for counter in CacheStatistics.COUNTERS})
+                        for counter in CacheStatistics.COUNTERS:
+                            counters[counter] += entry[counter]
+
+        return collected
+
+    @staticmethod
+    def _read_file(filename: Path) -> list:
+        # the files of the worker processes are overwritten in place, so the end of the file can remain from a longer previous content
+        try:
+            return json.JSONDecoder().raw_decode(filename.read_text())[0]
+        except (OSError, ValueError):
+            return []
+
+    @staticmethod
+    def _add_rates(values: dict) -> dict:
+        lookups = values["memory_hits"] + values["disk_hits"] + values["misses"]
+        return {**values, "hit_rate": round((values["memory_hits"] + values["disk_hits"]) / lookups, 4) if lookups > 0 else None}
+
+    @staticmethod
+    def get_summary() -> dict:
+        """
+        Returns the statistics of all processes as a dict with the keys 'object_types' (the counters per object type), 'call_sites' (the
+        counters per object type and call site, ordered by object type and the number of lookups) and 'total'
+        """
+        collected = CacheStatistics._collect()
+
+        object_types, total = {}, {counter: 0 for counter in CacheStatistics.COUNTERS}
+        for (object_type, call_site), values in collected.items():
+            type_counters = object_types.setdefault(object_type, {counter: 0 for counter in CacheStatistics.COUNTERS})
+            for counter in CacheStatistics.COUNTERS:
+                type_counters[counter] += values[counter]
+                total[counter] += values[counter]
+
+        call_sites = sorted(CacheStatistics._to_list(collected),
+                            key=lambda entry: (entry["object_type"], -(entry["memory_hits"] + entry["disk_hits"] + entry["misses"])))
+
+        return {"object_types": {object_type: CacheStatistics._add_rates(values) for object_type, values in sorted(object_types.items())},
+                "call_sites": [CacheStatistics._add_rates(entry) for entry in call_sites],
+                "total": CacheStatistics._add_rates(total)}
+
+    @staticmethod
+    def export(filename: Path) -> Path:
+        """Stores the summary of the statistics (see get_summary()) as a JSON file"""
+        with filename.open("w") as file:
+            json.dump(CacheStatistics.get_summary(), file, indent=2)
+        return filename
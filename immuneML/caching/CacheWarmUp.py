@@ -0,0 +1,108 @@
+import copy
+import datetime
+import time
+from pathlib import Path
+
+from immuneML.caching.CacheObjectType import CacheObjectType
+from immuneML.caching.CacheStatistics import CacheStatistics
+from immuneML.dsl.ImmuneMLParser import ImmuneMLParser
+from immuneML.dsl.symbol_table.SymbolType import SymbolType
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.environment.LabelConfiguration import LabelConfiguration
+from immuneML.hyperparameter_optimization.HPSetting import HPSetting
+from immuneML.hyperparameter_optimization.core.HPUtil import HPUtil
+from immuneML.hyperparameter_optimization.states.TrainMLModelState import TrainMLModelState
+from immuneML.util.PathBuilder import PathBuilder
+from immuneML.workflows.instructions.TrainMLModelInstruction import TrainMLModelInstruction
+
+
+class CacheWarmUp:
+    """
+    Fills the persistent cache (see EnvironmentSettings.set_persistent_cache()) with the encodings needed by a TrainMLModel instruction without
+    training any models, so that the instruction can later be run with the cache already filled (e.g., precomputing during off-peak hours).
+
+    The dataset, the labels, the encodings and the number of processes are taken from the TrainMLModel instruction in the YAML specification.
+    Each encoding is applied to the full dataset, the same way as TrainMLModel applies it to the training datasets: with all labels and, if
+    there are multiple labels, with each label separately. This stores the per-example intermediate results which do not depend on the
+    split of the data, e.g., the k-mer frequencies of each repertoire computed by KmerFreqRepertoireEncoder, the Atchley factor k-mers of
+    AtchleyKmerEncoder, or the one-hot and evenness profile encodings of the repertoires. Since their cache keys depend only on the example
+    and the encoding parameters, they are reused both when encoding the training datasets and when encoding the test datasets (learn_model
+    set to False) of each split. The results which depend on the whole training dataset (e.g., ComparisonData) are stored for the full
+    dataset only. Settings with preprocessing are skipped, since their repertoires are
+    only created during the instruction.
+
+    Only the object types included in the persistent cache are kept after the warm-up; the report lists the number and size of the cached
+    objects per object type and if they were stored in the persistent cache.
+    """
+
+    @staticmethod
+    def run(specification_path: Path, result_path: Path, instruction_name: str = None) -> dict:
+        symbol_table, _ = ImmuneMLParser.parse_yaml_file(specification_path, result_path)
+        instruction = CacheWarmUp._get_instruction(symbol_table, instruction_name)
+        return CacheWarmUp.warm_up(instruction.state, result_path)
+
+    @staticmethod
+    def warm_up(state: TrainMLModelState, result_path: Path) -> dict:
+        EnvironmentSettings.set_cache_statistics_path(result_path / "cache_statistics")
+        CacheStatistics.reset()
+
+        report = {"dataset": state.dataset.name, "examples": state.dataset.get_example_count(),
+                  "persistent_object_types": [object_type.name for object_type in EnvironmentSettings.get_persistent_cache_object_types()],
+                  "encodings": []}
+        warmed_encodings = set()
+        for hp_setting in state.hp_settings:
+            if hp_setting.preproc_sequence is not None and len(hp_setting.preproc_sequence) > 0:
+                report["encodings"].append({"encoding": hp_setting.encoder_name,
+                                            "status": f"skipped (preprocessing {hp_setting.preproc_sequence_name})"})
+            elif hp_setting.encoder_name not in warmed_encodings:
+                warmed_encodings.add(hp_setting.encoder_name)
+                report["encodings"].append(CacheWarmUp._warm_up_encoding(hp_setting, state, result_path / "encodings" / hp_setting.encoder_name))
+
+        EnvironmentSettings.set_cache_statistics_path(None)
+        return report
+
+    @staticmethod
+    def _get_instruction(symbol_table, instruction_name: str) -> TrainMLModelInstruction:
+        instructions = {entry.symbol: entry.item for entry in symbol_table.get_by_type(SymbolType.INSTRUCTION)
+                        if isinstance(entry.item, TrainMLModelInstruction)}
+        if instruction_name is not None:
+            assert instruction_name in instructions, \
+                f"CacheWarmUp: TrainMLModel instruction {instruction_name} is not defined in the specification, " \
+                f"found TrainMLModel instructions: {list(instructions.keys())}."
+            return instructions[instruction_name]
+        assert len(instructions) == 1, f"CacheWarmUp: the specification has to include exactly one TrainMLModel instruction or the name of the " \
+                                       f"instruction has to be given, found TrainMLModel instructions: {list(instructions.keys())}."
+        return list(instructions.values())[0]
+
+    @staticmethod
+    def _warm_up_encoding(hp_setting: HPSetting, state: TrainMLModelState, path: Path) -> dict:
+        print(f"{datetime.datetime.now()}: CacheWarmUp: encoding the dataset {state.dataset.name} with {hp_setting.encoder_name}...", flush=True)
+
+        label_configs = [state.label_configuration]
+        if state.label_configuration.get_label_count() > 1:
+            label_configs += [LabelConfiguration([state.label_configuration.get_label_object(label)])
+                              for label in state.label_configuration.get_labels_by_name()]
+
+        before = CacheStatistics.get_summary()["object_types"]
+        start = time.time()
+        for index, label_config in enumerate(label_configs):
+            HPUtil.encode_dataset(state.dataset, copy.deepcopy(hp_setting), PathBuilder.build(path / f"labels_{index + 1}"), learn_model=True,
+                                  context=state.context, number_of_processes=state.number_of_processes, label_configuration=label_config)
+
+        return {"encoding": hp_setting.encoder_name, "status": "done", "seconds": round(time.time() - start, 2),
+                "labels": [label_config.get_labels_by_name() for label_config in label_configs],
+                "cached_objects": CacheWarmUp._get_cached_objects(before, CacheStatistics.get_summary()["object_types"])}
+
+    @staticmethod
+    def _get_cached_objects(before: dict, after: dict) -> dict:
+        persistent_object_types = EnvironmentSettings.get_persistent_cache_object_types()
+        cached_objects = {}
+        for object_type, counters in after.items():
+            previous = before.get(object_type, {})
+            new_counters = {counter: counters[counter] - previous.get(counter, 0)
+                            for counter in ["writes", "bytes_written", "memory_hits", "disk_hits"]}
+            if any(value > 0 for value in new_counters.values()):
+                cached_objects[object_type.lower()] = {"written": new_counters["writes"], "bytes_written": new_counters["bytes_written"],
+                                                       "already_cached": new_counters["memory_hits"] + new_counters["disk_hits"],
+                                                       "persistent": CacheObjectType[object_type] in persistent_object_types}
+        return cached_objects
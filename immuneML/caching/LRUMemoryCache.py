@@ -0,0 +1,116 @@
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+class LRUMemoryCache:
+    """
+    In-memory key-value cache with a budget in bytes and least-recently-used eviction: when adding an object would exceed the budget, the
+    objects which were not accessed for the longest time are removed until the new object fits. Objects larger than the budget are not
+    cached. The cache is thread-safe and counts hits, misses and evictions, which can be obtained with get_stats().
+
+    The size of the objects is estimated by estimate_size() unless it is given explicitly when the object is added.
+    """
+
+    SIZE_SAMPLE = 1000
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._current_bytes = 0
+        self._lock = threading.RLock()
+        self.hits, self.misses, self.evictions = 0, 0, 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            else:
+                self.misses += 1
+                return default
+
+    def contains(self, key) -> bool:
+        """Checks if the key is in the cache without counting it as a hit or a miss or changing the order of eviction"""
+        with self._lock:
+            return key in self._entries
+
+    def put(self, key, value, size: int = None) -> bool:
+        """Adds the object to the cache and returns True if the object was cached, or False if the object is larger than the budget"""
+        size = LRUMemoryCache.estimate_size(value) if size is None else size
+        with self._lock:
+            self.remove(key)
+            if size > self.max_bytes:
+                return False
+            self._evict(self.max_bytes - size)
+            self._entries[key] = (value, size)
+            self._current_bytes += size
+            return True
+
+    def remove(self, key):
+        with self._lock:
+            if key in self._entries:
+                self._current_bytes -= self._entries.pop(key)[1]
+
+    def remove_if(self, condition):
+        """Removes all objects for which condition(key) is True"""
+        with self._lock:
+            for key in [key for key in self._entries if condition(key)]:
+                self.remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+
+    def set_max_bytes(self, max_bytes: int):
+        with self._lock:
+            self.max_bytes = max_bytes
+            self._evict(max_bytes)
+
+    def _evict(self, target_bytes: int):
+        while self._current_bytes > target_bytes and len(self._entries) > 0:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._current_bytes -= size
+            self.evictions += 1
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "entries": len(self._entries),
+                    "bytes": self._current_bytes, "max_bytes": self.max_bytes}
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits, self.misses, self.evictions = 0, 0, 0
+
+    @staticmethod
+    def estimate_size(obj) -> int:
+        """
+        Estimates the memory used by the object: for numpy arrays of objects (including structured arrays with object fields) the size of the
+        elements is estimated from a sample of at most SIZE_SAMPLE elements per field; dictionaries, lists and tuples are measured recursively
+        """
+        if isinstance(obj, np.ndarray):
+            size = obj.nbytes
+            if obj.dtype.names is not None:
+                size += sum(LRUMemoryCache._estimate_object_elements(obj[name]) for name in obj.dtype.names if obj.dtype[name].hasobject)
+            elif obj.dtype.hasobject:
+                size += LRUMemoryCache._estimate_object_elements(obj)
+            return size
+        elif isinstance(obj, dict):
+            return sys.getsizeof(obj) + sum(LRUMemoryCache.estimate_size(key) + LRUMemoryCache.estimate_size(value) for key, value in obj.items())
+        elif isinstance(obj, (list, tuple)):
+            return sys.getsizeof(obj) + sum(LRUMemoryCache.estimate_size(element) for element in obj)
+        else:
+            return sys.getsizeof(obj)
+
+    @staticmethod
+    def _estimate_object_elements(array: np.ndarray) -> int:
+        elements = array.ravel()
+        if elements.shape[0] == 0:
+            return 0
+        step = max(1, elements.shape[0] // LRUMemoryCache.SIZE_SAMPLE)
+        sample = elements[::step]
+        return int(sum(sys.getsizeof(element) for element in sample) * elements.shape[0] / sample.shape[0])
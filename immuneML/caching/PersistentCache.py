@@ -0,0 +1,124 @@
+import logging
+import sqlite3
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from immuneML.caching.CacheLock import CacheLock
+from immuneML.caching.CacheObjectType import CacheObjectType
+
+
+class PersistentCache:
+    """
+    Manages the manifest of the persistent cache (see EnvironmentSettings.set_persistent_cache()): an SQLite database in the cache folder
+    which lists the cached files with their object type, size, the time they were created and last accessed, and the number of accesses.
+    CacheHandler records each file it adds to or loads from the persistent cache, and prune() removes the least recently accessed files when
+    the cache exceeds its size budget. Files which are not in the manifest (e.g., if recording failed) are added to it with their modification
+    time as the last access time by synchronize(). Hidden files (temporary files and lock files of CacheHandler) are not part of the manifest.
+
+    The manifest can be used by multiple processes at the same time; if recording an access fails, a warning is logged and the run continues.
+    """
+
+    MANIFEST_NAME = "manifest.sqlite"
+    TIMEOUT = 60
+
+    @staticmethod
+    def _connect(cache_path: Path) -> sqlite3.Connection:
+        connection = sqlite3.connect(str(cache_path / PersistentCache.MANIFEST_NAME), timeout=PersistentCache.TIMEOUT)
+        connection.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, object_type TEXT, size INTEGER, created REAL, "
+                           "last_access REAL, access_count INTEGER)")
+        return connection
+
+    @staticmethod
+    def _execute(cache_path: Path, statements: list):
+        try:
+            connection = PersistentCache._connect(cache_path)
+            try:
+                with connection:
+                    for statement, parameters in statements:
+                        connection.execute(statement, parameters)
+            finally:
+                connection.close()
+        except sqlite3.Error as e:
+            logging.warning(f"PersistentCache: could not update the manifest of the cache in {cache_path}: {e}")
+
+    @staticmethod
+    def _get_key(filename: Path, cache_path: Path) -> str:
+        return filename.relative_to(cache_path).as_posix()
+
+    @staticmethod
+    def record_add(filename: Path, object_type: CacheObjectType, cache_path: Path):
+        now = time.time()
+        PersistentCache._execute(cache_path, [("INSERT INTO entries VALUES (?, ?, ?, ?, ?, 0) ON CONFLICT(key) DO UPDATE SET size = excluded.size, "
+                                               "last_access = excluded.last_access",
+                                               (PersistentCache._get_key(filename, cache_path), object_type.name, filename.stat().st_size, now,
+                                                now))])
+
+    @staticmethod
+    def record_access(filename: Path, object_type: CacheObjectType, cache_path: Path):
+        now = time.time()
+        PersistentCache._execute(cache_path, [("INSERT INTO entries VALUES (?, ?, ?, ?, ?, 1) ON CONFLICT(key) DO UPDATE SET "
+                                               "last_access = excluded.last_access, access_count = access_count + 1",
+                                               (PersistentCache._get_key(filename, cache_path), object_type.name, filename.stat().st_size,
+                                                filename.stat().st_mtime, now))])
+
+    @staticmethod
+    def synchronize(cache_path: Path):
+        """Adds the cached files missing from the manifest and removes the entries of the files which no longer exist"""
+        entries = PersistentCache.get_entries(cache_path, synchronize=False)
+        known_keys = set(entries["key"])
+        files = {PersistentCache._get_key(filename, cache_path): (object_type, filename)
+                 for object_type in CacheObjectType for filename in (cache_path / object_type.name.lower()).glob("*")
+                 if filename.is_file() and not filename.name.startswith(".")}
+
+        statements = [("DELETE FROM entries WHERE key = ?", (key,)) for key in known_keys if key not in files]
+        for key, (object_type, filename) in files.items():
+            if key not in known_keys:
+                stat = filename.stat()
+                statements.append(("INSERT OR IGNORE INTO entries VALUES (?, ?, ?, ?, ?, 0)",
+                                   (key, object_type.name, stat.st_size, stat.st_mtime, stat.st_mtime)))
+        PersistentCache._execute(cache_path, statements)
+
+    @staticmethod
+    def get_entries(cache_path: Path, synchronize: bool = True) -> pd.DataFrame:
+        """Returns the manifest as a data frame with one row per cached file, ordered from the least to the most recently accessed file"""
+        if synchronize:
+            PersistentCache.synchronize(cache_path)
+        connection = PersistentCache._connect(cache_path)
+        try:
+            return pd.read_sql_query("SELECT * FROM entries ORDER BY last_access", connection)
+        finally:
+            connection.close()
+
+    @staticmethod
+    def prune(cache_path: Path, max_bytes: int = None, max_age_days: float = None) -> dict:
+        """
+        Removes the cached files not accessed in the last max_age_days days and then the least recently accessed files until the total size of
+        the cache is at most max_bytes; the lock files of CacheHandler which are not used by any process are removed as well
+
+        Returns:
+            a dict with the number of removed files and their total size in bytes
+        """
+        entries = PersistentCache.get_entries(cache_path)
+        to_remove = entries["last_access"] < time.time() - max_age_days * 24 * 3600 if max_age_days is not None \
+            else pd.Series(False, index=entries.index)
+        if max_bytes is not None:
+            size_from_newest = entries["size"].where(~to_remove, 0)[::-1].cumsum()[::-1]
+            to_remove = to_remove | (size_from_newest > max_bytes)
+
+        removed = entries[to_remove]
+        for key in removed["key"]:
+            if (cache_path / key).is_file():
+                (cache_path / key).unlink()
+        PersistentCache._execute(cache_path, [("DELETE FROM entries WHERE key = ?", (key,)) for key in removed["key"]])
+
+        for object_type in CacheObjectType:
+            if (cache_path / object_type.name.lower()).is_dir():
+                CacheLock.remove_unused(cache_path / object_type.name.lower())
+
+        return {"removed_files": int(removed.shape[0]), "removed_bytes": int(removed["size"].sum())}
+
+    @staticmethod
+    def clear(cache_path: Path) -> dict:
+        return PersistentCache.prune(cache_path, max_bytes=0)
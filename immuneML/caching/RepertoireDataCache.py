@@ -0,0 +1,71 @@
+import os
+from pathlib import Path
+
+from immuneML.caching.LRUMemoryCache import LRUMemoryCache
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+
+
+class RepertoireDataCache:
+    """
+    Process-wide in-memory cache of the repertoire data loaded from disk, shared by all Repertoire objects. The data is cached per data file
+    (and per column for the storage formats which support reading individual columns), so that multiple accessors on the same repertoire
+    (e.g., get_sequence_identifiers() followed by load_data()) read the file only once.
+
+    The total size of the cached data is limited by the budget set in EnvironmentSettings (see
+    EnvironmentSettings.set_repertoire_cache_size()); when the budget is exceeded, the least recently used data is evicted. Each process
+    (e.g., each worker of a multiprocessing pool) has its own cache with the same budget. Setting the budget to 0 disables the cache.
+    """
+
+    _cache = None
+
+    @staticmethod
+    def _get_cache() -> LRUMemoryCache:
+        max_bytes = EnvironmentSettings.get_repertoire_cache_size()
+        if RepertoireDataCache._cache is None:
+            RepertoireDataCache._cache = LRUMemoryCache(max_bytes)
+        elif RepertoireDataCache._cache.max_bytes != max_bytes:
+            RepertoireDataCache._cache.set_max_bytes(max_bytes)
+        return RepertoireDataCache._cache
+
+    @staticmethod
+    def _build_key(data_filename: Path, column=None):
+        try:
+            stat = os.stat(data_filename)
+        except OSError:
+            return None
+        return str(data_filename), stat.st_mtime_ns, stat.st_size, column
+
+    @staticmethod
+    def get(data_filename: Path, column=None):
+        """Returns the cached data (or the column of the data) from the file or None if it is not in the cache"""
+        key = RepertoireDataCache._build_key(data_filename, column)
+        return RepertoireDataCache._get_cache().get(key) if key is not None else None
+
+    @staticmethod
+    def contains(data_filename: Path, column=None) -> bool:
+        key = RepertoireDataCache._build_key(data_filename, column)
+        return key is not None and RepertoireDataCache._get_cache().contains(key)
+
+    @staticmethod
+    def add(data_filename: Path, data, column=None):
+        key = RepertoireDataCache._build_key(data_filename, column)
+        if key is not None:
+            RepertoireDataCache._get_cache().put(key, data)
+
+    @staticmethod
+    def remove(data_filename: Path):
+        """Removes all data cached for the file"""
+        RepertoireDataCache._get_cache().remove_if(lambda key: key[0] == str(data_filename))
+
+    @staticmethod
+    def clear():
+        RepertoireDataCache._get_cache().clear()
+
+    @staticmethod
+    def get_stats() -> dict:
+        """Returns the number of hits, misses, evictions and cached entries, and the current size and the budget of the cache in bytes"""
+        return RepertoireDataCache._get_cache().get_stats()
+
+    @staticmethod
+    def reset_stats():
+        RepertoireDataCache._get_cache().reset_stats()
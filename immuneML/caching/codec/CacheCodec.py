@@ -0,0 +1,27 @@
+import abc
+from pathlib import Path
+
+
+class CacheCodec(metaclass=abc.ABCMeta):
+    """
+    Defines how the objects of a given kind are stored in the cache files of :py:obj:`~immuneML.caching.CacheHandler.CacheHandler`. The
+    codec of a cached object is chosen automatically when the object is added to the cache and is recognized by the file extension when the
+    object is loaded.
+    """
+
+    EXTENSION = None
+
+    @staticmethod
+    @abc.abstractmethod
+    def can_write(obj) -> bool:
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    def write(filename: Path, obj):
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    def read(filename: Path):
+        pass
@@ -0,0 +1,14 @@
+from pathlib import Path
+
+from immuneML.caching.codec.PickleCacheCodec import PickleCacheCodec
+
+
+class LZ4PickleCacheCodec(PickleCacheCodec):
+    """Stores any object with dill and compresses the file with LZ4, which is very fast; requires the optional dependency lz4"""
+
+    EXTENSION = ".pickle.lz4"
+
+    @staticmethod
+    def _open(filename: Path, mode: str):
+        import lz4.frame
+        return lz4.frame.open(filename, mode)
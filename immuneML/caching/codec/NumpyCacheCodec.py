@@ -0,0 +1,27 @@
+from pathlib import Path
+
+import numpy as np
+
+from immuneML.caching.codec.CacheCodec import CacheCodec
+
+
+class NumpyCacheCodec(CacheCodec):
+    """
+    Stores numpy arrays without object elements in .npy format; the arrays are memory-mapped when loaded, so only the parts of the array which
+    are accessed are read from disk. The mapping is copy-on-write: the loaded array can be modified without changing the cache file.
+    """
+
+    EXTENSION = ".npy"
+
+    @staticmethod
+    def can_write(obj) -> bool:
+        return type(obj) is np.ndarray and not obj.dtype.hasobject and obj.size > 0
+
+    @staticmethod
+    def write(filename: Path, obj):
+        with filename.open("wb") as file:
+            np.save(file, obj, allow_pickle=False)
+
+    @staticmethod
+    def read(filename: Path):
+        return np.load(filename, mmap_mode="c", allow_pickle=False)
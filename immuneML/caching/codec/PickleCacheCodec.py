@@ -0,0 +1,30 @@
+import pickle
+from pathlib import Path
+
+import dill
+
+from immuneML.caching.codec.CacheCodec import CacheCodec
+
+
+class PickleCacheCodec(CacheCodec):
+    """Stores any object with dill; this is the codec for all objects which do not have a specialized codec"""
+
+    EXTENSION = ".pickle"
+
+    @staticmethod
+    def can_write(obj) -> bool:
+        return True
+
+    @classmethod
+    def write(cls, filename: Path, obj):
+        with cls._open(filename, "wb") as file:
+            dill.dump(obj, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def read(cls, filename: Path):
+        with cls._open(filename, "rb") as file:
+            return dill.load(file)
+
+    @staticmethod
+    def _open(filename: Path, mode: str):
+        return filename.open(mode)
@@ -0,0 +1,25 @@
+from pathlib import Path
+
+from scipy import sparse
+
+from immuneML.caching.codec.CacheCodec import CacheCodec
+
+
+class SparseCacheCodec(CacheCodec):
+    """Stores scipy sparse matrices (e.g., k-mer frequencies) in the uncompressed .npz format of scipy, which keeps only the nonzero values"""
+
+    EXTENSION = ".npz"
+    FORMATS = ("csr", "csc", "coo", "bsr", "dia")
+
+    @staticmethod
+    def can_write(obj) -> bool:
+        return sparse.issparse(obj) and obj.format in SparseCacheCodec.FORMATS
+
+    @staticmethod
+    def write(filename: Path, obj):
+        with filename.open("wb") as file:
+            sparse.save_npz(file, obj, compressed=False)
+
+    @staticmethod
+    def read(filename: Path):
+        return sparse.load_npz(filename)
@@ -0,0 +1,17 @@
+from pathlib import Path
+
+from immuneML.caching.codec.PickleCacheCodec import PickleCacheCodec
+
+
+class ZstdPickleCacheCodec(PickleCacheCodec):
+    """
+    Stores any object with dill and compresses the file with Zstandard, which compresses better than LZ4 at a similar speed; requires the
+    optional dependency zstandard
+    """
+
+    EXTENSION = ".pickle.zst"
+
+    @staticmethod
+    def _open(filename: Path, mode: str):
+        import zstandard
+        return zstandard.open(filename, mode)
@@ -3,6 +3,8 @@ import abc
 
 class DatasetItem(metaclass=abc.ABCMeta):
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def get_attribute(self, name: str):
         pass
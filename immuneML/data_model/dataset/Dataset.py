@@ -32,6 +32,10 @@ class Dataset:
     def get_example_ids(self):
         pass
 
+    @abc.abstractmethod
+    def get_fingerprint(self) -> str:
+        pass
+
     @abc.abstractmethod
     def get_label_names(self):
         pass
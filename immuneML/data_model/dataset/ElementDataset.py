@@ -3,6 +3,8 @@ from uuid import uuid4
 from immuneML.data_model.dataset.Dataset import Dataset
 from immuneML.data_model.encoded_data.EncodedData import EncodedData
 from immuneML.data_model.receptor.ElementGenerator import ElementGenerator
+from immuneML.environment.SequenceType import SequenceType
+from immuneML.util.SequenceMatrixHelper import SequenceMatrixHelper
 
 
 class ElementDataset(Dataset):
@@ -23,15 +25,46 @@ class ElementDataset(Dataset):
         self.element_ids = None
         self.name = name
 
-    def get_data(self, batch_size: int = 10000):
+    def get_data(self, batch_size: int = 10000, prefetch_count: int = None):
+        """
+        Returns a generator of the examples in the dataset; if prefetch_count is set (or set in EnvironmentSettings.set_prefetch_count()),
+        the next prefetch_count batch files are read on a background thread while the examples from the current file are processed
+        """
         self._filenames.sort()
         self.element_generator.file_list = self._filenames
-        return self.element_generator.build_element_generator()
+        return self.element_generator.build_element_generator(prefetch_count)
 
-    def get_batch(self, batch_size: int = 10000):
+    def get_batch(self, batch_size: int = 10000, prefetch_count: int = None):
         self._filenames.sort()
         self.element_generator.file_list = self._filenames
-        return self.element_generator.build_batch_generator()
+        return self.element_generator.build_batch_generator(prefetch_count)
+
+    def get_sequence_matrix(self, sequence_type: SequenceType = None, chain: str = None):
+        """
+        Returns the sequences of all examples in the dataset as an integer-coded, padded uint8 matrix and a vector of sequence lengths (see
+        :py:obj:`~immuneML.util.SequenceMatrixHelper.SequenceMatrixHelper` for the coding). For each batch file, the matrix is memory-mapped
+        from disk if it was stored when the dataset was built, otherwise it is computed from the sequences.
+
+        Args:
+            sequence_type: amino acid or nucleotide sequences; if not set, the sequence type from EnvironmentSettings is used
+            chain: for receptor datasets, the name of the chain (as returned by the receptor's get_chains(), e.g., 'alpha') to return the
+                sequences for; not used for sequence datasets
+
+        Returns:
+            a tuple of the matrix of shape (number of examples, maximum sequence length) and the lengths vector
+        """
+        self._filenames.sort()
+        self.element_generator.file_list = self._filenames
+
+        matrices = []
+        for index, filename in enumerate(self._filenames):
+            matrix = SequenceMatrixHelper.load(filename, sequence_type, chain)
+            if matrix is None:
+                batch = self.element_generator._load_batch(index)
+                matrix = SequenceMatrixHelper.encode([(element.get_chain(chain) if chain is not None else element).get_sequence(sequence_type)
+                                                      for element in batch], sequence_type)
+            matrices.append(matrix)
+        return SequenceMatrixHelper.concatenate(matrices)
 
     def get_filenames(self):
         return self._filenames
@@ -40,15 +73,23 @@ class ElementDataset(Dataset):
         self._filenames = filenames
 
     def get_example_count(self):
-        return len(self.get_example_ids())
+        self._filenames.sort()
+        self.element_generator.file_list = self._filenames
+        return self.element_generator.get_element_count()
 
     def get_example_ids(self):
         if self.element_ids is None or (isinstance(self.element_ids, list) and len(self.element_ids) == 0):
-            self.element_ids = []
-            for element in self.get_data():
-                self.element_ids.append(element.identifier)
+            self._filenames.sort()
+            self.element_generator.file_list = self._filenames
+            self.element_ids = self.element_generator.get_identifiers()
         return self.element_ids
 
+    def get_fingerprint(self) -> str:
+        """Returns the content fingerprint of the dataset computed from the fingerprints of the batch files, used to build cache keys"""
+        self._filenames.sort()
+        self.element_generator.file_list = self._filenames
+        return self.element_generator.get_fingerprint()
+
     def make_subset(self, example_indices, path, dataset_type: str):
         """
         Creates a new dataset object with only those examples (receptors or receptor sequences) available which were given by index in example_indices argument.
@@ -64,6 +105,8 @@ class ElementDataset(Dataset):
 
         """
         new_dataset = self.__class__(labels=self.labels, file_size=self.file_size)
+        self._filenames.sort()
+        self.element_generator.file_list = self._filenames
         batch_filenames = self.element_generator.make_subset(example_indices, path, dataset_type, new_dataset.identifier)
         new_dataset.set_filenames(batch_filenames)
         new_dataset.name = f"{self.name}_split_{dataset_type.lower()}"
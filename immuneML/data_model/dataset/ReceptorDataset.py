@@ -1,7 +1,6 @@
 import copy
 import logging
 import math
-import pickle
 from pathlib import Path
 from typing import List
 
@@ -9,6 +8,7 @@ import pandas as pd
 
 from immuneML.data_model.dataset.ElementDataset import ElementDataset
 from immuneML.data_model.receptor.Receptor import Receptor
+from immuneML.data_model.receptor.ElementBatchFile import ElementBatchFile
 
 
 class ReceptorDataset(ElementDataset):
@@ -23,8 +23,7 @@ class ReceptorDataset(ElementDataset):
                       for index in range(1, file_count+1)]
 
         for index in range(file_count):
-            with file_names[index].open("wb") as file:
-                pickle.dump(receptors[index*file_size:(index+1)*file_size], file)
+            ElementBatchFile.write(file_names[index], receptors[index*file_size:(index+1)*file_size])
 
         return ReceptorDataset(filenames=file_names, file_size=file_size, name=name)
 
@@ -7,8 +7,13 @@ import pandas as pd
 
 from immuneML.data_model.dataset.Dataset import Dataset
 from immuneML.data_model.encoded_data.EncodedData import EncodedData
+from immuneML.data_model.repertoire.CategoricalVocabulary import CategoricalVocabulary
 from immuneML.data_model.repertoire.Repertoire import Repertoire
 from immuneML.environment.Constants import Constants
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.FingerprintHelper import FingerprintHelper
+from immuneML.util.PathBuilder import PathBuilder
+from immuneML.util.PrefetchHelper import PrefetchHelper
 
 
 class RepertoireDataset(Dataset):
@@ -18,12 +23,91 @@ class RepertoireDataset(Dataset):
         super().__init__(encoded_data, name, identifier if identifier is not None else uuid.uuid4().hex, labels)
         self.metadata_file = metadata_file
         self.metadata_fields = None
-        self.repertoire_ids = None
         self.repertoires = repertoires
+        self.categorical_vocabularies = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_metadata_cache"] = None
+        state["_repertoire_index"] = None
+        return state
+
+    def __setstate__(self, state):
+        for attribute in ["metadata_file", "repertoires"]:
+            if attribute in state:
+                state[f"_{attribute}"] = state.pop(attribute)
+        state.setdefault("_metadata", None)
+        state.setdefault("_metadata_stored", True)
+        state.setdefault("_metadata_cache", None)
+        state.setdefault("_repertoire_index", None)
+        self.__dict__.update(state)
+
+    @property
+    def repertoires(self) -> list:
+        return self._repertoires
+
+    @repertoires.setter
+    def repertoires(self, repertoires: list):
+        self._repertoires = repertoires
+        self.repertoire_ids = None
+        self._repertoire_index = None
+
+    @property
+    def metadata_file(self) -> Path:
+        """
+        The path to the metadata file. The metadata of the datasets created by make_subset() is kept in memory and written to the file only
+        when this property is accessed for the first time (e.g., when the dataset is exported); to get the path without writing the file,
+        use metadata_path instead.
+        """
+        if not self._metadata_stored:
+            self._store_metadata()
+        return self._metadata_file
+
+    @metadata_file.setter
+    def metadata_file(self, metadata_file: Path):
+        self._metadata_file = metadata_file
+        self._metadata = None
+        self._metadata_stored = True
+        self._metadata_cache = None
+
+    @property
+    def metadata_path(self) -> Path:
+        """The path to the metadata file, which might not be written yet for the datasets created by make_subset()"""
+        return self._metadata_file
+
+    def _store_metadata(self):
+        PathBuilder.build(self._metadata_file.parent)
+        self._metadata.to_csv(self._metadata_file, index=False)
+        self._metadata_stored = True
+
+    def _get_metadata_frame(self) -> pd.DataFrame:
+        """
+        Returns the metadata of all repertoires; the metadata file is parsed once and parsed again only when the file changes (its modification
+        time or size is different), and for the datasets created by make_subset() the metadata is kept in memory. The returned frame is shared
+        and must not be modified.
+        """
+        if self._metadata is not None:
+            return self._metadata
+
+        assert isinstance(self._metadata_file, Path) and self._metadata_file.is_file(), \
+            f"RepertoireDataset: for dataset {self.name} (id: {self.identifier}) metadata file is not set properly. The metadata file points to " \
+            f"{self._metadata_file}."
+
+        stat = self._metadata_file.stat()
+        key = (str(self._metadata_file), stat.st_mtime_ns, stat.st_size)
+        if self._metadata_cache is None or self._metadata_cache[0] != key:
+            self._metadata_cache = key, pd.read_csv(self._metadata_file, sep=",", comment=Constants.COMMENT_SIGN)
+        return self._metadata_cache[1]
 
     def clone(self):
-        return RepertoireDataset(self.labels, copy.deepcopy(self.encoded_data), copy.deepcopy(self.repertoires),
-                                 metadata_file=self.metadata_file, name=self.name)
+        """
+        Returns a new dataset with the same repertoires and metadata; the repertoire objects are shared with this dataset (they are not
+        modified after creation, processing steps create new repertoires instead), while the list of repertoires is copied
+        """
+        dataset = RepertoireDataset(self.labels, copy.deepcopy(self.encoded_data), list(self.repertoires), metadata_file=self._metadata_file,
+                                    name=self.name)
+        dataset._metadata, dataset._metadata_stored = self._metadata, self._metadata_stored
+        return dataset
 
     def add_encoded_data(self, encoded_data: EncodedData):
         self.encoded_data = encoded_data
@@ -34,10 +118,52 @@ class RepertoireDataset(Dataset):
     def get_batch(self, batch_size: int = 1):
         return self.repertoires
 
+    def iterate_repertoires(self, prefetch_count: int = None):
+        """
+        Yields the repertoires in the dataset one by one. If prefetch_count is set (or set in EnvironmentSettings.set_prefetch_count()), the
+        data of the next prefetch_count repertoires is loaded into the :py:obj:`~immuneML.caching.RepertoireDataCache.RepertoireDataCache` on
+        a background thread while the current repertoire is processed; the cache must be large enough to hold the prefetched repertoires for
+        this to have an effect.
+        """
+        prefetch_count = EnvironmentSettings.get_prefetch_count() if prefetch_count is None else prefetch_count
+        if prefetch_count > 0:
+            yield from PrefetchHelper.iterate(self.repertoires, RepertoireDataset._prefetch_repertoire, prefetch_count)
+        else:
+            yield from self.repertoires
+
+    @staticmethod
+    def _prefetch_repertoire(repertoire: Repertoire) -> Repertoire:
+        repertoire.load_data()
+        return repertoire
+
     def get_repertoire(self, index: int = -1, repertoire_identifier: str = "") -> Repertoire:
         assert index != -1 or repertoire_identifier != "", \
             "RepertoireDataset: cannot import_dataset repertoire since the index nor identifier are set."
-        return self.repertoires[index] if index != -1 else [rep for rep in self.repertoires if rep.identifier == repertoire_identifier][0]
+        if index != -1:
+            return self.repertoires[index]
+
+        if self._repertoire_index is None:
+            self._repertoire_index = {}
+            for position, repertoire in enumerate(self.repertoires):
+                self._repertoire_index.setdefault(repertoire.identifier, position)
+        return self.repertoires[self._repertoire_index[repertoire_identifier]]
+
+    def get_categorical_vocabulary(self, field: str, refresh: bool = False) -> CategoricalVocabulary:
+        """
+        Returns the vocabulary of all values of a categorical sequence field (e.g., v_genes, j_genes, chains, region_types) across all repertoires
+        in the dataset, so that the field can be represented by integer codes which are comparable between repertoires
+        (see :py:obj:`~immuneML.data_model.repertoire.Repertoire.Repertoire.get_categorical_codes`). The vocabulary is computed once and
+        recomputed only if the repertoires in the dataset change or if refresh=True.
+        """
+        repertoire_ids = tuple(repertoire.identifier for repertoire in self.repertoires)
+        vocabularies = getattr(self, "categorical_vocabularies", None)
+        if vocabularies is None or refresh or vocabularies["repertoire_ids"] != repertoire_ids:
+            self.categorical_vocabularies = vocabularies = {"repertoire_ids": repertoire_ids}
+
+        if field not in vocabularies:
+            vocabularies[field] = CategoricalVocabulary(field, [value for repertoire in self.repertoires
+                                                                for value in repertoire.get_unique_values(field)])
+        return vocabularies[field]
 
     def get_example_count(self):
         return len(self.repertoires)
@@ -45,8 +171,7 @@ class RepertoireDataset(Dataset):
     def get_metadata_fields(self, refresh=False):
         """Returns the list of metadata fields, includes also the fields that will typically not be used as labels, like filename or identifier"""
         if self.metadata_fields is None or refresh:
-            df = pd.read_csv(self.metadata_file, sep=",", nrows=0, comment=Constants.COMMENT_SIGN)
-            self.metadata_fields = df.columns.values.tolist()
+            self.metadata_fields = self._get_metadata_frame().columns.values.tolist()
         return self.metadata_fields
 
     def get_label_names(self, refresh=False):
@@ -72,11 +197,15 @@ class RepertoireDataset(Dataset):
             a dictionary where keys are fields names and values are lists of field values for each repertoire; alternatively returns the same information in dataframe format
 
         """
-        assert isinstance(self.metadata_file, Path) and self.metadata_file.is_file(), \
-            f"RepertoireDataset: for dataset {self.name} (id: {self.identifier}) metadata file is not set properly. The metadata file points to " \
-            f"{self.metadata_file}."
+        metadata = self._get_metadata_frame()
+        if field_names is None:
+            df = metadata.copy()
+        else:
+            missing_fields = [field for field in field_names if field not in metadata.columns]
+            if len(missing_fields) > 0:
+                raise ValueError(f"RepertoireDataset: metadata fields {missing_fields} are not present in the metadata of dataset {self.name}.")
+            df = metadata[[column for column in metadata.columns if column in field_names]].copy()
 
-        df = pd.read_csv(self.metadata_file, sep=",", usecols=field_names, comment=Constants.COMMENT_SIGN)
         if return_df:
             return df
         else:
@@ -86,18 +215,11 @@ class RepertoireDataset(Dataset):
         """Returns the paths to files in which repertoire information is stored"""
         return [Path(filename) for filename in self.get_metadata(["filename"])["filename"]]
 
-    def _build_new_metadata(self, indices, path: Path) -> Path:
-        if self.metadata_file:
-            df = pd.read_csv(self.metadata_file, comment=Constants.COMMENT_SIGN)
-            df = df.iloc[indices, :]
-            df.to_csv(path, index=False)
-            return path
-        else:
-            return None
-
     def make_subset(self, example_indices, path: Path, dataset_type: str):
         """
         Creates a new dataset object with only those examples (repertoires) available which were given by index in example_indices argument.
+        The repertoire objects are shared with this dataset, and the metadata of the new dataset is kept in memory and written to
+        path / f"{dataset_type}_metadata.csv" only when the metadata file is accessed (see metadata_file).
 
         Args:
             example_indices (list): a list of indices of examples (repertoires) to use in the new dataset
@@ -110,9 +232,12 @@ class RepertoireDataset(Dataset):
 
         """
 
-        metadata_file = self._build_new_metadata(example_indices, path / f"{dataset_type}_metadata.csv")
         new_dataset = RepertoireDataset(repertoires=[self.repertoires[i] for i in example_indices], labels=copy.deepcopy(self.labels),
-                                        metadata_file=metadata_file, identifier=str(uuid.uuid1()))
+                                        identifier=str(uuid.uuid1()))
+        if self._metadata_file is not None:
+            new_dataset._metadata_file = path / f"{dataset_type}_metadata.csv"
+            new_dataset._metadata = self._get_metadata_frame().iloc[example_indices, :].reset_index(drop=True)
+            new_dataset._metadata_stored = False
 
         return new_dataset
 
@@ -125,3 +250,17 @@ class RepertoireDataset(Dataset):
     def get_example_ids(self):
         """Returns a list of example identifiers"""
         return self.get_repertoire_ids()
+
+    def get_fingerprint(self) -> str:
+        """
+        Returns the content fingerprint of the dataset, which is derived from the identifiers and fingerprints of the repertoires and from the
+        metadata (without the file locations); unlike the dataset identifier, it is the same for different dataset objects with the same
+        repertoires (e.g., for the same split in different runs) and changes when the repertoires change, so it is used to build cache keys
+        """
+        if self._metadata is not None or (isinstance(self._metadata_file, Path) and self._metadata_file.is_file()):
+            metadata = self._get_metadata_frame()
+            metadata_fingerprint = FingerprintHelper.fingerprint_frame(metadata[[column for column in metadata.columns if column != "filename"]])
+        else:
+            metadata_fingerprint = None
+        return FingerprintHelper.fingerprint_values([metadata_fingerprint] + [f"{repertoire.identifier}:{repertoire.get_fingerprint()}"
+                                                                              for repertoire in self.repertoires])
@@ -6,6 +6,8 @@ from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import Rece
 
 class BCKReceptor(Receptor):
 
+    __slots__ = ("heavy", "kappa", "metadata", "identifier")
+
     def __init__(self, heavy: ReceptorSequence = None, kappa: ReceptorSequence = None, metadata: dict = None,
                  identifier: str = None):
         self.heavy = heavy
@@ -6,6 +6,8 @@ from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import Rece
 
 class BCReceptor(Receptor):
 
+    __slots__ = ("heavy", "light", "metadata", "identifier")
+
     def __init__(self, heavy: ReceptorSequence = None, light: ReceptorSequence = None, metadata: dict = None,
                  identifier: str = None):
         self.heavy = heavy
@@ -0,0 +1,105 @@
+import pickle
+from pathlib import Path
+
+import numpy as np
+
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.FingerprintHelper import FingerprintHelper
+from immuneML.util.SequenceMatrixHelper import SequenceMatrixHelper
+
+
+class ElementBatchFile:
+    """
+    Helper class for reading and writing the batch files of ElementDatasets (SequenceDataset and ReceptorDataset). Each element (sequence or
+    receptor) is pickled separately and the pickles are concatenated in the batch file. Next to the batch file, an index file is stored with
+    the byte offset of each element in the batch file and the identifiers of the elements, so that the number of elements and their
+    identifiers can be obtained without unpickling the elements, and individual elements can be read without reading the whole file. The
+    index also includes the content fingerprint of the batch file, computed while the file is written.
+
+    Batch files without the index file (where the whole list of elements is pickled at once) can still be read, but each access reads the
+    whole file.
+    """
+
+    INDEX_SUFFIX = "_index.npz"
+
+    @staticmethod
+    def get_index_filename(filename: Path) -> Path:
+        return filename.parent / f"{filename.stem}{ElementBatchFile.INDEX_SUFFIX}"
+
+    @staticmethod
+    def is_indexed(filename: Path) -> bool:
+        return ElementBatchFile.get_index_filename(filename).is_file()
+
+    @staticmethod
+    def write(filename: Path, elements: list):
+        offsets = np.zeros(len(elements) + 1, dtype=np.int64)
+        hasher = FingerprintHelper.new_hasher()
+        with filename.open("wb") as file:
+            for index, element in enumerate(elements):
+                element_bytes = pickle.dumps(element, pickle.HIGHEST_PROTOCOL)
+                file.write(element_bytes)
+                hasher.update(element_bytes)
+                offsets[index + 1] = file.tell()
+
+        identifiers = np.array(["" if element.identifier is None else str(element.identifier) for element in elements], dtype=str)
+        missing = np.array([element.identifier is None for element in elements], dtype=bool)
+        with ElementBatchFile.get_index_filename(filename).open("wb") as file:
+            np.savez(file, offsets=offsets, identifiers=identifiers, missing=missing, fingerprint=np.array(hasher.hexdigest()))
+
+        if EnvironmentSettings.persist_sequence_matrix:
+            SequenceMatrixHelper.store_for_elements(elements, filename)
+
+    @staticmethod
+    def _load_index(filename: Path):
+        with np.load(ElementBatchFile.get_index_filename(filename)) as index:
+            identifiers = index["identifiers"].astype(object)
+            identifiers[index["missing"]] = None
+            return index["offsets"], identifiers
+
+    @staticmethod
+    def read(filename: Path) -> list:
+        if not ElementBatchFile.is_indexed(filename):
+            with filename.open("rb") as file:
+                return pickle.load(file)
+
+        offsets, _ = ElementBatchFile._load_index(filename)
+        with filename.open("rb") as file:
+            return [pickle.load(file) for _ in range(offsets.shape[0] - 1)]
+
+    @staticmethod
+    def read_elements(filename: Path, indices) -> list:
+        """Reads the elements at the given positions in the batch file; for indexed files, only these elements are read from the disk"""
+        if not ElementBatchFile.is_indexed(filename):
+            elements = ElementBatchFile.read(filename)
+            return [elements[index] for index in indices]
+
+        offsets, _ = ElementBatchFile._load_index(filename)
+        elements = []
+        with filename.open("rb") as file:
+            for index in indices:
+                file.seek(offsets[index])
+                elements.append(pickle.load(file))
+        return elements
+
+    @staticmethod
+    def get_element_count(filename: Path) -> int:
+        if not ElementBatchFile.is_indexed(filename):
+            return len(ElementBatchFile.read(filename))
+        offsets, _ = ElementBatchFile._load_index(filename)
+        return offsets.shape[0] - 1
+
+    @staticmethod
+    def get_fingerprint(filename: Path) -> str:
+        """Returns the fingerprint stored in the index or, for batch files stored without it, computes it from the file content"""
+        if ElementBatchFile.is_indexed(filename):
+            with np.load(ElementBatchFile.get_index_filename(filename)) as index:
+                if "fingerprint" in index.files:
+                    return str(index["fingerprint"])
+        return FingerprintHelper.fingerprint_file(filename)
+
+    @staticmethod
+    def get_identifiers(filename: Path) -> list:
+        if not ElementBatchFile.is_indexed(filename):
+            return [element.identifier for element in ElementBatchFile.read(filename)]
+        _, identifiers = ElementBatchFile._load_index(filename)
+        return identifiers.tolist()
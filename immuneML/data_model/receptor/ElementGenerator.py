@@ -1,57 +1,64 @@
 import math
-import pickle
 from pathlib import Path
 
+import numpy as np
+
+from immuneML.data_model.receptor.ElementBatchFile import ElementBatchFile
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.FingerprintHelper import FingerprintHelper
+from immuneML.util.PrefetchHelper import PrefetchHelper
+
 class ElementGenerator:
 
     def __init__(self, file_list: list, file_size: int = 1000):
         self.file_list = file_list
-        self.file_lengths = [-1 for i in range(len(file_list))]
+        self.file_lengths = {}
         self.file_size = file_size
 
-    def _load_batch(self, current_file: int):
+    def __setstate__(self, state):
+        if isinstance(state.get("file_lengths"), list):
+            state["file_lengths"] = {}
+        self.__dict__.update(state)
 
-        with self.file_list[current_file].open("rb") as file:
-            elements = pickle.load(file)
-
-        return elements
+    def _load_batch(self, current_file: int):
+        return ElementBatchFile.read(self.file_list[current_file])
 
     def _get_element_count(self, file_index: int):
+        filename = self.file_list[file_index]
+        if filename not in self.file_lengths:
+            self.file_lengths[filename] = ElementBatchFile.get_element_count(filename)
 
-        # TODO: make this abstract and move implementation to specific generator: count elements in file for new format
+        return self.file_lengths[filename]
 
-        if self.file_lengths[file_index] == -1:
-            with self.file_list[file_index].open("rb") as file:
-                count = len(pickle.load(file))
-            self.file_lengths[file_index] = count
+    def get_element_count(self):
+        return sum(self._get_element_count(index) for index in range(len(self.file_list)))
 
-        return self.file_lengths[file_index]
+    def get_identifiers(self) -> list:
+        """Returns the identifiers of all elements in the order of the files; for indexed batch files, the elements are not unpickled"""
+        return [identifier for filename in self.file_list for identifier in ElementBatchFile.get_identifiers(filename)]
 
-    def get_element_count(self):
-        for index in range(len(self.file_list)):
-            if self.file_lengths[index] == -1:
-                self._get_element_count(index)
-        return sum(self.file_lengths)
+    def get_fingerprint(self) -> str:
+        return FingerprintHelper.fingerprint_values([ElementBatchFile.get_fingerprint(filename) for filename in self.file_list])
 
-    def build_batch_generator(self):
+    def build_batch_generator(self, prefetch_count: int = None):
         """
         creates a generator which will return one batch of elements at the time
 
-        :param batch_size: how many elements should be returned at once (default 1)
+        :param prefetch_count: how many batch files to load ahead on a background thread while the current batch is processed; if not set,
+                               the value from EnvironmentSettings.get_prefetch_count() is used (no prefetching by default)
         :return: element generator
         """
+        prefetch_count = EnvironmentSettings.get_prefetch_count() if prefetch_count is None else prefetch_count
+        yield from PrefetchHelper.iterate(range(len(self.file_list)), self._load_batch, prefetch_count)
 
-        for current_file_index in range(len(self.file_list)):
-            batch = self._load_batch(current_file_index)
-            yield batch
-
-    def build_element_generator(self):
+    def build_element_generator(self, prefetch_count: int = None):
         """
         creates a generator which will return one element at the time
+
+        :param prefetch_count: how many batch files to load ahead, as in build_batch_generator()
         :return: element generator
         """
-        for current_file_index in range(len(self.file_list)):
-            batch = self._load_batch(current_file_index)
+        for batch in self.build_batch_generator(prefetch_count):
             for element in batch:
                 yield element
 
@@ -59,7 +66,6 @@ class ElementGenerator:
         if example_indices is None or len(example_indices) == 0:
             raise RuntimeError(f"{ElementGenerator.__name__}: no examples were specified to create the dataset subset. "
                                f"Dataset type was {dataset_type}, dataset identifier: {dataset_identifier}.")
-        batch_size = self.file_size
         elements = []
         file_count = 1
 
@@ -67,12 +73,11 @@ class ElementGenerator:
 
         batch_filenames = self._prepare_batch_filenames(len(example_indices), path, dataset_type, dataset_identifier)
 
-        for index, batch in enumerate(self.build_batch_generator()):
-            extracted_elements = self._extract_elements_from_batch(index, batch_size, batch, example_indices)
-            elements.extend(extracted_elements)
+        for file_index, batch_indices in self._group_indices_by_file(example_indices):
+            elements.extend(ElementBatchFile.read_elements(self.file_list[file_index], batch_indices))
 
-            if len(elements) >= self.file_size or len(elements) == len(example_indices):
-                self._store_elements_to_file(batch_filenames[file_count-1], elements[:self.file_size])
+            while len(elements) >= self.file_size:
+                self._store_elements_to_file(batch_filenames[file_count - 1], elements[:self.file_size])
                 file_count += 1
                 elements = elements[self.file_size:]
 
@@ -81,6 +86,15 @@ class ElementGenerator:
 
         return batch_filenames
 
+    def _group_indices_by_file(self, example_indices: list):
+        """Splits the sorted example indices to indices within the files which include them, based on the element count of each file"""
+        file_ends = np.cumsum([self._get_element_count(index) for index in range(len(self.file_list))])
+        example_indices = np.array(example_indices)
+        file_indices = np.searchsorted(file_ends, example_indices, side="right")
+        for file_index in np.unique(file_indices[file_indices < len(self.file_list)]):
+            file_start = file_ends[file_index - 1] if file_index > 0 else 0
+            yield file_index, (example_indices[file_indices == file_index] - file_start).tolist()
+
     def _prepare_batch_filenames(self, example_count: int, path: Path, dataset_type: str, dataset_identifier: str):
         batch_count = math.ceil(example_count / self.file_size)
         digits_count = len(str(batch_count)) + 1
@@ -89,11 +103,4 @@ class ElementGenerator:
         return filenames
 
     def _store_elements_to_file(self, path, elements):
-        with path.open("wb") as file:
-            pickle.dump(elements, file)
-
-    def _extract_elements_from_batch(self, index, batch_size, batch, example_indices):
-        upper_limit, lower_limit = (index + 1) * batch_size, index * batch_size
-        batch_indices = [ind for ind in example_indices if lower_limit <= ind < upper_limit]
-        elements = [batch[i - lower_limit] for i in batch_indices]
-        return elements
+        ElementBatchFile.write(path, elements)
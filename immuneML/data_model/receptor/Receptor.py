@@ -6,6 +6,25 @@ from immuneML.data_model.DatasetItem import DatasetItem
 
 
 class Receptor(DatasetItem):
+    """
+    Base class for receptors consisting of two chains; the attributes of the subclasses are stored in __slots__ to reduce memory use when many
+    receptors are kept in memory (e.g., when loading batches of receptor datasets). Objects pickled before __slots__ were introduced can
+    still be unpickled.
+    """
+
+    __slots__ = ()
+
+    def __reduce__(self):
+        # the subclasses take the two chains, metadata and identifier as positional arguments in the same order as in __slots__
+        return type(self), tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        # objects pickled before __slots__ were introduced are restored from the dict of their attributes
+        state = state[1] if isinstance(state, tuple) else state
+        for name in self.__slots__:
+            setattr(self, name, None)
+        for name, value in state.items():
+            setattr(self, name, value)
 
     @abc.abstractmethod
     def get_chains(self):
@@ -6,6 +6,8 @@ from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import Rece
 
 class TCABReceptor(Receptor):
 
+    __slots__ = ("alpha", "beta", "metadata", "identifier")
+
     def __init__(self, alpha: ReceptorSequence = None, beta: ReceptorSequence = None, metadata: dict = None, identifier: str = None):
 
         self.alpha = alpha
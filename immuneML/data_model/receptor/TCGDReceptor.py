@@ -6,6 +6,8 @@ from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import Rece
 
 class TCGDReceptor(Receptor):
 
+    __slots__ = ("gamma", "delta", "metadata", "identifier")
+
     def __init__(self, gamma: ReceptorSequence = None, delta: ReceptorSequence = None, metadata: dict = None, identifier: str = None):
 
         self.gamma = gamma
@@ -7,6 +7,13 @@ from immuneML.environment.SequenceType import SequenceType
 
 
 class ReceptorSequence(DatasetItem):
+    """
+    Receptor sequence with its metadata and annotation. The attributes are stored in __slots__ to reduce memory use when many sequences are
+    kept in memory (e.g., when loading batches of sequence or receptor datasets) and the annotation object is created only when it is
+    accessed. Objects pickled before __slots__ were introduced can still be unpickled.
+    """
+
+    __slots__ = ("identifier", "amino_acid_sequence", "nucleotide_sequence", "_annotation", "metadata")
 
     def __init__(self,
                  amino_acid_sequence: str = None,
@@ -17,9 +24,39 @@ class ReceptorSequence(DatasetItem):
         self.identifier = identifier
         self.amino_acid_sequence = amino_acid_sequence
         self.nucleotide_sequence = nucleotide_sequence
-        self.annotation = annotation
+        self._annotation = annotation
         self.metadata = metadata
 
+    @property
+    def annotation(self) -> SequenceAnnotation:
+        if self._annotation is None:
+            self._annotation = SequenceAnnotation()
+        return self._annotation
+
+    @annotation.setter
+    def annotation(self, annotation: SequenceAnnotation):
+        self._annotation = annotation
+
+    def __reduce__(self):
+        return ReceptorSequence._restore, (self.amino_acid_sequence, self.nucleotide_sequence, self.identifier, self._annotation, self.metadata)
+
+    @staticmethod
+    def _restore(amino_acid_sequence, nucleotide_sequence, identifier, annotation, metadata):
+        sequence = ReceptorSequence.__new__(ReceptorSequence)
+        sequence.amino_acid_sequence = amino_acid_sequence
+        sequence.nucleotide_sequence = nucleotide_sequence
+        sequence.identifier = identifier
+        sequence._annotation = annotation
+        sequence.metadata = metadata
+        return sequence
+
+    def __setstate__(self, state):
+        # objects pickled before __slots__ were introduced are restored from the dict of their attributes
+        state = state[1] if isinstance(state, tuple) else state
+        self.identifier, self.amino_acid_sequence, self.nucleotide_sequence, self._annotation, self.metadata = None, None, None, None, None
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def set_metadata(self, metadata: SequenceMetadata):
         self.metadata = metadata
 
@@ -7,9 +7,19 @@ class SequenceAnnotation:
     Sequence Annotation class includes antigen-specific data (in experimental
     scenario) and implanted signals (in simulated scenario)
     """
+
+    __slots__ = ("implants", "other")
+
     def __init__(self, implants: list = None, other: dict = None):
         self.implants = implants if implants is not None else []
         self.other = other if other is not None else {}
 
+    def __setstate__(self, state):
+        # objects pickled before __slots__ were introduced are restored from the dict of their attributes
+        state = state[1] if isinstance(state, tuple) else state
+        self.implants, self.other = [], {}
+        for name, value in state.items():
+            setattr(self, name, value)
+
     def add_implant(self, implant: ImplantAnnotation):
         self.implants.append(implant)
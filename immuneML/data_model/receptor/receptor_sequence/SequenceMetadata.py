@@ -1,4 +1,6 @@
 # quality: gold
+import sys
+
 from immuneML.data_model.receptor.RegionType import RegionType
 from immuneML.data_model.receptor.receptor_sequence.Chain import Chain
 from immuneML.data_model.receptor.receptor_sequence.SequenceFrameType import SequenceFrameType
@@ -22,8 +24,16 @@ class SequenceMetadata:
         - sample
         - custom params (dictionary with custom sequence information)
 
+    The attributes are stored in __slots__, the gene names are interned so that the objects with the same genes share the strings, and the
+    custom params dictionary is created only when it is accessed. Objects pickled before __slots__ were introduced can still be unpickled.
+
     """
 
+    __slots__ = ("v_subgroup", "v_gene", "v_allele", "j_subgroup", "j_gene", "j_allele", "chain", "count", "frame_type", "region_type",
+                 "cell_id", "_custom_params")
+
+    GENE_FIELDS = ("v_subgroup", "v_gene", "v_allele", "j_subgroup", "j_gene", "j_allele")
+
     def __init__(self,
                  v_subgroup: str = None, v_gene: str = None, v_allele: str = None,
                  j_subgroup: str = None, j_gene: str = None, j_allele: str = None,
@@ -33,18 +43,54 @@ class SequenceMetadata:
                  region_type: str = None,
                  cell_id: str = None,
                  custom_params: dict = None):
-        self.v_subgroup = v_subgroup
-        self.v_gene = v_gene
-        self.v_allele = v_allele
-        self.j_subgroup = j_subgroup
-        self.j_gene = j_gene
-        self.j_allele = j_allele
+        self.v_subgroup = SequenceMetadata._intern(v_subgroup)
+        self.v_gene = SequenceMetadata._intern(v_gene)
+        self.v_allele = SequenceMetadata._intern(v_allele)
+        self.j_subgroup = SequenceMetadata._intern(j_subgroup)
+        self.j_gene = SequenceMetadata._intern(j_gene)
+        self.j_allele = SequenceMetadata._intern(j_allele)
         self.chain = Chain.get_chain(chain) if chain and isinstance(chain, str) else chain if isinstance(chain, Chain) else None
         self.count = int(float(count)) if isinstance(count, str) else count
         self.frame_type = SequenceFrameType(frame_type) if frame_type and isinstance(frame_type, str) else frame_type if isinstance(frame_type, SequenceFrameType) else None
         self.region_type = RegionType(region_type) if region_type and isinstance(region_type, str) else region_type if isinstance(region_type, RegionType) else None
         self.cell_id = cell_id
-        self.custom_params = custom_params if custom_params is not None else {}
+        self._custom_params = custom_params if custom_params else None
+
+    @property
+    def custom_params(self) -> dict:
+        if self._custom_params is None:
+            self._custom_params = {}
+        return self._custom_params
+
+    @custom_params.setter
+    def custom_params(self, custom_params: dict):
+        self._custom_params = custom_params
+
+    @staticmethod
+    def _intern(value):
+        return sys.intern(value) if type(value) is str else value
+
+    def __reduce__(self):
+        return SequenceMetadata._restore, (self.v_subgroup, self.v_gene, self.v_allele, self.j_subgroup, self.j_gene, self.j_allele, self.chain,
+                                           self.count, self.frame_type, self.region_type, self.cell_id, self._custom_params)
+
+    @staticmethod
+    def _restore(v_subgroup, v_gene, v_allele, j_subgroup, j_gene, j_allele, chain, count, frame_type, region_type, cell_id, custom_params):
+        intern = SequenceMetadata._intern
+        metadata = SequenceMetadata.__new__(SequenceMetadata)
+        metadata.v_subgroup, metadata.v_gene, metadata.v_allele = intern(v_subgroup), intern(v_gene), intern(v_allele)
+        metadata.j_subgroup, metadata.j_gene, metadata.j_allele = intern(j_subgroup), intern(j_gene), intern(j_allele)
+        metadata.chain, metadata.count, metadata.frame_type, metadata.region_type = chain, count, frame_type, region_type
+        metadata.cell_id, metadata._custom_params = cell_id, custom_params
+        return metadata
+
+    def __setstate__(self, state):
+        # objects pickled before __slots__ were introduced are restored from the dict of their attributes
+        state = state[1] if isinstance(state, tuple) else state
+        for name in SequenceMetadata.__slots__:
+            setattr(self, name, None)
+        for name, value in state.items():
+            setattr(self, name, SequenceMetadata._intern(value) if name in SequenceMetadata.GENE_FIELDS else value)
 
     def get_attribute(self, name: str):
         """Returns the attribute value if attribute is present either directly or in custom_params, otherwise returns None"""
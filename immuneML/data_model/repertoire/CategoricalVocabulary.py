@@ -0,0 +1,56 @@
+from enum import Enum
+
+import numpy as np
+import pandas as pd
+
+
+class CategoricalVocabulary:
+    """
+    Maps the values of a categorical sequence field (e.g., v_genes, chains, region_types) to small integer codes. A vocabulary is typically
+    shared across all repertoires of a RepertoireDataset (see RepertoireDataset.get_categorical_vocabulary()), so that the codes from different
+    repertoires can be directly compared, grouped or used for indexing.
+
+    Enum values (e.g., Chain.ALPHA) are stored by their value (e.g., 'TRA'), and missing values are coded as MISSING_CODE.
+    """
+
+    MISSING_CODE = -1
+
+    def __init__(self, field: str, values: list):
+        self.field = field
+        self.values = np.array(sorted(set(CategoricalVocabulary.normalize(value) for value in values if value is not None), key=str),
+                               dtype=object)
+        self._index = {value: code for code, value in enumerate(self.values)}
+        self.code_dtype = np.int16 if len(self.values) < np.iinfo(np.int16).max else np.int32
+
+    @staticmethod
+    def normalize(value):
+        return value.value if isinstance(value, Enum) else value
+
+    def __len__(self):
+        return len(self.values)
+
+    def get_code(self, value) -> int:
+        if value is None:
+            return CategoricalVocabulary.MISSING_CODE
+        value = CategoricalVocabulary.normalize(value)
+        assert value in self._index, f"{CategoricalVocabulary.__name__}: value {value} is not in the vocabulary for field {self.field}."
+        return self._index[value]
+
+    def encode_dictionary(self, dictionary, indices: np.ndarray) -> np.ndarray:
+        """
+        Converts dictionary-encoded values (a list of unique values and an index into it for each element, with negative index for missing
+        values) to codes of this vocabulary; the conversion of values is done once per unique value, and the rest is vectorized
+        """
+        mapping = np.array([self.get_code(value) for value in dictionary] + [CategoricalVocabulary.MISSING_CODE], dtype=self.code_dtype)
+        return mapping[np.where(indices < 0, len(dictionary), indices)]
+
+    def encode(self, values) -> np.ndarray:
+        indices, dictionary = pd.factorize(np.asarray(values, dtype=object))
+        return self.encode_dictionary(dictionary, indices)
+
+    def decode(self, codes) -> np.ndarray:
+        codes = np.asarray(codes)
+        values = np.empty(codes.shape[0], dtype=object)
+        present = codes != CategoricalVocabulary.MISSING_CODE
+        values[present] = self.values[codes[present]]
+        return values
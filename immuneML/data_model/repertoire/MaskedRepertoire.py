@@ -0,0 +1,132 @@
+from pathlib import Path
+from uuid import uuid4
+
+import numpy as np
+
+from immuneML.caching.RepertoireDataCache import RepertoireDataCache
+from immuneML.data_model.repertoire.Repertoire import Repertoire
+from immuneML.data_model.repertoire.storage.RepertoireStorage import RepertoireStorage
+from immuneML.data_model.repertoire.storage.RepertoireStorageFormat import RepertoireStorageFormat
+from immuneML.environment.SequenceType import SequenceType
+from immuneML.util.FingerprintHelper import FingerprintHelper
+from immuneML.util.PathBuilder import PathBuilder
+from immuneML.util.SequenceMatrixHelper import SequenceMatrixHelper
+
+
+class MaskedRepertoire(Repertoire):
+    """
+    Repertoire which consists of a subset of the sequences of another (parent) repertoire without copying its data: only the indices of the
+    sequences in the parent repertoire are stored (in a .rows file), while the data is read from the parent's data file and subset when it is
+    accessed. The repertoire-level metadata file is shared with the parent. Masked repertoires are created by Repertoire.build_like(); masking
+    a masked repertoire again refers to the original data file, so a chain of filters does not copy the data at any step.
+
+    Since the masked repertoire depends on the parent's data file, materialize() can be used to store the data as a standalone repertoire,
+    e.g., before the parent dataset is removed. Datasets exported in immuneML format always include materialized repertoires.
+    """
+
+    ROWS_SUFFIX = ".rows"
+
+    @classmethod
+    def build(cls, repertoire: Repertoire, indices_to_keep, result_path: Path, filename_base: str = None):
+        indices_to_keep = np.asarray(indices_to_keep)
+        rows = np.flatnonzero(indices_to_keep) if indices_to_keep.dtype == bool else indices_to_keep.astype(np.int64)
+
+        if isinstance(repertoire, MaskedRepertoire):
+            rows, parent_filename = repertoire.get_rows()[rows], repertoire.parent_filename
+        else:
+            parent_filename = repertoire.data_filename
+
+        PathBuilder.build(result_path)
+        identifier = uuid4().hex
+        data_filename = result_path / f"{filename_base if filename_base is not None else identifier}{MaskedRepertoire.ROWS_SUFFIX}"
+        with data_filename.open("wb") as file:
+            np.save(file, rows)
+
+        return MaskedRepertoire(data_filename, repertoire.metadata_filename, identifier, parent_filename)
+
+    def __init__(self, data_filename: Path, metadata_filename: Path, identifier: str, parent_filename: Path):
+        super().__init__(data_filename, metadata_filename, identifier)
+        self.parent_filename = Path(parent_filename)
+        self._rows = None
+
+    def _check_data_filename(self, data_filename: Path):
+        assert data_filename.suffix == MaskedRepertoire.ROWS_SUFFIX, \
+            f"MaskedRepertoire: the file with the indices of the sequences has to have the suffix {MaskedRepertoire.ROWS_SUFFIX}, " \
+            f"got {data_filename.suffix} instead."
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_rows"] = None
+        return state
+
+    def get_rows(self) -> np.ndarray:
+        """Returns the indices of the sequences of this repertoire in the parent repertoire's data"""
+        if getattr(self, "_rows", None) is None:
+            with self.data_filename.open("rb") as file:
+                self._rows = np.load(file)
+            self._rows.flags.writeable = False
+        return self._rows
+
+    def materialize(self, path: Path, filename_base: str = None) -> Repertoire:
+        """
+        Stores the data of the masked repertoire as a standalone repertoire in the same format as the parent repertoire
+
+        Args:
+            path: folder where the files of the new repertoire will be stored
+            filename_base: the name of the files without extension; if not set, the name of the .rows file is used
+
+        Returns:
+            the new repertoire which does not depend on the parent's data file
+        """
+        return Repertoire.build_from_data(self.load_data(), RepertoireStorageFormat.get_format(self.parent_filename), path, dict(self.metadata),
+                                          filename_base if filename_base is not None else self.data_filename.stem)
+
+    def _build_data_fingerprint(self) -> str:
+        """Combines the fingerprint of the parent's data with the indices of the kept sequences, so that the data is not read"""
+        parent_fingerprint = (getattr(self, "metadata", None) or {}).get(Repertoire.FINGERPRINT_KEY)
+        if parent_fingerprint is None:
+            return super()._build_data_fingerprint()
+        return FingerprintHelper.fingerprint_values([parent_fingerprint, FingerprintHelper.fingerprint_array(self.get_rows())])
+
+    def _get_storage(self) -> RepertoireStorage:
+        return Repertoire.STORAGE[RepertoireStorageFormat.get_format(self.parent_filename)]
+
+    def _read_stored_data(self) -> np.ndarray:
+        parent_data = RepertoireDataCache.get(self.parent_filename)
+        if parent_data is None:
+            parent_data = self._get_storage().read(self.parent_filename)
+        return parent_data[self.get_rows()]
+
+    def _read_stored_columns(self, attributes: list) -> dict:
+        rows = self.get_rows()
+        return {attribute: column[rows] for attribute, column in self._get_storage().read_columns(self.parent_filename, attributes).items()}
+
+    def _read_stored_dictionary(self, attribute: str):
+        parent_dictionary = self._get_storage().read_dictionary(self.parent_filename, attribute)
+        if parent_dictionary is None:
+            return None
+
+        dictionary, parent_indices = parent_dictionary
+        parent_indices = parent_indices[self.get_rows()]
+        present = parent_indices >= 0
+        used_values, indices_present = np.unique(parent_indices[present], return_inverse=True)
+        indices = np.full(parent_indices.shape[0], -1, dtype=np.int64)
+        indices[present] = indices_present
+        return np.asarray(dictionary, dtype=object)[used_values], indices
+
+    def _load_stored_sequence_matrix(self, sequence_type: SequenceType):
+        parent_matrix = SequenceMatrixHelper.load(self.parent_filename, sequence_type)
+        if parent_matrix is not None:
+            rows = self.get_rows()
+            return parent_matrix[0][rows], parent_matrix[1][rows]
+        return None
+
+    def store_sequence_matrices(self):
+        """The sequence matrices of a masked repertoire are taken from the parent repertoire, so nothing is stored"""
+        pass
+
+    def get_sequence_matrix_filenames(self):
+        return []
+
+    def get_element_count(self):
+        return self.get_rows().shape[0]
@@ -2,14 +2,14 @@
 import ast
 import logging
 import pickle
-import shutil
-import weakref
 from pathlib import Path
 from typing import List
 from uuid import uuid4
 
 import numpy as np
+import pandas as pd
 
+from immuneML.caching.RepertoireDataCache import RepertoireDataCache
 from immuneML.data_model.DatasetItem import DatasetItem
 from immuneML.data_model.cell.Cell import Cell
 from immuneML.data_model.cell.CellList import CellList
@@ -20,31 +20,42 @@ from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import Rece
 from immuneML.data_model.receptor.receptor_sequence.ReceptorSequenceList import ReceptorSequenceList
 from immuneML.data_model.receptor.receptor_sequence.SequenceAnnotation import SequenceAnnotation
 from immuneML.data_model.receptor.receptor_sequence.SequenceMetadata import SequenceMetadata
+from immuneML.data_model.repertoire.CategoricalVocabulary import CategoricalVocabulary
+from immuneML.data_model.repertoire.storage.ArrowRepertoireStorage import ArrowRepertoireStorage
+from immuneML.data_model.repertoire.storage.ColumnSpool import ColumnSpool
+from immuneML.data_model.repertoire.storage.NumpyRepertoireStorage import NumpyRepertoireStorage
+from immuneML.data_model.repertoire.storage.RepertoireStorage import RepertoireStorage
+from immuneML.data_model.repertoire.storage.RepertoireStorageFormat import RepertoireStorageFormat
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.environment.SequenceType import SequenceType
 from immuneML.simulation.implants.ImplantAnnotation import ImplantAnnotation
+from immuneML.util.FingerprintHelper import FingerprintHelper
 from immuneML.util.NumpyHelper import NumpyHelper
 from immuneML.util.PathBuilder import PathBuilder
+from immuneML.util.SequenceMatrixHelper import SequenceMatrixHelper
 
 
 class Repertoire(DatasetItem):
     """
     Repertoire object consisting of sequence objects, each sequence attribute is stored as a list across all sequences and can be
-    loaded separately. Internally, this class relies on numpy to store/import_dataset the data.
+    loaded separately. Internally, this class relies on numpy to store/import_dataset the data by default, or on Arrow IPC format with typed
+    columns if the repertoire storage format is set to ARROW in EnvironmentSettings (see
+    :py:obj:`~immuneML.data_model.repertoire.storage.RepertoireStorageFormat.RepertoireStorageFormat`).
+
+    The data loaded from disk is kept in the process-wide :py:obj:`~immuneML.caching.RepertoireDataCache.RepertoireDataCache` with a memory
+    budget set in EnvironmentSettings, so repeated accesses to the same repertoire do not read the file again until the data is evicted.
+    The arrays returned by the accessors are shared through the cache and are therefore read-only.
     """
 
     FIELDS = tuple(
         "sequence_aas,sequences,v_genes,j_genes,v_subgroups,j_subgroups,v_alleles,j_alleles,chains,counts,region_types,frame_types,"
         "sequence_identifiers,cell_ids".split(","))
 
-    @staticmethod
-    def process_custom_lists(custom_lists):
-        if custom_lists:
-            field_list = list(custom_lists.keys())
-            values = [custom_lists[field] for field in custom_lists.keys()]
-            dtype = [(field, np.object) for field in custom_lists.keys()]
-        else:
-            field_list, values, dtype = [], [], []
-        return field_list, values, dtype
+    CATEGORICAL_FIELDS = ("v_genes", "j_genes", "v_subgroups", "j_subgroups", "v_alleles", "j_alleles", "chains", "region_types", "frame_types")
+
+    STORAGE = {RepertoireStorageFormat.NUMPY: NumpyRepertoireStorage, RepertoireStorageFormat.ARROW: ArrowRepertoireStorage}
+
+    FINGERPRINT_KEY = "fingerprint"
 
     @staticmethod
     def check_count(sequence_aas: list = None, sequences: list = None, custom_lists: dict = None) -> int:
@@ -68,67 +79,169 @@ class Repertoire(DatasetItem):
               custom_lists: dict = None, sequence_identifiers: list = None, path: Path = None, metadata: dict = None,
               signals: dict = None, cell_ids: list = None, filename_base: str = None):
 
-        sequence_count = Repertoire.check_count(sequence_aas, sequences, custom_lists)
+        Repertoire.check_count(sequence_aas, sequences, custom_lists)
 
-        if sequence_identifiers is None or len(sequence_identifiers) == 0 or any(identifier is None for identifier in sequence_identifiers):
-            sequence_identifiers = list(range(sequence_count))
+        columns = dict(custom_lists) if custom_lists else {}
 
-        identifier = uuid4().hex
+        if signals:
+            columns.update({signal: signals[signal] for signal in signals if signal not in metadata["field_list"]})
+
+        fields = {"sequence_aas": sequence_aas, "sequences": sequences, "v_genes": v_genes, "j_genes": j_genes, "v_subgroups": v_subgroups,
+                  "j_subgroups": j_subgroups, "v_alleles": v_alleles, "j_alleles": j_alleles, "chains": chains, "counts": counts,
+                  "region_types": region_types, "frame_types": frame_types, "sequence_identifiers": sequence_identifiers, "cell_ids": cell_ids}
+        columns.update({field: values for field, values in fields.items() if values is not None})
+
+        return cls.build_from_arrays(columns, path, metadata, filename_base)
+
+    @classmethod
+    def build_from_dataframe(cls, dataframe: pd.DataFrame, path: Path, metadata: dict = None, filename_base: str = None):
+        """
+        Builds the repertoire from a DataFrame where each column is one field (one of Repertoire.FIELDS or a custom field); the columns are
+        stored directly from the underlying numpy arrays without creating Python objects per sequence. See build_from_arrays() for details.
+        """
+        return cls.build_from_arrays({column: dataframe[column].values for column in dataframe.columns}, path, metadata, filename_base)
 
+    @classmethod
+    def build_from_arrays(cls, columns: dict, path: Path, metadata: dict = None, filename_base: str = None):
+        """
+        Builds the repertoire from a dict where keys are field names (one of Repertoire.FIELDS or custom fields) and values are numpy arrays,
+        pandas Series or lists of equal length. Standard fields where all values are None are not stored, and if sequence_identifiers are
+        not set or some of them are missing, the sequences are numbered from 0.
+
+        Args:
+            columns: dict of field names and values per sequence
+            path: folder where the repertoire files will be stored
+            metadata: repertoire-level metadata (e.g., subject_id, labels); the list of stored fields is added to it under 'field_list' and
+                      the fingerprint of the sequence data under 'fingerprint'
+            filename_base: the name of the files without extension; if not set, the identifier of the repertoire is used
+
+        Returns:
+            the new repertoire
+        """
+        columns = {field: values.values if isinstance(values, pd.Series) else values for field, values in columns.items()}
+        columns = {field: values for field, values in columns.items()
+                   if field not in Repertoire.FIELDS or not (len(values) == 0 or Repertoire._is_missing_column(values))}
+
+        lengths = {field: len(values) for field, values in columns.items()}
+        assert len(set(lengths.values())) <= 1, \
+            f"Repertoire: there is a mismatch between the number of sequences and the number of values in the fields: {lengths}."
+        sequence_count = next(iter(lengths.values())) if len(lengths) > 0 else 0
+
+        if "sequence_identifiers" not in columns or pd.isnull(pd.Series(columns["sequence_identifiers"], dtype=object)).any():
+            columns["sequence_identifiers"] = np.arange(sequence_count)
+
+        identifier = uuid4().hex
         filename_base = filename_base if filename_base is not None else identifier
 
-        data_filename = path / f"{filename_base}.npy"
+        storage_format = EnvironmentSettings.get_repertoire_storage_format()
+        data_filename = path / f"{filename_base}.{storage_format.value}"
+        Repertoire.STORAGE[storage_format].write(data_filename, columns, Repertoire.CATEGORICAL_FIELDS)
 
-        field_list, values, dtype = Repertoire.process_custom_lists(custom_lists)
+        return cls._build_with_metadata(data_filename, identifier, path / f"{filename_base}_metadata.pickle", metadata, list(columns.keys()),
+                                        FingerprintHelper.fingerprint_columns(columns))
 
-        if signals:
-            signals_filtered = {signal: signals[signal] for signal in signals if signal not in metadata["field_list"]}
-            field_list_signals, values_signals, dtype_signals = Repertoire.process_custom_lists(signals_filtered)
+    @classmethod
+    def build_from_chunks(cls, chunks, path: Path, metadata: dict = None, filename_base: str = None):
+        """
+        Builds the repertoire from chunks of sequences without keeping all of them in memory (e.g., when importing a repertoire file which
+        is larger than the available memory). Each chunk is a dict of field names and values as in build_from_arrays(), the chunks may
+        have different fields (missing values are set to None). The chunks are first stored in a temporary
+        :py:obj:`~immuneML.data_model.repertoire.storage.ColumnSpool.ColumnSpool` in the repertoire folder, and then written to the
+        repertoire storage: with the Arrow storage format one chunk at a time, with the numpy format all at once, since numpy files cannot
+        be written in parts. The stored repertoire and its fingerprint are the same as with build_from_arrays() for the same data.
 
-            field_list.extend(field_list_signals)
-            values.extend(values_signals)
-            dtype.extend(dtype_signals)
+        Args:
+            chunks: iterable of dicts of field names and values per sequence
+            path: folder where the repertoire files will be stored
+            metadata: repertoire-level metadata, see build_from_arrays()
+            filename_base: the name of the files without extension; if not set, the identifier of the repertoire is used
 
-        for field in Repertoire.FIELDS:
-            if eval(field) is not None and not all(el is None for el in eval(field)):
-                field_list.append(field)
-                values.append(eval(field))
-                dtype.append((field, np.object))
+        Returns:
+            the new repertoire
+        """
+        identifier = uuid4().hex
+        filename_base = filename_base if filename_base is not None else identifier
 
-        dtype = np.dtype(dtype)
+        with ColumnSpool(path, Repertoire.CATEGORICAL_FIELDS) as spool:
+            for chunk in chunks:
+                spool.append(chunk)
 
-        repertoire_matrix = np.array(list(map(tuple, zip(*values))), order='F', dtype=dtype)
-        np.save(str(data_filename), repertoire_matrix)
+            fields = [field for field in spool.columns.keys() if field not in Repertoire.FIELDS or not spool.is_missing(field)]
+            if "sequence_identifiers" not in fields or spool.columns["sequence_identifiers"].null_count > 0:
+                spool.set_row_numbers("sequence_identifiers")
+                fields = fields if "sequence_identifiers" in fields else fields + ["sequence_identifiers"]
 
-        metadata_filename = path / f"{filename_base}_metadata.pickle"
+            storage_format = EnvironmentSettings.get_repertoire_storage_format()
+            data_filename = path / f"{filename_base}.{storage_format.value}"
+            Repertoire.STORAGE[storage_format].write_spool(data_filename, spool, fields, Repertoire.CATEGORICAL_FIELDS)
+
+            fingerprint = FingerprintHelper.fingerprint_column_chunks({field: spool.iterate_column(field) for field in fields},
+                                                                      spool.element_count)
+
+        return cls._build_with_metadata(data_filename, identifier, path / f"{filename_base}_metadata.pickle", metadata, fields, fingerprint)
+
+    @classmethod
+    def _build_with_metadata(cls, data_filename: Path, identifier: str, metadata_filename: Path, metadata: dict, fields: list, fingerprint: str):
         metadata = {} if metadata is None else metadata
-        metadata["field_list"] = field_list
+        metadata["field_list"] = fields
+        metadata[Repertoire.FINGERPRINT_KEY] = fingerprint
         with metadata_filename.open("wb") as file:
             pickle.dump(metadata, file)
 
         repertoire = Repertoire(data_filename, metadata_filename, identifier)
+        if EnvironmentSettings.persist_sequence_matrix:
+            repertoire.store_sequence_matrices()
         return repertoire
 
+    @staticmethod
+    def _is_missing_column(values) -> bool:
+        if isinstance(values, np.ndarray):
+            return values.dtype == object and bool(np.all(np.equal(values, None)))
+        else:
+            return all(value is None for value in values)
+
     @classmethod
     def build_like(cls, repertoire, indices_to_keep: list, result_path: Path, filename_base: str = None):
+        """
+        Creates a repertoire with a subset of the sequences of the given repertoire without copying the data: the new repertoire is a
+        :py:obj:`~immuneML.data_model.repertoire.MaskedRepertoire.MaskedRepertoire` which stores only the indices of the kept sequences
+        and reads the data from the original repertoire's data file on access; call materialize() on it to store the data separately.
+
+        Args:
+            repertoire: the repertoire to take the sequences from
+            indices_to_keep: a list of indices of the sequences to keep or a boolean mask with one value per sequence
+            result_path: folder where the files of the new repertoire will be stored
+            filename_base: the name of the files without extension; if not set, the identifier of the new repertoire is used
+
+        Returns:
+            the new repertoire or None if indices_to_keep is empty
+        """
         if indices_to_keep is not None and len(indices_to_keep) > 0:
-            PathBuilder.build(result_path)
+            from immuneML.data_model.repertoire.MaskedRepertoire import MaskedRepertoire
+            return MaskedRepertoire.build(repertoire, indices_to_keep, result_path, filename_base)
+        else:
+            return None
 
-            data = repertoire.load_data()
-            data = data[indices_to_keep]
-            identifier = uuid4().hex
-            filename_base = filename_base if filename_base is not None else identifier
+    @classmethod
+    def build_from_data(cls, data: np.ndarray, storage_format: RepertoireStorageFormat, path: Path, metadata: dict, filename_base: str = None):
+        """Stores the structured array of repertoire data (as returned by load_data()) in the given format as a new repertoire"""
+        PathBuilder.build(path)
+        identifier = uuid4().hex
+        filename_base = filename_base if filename_base is not None else identifier
 
-            data_filename = result_path / f"{filename_base}.npy"
-            np.save(str(data_filename), data)
+        columns = {field: data[field] for field in data.dtype.names}
+        data_filename = path / f"{filename_base}.{storage_format.value}"
+        Repertoire.STORAGE[storage_format].write(data_filename, columns, Repertoire.CATEGORICAL_FIELDS)
 
-            metadata_filename = result_path / f"{filename_base}_metadata.pickle"
-            shutil.copyfile(repertoire.metadata_filename, metadata_filename)
+        metadata_filename = path / f"{filename_base}_metadata.pickle"
+        metadata[Repertoire.FINGERPRINT_KEY] = FingerprintHelper.fingerprint_columns(columns)
+        with metadata_filename.open("wb") as file:
+            pickle.dump(metadata, file)
 
-            new_repertoire = Repertoire(data_filename, metadata_filename, identifier)
-            return new_repertoire
-        else:
-            return None
+        repertoire = Repertoire(data_filename, metadata_filename, identifier)
+        if EnvironmentSettings.persist_sequence_matrix:
+            repertoire.store_sequence_matrices()
+        return repertoire
 
     @classmethod
     def build_from_sequence_objects(cls, sequence_objects: list, path: Path, metadata: dict, filename_base: str = None):
@@ -165,6 +278,8 @@ class Repertoire(DatasetItem):
                     else:
                         signals[implant.signal_id] = [None for _ in range(index)] + [str(implant)]
 
+        signals = {signal: values + [None for _ in range(len(sequence_objects) - len(values))] for signal, values in signals.items()}
+
         return cls.build(sequence_aas=sequence_aas, sequences=sequences, v_genes=v_genes, j_genes=j_genes, v_subgroups=v_subgroups,
                          j_subgroups=j_subgroups, v_alleles=v_alleles, j_alleles=j_alleles, chains=chains, counts=counts, region_types=region_types,
                          frame_types=frame_types, custom_lists=custom_lists, sequence_identifiers=sequence_identifiers, path=path, metadata=metadata,
@@ -174,8 +289,7 @@ class Repertoire(DatasetItem):
         data_filename = Path(data_filename)
         metadata_filename = Path(metadata_filename) if metadata_filename is not None else None
 
-        assert data_filename.suffix == ".npy", \
-            f"Repertoire: the file representing the repertoire has to be in numpy binary format. Got {data_filename.suffix} instead."
+        self._check_data_filename(data_filename)
 
         self.data_filename = data_filename
 
@@ -186,8 +300,13 @@ class Repertoire(DatasetItem):
 
         self.metadata_filename = metadata_filename
         self.identifier = identifier
-        self.data = None
         self.element_count = None
+        self._data_fingerprint = None
+
+    def _check_data_filename(self, data_filename: Path):
+        assert data_filename.suffix[1:] in [storage_format.value for storage_format in RepertoireStorageFormat], \
+            f"Repertoire: the file representing the repertoire has to be in numpy binary format or in Arrow IPC format. " \
+            f"Got {data_filename.suffix} instead."
 
     def get_sequence_aas(self):
         return self.get_attribute("sequence_aas")
@@ -203,57 +322,200 @@ class Repertoire(DatasetItem):
 
     def get_counts(self):
         counts = self.get_attribute("counts")
-        if counts is not None:
-            counts = np.array([int(count) if count is not None else None for count in counts])
+        if counts is not None and counts.dtype == object:
+            missing = pd.isnull(counts)
+            if missing.any():
+                present_counts = counts[~missing].astype(np.int64)
+                counts = np.empty(counts.shape[0], dtype=object)
+                counts[~missing] = present_counts
+            else:
+                counts = counts.astype(np.int64)
         return counts
 
     def get_chains(self):
-        chains = self.get_attribute("chains")
+        chains = self._read_dictionary("chains")
         if chains is not None:
-            chains = np.array([Chain.get_chain(chain_str) if chain_str is not None else None for chain_str in chains])
+            dictionary, indices = chains
+            chain_objects = np.array([Chain.get_chain(chain_str) for chain_str in dictionary] + [None], dtype=object)
+            chains = chain_objects[np.where(indices < 0, len(dictionary), indices)]
         return chains
 
+    def get_unique_values(self, field: str) -> list:
+        """Returns the distinct non-missing values of the field in the repertoire, or an empty list if the field is not present"""
+        dictionary = self._read_dictionary(field)
+        return list(dictionary[0]) if dictionary is not None else []
+
+    def get_categorical_codes(self, field: str, vocabulary: CategoricalVocabulary = None) -> np.ndarray:
+        """
+        Returns the values of a categorical field (e.g., v_genes, chains) as integer codes in the given vocabulary; the vocabulary is typically
+        shared across the dataset (see RepertoireDataset.get_categorical_vocabulary()), and if it is not given, a vocabulary of the values in
+        this repertoire is used. If the field is not present in the repertoire, all codes are CategoricalVocabulary.MISSING_CODE.
+        """
+        dictionary = self._read_dictionary(field)
+        if dictionary is None:
+            return np.full(self.get_element_count(), CategoricalVocabulary.MISSING_CODE,
+                           dtype=vocabulary.code_dtype if vocabulary is not None else np.int16)
+        vocabulary = CategoricalVocabulary(field, dictionary[0]) if vocabulary is None else vocabulary
+        return vocabulary.encode_dictionary(*dictionary)
+
+    def iter_batches(self, columns: list = None, batch_size: int = 10000):
+        """
+        Iterates over the sequences in the repertoire in batches without creating sequence objects. Each batch is a dict where keys are
+        the column names and values are numpy arrays with at most batch_size elements; the arrays are views of the data and should not be
+        modified. Columns which are not present in the repertoire are not included in the batches.
+
+        Args:
+            columns: the fields to include in the batches (e.g., sequence_aas, counts, v_genes); if None, all fields are included
+            batch_size: the maximum number of sequences in one batch
+
+        Returns:
+            a generator of dicts of numpy arrays
+        """
+        if columns is None:
+            data = self.load_data()
+            columns = {column: data[column] for column in data.dtype.names}
+        else:
+            columns = self._read_columns(columns)
+
+        for start in range(0, self.get_element_count(), batch_size):
+            yield {column: values[start:start + batch_size] for column, values in columns.items()}
+
+    def get_sequence_matrix(self, sequence_type: SequenceType = None):
+        """
+        Returns the sequences of the given type (or the type set in EnvironmentSettings) as an integer-coded, padded uint8 matrix and a vector
+        of sequence lengths (see :py:obj:`~immuneML.util.SequenceMatrixHelper.SequenceMatrixHelper` for the coding). If the matrix was stored
+        when the repertoire was built, it is memory-mapped from disk, otherwise it is computed from the sequences.
+
+        Args:
+            sequence_type: amino acid or nucleotide sequences
+
+        Returns:
+            a tuple of the matrix of shape (number of sequences, maximum sequence length) and the lengths vector
+        """
+        sequence_type = EnvironmentSettings.get_sequence_type() if sequence_type is None else sequence_type
+        stored_matrix = self._load_stored_sequence_matrix(sequence_type)
+        if stored_matrix is not None:
+            return stored_matrix
+
+        sequences = self.get_attribute(sequence_type.value)
+        assert sequences is not None, f"Repertoire: cannot create the sequence matrix for repertoire {self.identifier} since the " \
+                                      f"field {sequence_type.value} is not set."
+
+        return SequenceMatrixHelper.encode(sequences, sequence_type)
+
+    def store_sequence_matrices(self):
+        """Stores the sequence matrices for all sequence types present in the repertoire next to the repertoire data file"""
+        sequence_columns = self.get_attributes([sequence_type.value for sequence_type in SequenceType if sequence_type.value in self.fields])
+        for sequence_type in SequenceType:
+            if sequence_type.value in sequence_columns:
+                matrix, lengths = SequenceMatrixHelper.encode(sequence_columns[sequence_type.value], sequence_type)
+                SequenceMatrixHelper.store(matrix, lengths, self.data_filename, sequence_type)
+
+    def get_sequence_matrix_filenames(self) -> List[Path]:
+        return SequenceMatrixHelper.get_stored_filenames(self.data_filename)
+
+    def _load_stored_sequence_matrix(self, sequence_type: SequenceType):
+        return SequenceMatrixHelper.load(self.data_filename, sequence_type)
+
+    def _get_storage(self) -> RepertoireStorage:
+        return Repertoire.STORAGE[RepertoireStorageFormat.get_format(self.data_filename)]
+
+    def _read_stored_data(self) -> np.ndarray:
+        return self._get_storage().read(self.data_filename)
+
+    def _read_stored_columns(self, attributes: list) -> dict:
+        return self._get_storage().read_columns(self.data_filename, attributes)
+
+    def _read_stored_dictionary(self, attribute: str):
+        return self._get_storage().read_dictionary(self.data_filename, attribute)
+
     def load_data(self):
-        if self.data is None or (isinstance(self.data, weakref.ref) and self.data() is None):
-            data = np.load(self.data_filename, allow_pickle=True)
-            self.data = weakref.ref(data) if EnvironmentSettings.low_memory else data
-        data = self.data() if EnvironmentSettings.low_memory else self.data
+        data = RepertoireDataCache.get(self.data_filename)
+        if data is None:
+            data = self._read_stored_data()
+            data.flags.writeable = False
+            RepertoireDataCache.add(self.data_filename, data)
         self.element_count = data.shape[0]
         return data
 
-    def get_attribute(self, attribute):
-        data = self.load_data()
-        if attribute in data.dtype.names:
-            tmp = data[attribute]
-            return tmp
+    def _is_loaded(self) -> bool:
+        return RepertoireDataCache.contains(self.data_filename)
+
+    def _read_columns(self, attributes: list) -> dict:
+        if self._is_loaded() or self._get_storage() is NumpyRepertoireStorage:
+            data = self.load_data()
+            return {attribute: data[attribute] for attribute in attributes if attribute in data.dtype.names}
         else:
-            return None
+            columns = {attribute: RepertoireDataCache.get(self.data_filename, attribute) for attribute in attributes}
+            missing_attributes = [attribute for attribute, column in columns.items() if column is None]
+            if len(missing_attributes) > 0:
+                for attribute, column in self._read_stored_columns(missing_attributes).items():
+                    column.flags.writeable = False
+                    RepertoireDataCache.add(self.data_filename, column, attribute)
+                    columns[attribute] = column
+            return {attribute: column for attribute, column in columns.items() if column is not None}
+
+    def _read_dictionary(self, attribute: str):
+        if self._is_loaded() or self._get_storage() is NumpyRepertoireStorage:
+            column = self.get_attribute(attribute)
+            if column is None:
+                return None
+            indices, dictionary = pd.factorize(column)
+            return dictionary, indices
+        else:
+            dictionary = RepertoireDataCache.get(self.data_filename, (attribute, "dictionary"))
+            if dictionary is None:
+                dictionary = self._read_stored_dictionary(attribute)
+                if dictionary is not None:
+                    RepertoireDataCache.add(self.data_filename, dictionary, (attribute, "dictionary"))
+            return dictionary
+
+    def get_attribute(self, attribute):
+        return self._read_columns([attribute]).get(attribute, None)
 
     def get_attributes(self, attributes: list):
-        data = self.load_data()
-        result = {}
+        result = self._read_columns(attributes)
         for attribute in attributes:
-            if attribute in data.dtype.names:
-                result[attribute] = data[attribute]
-            else:
+            if attribute not in result:
                 logging.warning(f"{Repertoire.__name__}: attribute {attribute} is not present in the repertoire {self.identifier}, skipping...")
         return result
 
     def free_memory(self):
-        self.data = None
+        RepertoireDataCache.remove(self.data_filename)
 
-    def __getstate__(self):
-        state = self.__dict__.copy()
-        del state['data']
-        return state
+    def get_fingerprint(self) -> str:
+        """
+        Returns the content fingerprint of the repertoire, which is computed from the sequence data and the repertoire-level metadata (e.g.,
+        labels) and, unlike the identifier, is the same for repertoires with the same content; it is used to build cache keys. The fingerprint
+        of the data is computed when the repertoire is built and stored in the metadata file, so this does not read the data.
+        """
+        metadata = getattr(self, "metadata", None) or {}
+        metadata_values = [(key, metadata[key]) for key in sorted(metadata.keys()) if key not in ["field_list", Repertoire.FINGERPRINT_KEY]]
+        return FingerprintHelper.fingerprint_values([self._get_data_fingerprint(), metadata_values])
+
+    def _get_data_fingerprint(self) -> str:
+        if getattr(self, "_data_fingerprint", None) is None:
+            self._data_fingerprint = self._build_data_fingerprint()
+        return self._data_fingerprint
+
+    def _build_data_fingerprint(self) -> str:
+        """Returns the fingerprint stored at build time or, for repertoires stored without it, computes it from the data"""
+        metadata = getattr(self, "metadata", None) or {}
+        if metadata.get(Repertoire.FINGERPRINT_KEY) is not None:
+            return metadata[Repertoire.FINGERPRINT_KEY]
+        data = self.load_data()
+        return FingerprintHelper.fingerprint_columns({field: data[field] for field in data.dtype.names})
 
     def __setstate__(self, state):
+        state.pop("data", None)
         self.__dict__.update(state)
-        self.data = None
 
     def get_element_count(self):
         if self.element_count is None:
-            self.load_data()
+            if self._get_storage() is NumpyRepertoireStorage:
+                self.load_data()
+            else:
+                self.element_count = self._get_storage().get_element_count(self.data_filename)
         return self.element_count
 
     def _make_sequence_object(self, row, load_implants: bool = False):
@@ -287,7 +549,7 @@ class Repertoire(DatasetItem):
                                                          cell_id=row["cell_ids"] if "cell_ids" in fields else None,
                                                          custom_params={key: row[key] if key in fields else None
                                                                         for key in set(self.fields) - set(Repertoire.FIELDS)}),
-                               annotation=SequenceAnnotation(implants=implants))
+                               annotation=SequenceAnnotation(implants=implants) if len(implants) > 0 else None)
 
         return seq
 
@@ -0,0 +1,156 @@
+import pickle
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from immuneML.data_model.repertoire.storage.RepertoireStorage import RepertoireStorage
+
+
+class ArrowRepertoireStorage(RepertoireStorage):
+    """
+    Stores repertoire data in Arrow IPC (feather v2) format with typed columns: strings are stored as string columns and numbers as
+    integer/float columns. The file is memory-mapped when read, so only the columns which are requested are read from disk, and numeric
+    columns without missing values are returned as numpy arrays without copying. Categorical columns (e.g., genes, chains) are stored
+    dictionary-encoded, so that each distinct value is stored only once.
+
+    Columns which cannot be represented by a single Arrow type (e.g., a mix of strings and numbers or arbitrary objects) are stored as
+    pickled values and unpickled when read, so that the values are the same as with the numpy storage.
+
+    Repertoires built in chunks (see Repertoire.build_from_chunks()) are written one record batch per chunk, with the column types chosen from
+    the summary of all chunks and one dictionary per categorical column shared by all batches, so the file is the same as if all data were
+    written at once, except for the batch boundaries.
+
+    This storage requires the optional dependency pyarrow (install immuneML with the Arrow extra: pip install immuneML[Arrow]).
+    """
+
+    PICKLED_COLUMN_KEY = b"immuneML_pickled"
+
+    @staticmethod
+    def write(filename: Path, columns: dict, categorical_columns: list = None):
+        import pyarrow as pa
+
+        arrays, fields = [], []
+        for name, values in columns.items():
+            array, field = ArrowRepertoireStorage._make_column(pa, name, values, categorical_columns is not None and name in categorical_columns)
+            arrays.append(array)
+            fields.append(field)
+
+        table = pa.Table.from_arrays(arrays, schema=pa.schema(fields))
+
+        with pa.OSFile(str(filename), "wb") as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+
+    @staticmethod
+    def _make_column(pa, name: str, values, categorical: bool):
+        try:
+            array = pa.array(values, from_pandas=True)
+            if pa.types.is_null(array.type) or pa.types.is_nested(array.type):
+                raise TypeError(f"column {name} cannot be stored as a typed column")
+            if categorical and pa.types.is_string(array.type):
+                array = array.dictionary_encode()
+            return array, pa.field(name, array.type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError, TypeError, ValueError):
+            array = pa.array([pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL) for value in values], type=pa.binary())
+            return array, pa.field(name, pa.binary(), metadata={ArrowRepertoireStorage.PICKLED_COLUMN_KEY: b"1"})
+
+    @staticmethod
+    def write_spool(filename: Path, spool, columns: list, categorical_columns: list = None):
+        import pyarrow as pa
+
+        fields = [ArrowRepertoireStorage._make_spooled_field(pa, name, spool.columns[name], categorical_columns is not None
+                                                              and name in categorical_columns) for name in columns]
+        schema = pa.schema(fields)
+        dictionaries = {field.name: list(spool.columns[field.name].categories.keys()) for field in fields if pa.types.is_dictionary(field.type)}
+        dictionaries = {name: (pa.array(values, type=pa.string()), pd.Index(values, dtype=object)) for name, values in dictionaries.items()}
+
+        with pa.OSFile(str(filename), "wb") as sink:
+            with pa.ipc.new_file(sink, schema) as writer:
+                for chunk in spool.iterate_chunks(columns):
+                    arrays = [ArrowRepertoireStorage._make_spooled_array(pa, chunk[field.name], field, dictionaries.get(field.name)) for field in fields]
+                    writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+
+    @staticmethod
+    def _make_spooled_field(pa, name: str, column, categorical: bool):
+        if column.dtype != object:
+            return pa.field(name, pa.from_numpy_dtype(column.dtype))
+        elif len(column.kinds) > 0 and column.kinds.issubset({"string"}):
+            return pa.field(name, pa.dictionary(pa.int32(), pa.string()) if categorical else pa.string())
+        elif column.kinds == {"integer"}:
+            return pa.field(name, pa.int64())
+        elif column.kinds == {"boolean"}:
+            return pa.field(name, pa.bool_())
+        elif len(column.kinds) > 0 and column.kinds.issubset({"integer", "floating", "mixed-integer-float"}):
+            return pa.field(name, pa.float64())
+        else:
+            return pa.field(name, pa.binary(), metadata={ArrowRepertoireStorage.PICKLED_COLUMN_KEY: b"1"})
+
+    @staticmethod
+    def _make_spooled_array(pa, values, field, dictionary: tuple):
+        if field.metadata is not None and ArrowRepertoireStorage.PICKLED_COLUMN_KEY in field.metadata:
+            return pa.array([pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL) for value in values], type=pa.binary())
+        elif dictionary is not None:
+            indices = dictionary[1].get_indexer(values).astype(np.int32)
+            return pa.DictionaryArray.from_arrays(pa.array(indices, mask=indices < 0, type=pa.int32()), dictionary[0])
+        else:
+            return pa.array(values, type=field.type, from_pandas=True)
+
+    @staticmethod
+    def _open_table(filename: Path):
+        import pyarrow as pa
+
+        with pa.memory_map(str(filename), "r") as source:
+            return pa.ipc.open_file(source).read_all()
+
+    @staticmethod
+    def _to_numpy(column, field) -> np.ndarray:
+        import pyarrow as pa
+
+        if field.metadata is not None and ArrowRepertoireStorage.PICKLED_COLUMN_KEY in field.metadata:
+            values = np.empty(len(column), dtype=object)
+            values[:] = [pickle.loads(value) for value in column.to_pylist()]
+            return values
+        elif pa.types.is_dictionary(field.type):
+            return column.cast(field.type.value_type).to_numpy()
+        elif column.null_count > 0 and not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+            values = np.empty(len(column), dtype=object)
+            values[:] = column.to_pylist()
+            return values
+        else:
+            return column.to_numpy()
+
+    @staticmethod
+    def read(filename: Path) -> np.ndarray:
+        table = ArrowRepertoireStorage._open_table(filename)
+        data = np.empty(table.num_rows, dtype=np.dtype([(name, object) for name in table.column_names]))
+        for field in table.schema:
+            data[field.name] = ArrowRepertoireStorage._to_numpy(table.column(field.name), field)
+        return data
+
+    @staticmethod
+    def read_columns(filename: Path, columns: list) -> dict:
+        table = ArrowRepertoireStorage._open_table(filename)
+        return {column: ArrowRepertoireStorage._to_numpy(table.column(column), table.schema.field(column))
+                for column in columns if column in table.column_names}
+
+    @staticmethod
+    def read_dictionary(filename: Path, column: str):
+        import pyarrow as pa
+
+        table = ArrowRepertoireStorage._open_table(filename)
+        if column not in table.column_names:
+            return None
+
+        field, column_data = table.schema.field(column), table.column(column)
+        if pa.types.is_dictionary(field.type) and column_data.num_chunks > 0 \
+                and all(chunk.dictionary.equals(column_data.chunk(0).dictionary) for chunk in column_data.chunks):
+            indices = [chunk.indices.fill_null(-1).to_numpy() for chunk in column_data.chunks]
+            return column_data.chunk(0).dictionary.to_numpy(zero_copy_only=False), np.concatenate(indices) if len(indices) > 1 else indices[0]
+
+        indices, dictionary = pd.factorize(ArrowRepertoireStorage._to_numpy(column_data, field))
+        return dictionary, indices
+
+    @staticmethod
+    def get_element_count(filename: Path) -> int:
+        return ArrowRepertoireStorage._open_table(filename).num_rows
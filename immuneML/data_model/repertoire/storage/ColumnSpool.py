@@ -0,0 +1,149 @@
+import pickle
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class SpooledColumn:
+    """
+    Summary of a column stored in a ColumnSpool:
+
+    - dtype: the numpy dtype shared by all chunks, or object if the chunks have different dtypes,
+    - kinds: the kinds of the values as returned by pandas.api.types.infer_dtype() for each chunk, without the chunks where all values are missing,
+    - none_count: the number of None values and null_count the number of None or NaN values,
+    - categories: the distinct values in the order of first appearance, only for the categorical columns,
+    - generated: if True, the column is not stored and its values are the row numbers.
+    """
+    filename: Path
+    dtype: np.dtype = None
+    kinds: set = field(default_factory=set)
+    none_count: int = 0
+    null_count: int = 0
+    categories: dict = None
+    generated: bool = False
+
+
+class ColumnSpool:
+    """
+    Temporarily stores the columns of a repertoire which is built in chunks (see Repertoire.build_from_chunks()), so that only one chunk has
+    to be kept in memory. Each column is stored in a separate file as a sequence of pickled chunks, so that the columns can be read one by
+    one (e.g., for fingerprinting) or chunk by chunk (for writing them to the repertoire storage). The summary of each column (see
+    SpooledColumn) is kept in memory and is used to choose the types of the stored columns.
+
+    The chunks may have different columns; the values of a column which is missing from a chunk are set to None.
+    """
+
+    def __init__(self, path: Path, categorical_columns: list = None):
+        self.path = Path(tempfile.mkdtemp(prefix=".spool_", dir=path))
+        self.categorical_columns = set(categorical_columns) if categorical_columns is not None else set()
+        self.columns = {}
+        self.chunk_sizes = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.remove()
+
+    @property
+    def element_count(self) -> int:
+        return int(sum(self.chunk_sizes))
+
+    def append(self, columns: dict):
+        """Appends a chunk given as a dict of column names and lists, numpy arrays or pandas Series of equal length"""
+        columns = {name: ColumnSpool._to_array(values) for name, values in columns.items()}
+        lengths = {len(values) for values in columns.values()}
+        assert len(lengths) <= 1, f"ColumnSpool: there is a mismatch between the number of values in the columns: {lengths}."
+        chunk_size = lengths.pop() if len(lengths) > 0 else 0
+        if chunk_size == 0:
+            return
+
+        for name in columns.keys():
+            if name not in self.columns:
+                self._add_column(name)
+        for name in self.columns.keys():
+            if name not in columns:
+                columns[name] = np.full(chunk_size, None, dtype=object)
+
+        for name, values in columns.items():
+            self._append_values(self.columns[name], values)
+        self.chunk_sizes.append(chunk_size)
+
+    def _add_column(self, name: str):
+        column = SpooledColumn(filename=self.path / f"{len(self.columns)}.pickle",
+                               categories={} if name in self.categorical_columns else None)
+        self.columns[name] = column
+        for chunk_size in self.chunk_sizes:
+            self._append_values(column, np.full(chunk_size, None, dtype=object))
+
+    def _append_values(self, column: SpooledColumn, values: np.ndarray):
+        column.dtype = values.dtype if column.dtype is None or column.dtype == values.dtype else np.dtype(object)
+
+        kind = pd.api.types.infer_dtype(values, skipna=True)
+        if kind != "empty":
+            column.kinds.add(kind)
+
+        if values.dtype == object:
+            column.none_count += int(np.equal(values, None).sum())
+        column.null_count += int(pd.isnull(values).sum())
+
+        if column.categories is not None:
+            column.categories.update((value, None) for value in pd.unique(values) if not pd.isnull(value) and value not in column.categories)
+
+        with column.filename.open("ab") as file:
+            pickle.dump(values, file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def set_row_numbers(self, name: str):
+        """Replaces the values of the column by the row numbers (0, 1, 2, ...)"""
+        self.columns[name] = SpooledColumn(filename=self.path / f"{len(self.columns)}.pickle", dtype=np.arange(0).dtype, kinds={"integer"},
+                                           generated=True)
+
+    def is_missing(self, name: str) -> bool:
+        """Returns True if all values of the column are None"""
+        column = self.columns[name]
+        return not column.generated and column.dtype == object and column.none_count == self.element_count
+
+    def iterate_column(self, name: str):
+        """Yields the chunks of the column as numpy arrays with the dtype of the column (see SpooledColumn)"""
+        column = self.columns[name]
+        if column.generated:
+            start = 0
+            for chunk_size in self.chunk_sizes:
+                yield np.arange(start, start + chunk_size)
+                start += chunk_size
+        else:
+            with column.filename.open("rb") as file:
+                for _ in self.chunk_sizes:
+                    values = pickle.load(file)
+                    yield values if values.dtype == column.dtype else values.astype(column.dtype)
+
+    def iterate_chunks(self, names: list):
+        """Yields the chunks as dicts of column names and numpy arrays"""
+        iterators = {name: self.iterate_column(name) for name in names}
+        for _ in self.chunk_sizes:
+            yield {name: next(iterator) for name, iterator in iterators.items()}
+
+    def read_column(self, name: str) -> np.ndarray:
+        chunks = list(self.iterate_column(name))
+        return np.concatenate(chunks) if len(chunks) > 0 else np.empty(0, dtype=object)
+
+    def remove(self):
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    @staticmethod
+    def _to_array(values) -> np.ndarray:
+        if isinstance(values, pd.Series):
+            values = values.values
+        if isinstance(values, np.ndarray) and values.ndim == 1:
+            return values
+        if isinstance(values, pd.api.extensions.ExtensionArray):
+            return values.to_numpy(dtype=object)
+        array = np.empty(len(values), dtype=object)
+        for index, value in enumerate(values):
+            array[index] = value
+        return array
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from immuneML.data_model.repertoire.storage.RepertoireStorage import RepertoireStorage
+
+
+class NumpyRepertoireStorage(RepertoireStorage):
+    """
+    Stores repertoire data as a numpy structured array where each field is of object type. Reading any of the columns requires
+    unpickling the whole file.
+    """
+
+    @staticmethod
+    def write(filename: Path, columns: dict, categorical_columns: list = None):
+        element_count = len(next(iter(columns.values()))) if len(columns) > 0 else 0
+        repertoire_matrix = np.empty(element_count, dtype=np.dtype([(field, object) for field in columns.keys()]))
+        for field, values in columns.items():
+            repertoire_matrix[field] = NumpyRepertoireStorage._make_object_column(values, element_count)
+        np.save(str(filename), repertoire_matrix)
+
+    @staticmethod
+    def write_spool(filename: Path, spool, columns: list, categorical_columns: list = None):
+        repertoire_matrix = np.empty(spool.element_count, dtype=np.dtype([(field, object) for field in columns]))
+        start = 0
+        for chunk in spool.iterate_chunks(columns):
+            chunk_size = len(next(iter(chunk.values()))) if len(chunk) > 0 else 0
+            for field, values in chunk.items():
+                repertoire_matrix[field][start:start + chunk_size] = NumpyRepertoireStorage._make_object_column(values, chunk_size)
+            start += chunk_size
+        np.save(str(filename), repertoire_matrix)
+
+    @staticmethod
+    def _make_object_column(values, element_count: int) -> np.ndarray:
+        if isinstance(values, np.ndarray) and values.dtype == object:
+            return values
+        column = np.empty(element_count, dtype=object)
+        try:
+            column[:] = values
+        except ValueError:
+            for index, value in enumerate(values):
+                column[index] = value
+        return column
+
+    @staticmethod
+    def read(filename: Path) -> np.ndarray:
+        return np.load(filename, allow_pickle=True)
+
+    @staticmethod
+    def read_columns(filename: Path, columns: list) -> dict:
+        data = NumpyRepertoireStorage.read(filename)
+        return {column: data[column] for column in columns if column in data.dtype.names}
+
+    @staticmethod
+    def read_dictionary(filename: Path, column: str):
+        columns = NumpyRepertoireStorage.read_columns(filename, [column])
+        if column in columns:
+            indices, dictionary = pd.factorize(columns[column])
+            return dictionary, indices
+        else:
+            return None
+
+    @staticmethod
+    def get_element_count(filename: Path) -> int:
+        return NumpyRepertoireStorage.read(filename).shape[0]
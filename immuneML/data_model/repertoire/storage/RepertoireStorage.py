@@ -0,0 +1,56 @@
+import abc
+from pathlib import Path
+
+import numpy as np
+
+
+class RepertoireStorage(metaclass=abc.ABCMeta):
+    """
+    Defines how the sequence-level data of a :py:obj:`~immuneML.data_model.repertoire.Repertoire.Repertoire` is stored on disk.
+    Each field (e.g., sequence_aas, v_genes, counts) is stored as one column, and the columns can be read all at once as a numpy
+    structured array or separately by name.
+    """
+
+    @staticmethod
+    @abc.abstractmethod
+    def write(filename: Path, columns: dict, categorical_columns: list = None):
+        """
+        Stores the columns (a dict where keys are field names and values are lists or numpy arrays of equal length) to the file; columns listed
+        in categorical_columns have few distinct values and may be stored dictionary-encoded if the storage supports it
+        """
+        pass
+
+    @classmethod
+    def write_spool(cls, filename: Path, spool, columns: list, categorical_columns: list = None):
+        """
+        Stores the given columns of a :py:obj:`~immuneML.data_model.repertoire.storage.ColumnSpool.ColumnSpool` (used when the repertoire is
+        built in chunks); by default the columns are read into memory and stored with write(), storages which can write the data in parts
+        override this method
+        """
+        cls.write(filename, {column: spool.read_column(column) for column in columns}, categorical_columns)
+
+    @staticmethod
+    @abc.abstractmethod
+    def read(filename: Path) -> np.ndarray:
+        """Reads all columns from the file and returns them as a numpy structured array"""
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    def read_columns(filename: Path, columns: list) -> dict:
+        """Reads only the given columns from the file; columns which are not present in the file are not included in the result"""
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    def read_dictionary(filename: Path, column: str):
+        """
+        Returns the column as a tuple of unique values and an integer array with the index of the value for each element (-1 for missing
+        values), or None if the column is not present in the file
+        """
+        pass
+
+    @staticmethod
+    @abc.abstractmethod
+    def get_element_count(filename: Path) -> int:
+        pass
@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class RepertoireStorageFormat(Enum):
+
+    NUMPY = "npy"
+    ARROW = "arrow"
+
+    @staticmethod
+    def get_format(filename):
+        suffix = str(filename).rsplit(".", 1)[-1] if "." in str(filename) else ""
+        for storage_format in RepertoireStorageFormat:
+            if storage_format.value == suffix:
+                return storage_format
+        raise ValueError(f"RepertoireStorageFormat: unknown repertoire file format {suffix}, expected one of "
+                         f"{[storage_format.value for storage_format in RepertoireStorageFormat]}.")
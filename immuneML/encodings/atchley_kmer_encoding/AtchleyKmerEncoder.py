@@ -1,6 +1,5 @@
 import logging
 import math
-from multiprocessing import Pool
 from pathlib import Path
 from typing import Tuple, List
 
@@ -120,11 +119,11 @@ class AtchleyKmerEncoder(DatasetEncoder):
         keys = set()
         example_count = dataset.get_example_count()
 
-        arguments = [(repertoire, index, example_count) for index, repertoire in enumerate(dataset.repertoires)]
-
-        with Pool(params.pool_size) as pool:
-            chunksize = math.floor(dataset.get_example_count() / params.pool_size) + 1
-            examples = pool.starmap(self._process_repertoire_cached, arguments, chunksize=chunksize)
+        chunksize = math.floor(dataset.get_example_count() / params.pool_size) + 1
+        examples = CacheHandler.memo_in_pool([self._get_repertoire_caching_params(repertoire) for repertoire in dataset.repertoires],
+                                             self._process_repertoire,
+                                             [(repertoire, index, example_count) for index, repertoire in enumerate(dataset.repertoires)],
+                                             params.pool_size, CacheObjectType.ENCODING_STEP, chunksize=chunksize)
 
         for example in examples:
             keys.update(list(example.keys()))
@@ -133,10 +132,9 @@ class AtchleyKmerEncoder(DatasetEncoder):
 
         return examples, keys, labels
 
-    def _process_repertoire_cached(self, repertoire, index, example_count):
-        return CacheHandler.memo_by_params((('repertoire', repertoire.identifier), ('encoder', AtchleyKmerEncoder.__name__),
-                                            (self.abundance, self.skip_last_n_aa, self.skip_first_n_aa, self.k)),
-                                           lambda: self._process_repertoire(repertoire, index, example_count), CacheObjectType.ENCODING_STEP)
+    def _get_repertoire_caching_params(self, repertoire):
+        return (('repertoire', repertoire.get_fingerprint()), ('encoder', AtchleyKmerEncoder.__name__),
+                (self.abundance, self.skip_last_n_aa, self.skip_first_n_aa, self.k))
 
     def _process_repertoire(self, repertoire, index, example_count):
         if self.skip_first_n_aa > 0 and self.skip_last_n_aa > 0:
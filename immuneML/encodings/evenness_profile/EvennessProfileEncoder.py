@@ -91,8 +91,7 @@ class EvennessProfileEncoder(DatasetEncoder):
         return encoded_dataset
 
     def _prepare_caching_params(self, dataset, params: EncoderParams, step: str = ""):
-        return (("example_identifiers", tuple(dataset.get_example_ids())),
-                ("dataset_metadata", dataset.metadata_file if hasattr(dataset, "metadata_file") else None),
+        return (("dataset", dataset.get_fingerprint()),
                 ("dataset_type", dataset.__class__.__name__),
                 ("labels", tuple(params.label_config.get_labels_by_name())),
                 ("encoding", EvennessProfileEncoder.__name__),
@@ -1,6 +1,4 @@
-import hashlib
 import math
-from multiprocessing.pool import Pool
 
 import numpy as np
 
@@ -21,44 +19,43 @@ class EvennessProfileRepertoireEncoder(EvennessProfileEncoder):
 
         encoded_data = self._encode_data(dataset, params)
 
-        encoded_dataset = RepertoireDataset(repertoires=dataset.repertoires,
-                                            encoded_data=encoded_data,
-                                            labels=dataset.labels,
-                                            metadata_file=dataset.metadata_file)
+        encoded_dataset = dataset.clone()
+        encoded_dataset.add_encoded_data(encoded_data)
 
         return encoded_dataset
 
     @log
     def _encode_examples(self, dataset, params: EncoderParams):
 
-        arguments = [(repertoire, params) for repertoire in dataset.repertoires]
+        chunksize = math.floor(dataset.get_example_count()/params.pool_size) + 1
+        repertoires = CacheHandler.memo_in_pool([self._get_repertoire_caching_params(repertoire, params) for repertoire in dataset.repertoires],
+                                                self.encode_repertoire, [(repertoire, params) for repertoire in dataset.repertoires],
+                                                params.pool_size, CacheObjectType.ENCODING_STEP, chunksize=chunksize)
 
-        with Pool(params.pool_size) as pool:
-            chunksize = math.floor(dataset.get_example_count()/params.pool_size) + 1
-            repertoires = pool.starmap(self.get_encoded_repertoire, arguments, chunksize=chunksize)
-
-        encoded_repertoire_list, repertoire_names, labels = zip(*repertoires)
+        encoded_repertoire_list, _, labels = zip(*repertoires)
 
         encoded_labels = {k: [dic[k] for dic in labels] for k in labels[0]} if params.encode_labels else None
 
-        return list(encoded_repertoire_list), list(repertoire_names), encoded_labels
-
-    def get_encoded_repertoire(self, repertoire, params: EncoderParams):
+        return list(encoded_repertoire_list), [repertoire.identifier for repertoire in dataset.repertoires], encoded_labels
 
-        params.model = vars(self)
-
-        return CacheHandler.memo_by_params((("encoding_model", params.model),
-                                            ("labels", params.label_config.get_labels_by_name()),
-                                            ("repertoire_id", repertoire.identifier),
-                                            ("repertoire_data",  hashlib.sha256(np.ascontiguousarray(repertoire.get_sequence_aas())).hexdigest())),
-                                           lambda: self.encode_repertoire(repertoire, params), CacheObjectType.ENCODING_STEP)
+    def _get_repertoire_caching_params(self, repertoire, params: EncoderParams):
+        return (("encoding_model", (("min_alpha", self.min_alpha), ("max_alpha", self.max_alpha), ("dimension", self.dimension))),
+                ("labels", params.label_config.get_labels_by_name() if params.encode_labels else None),
+                ("repertoire", repertoire.get_fingerprint()))
 
     def encode_repertoire(self, repertoire, params: EncoderParams):
 
-        alphas = np.linspace(start=params.model["min_alpha"], stop=params.model["max_alpha"], num=params.model["dimension"])
+        alphas = np.linspace(start=self.min_alpha, stop=self.max_alpha, num=self.dimension)
+
+        counts = []
+        for batch in repertoire.iter_batches(["counts", "frame_types"]):
+            if "frame_types" in batch:
+                frame_types = batch["frame_types"]
+                counts.append(batch["counts"][(frame_types == SequenceFrameType.IN.value) | (frame_types == SequenceFrameType.IN)])
+            else:
+                counts.append(batch["counts"])
 
-        counts = [sequence.metadata.count for sequence in repertoire.sequences if sequence.metadata.frame_type == SequenceFrameType.IN]
-        freqs = np.array(counts)
+        freqs = np.concatenate(counts).astype(np.int64) if len(counts) > 0 else np.array([], dtype=np.int64)
         freqs = freqs[np.nonzero(freqs)]
 
         evenness_profile = np.array([np.exp(EntropyCalculator.renyi_entropy(freqs, alpha))/len(freqs) for alpha in alphas])
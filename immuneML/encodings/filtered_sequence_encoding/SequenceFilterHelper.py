@@ -7,6 +7,7 @@ import numpy as np
 import pandas as pd
 
 from immuneML.caching.CacheHandler import CacheHandler
+from immuneML.caching.CacheObjectType import CacheObjectType
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.data_model.repertoire.Repertoire import Repertoire
 from immuneML.encodings.EncoderParams import EncoderParams
@@ -26,7 +27,8 @@ class SequenceFilterHelper:
         comparison_data = CacheHandler.memo_by_params(EncoderHelper.build_comparison_params(current_dataset, comparison_attributes),
                                                       lambda: EncoderHelper.build_comparison_data(current_dataset, params,
                                                                                                   comparison_attributes,
-                                                                                                  sequence_batch_size))
+                                                                                                  sequence_batch_size),
+                                                      CacheObjectType.COMPARISON_DATA)
 
         return comparison_data
 
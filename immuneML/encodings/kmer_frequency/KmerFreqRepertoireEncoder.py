@@ -1,11 +1,13 @@
 from collections import Counter
-from multiprocessing.pool import Pool
+from itertools import chain
 
 from immuneML.caching.CacheHandler import CacheHandler
 from immuneML.caching.CacheObjectType import CacheObjectType
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.encodings.EncoderParams import EncoderParams
 from immuneML.encodings.kmer_frequency.KmerFrequencyEncoder import KmerFrequencyEncoder
+from immuneML.encodings.kmer_frequency.ReadsType import ReadsType
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.util.Logger import log
 
 
@@ -16,43 +18,52 @@ class KmerFreqRepertoireEncoder(KmerFrequencyEncoder):
 
         encoded_data = self._encode_data(dataset, params)
 
-        encoded_dataset = RepertoireDataset(repertoires=dataset.repertoires,
-                                            encoded_data=encoded_data,
-                                            labels=dataset.labels,
-                                            metadata_file=dataset.metadata_file)
+        encoded_dataset = dataset.clone()
+        encoded_dataset.add_encoded_data(encoded_data)
 
         return encoded_dataset
 
     @log
     def _encode_examples(self, dataset, params: EncoderParams):
 
-        arguments = [(repertoire, params) for repertoire in dataset.repertoires]
+        repertoires = CacheHandler.memo_in_pool([self._get_repertoire_caching_params(repertoire, params) for repertoire in dataset.repertoires],
+                                                self.encode_repertoire, [(repertoire, params) for repertoire in dataset.repertoires],
+                                                params.pool_size, CacheObjectType.ENCODING_STEP)
 
-        with Pool(params.pool_size) as pool:
-            repertoires = pool.starmap(self.get_encoded_repertoire, arguments)
-
-        encoded_repertoire_list, repertoire_names, labels, feature_annotation_names = zip(*repertoires)
+        encoded_repertoire_list, _, labels, feature_annotation_names = zip(*repertoires)
+        repertoire_names = [repertoire.identifier for repertoire in dataset.repertoires]
 
         encoded_labels = {k: [dic[k] for dic in labels] for k in labels[0]} if params.encode_labels else None
 
         feature_annotation_names = feature_annotation_names[0]
 
-        return list(encoded_repertoire_list), list(repertoire_names), encoded_labels, feature_annotation_names
-
-    def get_encoded_repertoire(self, repertoire, params: EncoderParams):
-        params.model = vars(self)
+        return list(encoded_repertoire_list), repertoire_names, encoded_labels, feature_annotation_names
 
-        return CacheHandler.memo_by_params((("encoding_model", params.model), ("type", "kmer_encoding"),
-                                            ("labels", params.label_config.get_labels_by_name()),
-                                            ("repertoire_id", repertoire.identifier)),
-                                           lambda: self.encode_repertoire(repertoire, params), CacheObjectType.ENCODING_STEP)
+    def _get_repertoire_caching_params(self, repertoire, params: EncoderParams):
+        return (("encoding_model", self._get_example_caching_params()),
+                ("type", "kmer_encoding"),
+                ("labels", params.label_config.get_labels_by_name() if params.encode_labels else None),
+                ("repertoire", repertoire.get_fingerprint()))
 
     def encode_repertoire(self, repertoire, params: EncoderParams):
         counts = Counter()
         sequence_encoder = self._prepare_sequence_encoder()
         feature_names = sequence_encoder.get_feature_names(params)
-        for sequence in repertoire.sequences:
-            counts = self._encode_sequence(sequence, params, sequence_encoder, counts)
+        params.model = vars(self)
+
+        sequence_field = (self.sequence_type if self.sequence_type is not None else EnvironmentSettings.get_sequence_type()).value
+        metadata_fields = sequence_encoder.get_metadata_columns(params)
+        count_fields = ["counts"] if self.reads == ReadsType.ALL else []
+
+        for batch in repertoire.iter_batches([sequence_field] + metadata_fields + count_fields):
+            features = sequence_encoder.encode_sequences(batch[sequence_field], params, batch)
+            if self.reads == ReadsType.UNIQUE:
+                counts.update(chain.from_iterable(sequence_features for sequence_features in features if sequence_features is not None))
+            elif self.reads == ReadsType.ALL:
+                for sequence_features, count in zip(features, batch["counts"]):
+                    if sequence_features is not None:
+                        for feature in sequence_features:
+                            counts[feature] += count
 
         label_config = params.label_config
         labels = dict() if params.encode_labels else None
@@ -16,6 +16,7 @@ from immuneML.encodings.kmer_frequency.ReadsType import ReadsType
 from immuneML.encodings.kmer_frequency.sequence_encoding.SequenceEncodingType import SequenceEncodingType
 from immuneML.encodings.preprocessing.FeatureScaler import FeatureScaler
 from immuneML.environment.Constants import Constants
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.environment.SequenceType import SequenceType
 from immuneML.util.FilenameHandler import FilenameHandler
 from immuneML.util.ParameterValidator import ParameterValidator
@@ -169,13 +170,24 @@ class KmerFrequencyEncoder(DatasetEncoder):
         return encoded_dataset
 
     def _prepare_caching_params(self, dataset, params: EncoderParams, step: str = ""):
-        return (("dataset_identifier", dataset.identifier),
+        return (("dataset", dataset.get_fingerprint()),
                 ("labels", tuple(params.label_config.get_labels_by_name())),
                 ("encoding", KmerFrequencyEncoder.__name__),
                 ("learn_model", params.learn_model),
                 ("step", step),
                 ("encoding_params", tuple(vars(self).items())))
 
+    def _get_example_caching_params(self) -> tuple:
+        """
+        Returns the parameters which determine the encoding of a single example, to be used in the cache keys of the per-example results; the
+        paths and the state learned from the training data (vectorizer, scaler) and the normalization (applied to the whole dataset) are not
+        included, so that the per-example results are reused between learning and applying the encoding and between data splits
+        """
+        sequence_type = self.sequence_type if self.sequence_type is not None else EnvironmentSettings.get_sequence_type()
+        return (("encoding", self.__class__.__name__), ("reads", self.reads), ("sequence_encoding", self.sequence_encoding),
+                ("sequence_type", sequence_type), ("k", self.k), ("k_left", self.k_left), ("k_right", self.k_right), ("min_gap", self.min_gap),
+                ("max_gap", self.max_gap), ("metadata_fields_to_include", tuple(self.metadata_fields_to_include)))
+
     def _encode_data(self, dataset, params: EncoderParams) -> EncodedData:
         encoded_example_list, example_ids, encoded_labels, feature_annotation_names = CacheHandler.memo_by_params(
             self._prepare_caching_params(dataset, params, KmerFrequencyEncoder.STEP_ENCODED),
@@ -1,5 +1,7 @@
 import warnings
 
+import numpy as np
+
 from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
 from immuneML.encodings.EncoderParams import EncoderParams
 from immuneML.encodings.kmer_frequency.sequence_encoding.SequenceEncodingStrategy import SequenceEncodingStrategy
@@ -34,6 +36,23 @@ class GappedKmerSequenceEncoder(SequenceEncodingStrategy):
 
         return gapped_kmers
 
+    @staticmethod
+    def encode_sequences(sequences: np.ndarray, params: EncoderParams, metadata: dict = None) -> list:
+        k_left = params.model.get('k_left')
+        k_right = params.model.get('k_right', k_left)
+        max_gap = params.model.get('max_gap')
+        min_gap = params.model.get('min_gap', 0)
+
+        features = []
+        for sequence in sequences:
+            if len(sequence) < k_left + k_right + max_gap:
+                warnings.warn('Sequence length is less than k_left + k_right + max_gap. Ignoring sequence')
+                features.append(None)
+            else:
+                features.append(KmerHelper.create_gapped_kmers_from_string(sequence, k_left=k_left, max_gap=max_gap, min_gap=min_gap,
+                                                                           k_right=k_right))
+        return features
+
     @staticmethod
     def get_feature_names(params: EncoderParams):
         return ["sequence"]
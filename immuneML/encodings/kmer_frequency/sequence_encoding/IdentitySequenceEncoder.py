@@ -1,4 +1,7 @@
+import numpy as np
+
 from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
+from immuneML.data_model.repertoire.Repertoire import Repertoire
 from immuneML.encodings.EncoderParams import EncoderParams
 from immuneML.encodings.kmer_frequency.sequence_encoding.SequenceEncodingStrategy import SequenceEncodingStrategy
 from immuneML.environment.Constants import Constants
@@ -30,6 +33,23 @@ class IdentitySequenceEncoder(SequenceEncodingStrategy):
 
         return [Constants.FEATURE_DELIMITER.join(res)]
 
+    @staticmethod
+    def encode_sequences(sequences: np.ndarray, params: EncoderParams, metadata: dict = None) -> list:
+        metadata = {} if metadata is None else metadata
+        columns = IdentitySequenceEncoder.get_metadata_columns(params)
+        include_sequence = params.model.get("sequence", True)
+
+        features = []
+        for index, sequence in enumerate(sequences):
+            res = [sequence] if include_sequence else []
+            res.extend(metadata[column][index] if column in metadata else None for column in columns)
+            features.append([Constants.FEATURE_DELIMITER.join(res)])
+        return features
+
+    @staticmethod
+    def get_metadata_columns(params: EncoderParams) -> list:
+        return [f"{field}s" if f"{field}s" in Repertoire.FIELDS else field for field in params.model.get("metadata_fields_to_include", [])]
+
     @staticmethod
     def get_feature_names(params: EncoderParams):
         res = []
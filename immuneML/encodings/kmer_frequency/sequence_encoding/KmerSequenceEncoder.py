@@ -1,5 +1,7 @@
 import logging
 
+import numpy as np
+
 from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
 from immuneML.encodings.EncoderParams import EncoderParams
 from immuneML.encodings.kmer_frequency.sequence_encoding.SequenceEncodingStrategy import SequenceEncodingStrategy
@@ -31,6 +33,18 @@ class KmerSequenceEncoder(SequenceEncodingStrategy):
 
         return kmers
 
+    @staticmethod
+    def encode_sequences(sequences: np.ndarray, params: EncoderParams, metadata: dict = None) -> list:
+        k = params.model["k"]
+        features = []
+        for sequence in sequences:
+            if len(sequence) < k:
+                logging.warning(f'KmerSequenceEncoder: Sequence length {len(sequence)} is less than {k}. Ignoring sequence...')
+                features.append(None)
+            else:
+                features.append(KmerHelper.create_kmers_from_string(sequence, k))
+        return features
+
     @staticmethod
     def get_feature_names(params: EncoderParams):
         return ["sequence"]
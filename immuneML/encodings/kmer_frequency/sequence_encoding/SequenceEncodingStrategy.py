@@ -1,5 +1,7 @@
 import abc
 
+import numpy as np
+
 from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
 from immuneML.encodings.EncoderParams import EncoderParams
 
@@ -11,6 +13,27 @@ class SequenceEncodingStrategy(metaclass=abc.ABCMeta):
     def encode_sequence(sequence: ReceptorSequence, params: EncoderParams):
         pass
 
+    @staticmethod
+    @abc.abstractmethod
+    def encode_sequences(sequences: np.ndarray, params: EncoderParams, metadata: dict = None) -> list:
+        """
+        Encodes a batch of sequences given as strings (e.g., from Repertoire.iter_batches()) without creating ReceptorSequence objects
+
+        Args:
+            sequences: array of sequence strings of the sequence type set in params.model['sequence_type']
+            params: EncoderParams object, same as for encode_sequence()
+            metadata: dict of arrays with the values of the fields returned by get_metadata_columns() for each sequence
+
+        Returns:
+            a list with the features of each sequence or None for sequences which cannot be encoded
+        """
+        pass
+
+    @staticmethod
+    def get_metadata_columns(params: EncoderParams) -> list:
+        """Returns the repertoire fields (other than the sequence) which encode_sequences() needs in the metadata"""
+        return []
+
     @staticmethod
     @abc.abstractmethod
     def get_feature_names(params: EncoderParams):
@@ -1,6 +1,4 @@
-import hashlib
 import math
-from multiprocessing.pool import Pool
 
 import numpy as np
 
@@ -26,10 +24,8 @@ class OneHotRepertoireEncoder(OneHotEncoder):
     def _encode_new_dataset(self, dataset, params: EncoderParams):
         encoded_data = self._encode_data(dataset, params)
 
-        encoded_dataset = RepertoireDataset(repertoires=dataset.repertoires,
-                                            encoded_data=encoded_data,
-                                            labels=dataset.labels,
-                                            metadata_file=dataset.metadata_file)
+        encoded_dataset = dataset.clone()
+        encoded_dataset.add_encoded_data(encoded_data)
 
         return encoded_dataset
 
@@ -55,13 +51,13 @@ class OneHotRepertoireEncoder(OneHotEncoder):
     def _encode_data(self, dataset, params: EncoderParams):
         self._set_max_dims(dataset)
 
-        arguments = [(repertoire, params) for repertoire in dataset.repertoires]
+        chunksize = math.floor(dataset.get_example_count() / params.pool_size) + 1
+        repertoires = CacheHandler.memo_in_pool([self._get_repertoire_caching_params(repertoire, params) for repertoire in dataset.repertoires],
+                                                self._encode_repertoire, [(repertoire, params) for repertoire in dataset.repertoires],
+                                                params.pool_size, CacheObjectType.ENCODING, chunksize=chunksize)
 
-        with Pool(params.pool_size) as pool:
-            chunksize = math.floor(dataset.get_example_count() / params.pool_size) + 1
-            repertoires = pool.starmap(self._get_encoded_repertoire, arguments, chunksize=chunksize)
-
-        encoded_repertoires, repertoire_names, labels = zip(*repertoires)
+        encoded_repertoires, _, labels = zip(*repertoires)
+        repertoire_names = [repertoire.identifier for repertoire in dataset.repertoires]
 
         examples = np.stack(encoded_repertoires, axis=0)
 
@@ -84,14 +80,14 @@ class OneHotRepertoireEncoder(OneHotEncoder):
     def _get_feature_names(self, max_seq_len, max_rep_len):
         return [[[f"{seq}_{pos}_{dim}" for dim in self.onehot_dimensions] for pos in range(max_seq_len)] for seq in range(max_rep_len)]
 
-    def _get_encoded_repertoire(self, repertoire, params: EncoderParams):
-        params.model = vars(self)
-
-        return CacheHandler.memo_by_params((("encoding_model", params.model),
-                                            ("labels", params.label_config.get_labels_by_name()),
-                                            ("repertoire_id", repertoire.identifier),
-                                            ("repertoire_data", hashlib.sha256(np.ascontiguousarray(repertoire.get_attribute(self.sequence_type.value))).hexdigest())),
-                                           lambda: self._encode_repertoire(repertoire, params), CacheObjectType.ENCODING)
+    def _get_repertoire_caching_params(self, repertoire, params: EncoderParams):
+        # the dimensions of the padded matrix depend on the dataset, but the paths and the flattening (done for the whole dataset) do not
+        encoding_params = (("use_positional_info", self.use_positional_info), ("distance_to_seq_middle", self.distance_to_seq_middle),
+                           ("sequence_type", self.sequence_type), ("alphabet", tuple(self.alphabet)), ("max_rep_len", self.max_rep_len),
+                           ("max_seq_len", self.max_seq_len))
+        return (("encoding_model", encoding_params),
+                ("labels", params.label_config.get_labels_by_name() if params.encode_labels else None),
+                ("repertoire", repertoire.get_fingerprint()))
 
     def _encode_repertoire(self, repertoire, params: EncoderParams):
         sequences = repertoire.get_attribute(self.sequence_type.value)
@@ -111,8 +111,7 @@ class MatchedReceptorsEncoder(DatasetEncoder):
                                                                 chain_b.get_sequence() + chain_b.metadata.v_gene + chain_b.metadata.j_gene
                                                                 for chain_a, chain_b in chains])}
 
-        return (("dataset_identifiers", tuple(dataset.get_example_ids())),
-                ("dataset_metadata", dataset.metadata_file),
+        return (("dataset", dataset.get_fingerprint()),
                 ("dataset_type", dataset.__class__.__name__),
                 ("labels", tuple(params.label_config.get_labels_by_name())),
                 ("encoding", MatchedReceptorsEncoder.__name__),
@@ -12,8 +12,7 @@ from immuneML.encodings.reference_encoding.MatchedReceptorsEncoder import Matche
 class MatchedReceptorsRepertoireEncoder(MatchedReceptorsEncoder):
 
     def _encode_new_dataset(self, dataset, params: EncoderParams):
-        encoded_dataset = RepertoireDataset(repertoires=dataset.repertoires, labels=dataset.labels,
-                                            metadata_file=dataset.metadata_file)
+        encoded_dataset = dataset.clone()
 
         feature_annotations = self._get_feature_info()
         encoded_repertoires, labels, example_ids = self._encode_repertoires(dataset, params)
@@ -84,7 +83,7 @@ class MatchedReceptorsRepertoireEncoder(MatchedReceptorsEncoder):
                                        dtype=int)
         labels = {label: [] for label in params.label_config.get_labels_by_name()} if params.encode_labels else None
 
-        for i, repertoire in enumerate(dataset.get_data()):
+        for i, repertoire in enumerate(dataset.iterate_repertoires()):
             encoded_repertories[i] = self._match_repertoire_to_receptors(repertoire)
 
             if labels is not None:
@@ -136,8 +136,7 @@ class MatchedRegexEncoder(DatasetEncoder):
         return encoded_dataset
 
     def _prepare_caching_params(self, dataset, params: EncoderParams):
-        return (("dataset_identifiers", tuple(dataset.get_example_ids())),
-                ("dataset_metadata", dataset.metadata_file),
+        return (("dataset", dataset.get_fingerprint()),
                 ("dataset_type", dataset.__class__.__name__),
                 ("labels", tuple(params.label_config.get_labels_by_name())),
                 ("encoding", MatchedRegexEncoder.__name__),
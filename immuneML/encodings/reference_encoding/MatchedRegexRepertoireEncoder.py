@@ -18,8 +18,7 @@ class MatchedRegexRepertoireEncoder(MatchedRegexEncoder):
     def _encode_new_dataset(self, dataset, params: EncoderParams):
         self._load_regex_df()
 
-        encoded_dataset = RepertoireDataset(repertoires=dataset.repertoires, labels=dataset.labels,
-                                            metadata_file=dataset.metadata_file)
+        encoded_dataset = dataset.clone()
 
         feature_annotations = self._get_feature_info()
         encoded_repertoires, labels = self._encode_repertoires(dataset, params)
@@ -73,7 +72,7 @@ class MatchedRegexRepertoireEncoder(MatchedRegexEncoder):
 
         n_repertoires = dataset.get_example_count()
 
-        for i, repertoire in enumerate(dataset.get_data()):
+        for i, repertoire in enumerate(dataset.iterate_repertoires()):
             print(f"{datetime.datetime.now()}: Encoding repertoire {i+1}/{n_repertoires}")
             encoded_repertoires[i] = self._match_repertoire_to_regexes(repertoire)
 
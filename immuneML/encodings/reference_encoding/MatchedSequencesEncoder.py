@@ -84,8 +84,7 @@ class MatchedSequencesEncoder(DatasetEncoder):
                                 "reference_sequences": sorted([seq.get_sequence() + seq.metadata.v_gene + seq.metadata.j_gene
                                                                for seq in self.reference_sequences])}
 
-        return (("dataset_identifiers", tuple(dataset.get_example_ids())),
-                ("dataset_metadata", dataset.metadata_file),
+        return (("dataset", dataset.get_fingerprint()),
                 ("dataset_type", dataset.__class__.__name__),
                 ("labels", tuple(params.label_config.get_labels_by_name())),
                 ("encoding", MatchedSequencesEncoder.__name__),
@@ -12,8 +12,7 @@ from immuneML.encodings.reference_encoding.MatchedSequencesEncoder import Matche
 class MatchedSequencesRepertoireEncoder(MatchedSequencesEncoder):
 
     def _encode_new_dataset(self, dataset, params: EncoderParams):
-        encoded_dataset = RepertoireDataset(repertoires=dataset.repertoires, labels=dataset.labels,
-                                            metadata_file=dataset.metadata_file)
+        encoded_dataset = dataset.clone()
         encoded_repertoires, labels = self._encode_repertoires(dataset, params)
 
         feature_annotations = self._get_feature_info()
@@ -61,7 +60,7 @@ class MatchedSequencesRepertoireEncoder(MatchedSequencesEncoder):
 
         labels = {label: [] for label in params.label_config.get_labels_by_name()} if params.encode_labels else None
 
-        for i, repertoire in enumerate(dataset.get_data()):
+        for i, repertoire in enumerate(dataset.iterate_repertoires()):
             encoded_repertories[i] = self._match_repertoire_to_reference(repertoire)
 
             for label in params.label_config.get_labels_by_name():
@@ -2,6 +2,7 @@ import numpy as np
 
 from immuneML.encodings.EncoderParams import EncoderParams
 from immuneML.encodings.word2vec.Word2VecEncoder import Word2VecEncoder
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.util.KmerHelper import KmerHelper
 
 
@@ -9,7 +10,7 @@ class W2VRepertoireEncoder(Word2VecEncoder):
 
     def _encode_examples(self, encoded_dataset, vectors, params):
         repertoires = np.zeros(shape=[encoded_dataset.get_example_count(), vectors.vector_size])
-        for (index, repertoire) in enumerate(encoded_dataset.get_data()):
+        for (index, repertoire) in enumerate(encoded_dataset.iterate_repertoires()):
             repertoires[index] = self._encode_repertoire(repertoire, vectors)
         return repertoires
 
@@ -28,15 +29,14 @@ class W2VRepertoireEncoder(Word2VecEncoder):
 
     def _encode_repertoire(self, repertoire, vectors):
         repertoire_vector = np.zeros(vectors.vector_size)
-        for (index2, sequence) in enumerate(repertoire.sequences):
-            kmers = KmerHelper.create_kmers_from_sequence(sequence=sequence, k=self.k)
-            sequence_vector = np.zeros(vectors.vector_size)
-            for kmer in kmers:
-                try:
-                    word_vector = vectors.get_vector(kmer)
-                    sequence_vector = np.add(sequence_vector, word_vector)
-                except KeyError:
-                    pass
-
-            repertoire_vector = np.add(repertoire_vector, sequence_vector)
+        sequence_field = EnvironmentSettings.get_sequence_type().value
+        for batch in repertoire.iter_batches([sequence_field]):
+            for sequence in batch[sequence_field]:
+                sequence_vector = np.zeros(vectors.vector_size)
+                for kmer in KmerHelper.create_kmers_from_string(sequence, self.k):
+                    try:
+                        sequence_vector = np.add(sequence_vector, vectors.get_vector(kmer))
+                    except KeyError:
+                        pass
+                repertoire_vector = np.add(repertoire_vector, sequence_vector)
         return repertoire_vector
@@ -1,6 +1,5 @@
 # quality: gold
 import abc
-import hashlib
 from pathlib import Path
 from typing import List
 
@@ -102,12 +101,10 @@ class Word2VecEncoder(DatasetEncoder):
         return encoded_dataset
 
     def _prepare_caching_params(self, dataset, params: EncoderParams, vectors=None, description: str = ""):
-        return (("dataset_id", dataset.identifier),
-                ("dataset_filenames", tuple(dataset.get_example_ids())),
-                ("dataset_metadata", dataset.metadata_file),
+        return (("dataset", dataset.get_fingerprint()),
                 ("dataset_type", dataset.__class__.__name__),
                 ("labels", tuple(params.label_config.get_labels_by_name())),
-                ("vectors", hashlib.sha256(str(vectors).encode("utf-8")).hexdigest()),
+                ("vectors", vectors),
                 ("description", description),
                 ("encoding", Word2VecEncoder.__name__),
                 ("learn_model", params.learn_model),
@@ -11,6 +11,17 @@ class Constants:
     GENE_DELIMITER = "-"
     STOP_CODON = "*"
     CACHE_TYPE = "cache_type"
+    REPERTOIRE_STORAGE_FORMAT = "repertoire_storage_format"
+    REPERTOIRE_CACHE_SIZE = "repertoire_cache_size"
+    PREFETCH_COUNT = "prefetch_count"
+    CACHE_MEMORY_SIZE = "cache_memory_size"
+    CACHE_MEMORY_POLICY = "cache_memory_policy"
+    CACHE_COMPRESSION = "cache_compression"
+    CACHE_STATISTICS_PATH = "cache_statistics_path"
+    CACHE_STATISTICS_CALL_SITES = "cache_statistics_call_sites"
+    PERSISTENT_CACHE_PATH = "persistent_cache_path"
+    PERSISTENT_CACHE_SIZE = "persistent_cache_size"
+    PERSISTENT_CACHE_OBJECT_TYPES = "persistent_cache_object_types"
     COMMENT_SIGN = "#"
     NOT_COMPUTED = "not computed"
 
@@ -1,9 +1,14 @@
 # quality: gold
 import datetime
 import os
+import warnings
 from pathlib import Path
 
+from immuneML.caching.CacheCompression import CacheCompression
+from immuneML.caching.CacheMemoryPolicy import CacheMemoryPolicy
+from immuneML.caching.CacheObjectType import CacheObjectType
 from immuneML.caching.CacheType import CacheType
+from immuneML.data_model.repertoire.storage.RepertoireStorageFormat import RepertoireStorageFormat
 from immuneML.environment.Constants import Constants
 from immuneML.environment.SequenceType import SequenceType
 from immuneML.util.PathBuilder import PathBuilder
@@ -26,7 +31,13 @@ class EnvironmentSettings:
     specs_docs_path = root_path / "docs/specs"
     source_docs_path = root_path / "docs/source"
     max_sequence_length = 20
-    low_memory = True
+    default_repertoire_cache_size = 2 * 1024 ** 3
+    default_cache_memory_size = 512 * 1024 ** 2
+    default_cache_memory_policies = {CacheObjectType.ENCODING_STEP: CacheMemoryPolicy.READ_WRITE, CacheObjectType.ENCODING: CacheMemoryPolicy.READ,
+                                     CacheObjectType.COMPARISON_DATA: CacheMemoryPolicy.READ, CacheObjectType.OTHER: CacheMemoryPolicy.NONE}
+    default_persistent_cache_size = 20 * 1024 ** 3
+    default_persistent_cache_object_types = [CacheObjectType.ENCODING_STEP, CacheObjectType.ENCODING]
+    persist_sequence_matrix = False
 
     @staticmethod
     def reset_cache_path():
@@ -45,15 +56,187 @@ class EnvironmentSettings:
         return CacheType[os.environ[Constants.CACHE_TYPE].upper()]
 
     @staticmethod
-    def get_cache_path(cache_type: CacheType = None):
+    def get_cache_path(cache_type: CacheType = None, object_type: CacheObjectType = None):
+        """
+        :return: the folder of the cache; for production cache and the object types which are stored in the persistent cache (if it is set, see
+                 set_persistent_cache()), it is the folder of the persistent cache shared between runs
+        """
         cache_type = EnvironmentSettings.get_cache_type() if cache_type is None else cache_type
         if cache_type == CacheType.PRODUCTION:
+            persistent_cache_path = EnvironmentSettings.get_persistent_cache_path()
+            if persistent_cache_path is not None and object_type in EnvironmentSettings.get_persistent_cache_object_types():
+                return persistent_cache_path
             return EnvironmentSettings.cache_path
         elif cache_type == CacheType.TEST:
             return EnvironmentSettings.tmp_cache_path
         else:
             raise RuntimeError("Cache is not set up.")
 
+    @staticmethod
+    def set_persistent_cache(path: Path, max_bytes: int = None, object_types: list = None):
+        """
+        Sets the folder of the persistent cache, which is shared between runs and is not removed at the end of a run: the cached objects of the
+        given types (by default, encoded repertoires) are stored there instead of in the cache folder of the run, so that the next runs on the
+        same data can reuse them. At the end of each run, the least recently used objects are removed until the cache fits max_bytes (20 GB
+        by default). The objects which refer to other files of a run (e.g., datasets) should not be stored in the persistent cache.
+
+        Args:
+            path: the folder of the persistent cache
+            max_bytes: the size budget of the persistent cache in bytes
+            object_types: the list of CacheObjectType values of the objects stored in the persistent cache
+        """
+        os.environ[Constants.PERSISTENT_CACHE_PATH] = str(Path(path).absolute())
+        if max_bytes is not None:
+            os.environ[Constants.PERSISTENT_CACHE_SIZE] = str(int(max_bytes))
+        if object_types is not None:
+            os.environ[Constants.PERSISTENT_CACHE_OBJECT_TYPES] = ",".join(object_type.name for object_type in object_types)
+
+    @staticmethod
+    def get_persistent_cache_path():
+        """
+        :return: the folder of the persistent cache or None if the persistent cache is not used (default); can be set by setting the
+                 environment variable 'persistent_cache_path' or by calling set_persistent_cache()
+        """
+        path = os.environ.get(Constants.PERSISTENT_CACHE_PATH)
+        return Path(path) if path else None
+
+    @staticmethod
+    def get_persistent_cache_size() -> int:
+        return int(os.environ.get(Constants.PERSISTENT_CACHE_SIZE, EnvironmentSettings.default_persistent_cache_size))
+
+    @staticmethod
+    def get_persistent_cache_object_types() -> list:
+        object_types = os.environ.get(Constants.PERSISTENT_CACHE_OBJECT_TYPES)
+        if object_types is None:
+            return EnvironmentSettings.default_persistent_cache_object_types
+        return [CacheObjectType[object_type.strip().upper()] for object_type in object_types.split(",") if object_type.strip() != ""]
+
+    @staticmethod
+    def set_repertoire_storage_format(storage_format: RepertoireStorageFormat):
+        os.environ[Constants.REPERTOIRE_STORAGE_FORMAT] = storage_format.name
+
+    @staticmethod
+    def get_repertoire_storage_format() -> RepertoireStorageFormat:
+        """
+        :return: the format in which newly built repertoires are stored; NUMPY by default, can be set to ARROW by setting the environment
+                 variable 'repertoire_storage_format' or by calling set_repertoire_storage_format()
+        """
+        if Constants.REPERTOIRE_STORAGE_FORMAT not in os.environ:
+            os.environ[Constants.REPERTOIRE_STORAGE_FORMAT] = RepertoireStorageFormat.NUMPY.name
+        return RepertoireStorageFormat[os.environ[Constants.REPERTOIRE_STORAGE_FORMAT].upper()]
+
+    @staticmethod
+    def set_repertoire_cache_size(size: int):
+        """
+        Sets the memory budget (in bytes) of the in-memory cache of repertoire data in each process; setting it to 0 disables caching, so the
+        repertoire data is read from disk on every access
+        """
+        os.environ[Constants.REPERTOIRE_CACHE_SIZE] = str(int(size))
+
+    @staticmethod
+    def get_repertoire_cache_size() -> int:
+        """
+        :return: the memory budget (in bytes) of the in-memory cache of repertoire data in each process, 2 GB by default; can be set by setting
+                 the environment variable 'repertoire_cache_size' or by calling set_repertoire_cache_size()
+        """
+        if Constants.REPERTOIRE_CACHE_SIZE not in os.environ:
+            os.environ[Constants.REPERTOIRE_CACHE_SIZE] = str(EnvironmentSettings.default_repertoire_cache_size)
+        return int(os.environ[Constants.REPERTOIRE_CACHE_SIZE])
+
+    @staticmethod
+    def set_cache_memory_size(size: int):
+        """
+        Sets the memory budget (in bytes) of the in-memory tier of the cache (see CacheHandler) in each process; setting it to 0 disables the
+        in-memory tier, so the cached objects are always loaded from the cache files
+        """
+        os.environ[Constants.CACHE_MEMORY_SIZE] = str(int(size))
+
+    @staticmethod
+    def get_cache_memory_size() -> int:
+        """
+        :return: the memory budget (in bytes) of the in-memory tier of the cache in each process, 512 MB by default; can be set by setting
+                 the environment variable 'cache_memory_size' or by calling set_cache_memory_size()
+        """
+        return int(os.environ.get(Constants.CACHE_MEMORY_SIZE, EnvironmentSettings.default_cache_memory_size))
+
+    @staticmethod
+    def set_cache_memory_policy(object_type: CacheObjectType, policy: CacheMemoryPolicy):
+        os.environ[f"{Constants.CACHE_MEMORY_POLICY}_{object_type.name.lower()}"] = policy.name
+
+    @staticmethod
+    def get_cache_memory_policy(object_type: CacheObjectType) -> CacheMemoryPolicy:
+        """
+        :return: the policy defining if the cached objects of the given type are kept in the in-memory tier of the cache; can be set by setting
+                 the environment variable 'cache_memory_policy_<object type>' (e.g., cache_memory_policy_encoding_step) or by calling
+                 set_cache_memory_policy(), otherwise the defaults from default_cache_memory_policies are used
+        """
+        policy = os.environ.get(f"{Constants.CACHE_MEMORY_POLICY}_{object_type.name.lower()}")
+        return CacheMemoryPolicy[policy.upper()] if policy is not None else EnvironmentSettings.default_cache_memory_policies[object_type]
+
+    @staticmethod
+    def set_cache_compression(compression: CacheCompression):
+        os.environ[Constants.CACHE_COMPRESSION] = EnvironmentSettings._get_available_compression(compression).name
+
+    @staticmethod
+    def get_cache_compression() -> CacheCompression:
+        """
+        :return: the compression of the cache files of the objects stored with dill (numpy arrays and sparse matrices are stored uncompressed),
+                 no compression by default; can be set by setting the environment variable 'cache_compression' (values NONE, LZ4 or ZSTD) or by
+                 calling set_cache_compression(); if the library needed for the compression is not installed, the files are not compressed
+        """
+        compression = CacheCompression[os.environ.get(Constants.CACHE_COMPRESSION, CacheCompression.NONE.name).upper()]
+        return EnvironmentSettings._get_available_compression(compression)
+
+    @staticmethod
+    def _get_available_compression(compression: CacheCompression) -> CacheCompression:
+        if compression.is_available():
+            return compression
+        warnings.warn(f"EnvironmentSettings: cache compression {compression.name} requires the package {compression.get_module_name()}, "
+                      f"which is not installed. The cache files will not be compressed.", RuntimeWarning)
+        return CacheCompression.NONE
+
+    @staticmethod
+    def set_cache_statistics_path(path: Path = None):
+        """Sets the folder where each process stores its cache statistics (see CacheStatistics); if path is None, the statistics are not stored"""
+        if path is not None:
+            os.environ[Constants.CACHE_STATISTICS_PATH] = str(Path(path).absolute())
+        elif Constants.CACHE_STATISTICS_PATH in os.environ:
+            del os.environ[Constants.CACHE_STATISTICS_PATH]
+
+    @staticmethod
+    def get_cache_statistics_path():
+        path = os.environ.get(Constants.CACHE_STATISTICS_PATH)
+        return Path(path) if path is not None else None
+
+    @staticmethod
+    def set_cache_statistics_call_sites(enabled: bool):
+        """Sets if the cache statistics (see CacheStatistics) are also counted per call site, which requires inspecting the call stack"""
+        os.environ[Constants.CACHE_STATISTICS_CALL_SITES] = str(bool(enabled))
+
+    @staticmethod
+    def get_cache_statistics_call_sites() -> bool:
+        """
+        :return: if the cache statistics are counted per call site, False by default; can be set by setting the environment variable
+                 'cache_statistics_call_sites' to True or by calling set_cache_statistics_call_sites()
+        """
+        return os.environ.get(Constants.CACHE_STATISTICS_CALL_SITES, "False").lower() == "true"
+
+    @staticmethod
+    def set_prefetch_count(count: int):
+        """
+        Sets how many batch files (for sequence and receptor datasets) or repertoires (for repertoire datasets) are loaded ahead on a
+        background thread while iterating through a dataset; setting it to 0 disables prefetching
+        """
+        os.environ[Constants.PREFETCH_COUNT] = str(int(count))
+
+    @staticmethod
+    def get_prefetch_count() -> int:
+        """
+        :return: how many batch files or repertoires are loaded ahead when iterating through a dataset, 0 (no prefetching) by default; can be
+                 set by setting the environment variable 'prefetch_count' or by calling set_prefetch_count()
+        """
+        return int(os.environ.get(Constants.PREFETCH_COUNT, 0))
+
     @staticmethod
     def set_sequence_type(sequence_type: SequenceType):
         EnvironmentSettings.sequence_type = sequence_type
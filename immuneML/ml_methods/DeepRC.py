@@ -1,4 +1,3 @@
-import hashlib
 import warnings
 from pathlib import Path
 
@@ -240,7 +239,7 @@ class DeepRC(MLMethod):
 
     def _prepare_caching_params(self, encoded_data: EncodedData, type: str, label_name: str):
         return (("metadata_filepath", str(encoded_data.info["metadata_filepath"])),
-                ("y", hashlib.sha256(str(encoded_data.labels[label_name]).encode("utf-8")).hexdigest()),
+                ("y", encoded_data.labels[label_name]),
                 ("label_name", label_name),
                 ("type", type),
                 ("validation_part", self.validation_part),
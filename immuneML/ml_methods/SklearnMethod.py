@@ -1,5 +1,4 @@
 import abc
-import hashlib
 import os
 import warnings
 from pathlib import Path
@@ -87,14 +86,14 @@ class SklearnMethod(MLMethod):
         self.label_name = None
 
     def _prepare_caching_params(self, encoded_data: EncodedData, y, method_type: str, label_name: str = None, number_of_splits: int = -1):
-        return (("encoded_data", hashlib.sha256(str(encoded_data.examples).encode("utf-8")).hexdigest()),
-                ("y", hashlib.sha256(str(y).encode("utf-8")).hexdigest()),
+        return (("encoded_data", encoded_data.examples),
+                ("y", y),
                 ("label_names", label_name),
                 ("type", method_type),
                 ("class", self.__class__.__name__),
                 ("number_of_splits", str(number_of_splits)),
-                ("parameters", str(self._parameters)),
-                ("parameter_grid", str(self._parameter_grid)),)
+                ("parameters", self._parameters),
+                ("parameter_grid", self._parameter_grid),)
 
     def fit(self, encoded_data: EncodedData, label_name: str, cores_for_training: int = 2):
 
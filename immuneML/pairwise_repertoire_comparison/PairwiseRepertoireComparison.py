@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 
 from immuneML.caching.CacheHandler import CacheHandler
+from immuneML.caching.CacheObjectType import CacheObjectType
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.pairwise_repertoire_comparison.ComparisonData import ComparisonData
 from immuneML.util.Logger import log
@@ -31,18 +32,19 @@ class PairwiseRepertoireComparison:
 
     def prepare_caching_params(self, dataset: RepertoireDataset):
         return (
-            ("dataset_identifier", dataset.identifier),
+            ("dataset", dataset.get_fingerprint()),
             ("item_attributes", self.item_columns)
         )
 
     def compare(self, dataset: RepertoireDataset, comparison_fn, comparison_fn_name):
-        return CacheHandler.memo_by_params((("dataset_identifier", dataset.identifier),
+        return CacheHandler.memo_by_params((("dataset", dataset.get_fingerprint()),
                                             "pairwise_comparison",
                                             ("comparison_fn", comparison_fn_name)),
                                            lambda: self.compare_repertoires(dataset, comparison_fn))
 
     def memo_by_params(self, dataset: RepertoireDataset):
-        comparison_data = CacheHandler.memo_by_params(self.prepare_caching_params(dataset), lambda: self.create_comparison_data(dataset))
+        comparison_data = CacheHandler.memo_by_params(self.prepare_caching_params(dataset), lambda: self.create_comparison_data(dataset),
+                                                      CacheObjectType.COMPARISON_DATA)
         return comparison_data
 
     @log
@@ -46,16 +46,16 @@ class SubjectRepertoireCollector(Preprocessor):
 
         for index, repertoire in enumerate(processed_dataset.get_data()):
             if repertoire.metadata["subject_id"] in rep_map.keys():
-                sequences = np.append(repertoire.sequences, rep_map[repertoire.metadata["subject_id"]].sequences)
+                repertoires_to_merge = [repertoire, rep_map[repertoire.metadata["subject_id"]]]
                 del rep_map[repertoire.metadata["subject_id"]]
                 repertoires.append(SubjectRepertoireCollector.store_repertoire(
-                    params["result_path"], repertoire, sequences))
+                    params["result_path"], repertoire, repertoires_to_merge))
             else:
                 rep_map[repertoire.metadata["subject_id"]] = repertoire
                 indices_to_keep.append(index)
 
         for key in rep_map.keys():
-            repertoires.append(SubjectRepertoireCollector.store_repertoire(params["result_path"], rep_map[key], rep_map[key].sequences))
+            repertoires.append(SubjectRepertoireCollector.store_repertoire(params["result_path"], rep_map[key], [rep_map[key]]))
 
         processed_dataset.repertoires = repertoires
         processed_dataset.metadata_file = SubjectRepertoireCollector.build_new_metadata(dataset, indices_to_keep, params["result_path"])
@@ -73,6 +73,16 @@ class SubjectRepertoireCollector(Preprocessor):
         return path
 
     @staticmethod
-    def store_repertoire(path, repertoire, sequences):
-        new_repertoire = Repertoire.build_from_sequence_objects(sequences, path, repertoire.metadata)
+    def store_repertoire(path, repertoire, repertoires_to_merge: list):
+        fields = list(dict.fromkeys(field for rep in repertoires_to_merge for field in rep.fields))
+        columns = {field: [] for field in fields}
+
+        for rep in repertoires_to_merge:
+            for batch in rep.iter_batches(fields):
+                batch_size = len(next(iter(batch.values())))
+                for field in fields:
+                    columns[field].append(batch[field] if field in batch else np.full(batch_size, None, dtype=object))
+
+        new_repertoire = Repertoire.build_from_arrays({field: np.concatenate(values) if len(values) > 0 else []
+                                                       for field, values in columns.items()}, path, repertoire.metadata)
         return new_repertoire
@@ -6,6 +6,7 @@ import pandas as pd
 
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.data_model.receptor.receptor_sequence.Chain import Chain
+from immuneML.data_model.repertoire.CategoricalVocabulary import CategoricalVocabulary
 from immuneML.data_model.repertoire.Repertoire import Repertoire
 from immuneML.environment.SequenceType import SequenceType
 from immuneML.preprocessing.filters.CountAggregationFunction import CountAggregationFunction
@@ -58,6 +59,8 @@ class DuplicateSequenceFilter(Filter):
 
     """
 
+    STORED_FIELDS = ("sequence_aas", "sequences", "v_genes", "j_genes", "chains", "counts", "region_types", "sequence_identifiers")
+
     @classmethod
     def build_object(cls, **kwargs):
         location = cls.__name__
@@ -88,6 +91,11 @@ class DuplicateSequenceFilter(Filter):
 
         processed_dataset = copy.deepcopy(dataset)
 
+        # only the categorical fields which repertoires can be grouped by need a vocabulary shared across the dataset
+        groupby_fields = DuplicateSequenceFilter._prepare_group_by_field(params, Repertoire.FIELDS)
+        params = {**params, "vocabularies": {field: dataset.get_categorical_vocabulary(field) for field in groupby_fields
+                                             if field in Repertoire.CATEGORICAL_FIELDS}}
+
         with Pool(params["batch_size"]) as pool:
             repertoires = pool.starmap(DuplicateSequenceFilter.process_repertoire,
                                        [(repertoire, params) for repertoire in dataset.repertoires])
@@ -138,26 +146,28 @@ class DuplicateSequenceFilter(Filter):
         custom_lists = list(set(data.columns) - set(Repertoire.FIELDS))
         agg_dict = DuplicateSequenceFilter._prepare_agg_dict(params, data.columns, custom_lists)
 
-        # Chain objects can not be aggregated, convert to strings
-        if "chains" in data.columns:
-            data["chains"] = [chain.value if isinstance(chain, Chain) else chain for chain in data["chains"]]
-        else:
-            data["chains"] = None
+        # categorical fields (genes, chains, region types) are grouped by their integer codes and decoded afterwards
+        categorical_fields = [field for field in groupby_fields if field in Repertoire.CATEGORICAL_FIELDS]
+        vocabularies = {field: params["vocabularies"][field] if "vocabularies" in params
+                        else CategoricalVocabulary(field, repertoire.get_unique_values(field)) for field in categorical_fields}
+
+        for field in categorical_fields:
+            data[field] = repertoire.get_categorical_codes(field, vocabularies[field])
 
         no_duplicates = data.groupby(groupby_fields).agg(agg_dict).reset_index()
 
-        processed_repertoire = Repertoire.build(sequence_aas=list(no_duplicates["sequence_aas"]) if "sequence_aas" in no_duplicates.columns else None,
-                                                sequences=list(no_duplicates["sequences"]) if "sequences" in no_duplicates.columns else None,
-                                                v_genes=list(no_duplicates["v_genes"]) if "v_genes" in no_duplicates.columns else None,
-                                                j_genes=list(no_duplicates["j_genes"]) if 'j_genes' in no_duplicates.columns else None,
-                                                chains=[Chain(key) for key in list(no_duplicates["chains"])] if "chains" in no_duplicates.columns else None,
-                                                counts=list(no_duplicates["counts"]) if "counts" in no_duplicates else None,
-                                                region_types=list(no_duplicates["region_types"]) if "region_types" in no_duplicates else None,
-                                                custom_lists={key: list(no_duplicates[key]) for key in custom_lists},
-                                                sequence_identifiers=list(no_duplicates["sequence_identifiers"]),
-                                                metadata=copy.deepcopy(repertoire.metadata),
-                                                path=params["result_path"],
-                                                filename_base=f"{repertoire.data_filename.stem}_filtered")
+        for field in categorical_fields:
+            no_duplicates[field] = vocabularies[field].decode(no_duplicates[field].values)
+
+        if "chains" in no_duplicates.columns:
+            chains = no_duplicates["chains"].unique()
+            no_duplicates["chains"] = no_duplicates["chains"].map(dict(zip(chains, [Chain.get_chain(key) if key is not None else None
+                                                                                   for key in chains])))
+
+        columns = [column for column in DuplicateSequenceFilter.STORED_FIELDS if column in no_duplicates.columns]
+        processed_repertoire = Repertoire.build_from_dataframe(no_duplicates[custom_lists + columns], path=params["result_path"],
+                                                               metadata=copy.deepcopy(repertoire.metadata),
+                                                               filename_base=f"{repertoire.data_filename.stem}_filtered")
 
         return processed_repertoire
 
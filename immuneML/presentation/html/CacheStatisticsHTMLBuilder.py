@@ -0,0 +1,51 @@
+from pathlib import Path
+
+from immuneML.caching.CacheStatistics import CacheStatistics
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.ml_methods.util.Util import Util as MLUtil
+from immuneML.presentation.TemplateParser import TemplateParser
+from immuneML.presentation.html.Util import Util
+from immuneML.util.PathBuilder import PathBuilder
+from immuneML.util.SizeHelper import SizeHelper
+
+
+class CacheStatisticsHTMLBuilder:
+    """Builds the HTML page with the cache statistics of the run (see CacheStatistics), which is linked from the main HTML page of the results"""
+
+    CSS_PATH = EnvironmentSettings.html_templates_path / "css/custom.css"
+
+    @staticmethod
+    def build(path: Path) -> Path:
+        """
+        Builds the page under path/HTML_output/ if any object was cached or looked up in the cache during the run
+        Arguments:
+            path: the result path of the run
+        Returns:
+             path to the HTML file or None if the cache was not used
+        """
+        summary = CacheStatistics.get_summary()
+        if len(summary["call_sites"]) == 0:
+            return None
+
+        result_file = PathBuilder.build(path / "HTML_output/") / "CacheStatistics.html"
+        html_map = {
+            "css_style": Util.get_css_content(CacheStatisticsHTMLBuilder.CSS_PATH),
+            "immuneML_version": MLUtil.get_immuneML_version(),
+            "object_types": [CacheStatisticsHTMLBuilder._format({"object_type": object_type.lower(), **values})
+                             for object_type, values in summary["object_types"].items()],
+            "call_sites": [CacheStatisticsHTMLBuilder._format({**entry, "object_type": entry["object_type"].lower()})
+                           for entry in summary["call_sites"]],
+            "show_call_sites": any(entry["call_site"] != CacheStatistics.UNKNOWN_CALL_SITE for entry in summary["call_sites"]),
+            "total": CacheStatisticsHTMLBuilder._format(summary["total"])
+        }
+
+        TemplateParser.parse(template_path=EnvironmentSettings.html_templates_path / "CacheStatistics.html", template_map=html_map,
+                             result_path=result_file)
+
+        return result_file
+
+    @staticmethod
+    def _format(values: dict) -> dict:
+        return {**values, "bytes_read": SizeHelper.format_size(values["bytes_read"]), "bytes_written": SizeHelper.format_size(values["bytes_written"]),
+                "read_seconds": round(values["read_seconds"], 3), "write_seconds": round(values["write_seconds"], 3),
+                "hit_rate": f"{values['hit_rate'] * 100:.1f}%" if values["hit_rate"] is not None else "-"}
@@ -9,12 +9,14 @@ from immuneML.presentation.InstructionPresentation import InstructionPresentatio
 from immuneML.presentation.PresentationFactory import PresentationFactory
 from immuneML.presentation.PresentationFormat import PresentationFormat
 from immuneML.presentation.TemplateParser import TemplateParser
+from immuneML.presentation.html.CacheStatisticsHTMLBuilder import CacheStatisticsHTMLBuilder
 from immuneML.presentation.html.Util import Util
 
 
 class HTMLBuilder:
     """
-    Outputs HTML results of the analysis. This is currently the only defined format of presentation of results.
+    Outputs HTML results of the analysis. This is currently the only defined format of presentation of results. If the cache was used during
+    the run, the main page also links to the page with the cache statistics (see CacheStatisticsHTMLBuilder).
 
     YAML specification:
 
@@ -34,20 +36,25 @@ class HTMLBuilder:
     def build(states: list, path: Path) -> Path:
         rel_path = Path(os.path.relpath(str(path)))
         presentations = HTMLBuilder._collect_all_presentations(states, rel_path)
-        presentation_html_path = HTMLBuilder._make_document(presentations, rel_path)
+        cache_statistics_path = CacheStatisticsHTMLBuilder.build(rel_path)
+        presentation_html_path = HTMLBuilder._make_document(presentations, rel_path, cache_statistics_path)
         return presentation_html_path
 
     @staticmethod
-    def _make_document(presentations: List[InstructionPresentation], path: Path) -> Path:
+    def _make_document(presentations: List[InstructionPresentation], path: Path, cache_statistics_path: Path = None) -> Path:
         result_path = path / "index.html"
+        cache_statistics = {"path": os.path.relpath(str(cache_statistics_path), str(path))} if cache_statistics_path is not None else None
         if len(presentations) > 1:
             html_map = {"instructions": presentations, "css_path": EnvironmentSettings.html_templates_path / "css/custom.css",
-                        "full_specs": Util.get_full_specs_path(path), 'immuneML_version': MLUtil.get_immuneML_version()}
+                        "full_specs": Util.get_full_specs_path(path), 'immuneML_version': MLUtil.get_immuneML_version(),
+                        "cache_statistics": cache_statistics}
             TemplateParser.parse(template_path=EnvironmentSettings.html_templates_path / "index.html",
                                  template_map=html_map, result_path=result_path)
         elif len(presentations) == 1:
             shutil.copyfile(str(presentations[0].path), str(result_path))
             HTMLBuilder._update_paths(result_path)
+            if cache_statistics is not None:
+                HTMLBuilder._add_cache_statistics_link(result_path, cache_statistics["path"])
         else:
             result_path = None
 
@@ -69,6 +76,13 @@ class HTMLBuilder:
         with result_path.open("w") as file:
             file.write("\n".join(lines))
 
+    @staticmethod
+    def _add_cache_statistics_link(result_path: Path, link: str):
+        content = result_path.read_text()
+        link_html = f'<div class="container padded-bottom"><h4>Cache statistics</h4><a href="./{link}">Report link</a></div>\n'
+        index = content.rfind("</body>")
+        result_path.write_text(content[:index] + link_html + content[index:] if index != -1 else content + link_html)
+
     @staticmethod
     def _collect_all_presentations(states: list, rel_path: Path) -> List[InstructionPresentation]:
         presentations = []
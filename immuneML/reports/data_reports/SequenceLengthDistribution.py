@@ -7,6 +7,7 @@ import plotly.express as px
 
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.data_model.repertoire.Repertoire import Repertoire
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.reports.ReportOutput import ReportOutput
 from immuneML.reports.ReportResult import ReportResult
 from immuneML.reports.data_reports.DataReport import DataReport
@@ -57,7 +58,10 @@ class SequenceLengthDistribution(DataReport):
         return sequence_lenghts
 
     def _count_in_repertoire(self, repertoire: Repertoire) -> Counter:
-        c = Counter([len(sequence.get_sequence()) for sequence in repertoire.sequences])
+        sequence_field = EnvironmentSettings.get_sequence_type().value
+        c = Counter()
+        for batch in repertoire.iter_batches([sequence_field]):
+            c.update(len(sequence) for sequence in batch[sequence_field])
         return c
 
     def _plot(self, sequence_lengths: Counter):
@@ -1,10 +1,10 @@
-import pickle
 import random
 from pathlib import Path
 
 from immuneML.data_model.dataset.ReceptorDataset import ReceptorDataset
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.data_model.dataset.SequenceDataset import SequenceDataset
+from immuneML.data_model.receptor.ElementBatchFile import ElementBatchFile
 from immuneML.data_model.receptor.TCABReceptor import TCABReceptor
 from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
 from immuneML.data_model.receptor.receptor_sequence.SequenceMetadata import SequenceMetadata
@@ -161,8 +161,7 @@ class RandomDatasetGenerator:
 
         filename = path / "batch01.pickle"
 
-        with filename.open("wb") as file:
-            pickle.dump(receptors, file)
+        ElementBatchFile.write(filename, receptors)
 
         return ReceptorDataset(labels={label: list(label_dict.keys()) for label, label_dict in labels.items()},
                                filenames=[filename], file_size=receptor_count)
@@ -219,8 +218,7 @@ class RandomDatasetGenerator:
 
         filename = path / "batch01.pickle"
 
-        with filename.open("wb") as file:
-            pickle.dump(sequences, file)
+        ElementBatchFile.write(filename, sequences)
 
         return SequenceDataset(labels={label: list(label_dict.keys()) for label, label_dict in labels.items()},
                                filenames=[filename], file_size=sequence_count)
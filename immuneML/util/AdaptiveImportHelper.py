@@ -16,7 +16,7 @@ class AdaptiveImportHelper:
             frame_type_list = ImportHelper.prepare_frame_type_list(params)
             dataframe = dataframe[dataframe["frame_types"].isin(frame_type_list)]
 
-        dataframe.loc[:, "region_types"] = params.region_type.name
+        dataframe["region_types"] = params.region_type.name
 
         if params.region_type == RegionType.IMGT_CDR3:
             if "sequences" in dataframe.columns:
@@ -53,15 +53,16 @@ class AdaptiveImportHelper:
     def parse_germline(dataframe: pd.DataFrame, gene_name_replacement: dict, germline_value_replacement: dict):
         for gene in ["v", "j"]:
 
-            if f"{gene}_genes" in dataframe.columns:
+            # regex replacement fails for columns without any values (e.g., when a chunk of the file has no gene information)
+            if f"{gene}_genes" in dataframe.columns and dataframe[f"{gene}_genes"].notnull().any():
                 dataframe.loc[:, f"{gene}_genes"] = dataframe[f"{gene}_genes"].replace(gene_name_replacement, regex=True)
                 dataframe.loc[:, f"{gene}_genes"] = dataframe[f"{gene}_genes"].replace(germline_value_replacement, regex=True)
 
-            if f"{gene}_alleles" in dataframe.columns:
+            if f"{gene}_alleles" in dataframe.columns and dataframe[f"{gene}_alleles"].notnull().any():
                 dataframe.loc[:, f"{gene}_alleles"] = dataframe[f"{gene}_alleles"].replace(gene_name_replacement, regex=True)
                 dataframe.loc[:, f"{gene}_alleles"] = dataframe[f"{gene}_alleles"].replace(germline_value_replacement, regex=True)
 
-            if f"{gene}_subgroups" in dataframe.columns:
+            if f"{gene}_subgroups" in dataframe.columns and dataframe[f"{gene}_subgroups"].notnull().any():
                 dataframe.loc[:, f"{gene}_subgroups"] = dataframe[f"{gene}_subgroups"].replace(germline_value_replacement, regex=True)
 
         return dataframe
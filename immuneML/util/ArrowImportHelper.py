@@ -0,0 +1,152 @@
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from immuneML.IO.dataset_import.DatasetImportParams import DatasetImportParams
+
+
+class ArrowImportHelper:
+    """
+    Loads tabular receptor data files with the multithreaded CSV reader of pyarrow (used when the import parameter import_engine is set to
+    arrow). Compared to loading the files with pandas:
+
+    - the file is split into blocks which are parsed in parallel by Arrow's thread pool,
+    - only the columns which will be used are parsed (the columns from columns_to_load, column_mapping, column_mapping_synonyms and
+      metadata_column_mapping which are present in the file), instead of loading the file again with fewer columns when some of them are missing,
+    - missing values (the values recognized as missing by pandas and the values replaced by ImportHelper.standardize_none_values()) are set
+      to None while parsing,
+    - the columns mapped to counts and the columns with declared types are parsed as integers, floats or booleans instead of strings.
+
+    This engine requires the optional dependency pyarrow (install immuneML with the Arrow extra: pip install immuneML[Arrow]).
+    """
+
+    # the missing values recognized by pandas.read_csv() and the values replaced by ImportHelper.standardize_none_values()
+    NULL_VALUES = ["", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN",
+                   "None", "n/a", "nan", "null", "unresolved", "no data", "na", "unknown"]
+    TRUE_VALUES = ["True", "true", "TRUE", "T", "t"]
+    FALSE_VALUES = ["False", "false", "FALSE", "F", "f"]
+
+    @staticmethod
+    def load_dataframe(filepath: Path, params: DatasetImportParams, column_types: dict = None) -> pd.DataFrame:
+        """
+        Loads the file into a data frame with the original column names
+
+        Arguments:
+            filepath: path to the file or a seekable binary file object
+            params: import parameters; the separator and the columns to load are used
+            column_types: the type of the values (bool, int, float or str) per column name in the file; columns without a type are loaded as
+                          strings, except for the columns mapped to counts, which are loaded as integers
+
+        Returns:
+            data frame where missing values are None, integer and boolean columns without missing values have numpy dtypes and the other
+            columns have dtype object
+        """
+        from pyarrow import csv
+
+        parse_options, convert_options, types = ArrowImportHelper._make_options(filepath, params, column_types)
+        table = csv.read_csv(filepath, read_options=csv.ReadOptions(use_threads=True), parse_options=parse_options,
+                             convert_options=convert_options)
+
+        return ArrowImportHelper._to_dataframe(table, types)
+
+    @staticmethod
+    def iterate_dataframes(filepath: Path, params: DatasetImportParams, chunk_size: int, column_types: dict = None):
+        """
+        Same as load_dataframe(), but reads the file in parts and yields data frames with chunk_size rows (the last one may have fewer),
+        so that only one part of the file is kept in memory
+        """
+        import pyarrow as pa
+        from pyarrow import csv
+
+        parse_options, convert_options, types = ArrowImportHelper._make_options(filepath, params, column_types)
+        reader = csv.open_csv(filepath, read_options=csv.ReadOptions(use_threads=True), parse_options=parse_options,
+                              convert_options=convert_options)
+
+        batches, row_count = [], 0
+        for batch in reader:
+            batches.append(batch)
+            row_count += batch.num_rows
+            while row_count >= chunk_size:
+                table = pa.Table.from_batches(batches, schema=reader.schema)
+                yield ArrowImportHelper._to_dataframe(table.slice(0, chunk_size), types)
+                remaining = table.slice(chunk_size)
+                batches, row_count = remaining.to_batches(), remaining.num_rows
+
+        if row_count > 0:
+            yield ArrowImportHelper._to_dataframe(pa.Table.from_batches(batches, schema=reader.schema), types)
+
+    @staticmethod
+    def _make_options(filepath: Path, params: DatasetImportParams, column_types: dict):
+        from pyarrow import csv
+
+        parse_options = csv.ParseOptions(delimiter=params.separator)
+        column_names = csv.open_csv(filepath, parse_options=parse_options).schema.names
+        if hasattr(filepath, "seek"):
+            # file objects (e.g., members of zip files) are read again from the start
+            filepath.seek(0)
+
+        columns = ArrowImportHelper._get_columns_to_load(column_names, params, filepath)
+        types = ArrowImportHelper._get_column_types(columns, params, column_types)
+
+        convert_options = csv.ConvertOptions(include_columns=columns, column_types=ArrowImportHelper._to_arrow_types(types),
+                                             null_values=ArrowImportHelper.NULL_VALUES, strings_can_be_null=True,
+                                             true_values=ArrowImportHelper.TRUE_VALUES, false_values=ArrowImportHelper.FALSE_VALUES)
+
+        return parse_options, convert_options, types
+
+    @staticmethod
+    def _to_dataframe(table, types: dict) -> pd.DataFrame:
+        return pd.DataFrame({name: ArrowImportHelper._to_numpy(table.column(name), types[name]) for name in table.column_names})
+
+    @staticmethod
+    def _get_columns_to_load(column_names: list, params: DatasetImportParams, filepath: Path) -> list:
+        if params.columns_to_load is None:
+            return column_names
+
+        requested = set(params.columns_to_load)
+        for mapping in [params.column_mapping, params.column_mapping_synonyms, params.metadata_column_mapping]:
+            if mapping is not None:
+                requested.update(mapping.keys())
+
+        missing = [column for column in params.columns_to_load if column not in column_names]
+        if len(missing) > 0:
+            warnings.warn(f"{ArrowImportHelper.__name__}: columns {missing} from columns_to_load are missing in the input file {filepath}, "
+                          f"the other columns will be imported.")
+
+        return [column for column in column_names if column in requested]
+
+    @staticmethod
+    def _get_column_types(columns: list, params: DatasetImportParams, column_types: dict) -> dict:
+        count_columns = [column for mapping in [params.column_mapping, params.column_mapping_synonyms] if mapping is not None
+                         for column, field in mapping.items() if field == "counts"]
+
+        types = {column: int if column in count_columns else str for column in columns}
+        if column_types is not None:
+            types.update({column: column_type for column, column_type in column_types.items() if column in types})
+
+        return types
+
+    @staticmethod
+    def _to_arrow_types(types: dict) -> dict:
+        import pyarrow as pa
+
+        # integers are parsed as floats so that values such as 10.0 (e.g., counts exported by MiXCR) are accepted
+        arrow_types = {bool: pa.bool_(), int: pa.float64(), float: pa.float64(), str: pa.string()}
+        return {column: arrow_types[column_type] for column, column_type in types.items()}
+
+    @staticmethod
+    def _to_numpy(column, column_type) -> np.ndarray:
+        if column_type in [int, bool] and column.null_count == 0:
+            values = column.to_numpy()
+            return values.astype(np.int64) if column_type == int else values
+
+        values = column.to_pandas().values  # string and boolean columns with missing values are object arrays with None
+        if column_type in [int, float] and column.null_count > 0:
+            missing = np.isnan(values)
+            present = values[~missing].astype(np.int64) if column_type == int else values[~missing]
+            values = np.full(len(values), None, dtype=object)
+            values[~missing] = present.tolist()
+
+        return values
@@ -30,9 +30,8 @@ class EncoderHelper:
 
     @staticmethod
     def build_comparison_params(dataset, comparison_attributes) -> tuple:
-        return (("dataset_identifier", dataset.identifier),
-                ("comparison_attributes", tuple(comparison_attributes)),
-                ("repertoire_ids", tuple(dataset.get_repertoire_ids())))
+        return (("dataset", dataset.get_fingerprint()),
+                ("comparison_attributes", tuple(comparison_attributes)))
 
     @staticmethod
     def build_comparison_data(dataset: RepertoireDataset, params: EncoderParams,
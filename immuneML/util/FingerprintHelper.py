@@ -0,0 +1,103 @@
+import hashlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+
+class FingerprintHelper:
+    """
+    Helper class for computing content fingerprints of repertoires and datasets: short hashes which are the same for the same data
+    independently of the (random) identifiers and file locations, and which are used in cache keys instead of the identifiers.
+
+    The hashes are computed with xxhash (xxh3, 128 bits) if the optional dependency xxhash is installed and with BLAKE2 from hashlib
+    otherwise. The two give different fingerprints, so cached results are reused only between runs in the same environment.
+    """
+
+    NUMERIC_KINDS = "biufcmM"
+    BUFFER_SIZE = 2 ** 20
+
+    @staticmethod
+    def new_hasher():
+        try:
+            import xxhash
+            return xxhash.xxh3_128()
+        except ImportError:
+            return hashlib.blake2b(digest_size=16)
+
+    @staticmethod
+    def fingerprint_values(values: list) -> str:
+        """Combines the string representations of the values (e.g., fingerprints of the parts of a dataset) into one fingerprint"""
+        hasher = FingerprintHelper.new_hasher()
+        for value in values:
+            FingerprintHelper.update_with_bytes(hasher, str(value).encode("utf-8"))
+        return hasher.hexdigest()
+
+    @staticmethod
+    def fingerprint_columns(columns: dict) -> str:
+        """
+        Computes the fingerprint of the columns of a repertoire, where columns is a dict of field names and lists or arrays of values; numeric
+        arrays are hashed from their memory buffers and other arrays from the vectorized per-value hashes computed by pandas
+        """
+        hasher = FingerprintHelper.new_hasher()
+        for field in sorted(columns.keys()):
+            FingerprintHelper.update_with_bytes(hasher, field.encode("utf-8"))
+            FingerprintHelper.update_with_array(hasher, columns[field])
+        return hasher.hexdigest()
+
+    @staticmethod
+    def fingerprint_column_chunks(columns: dict, element_count: int) -> str:
+        """
+        Computes the same fingerprint as fingerprint_columns() for columns given in chunks, where columns is a dict of field names and
+        iterables of numpy arrays (the chunks of one column have the same dtype and element_count values in total)
+        """
+        hasher = FingerprintHelper.new_hasher()
+        for field in sorted(columns.keys()):
+            FingerprintHelper.update_with_bytes(hasher, field.encode("utf-8"))
+            FingerprintHelper.update_with_array_chunks(hasher, columns[field], element_count)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def fingerprint_array(values) -> str:
+        hasher = FingerprintHelper.new_hasher()
+        FingerprintHelper.update_with_array(hasher, values)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def fingerprint_frame(df: pd.DataFrame) -> str:
+        """Computes the fingerprint of the values and column names of the data frame, ignoring the index"""
+        return FingerprintHelper.fingerprint_columns({str(column): df[column].values for column in df.columns})
+
+    @staticmethod
+    def fingerprint_file(filename: Path) -> str:
+        hasher = FingerprintHelper.new_hasher()
+        with filename.open("rb") as file:
+            for chunk in iter(lambda: file.read(FingerprintHelper.BUFFER_SIZE), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
+
+    @staticmethod
+    def update_with_array(hasher, values):
+        values = values if isinstance(values, np.ndarray) else np.asarray(values, dtype=object)
+        FingerprintHelper.update_with_array_chunks(hasher, [values], len(values))
+
+    @staticmethod
+    def update_with_array_chunks(hasher, chunks, element_count: int):
+        hasher.update(element_count.to_bytes(8, "little"))
+        numeric = None
+        for values in chunks:
+            if numeric is None:
+                numeric = values.dtype.kind in FingerprintHelper.NUMERIC_KINDS
+                FingerprintHelper.update_with_bytes(hasher, values.dtype.str.encode("utf-8") if numeric else b"object")
+            if numeric:
+                hasher.update(np.ascontiguousarray(values).view(np.uint8))
+            else:
+                hasher.update(pd.util.hash_array(values.astype(object)).data)
+        if numeric is None:
+            FingerprintHelper.update_with_bytes(hasher, b"object")
+
+    @staticmethod
+    def update_with_bytes(hasher, value: bytes):
+        """Adds the length before the value so that the boundaries between consecutive values are part of the hash"""
+        hasher.update(len(value).to_bytes(8, "little"))
+        hasher.update(value)
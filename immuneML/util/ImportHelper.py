@@ -1,5 +1,7 @@
-import pickle
+import datetime
+import math
 import warnings
+from dataclasses import replace
 from multiprocessing.pool import Pool
 from pathlib import Path
 from typing import List
@@ -9,7 +11,10 @@ import pandas as pd
 
 from immuneML.IO.dataset_export.PickleExporter import PickleExporter
 from immuneML.IO.dataset_import.DatasetImportParams import DatasetImportParams
+from immuneML.IO.dataset_import.ImportEngine import ImportEngine
+from immuneML.IO.dataset_import.ImportManifest import ImportManifest
 from immuneML.IO.dataset_import.PickleImport import PickleImport
+from immuneML.caching.CacheKeyBuilder import CacheKeyBuilder
 from immuneML.data_model.dataset import Dataset
 from immuneML.data_model.dataset.ReceptorDataset import ReceptorDataset
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
@@ -17,6 +22,7 @@ from immuneML.data_model.dataset.SequenceDataset import SequenceDataset
 from immuneML.data_model.receptor.BCKReceptor import BCKReceptor
 from immuneML.data_model.receptor.BCReceptor import BCReceptor
 from immuneML.data_model.receptor.ChainPair import ChainPair
+from immuneML.data_model.receptor.ElementBatchFile import ElementBatchFile
 from immuneML.data_model.receptor.Receptor import Receptor
 from immuneML.data_model.receptor.RegionType import RegionType
 from immuneML.data_model.receptor.TCABReceptor import TCABReceptor
@@ -29,18 +35,21 @@ from immuneML.data_model.repertoire.Repertoire import Repertoire
 from immuneML.environment.Constants import Constants
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.environment.SequenceType import SequenceType
+from immuneML.util.FingerprintHelper import FingerprintHelper
 from immuneML.util.ParameterValidator import ParameterValidator
 from immuneML.util.PathBuilder import PathBuilder
 
 
 class ImportHelper:
     DATASET_FORMAT = "iml_dataset"
+    MANIFEST_SUFFIX = "import_manifest.jsonl"
 
     @staticmethod
     def import_dataset(import_class, params: dict, dataset_name: str) -> Dataset:
         processed_params = DatasetImportParams.build_object(**params)
 
-        dataset = ImportHelper.load_dataset_if_exists(params, processed_params, dataset_name)
+        # with incremental import, the existing dataset is updated from the source files instead of being loaded as is
+        dataset = ImportHelper.load_dataset_if_exists(params, processed_params, dataset_name) if not processed_params.incremental else None
         if dataset is None:
             # backwards compatibility: if is_repertoire is not specified but the metadata file is
             if processed_params.is_repertoire is None and processed_params.metadata_file is not None:
@@ -91,10 +100,18 @@ class ImportHelper:
 
         PathBuilder.build(params.result_path / "repertoires/")
 
-        arguments = [(import_class, row, params) for index, row in metadata.iterrows()]
-        with Pool(params.number_of_processes) as pool:
-            repertoires = pool.starmap(ImportHelper.load_repertoire_as_object, arguments)
+        if params.incremental:
+            repertoires = ImportHelper.import_repertoires_incrementally(import_class, metadata, params, dataset_name)
+        else:
+            arguments = [(import_class, row, params) for index, row in metadata.iterrows()]
+            with Pool(params.number_of_processes) as pool:
+                repertoires = pool.starmap(ImportHelper.load_repertoire_as_object, arguments)
+
+        return ImportHelper.build_repertoire_dataset(repertoires, metadata, params, dataset_name)
 
+    @staticmethod
+    def build_repertoire_dataset(repertoires: list, metadata: pd.DataFrame, params: DatasetImportParams, dataset_name: str) -> RepertoireDataset:
+        """Creates the dataset from the imported repertoires and the metadata with one row per repertoire and exports the dataset pickle file"""
         new_metadata_file = ImportHelper.make_new_metadata_file(repertoires, metadata, params.result_path, dataset_name)
 
         potential_labels = list(set(metadata.columns.tolist()) - {"filename"})
@@ -105,6 +122,56 @@ class ImportHelper:
 
         return dataset
 
+    @staticmethod
+    def import_repertoires_incrementally(import_class, metadata: pd.DataFrame, params: DatasetImportParams, dataset_name: str) -> list:
+        """
+        Imports the repertoires listed in the metadata, reusing the repertoires recorded in the import manifest (see ImportManifest) for the
+        source files which did not change since they were imported; each newly imported repertoire is recorded in the manifest as soon as it
+        is stored, so that an interrupted import can be resumed
+        """
+        manifest = ImportManifest(params.result_path / f"{dataset_name}_{ImportHelper.MANIFEST_SUFFIX}")
+        repertoires_path = params.result_path / "repertoires/"
+
+        repertoires, arguments = [None] * metadata.shape[0], []
+        for index, (_, row) in enumerate(metadata.iterrows()):
+            settings_fingerprint = ImportHelper._fingerprint_import_settings(import_class, row, params)
+            repertoire = manifest.find_repertoire(str(row["filename"]), params.path / f"{row['filename']}", settings_fingerprint, repertoires_path)
+            if repertoire is not None:
+                repertoires[index] = repertoire
+            else:
+                arguments.append((index, import_class, row, params, settings_fingerprint))
+
+        print(f"{datetime.datetime.now()}: ImportHelper: {metadata.shape[0] - len(arguments)} of {metadata.shape[0]} repertoires of the dataset "
+              f"{dataset_name} are unchanged since the last import, importing {len(arguments)} repertoires.", flush=True)
+
+        if len(arguments) > 0:
+            pending = {argument[0]: argument for argument in arguments}
+            with Pool(params.number_of_processes) as pool:
+                for index, repertoire, source_fingerprint, source_stat in pool.imap_unordered(ImportHelper._load_repertoire_with_fingerprint,
+                                                                                              arguments):
+                    _, _, row, _, settings_fingerprint = pending[index]
+                    manifest.add(str(row["filename"]), params.path / f"{row['filename']}", source_fingerprint, settings_fingerprint,
+                                 repertoire, source_stat)
+                    repertoires[index] = repertoire
+
+        manifest.save([str(filename) for filename in metadata["filename"]], repertoires_path)
+
+        return repertoires
+
+    @staticmethod
+    def _load_repertoire_with_fingerprint(arguments: tuple) -> tuple:
+        index, import_class, metadata_row, params, _ = arguments
+        source_file = params.path / f"{metadata_row['filename']}"
+        source_stat = source_file.stat()
+        source_fingerprint = FingerprintHelper.fingerprint_file(source_file)
+        return index, ImportHelper.load_repertoire_as_object(import_class, metadata_row, params), source_fingerprint, source_stat
+
+    @staticmethod
+    def _fingerprint_import_settings(import_class, metadata_row, params: DatasetImportParams) -> str:
+        # the paths and the number of processes do not change the imported repertoires
+        settings = {key: value for key, value in vars(params).items() if key not in ["path", "result_path", "metadata_file", "number_of_processes"]}
+        return CacheKeyBuilder.build((import_class.__name__, metadata_row.to_dict(), settings))
+
     @staticmethod
     def update_gene_info(df: pd.DataFrame):
         """
@@ -119,12 +186,12 @@ class ImportHelper:
         for gene in ['v', 'j']:
             # step 1: create all columns
             if f"{gene}_alleles" in df.columns and not f"{gene}_genes" in df.columns:
-                df.loc[:, f"{gene}_genes"] = ImportHelper.strip_alleles(df, f"{gene}_alleles")
+                df[f"{gene}_genes"] = ImportHelper.strip_alleles(df, f"{gene}_alleles")
 
             if f"{gene}_genes" in df.columns:
                 df.loc[:, f"{gene}_genes"] = ImportHelper.strip_alleles(df, f"{gene}_genes")
                 if not f"{gene}_subgroups" in df.columns:
-                    df.loc[:, f"{gene}_subgroups"] = ImportHelper.strip_genes(df, f"{gene}_genes")
+                    df[f"{gene}_subgroups"] = ImportHelper.strip_genes(df, f"{gene}_genes")
             elif f"{gene}_subgroups" in df.columns:
                 df.loc[:, f"{gene}_subgroups"] = ImportHelper.strip_genes(df, f"{gene}_subgroups")
 
@@ -159,21 +226,54 @@ class ImportHelper:
 
             filename = params.path / f"{metadata_row['filename']}"
 
+            if getattr(params, "import_chunk_size", None):
+                return ImportHelper.load_repertoire_in_chunks(import_class, filename, metadata_row, params)
+
             dataframe = ImportHelper.load_sequence_dataframe(filename, params, alternative_load_func)
             dataframe = import_class.preprocess_dataframe(dataframe, params)
-            sequence_lists = {field: dataframe[field].values.tolist() for field in Repertoire.FIELDS if field in dataframe.columns}
-            sequence_lists["custom_lists"] = {field: dataframe[field].values.tolist()
-                                              for field in list(set(dataframe.columns) - set(Repertoire.FIELDS))}
 
-            repertoire_inputs = {**{"metadata": metadata_row.to_dict(),
-                                    "path": params.result_path / "repertoires/",
-                                    "filename_base": filename.stem}, **sequence_lists}
-            repertoire = Repertoire.build(**repertoire_inputs)
+            repertoire = Repertoire.build_from_dataframe(dataframe, path=params.result_path / "repertoires/", metadata=metadata_row.to_dict(),
+                                                         filename_base=filename.stem)
 
             return repertoire
         except Exception as exception:
             raise RuntimeError(f"{ImportHelper.__name__}: error when importing file {metadata_row['filename']}.") from exception
 
+    @staticmethod
+    def load_repertoire_in_chunks(import_class, filename: Path, metadata_row, params: DatasetImportParams) -> Repertoire:
+        """
+        Reads the repertoire file in chunks of params.import_chunk_size rows, preprocesses each chunk with import_class.preprocess_dataframe()
+        and appends it to the repertoire (see Repertoire.build_from_chunks()), so that the whole file is never loaded into memory at once
+        """
+        chunks = ({column: dataframe[column].values for column in dataframe.columns}
+                  for dataframe in (import_class.preprocess_dataframe(dataframe, params)
+                                    for dataframe in ImportHelper.iterate_sequence_dataframes(import_class, filename, params)))
+
+        return Repertoire.build_from_chunks(chunks, path=params.result_path / "repertoires/", metadata=metadata_row.to_dict(),
+                                            filename_base=filename.stem)
+
+    @staticmethod
+    def iterate_sequence_dataframes(import_class, filepath: Path, params: DatasetImportParams):
+        """
+        Yields the data frames with params.import_chunk_size rows read from the file; if the import class has a custom load function
+        (alternative_load_func) but no function to load the file in chunks (alternative_chunk_load_func), the file is loaded at once
+        """
+        chunk_load_func = getattr(import_class, "alternative_chunk_load_func", None)
+        alternative_load_func = getattr(import_class, "alternative_load_func", None)
+
+        if chunk_load_func:
+            dataframes = chunk_load_func(filepath, params)
+        elif alternative_load_func:
+            dataframes = [alternative_load_func(filepath, params)]
+        else:
+            dataframes = ImportHelper.safe_load_dataframe(filepath, params, chunk_size=params.import_chunk_size)
+
+        for df in dataframes:
+            ImportHelper.rename_dataframe_columns(df, params)
+            if chunk_load_func or alternative_load_func or ImportHelper.get_import_engine(params) != ImportEngine.ARROW:
+                ImportHelper.standardize_none_values(df)
+            yield df
+
     @staticmethod
     def load_sequence_dataframe(filepath, params, alternative_load_func=None):
         try:
@@ -188,12 +288,27 @@ class ImportHelper:
                             f"For details on how to specify the dataset import, see the documentation.")
 
         ImportHelper.rename_dataframe_columns(df, params)
-        ImportHelper.standardize_none_values(df)
+        if alternative_load_func or ImportHelper.get_import_engine(params) != ImportEngine.ARROW:
+            # the arrow engine sets the missing values to None while parsing
+            ImportHelper.standardize_none_values(df)
 
         return df
 
     @staticmethod
-    def safe_load_dataframe(filepath, params: DatasetImportParams):
+    def get_import_engine(params) -> ImportEngine:
+        return getattr(params, "import_engine", None) or ImportEngine.PANDAS
+
+    @staticmethod
+    def safe_load_dataframe(filepath, params: DatasetImportParams, chunk_size: int = None):
+        """
+        Loads the file into a data frame, or if chunk_size is set, returns an iterator over data frames with chunk_size rows
+        """
+        if ImportHelper.get_import_engine(params) == ImportEngine.ARROW:
+            from immuneML.util.ArrowImportHelper import ArrowImportHelper
+            if chunk_size:
+                return ArrowImportHelper.iterate_dataframes(filepath, params, chunk_size)
+            return ArrowImportHelper.load_dataframe(filepath, params)
+
         if hasattr(params, "columns_to_load") and params.columns_to_load is not None:
             usecols = set(params.columns_to_load) if hasattr(params, "columns_to_load") and params.columns_to_load is not None else set()
             usecols = usecols.union(
@@ -206,14 +321,15 @@ class ImportHelper:
             usecols = None
 
         try:
-            df = pd.read_csv(filepath, sep=params.separator, iterator=False, usecols=usecols, dtype=str)
+            df = pd.read_csv(filepath, sep=params.separator, iterator=False, usecols=usecols, dtype=str, chunksize=chunk_size)
         except ValueError:
             try:
-                df = pd.read_csv(filepath, sep=params.separator, iterator=False, usecols=params.columns_to_load, dtype=str)
+                df = pd.read_csv(filepath, sep=params.separator, iterator=False, usecols=params.columns_to_load, dtype=str, chunksize=chunk_size)
             except ValueError:
-                df = pd.read_csv(filepath, sep=params.separator, iterator=False, dtype=str)
+                df = pd.read_csv(filepath, sep=params.separator, iterator=False, dtype=str, chunksize=chunk_size)
+                columns = df.columns if chunk_size is None else pd.read_csv(filepath, sep=params.separator, nrows=0).columns
                 warnings.warn(f"ImportHelper: failed to import columns {params.columns_to_load} for "
-                              f"the input file {filepath}, imported the following instead: {list(df.columns)}")
+                              f"the input file {filepath}, imported the following instead: {list(columns)}")
 
         return df
 
@@ -303,7 +419,7 @@ class ImportHelper:
         if "chains" in df.columns:
             df.loc[:, "chains"] = ImportHelper.load_chains_from_chains(df)
         else:
-            df.loc[:, "chains"] = ImportHelper.load_chains_from_genes(df)
+            df["chains"] = ImportHelper.load_chains_from_genes(df)
 
     @staticmethod
     def load_chains_from_chains(df: pd.DataFrame) -> list:
@@ -311,7 +427,7 @@ class ImportHelper:
 
     @staticmethod
     def load_chains_from_genes(df: pd.DataFrame) -> list:
-        return df.apply(ImportHelper.get_chain_for_row, axis=1)
+        return df.apply(ImportHelper.get_chain_for_row, axis=1, result_type="reduce")
 
     @staticmethod
     def get_chain_for_row(row):
@@ -332,7 +448,7 @@ class ImportHelper:
                 df.loc[:, "sequence_aas"] = df["sequence_aas"].str[1:-1]
             if "sequences" in df:
                 df.loc[:, "sequences"] = df["sequences"].str[3:-3]
-            df.loc[:, "region_types"] = region_type.name
+            df["region_types"] = region_type.name
 
     @staticmethod
     def strip_alleles(df: pd.DataFrame, column_name):
@@ -348,7 +464,10 @@ class ImportHelper:
         Safely removes everything after a delimiter from a column in the DataFrame
         """
         if column_name in df.columns:
-            return df[column_name].apply(lambda gene_col: None if gene_col is None else gene_col.rsplit(delimiter)[0])
+            column = df[column_name]
+            if column.isnull().all():
+                return column
+            return column.str.split(delimiter, n=1).str[0]
 
     @staticmethod
     def get_sequence_filenames(path: Path, dataset_name: str):
@@ -371,26 +490,131 @@ class ImportHelper:
 
     @staticmethod
     def import_sequence_dataset(import_class, params, dataset_name: str):
+        filenames = ImportHelper.get_sequence_filenames(params.path, dataset_name)
+        if params.number_of_processes > 1:
+            return ImportHelper.import_sequence_dataset_in_parallel(import_class, filenames, params, dataset_name)
+        return ImportHelper.build_sequence_dataset((ImportHelper.import_items(import_class, filename, params) for filename in filenames),
+                                                   params, dataset_name)
+
+    @staticmethod
+    def import_sequence_dataset_in_parallel(import_class, filenames: list, params: DatasetImportParams, dataset_name: str):
+        """
+        Imports the files with params.number_of_processes processes: each process parses a file, builds the sequences or receptors and stores
+        them directly in batch files of at most params.sequence_file_size items. If params.import_chunk_size is set and the dataset is not
+        paired, the files are read in parts of import_chunk_size rows and each part is imported by a process instead (the chains of a
+        receptor could be in different parts, so receptor files are always imported whole). The part size is rounded up to a multiple of
+        params.sequence_file_size, so that each part fills whole batch files and only the last batch file of each file (or of a part from
+        which rows were filtered out during preprocessing) is smaller. The batch files are named by the position of the file and the part, so
+        the order of the items is the same as with serial import. Finally, the lists of batch files and the labels from all processes are
+        merged to create the dataset and the dataset pickle file is exported.
+        """
         PathBuilder.build(params.result_path)
 
-        filenames = ImportHelper.get_sequence_filenames(params.path, dataset_name)
+        tasks = ImportHelper._make_sequence_import_tasks(import_class, filenames, params)
+        with Pool(params.number_of_processes) as pool:
+            results = list(ImportHelper.map_with_bounded_queue(pool, ImportHelper._import_items_to_batch_files, tasks,
+                                                               2 * params.number_of_processes))
+
+        return ImportHelper.build_sequence_dataset_from_batch_files(results, params, dataset_name)
+
+    @staticmethod
+    def _make_sequence_import_tasks(import_class, filenames: list, params: DatasetImportParams):
+        if params.import_chunk_size is not None and not params.paired:
+            params = replace(params, import_chunk_size=math.ceil(params.import_chunk_size / params.sequence_file_size) * params.sequence_file_size)
+
+        for file_index, filename in enumerate(filenames):
+            if params.import_chunk_size is not None and not params.paired:
+                for chunk_index, df in enumerate(ImportHelper.iterate_sequence_dataframes(import_class, filename, params)):
+                    yield import_class, df, params, f"batch_{file_index:06d}_{chunk_index:06d}"
+            else:
+                yield import_class, filename, params, f"batch_{file_index:06d}_{0:06d}"
+
+    @staticmethod
+    def _import_items_to_batch_files(import_class, source, params: DatasetImportParams, batch_name: str) -> tuple:
+        if isinstance(source, pd.DataFrame):
+            items = ImportHelper.build_items(import_class, source, params)
+        else:
+            items = ImportHelper.import_items(import_class, source, params)
+
+        return ImportHelper.store_items_in_batch_files(items, params, batch_name), ImportHelper.extract_sequence_dataset_params(items, params)
+
+    @staticmethod
+    def map_with_bounded_queue(pool: Pool, function, tasks, max_pending: int):
+        """
+        Yields the results of applying the function to the arguments from tasks (an iterable of tuples) in the order of the tasks; at most
+        max_pending tasks are submitted to the pool at a time, so that the tasks which are created while iterating (e.g., parts of large files)
+        do not all have to be kept in memory
+        """
+        pending = []
+        for arguments in tasks:
+            pending.append(pool.apply_async(function, arguments))
+            if len(pending) >= max_pending:
+                yield pending.pop(0).get()
+
+        for result in pending:
+            yield result.get()
+
+    @staticmethod
+    def store_items_in_batch_files(items, params: DatasetImportParams, batch_name: str) -> list:
+        """Stores the items in batch files of at most params.sequence_file_size items named <batch_name>_<index>.pickle and returns the file names"""
+        filenames = []
+        for index, start in enumerate(range(0, len(items), params.sequence_file_size)):
+            filenames.append(params.result_path / f"{batch_name}_{index:06d}.pickle")
+            ElementBatchFile.write(filenames[-1], items[start:start + params.sequence_file_size])
+        return filenames
+
+    @staticmethod
+    def build_sequence_dataset_from_batch_files(results: list, params: DatasetImportParams, dataset_name: str, labels: dict = None):
+        """
+        Creates the dataset from the batch files stored by the import processes and exports the dataset pickle file; results is a list of
+        tuples with the list of batch files and the labels (see extract_sequence_dataset_params()) from each process; the label values from
+        all processes are merged unless the labels are given
+        """
+        dataset_filenames = [filename for filenames, _ in results for filename in filenames]
+
+        if labels is None:
+            labels = {}
+            for dataset_params in (dataset_params for _, dataset_params in results):
+                for key, value in dataset_params.items():
+                    if isinstance(value, set) and isinstance(labels.get(key), set):
+                        labels[key].update(value)
+                    elif key not in labels:
+                        labels[key] = value
+
+        init_kwargs = {"filenames": dataset_filenames, "file_size": params.sequence_file_size, "name": dataset_name, "labels": labels}
+        dataset = ReceptorDataset(**init_kwargs) if params.paired else SequenceDataset(**init_kwargs)
+
+        PickleExporter.export(dataset, params.result_path)
+
+        return dataset
+
+    @staticmethod
+    def build_sequence_dataset(items_per_file, params: DatasetImportParams, dataset_name: str):
+        """
+        Stores the sequences or receptors imported from each file (items_per_file is an iterable of arrays of items) in batch files of
+        params.sequence_file_size items, creates the dataset and exports the dataset pickle file
+        """
+        PathBuilder.build(params.result_path)
 
         file_index = 0
         dataset_filenames = []
         dataset_params = {}
         items = None
 
-        for index, filename in enumerate(filenames):
-            new_items = ImportHelper.import_items(import_class, filename, params)
+        for new_items in items_per_file:
             items = np.append(items, new_items) if items is not None else new_items
             dataset_params = ImportHelper.extract_sequence_dataset_params(items, params)
 
-            while len(items) > params.sequence_file_size or (index == len(filenames) - 1 and len(items) > 0):
+            while len(items) > params.sequence_file_size:
                 dataset_filenames.append(params.result_path / "batch_{}.pickle".format(file_index))
                 ImportHelper.store_sequence_items(dataset_filenames, items, params.sequence_file_size)
                 items = items[params.sequence_file_size:]
                 file_index += 1
 
+        if items is not None and len(items) > 0:
+            dataset_filenames.append(params.result_path / "batch_{}.pickle".format(file_index))
+            ImportHelper.store_sequence_items(dataset_filenames, items, params.sequence_file_size)
+
         init_kwargs = {"filenames": dataset_filenames, "file_size": params.sequence_file_size, "name": dataset_name, "labels": dataset_params}
 
         dataset = ReceptorDataset(**init_kwargs) if params.paired else SequenceDataset(**init_kwargs)
@@ -418,6 +642,11 @@ class ImportHelper:
     def import_items(import_class, path, params: DatasetImportParams):
         alternative_load_func = getattr(import_class, "alternative_load_func", None)
         df = ImportHelper.load_sequence_dataframe(path, params, alternative_load_func)
+        return ImportHelper.build_items(import_class, df, params)
+
+    @staticmethod
+    def build_items(import_class, df: pd.DataFrame, params: DatasetImportParams):
+        """Preprocesses the data frame loaded from a file (or a part of the file) and creates the sequences or receptors from it"""
         df = import_class.preprocess_dataframe(df, params)
 
         if params.paired:
@@ -434,8 +663,7 @@ class ImportHelper:
 
     @staticmethod
     def store_sequence_items(dataset_filenames: list, items: list, sequence_file_size: int):
-        with dataset_filenames[-1].open("wb") as file:
-            pickle.dump(items[:sequence_file_size], file)
+        ElementBatchFile.write(dataset_filenames[-1], items[:sequence_file_size])
 
     @staticmethod
     def import_sequence(row, metadata_columns=None) -> ReceptorSequence:
@@ -5,6 +5,7 @@ class NumpyHelper:
 
     @staticmethod
     def group_structured_array_by(data, field):
+        data = data.copy()
         for col in data.dtype.names:
             data[col][np.argwhere(data[col] == None)] = ""
         sorted_data = np.sort(data, order=[field], axis=0)
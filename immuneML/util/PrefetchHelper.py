@@ -0,0 +1,70 @@
+import queue
+import threading
+from typing import Callable, Iterable
+
+
+class PrefetchHelper:
+    """
+    Helper class for overlapping the loading of data from disk with the processing of the data: the items are loaded in order on a
+    background thread, which stays at most prefetch_count items ahead of the consumer, so that the next batch files or repertoires are read
+    while the current one is being processed. Exceptions raised while loading an item are raised in the consumer when that item is reached.
+
+    Loading is done on a single thread, so the gain comes from the time the load function waits for I/O (reading files releases the GIL,
+    while unpickling does not); it does not make CPU-bound loading faster.
+    """
+
+    _END = object()
+    _POLL_INTERVAL = 0.1
+
+    @staticmethod
+    def iterate(items: Iterable, load_function: Callable, prefetch_count: int):
+        """
+        Returns a generator of load_function(item) for each of the items; if prefetch_count is 0 or less, the items are loaded on the calling
+        thread when they are requested (no prefetching)
+        """
+        if prefetch_count is None or prefetch_count <= 0:
+            return (load_function(item) for item in items)
+        else:
+            return PrefetchHelper._iterate_in_background(items, load_function, prefetch_count)
+
+    @staticmethod
+    def _iterate_in_background(items: Iterable, load_function: Callable, prefetch_count: int):
+        loaded = queue.Queue(maxsize=prefetch_count)
+        stop = threading.Event()
+        thread = threading.Thread(target=PrefetchHelper._load_items, args=(items, load_function, loaded, stop), daemon=True,
+                                  name="immuneML-prefetch")
+        thread.start()
+
+        try:
+            while True:
+                value, error = loaded.get()
+                if error is not None:
+                    raise error
+                elif value is PrefetchHelper._END:
+                    return
+                else:
+                    yield value
+        finally:
+            stop.set()
+            thread.join()
+
+    @staticmethod
+    def _load_items(items: Iterable, load_function: Callable, loaded: queue.Queue, stop: threading.Event):
+        try:
+            for item in items:
+                if not PrefetchHelper._put(loaded, (load_function(item), None), stop):
+                    return
+            PrefetchHelper._put(loaded, (PrefetchHelper._END, None), stop)
+        except Exception as error:
+            PrefetchHelper._put(loaded, (None, error), stop)
+
+    @staticmethod
+    def _put(loaded: queue.Queue, value, stop: threading.Event) -> bool:
+        """Waits until there is space in the queue or the consumer has stopped; returns False if the consumer has stopped"""
+        while not stop.is_set():
+            try:
+                loaded.put(value, timeout=PrefetchHelper._POLL_INTERVAL)
+                return True
+            except queue.Full:
+                pass
+        return False
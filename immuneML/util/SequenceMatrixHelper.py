@@ -0,0 +1,105 @@
+from pathlib import Path
+from typing import List, Tuple
+
+import numpy as np
+
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.environment.SequenceType import SequenceType
+
+
+class SequenceMatrixHelper:
+    """
+    Helper class for the integer-coded representation of sequences: a uint8 matrix of shape (number of sequences, maximum sequence length)
+    where each character is replaced by its index in the alphabet as returned by EnvironmentSettings.get_sequence_alphabet(). Positions after
+    the end of each sequence are filled with PADDING_CODE, and characters not in the alphabet (e.g., stop codons) with UNKNOWN_CODE. The
+    matrix is accompanied by an int32 vector of sequence lengths; missing sequences have length 0.
+
+    When stored to disk, the matrix and the lengths are kept in two .npy files next to the data file and are loaded as memory-mapped arrays.
+    """
+
+    PADDING_CODE = 255
+    UNKNOWN_CODE = 254
+    MATRIX_SUFFIX = "_matrix.npy"
+    LENGTHS_SUFFIX = "_lengths.npy"
+
+    @staticmethod
+    def encode(sequences, sequence_type: SequenceType = None) -> Tuple[np.ndarray, np.ndarray]:
+        sequences = ["" if sequence is None else sequence for sequence in sequences]
+        lengths = np.fromiter((len(sequence) for sequence in sequences), dtype=np.int32, count=len(sequences))
+        matrix = np.full((len(sequences), lengths.max() if len(sequences) > 0 else 0), SequenceMatrixHelper.PADDING_CODE, dtype=np.uint8)
+
+        characters = np.frombuffer("".join(sequences).encode("ascii", errors="replace"), dtype=np.uint8)
+        rows = np.repeat(np.arange(len(sequences)), lengths)
+        columns = np.arange(characters.shape[0]) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+        matrix[rows, columns] = SequenceMatrixHelper.get_lookup_table(sequence_type)[characters]
+
+        return matrix, lengths
+
+    @staticmethod
+    def decode(matrix: np.ndarray, lengths: np.ndarray, sequence_type: SequenceType = None) -> np.ndarray:
+        alphabet = np.array(EnvironmentSettings.get_sequence_alphabet(sequence_type) + ["X"])
+        codes = np.minimum(matrix, len(alphabet) - 1)
+        sequences = np.empty(matrix.shape[0], dtype=object)
+        sequences[:] = ["".join(alphabet[codes[index, :lengths[index]]]) for index in range(matrix.shape[0])]
+        return sequences
+
+    @staticmethod
+    def get_lookup_table(sequence_type: SequenceType = None) -> np.ndarray:
+        lookup_table = np.full(256, SequenceMatrixHelper.UNKNOWN_CODE, dtype=np.uint8)
+        for index, character in enumerate(EnvironmentSettings.get_sequence_alphabet(sequence_type)):
+            lookup_table[ord(character)] = index
+        return lookup_table
+
+    @staticmethod
+    def concatenate(matrices: List[Tuple[np.ndarray, np.ndarray]]) -> Tuple[np.ndarray, np.ndarray]:
+        if len(matrices) == 0:
+            return np.zeros((0, 0), dtype=np.uint8), np.zeros(0, dtype=np.int32)
+        width = max(matrix.shape[1] for matrix, _ in matrices)
+        padded = [np.pad(matrix, ((0, 0), (0, width - matrix.shape[1])), constant_values=SequenceMatrixHelper.PADDING_CODE)
+                  for matrix, _ in matrices]
+        return np.concatenate(padded, axis=0), np.concatenate([lengths for _, lengths in matrices])
+
+    @staticmethod
+    def get_filenames(data_filename: Path, sequence_type: SequenceType = None, chain: str = None) -> Tuple[Path, Path]:
+        sequence_type = EnvironmentSettings.get_sequence_type() if sequence_type is None else sequence_type
+        stem = f"{data_filename.stem}_{sequence_type.value}" + (f"_{chain}" if chain is not None else "")
+        return data_filename.parent / f"{stem}{SequenceMatrixHelper.MATRIX_SUFFIX}", \
+               data_filename.parent / f"{stem}{SequenceMatrixHelper.LENGTHS_SUFFIX}"
+
+    @staticmethod
+    def get_stored_filenames(data_filename: Path) -> List[Path]:
+        prefixes = [f"{data_filename.stem}_{sequence_type.value}" for sequence_type in SequenceType]
+        return sorted(filename for filename in data_filename.parent.glob(f"{data_filename.stem}_*")
+                      if SequenceMatrixHelper.is_sequence_matrix_file(filename) and any(filename.name.startswith(prefix) for prefix in prefixes))
+
+    @staticmethod
+    def is_sequence_matrix_file(filename: Path) -> bool:
+        return filename.name.endswith(SequenceMatrixHelper.MATRIX_SUFFIX) or filename.name.endswith(SequenceMatrixHelper.LENGTHS_SUFFIX)
+
+    @staticmethod
+    def store(matrix: np.ndarray, lengths: np.ndarray, data_filename: Path, sequence_type: SequenceType = None, chain: str = None):
+        matrix_filename, lengths_filename = SequenceMatrixHelper.get_filenames(data_filename, sequence_type, chain)
+        np.save(str(matrix_filename), matrix)
+        np.save(str(lengths_filename), lengths)
+
+    @staticmethod
+    def load(data_filename: Path, sequence_type: SequenceType = None, chain: str = None):
+        """Returns the memory-mapped matrix and lengths stored for the data file or None if they have not been stored"""
+        matrix_filename, lengths_filename = SequenceMatrixHelper.get_filenames(data_filename, sequence_type, chain)
+        if matrix_filename.is_file() and lengths_filename.is_file():
+            return np.load(str(matrix_filename), mmap_mode="r"), np.load(str(lengths_filename), mmap_mode="r")
+        else:
+            return None
+
+    @staticmethod
+    def store_for_elements(elements: list, batch_filename: Path):
+        """Stores the matrices for all sequence types of the sequences or receptors (one matrix per chain) in the batch file"""
+        if len(elements) > 0:
+            chains = elements[0].get_chains() if hasattr(elements[0], "get_chains") else [None]
+            for sequence_type in SequenceType:
+                for chain in chains:
+                    sequences = [(element.get_chain(chain) if chain is not None else element).get_sequence(sequence_type)
+                                 for element in elements]
+                    if any(sequence is not None for sequence in sequences):
+                        matrix, lengths = SequenceMatrixHelper.encode(sequences, sequence_type)
+                        SequenceMatrixHelper.store(matrix, lengths, batch_filename, sequence_type, chain)
@@ -0,0 +1,22 @@
+class SizeHelper:
+    """Converts between sizes in bytes and human-readable sizes with units (e.g., 500M or 20G), as used for the cache size budgets"""
+
+    UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+    @staticmethod
+    def parse_size(size: str) -> int:
+        """Parses the size in bytes given as an integer with an optional unit (K, M, G or T, e.g., 500M or 20G)"""
+        size = size.strip().upper().rstrip("B")
+        unit = size[-1] if size != "" and size[-1] in SizeHelper.UNITS else ""
+        try:
+            return int(float(size[:len(size) - len(unit)]) * SizeHelper.UNITS[unit])
+        except ValueError:
+            raise ValueError(f"SizeHelper: invalid size: {size}. The size has to be a number with an optional unit (K, M, G or T), e.g. 20G.")
+
+    @staticmethod
+    def format_size(size: int) -> str:
+        for unit in ["", "K", "M", "G"]:
+            if size < 1024:
+                return f"{size:.1f}{unit}B" if unit != "" else f"{size}B"
+            size /= 1024
+        return f"{size:.1f}TB"
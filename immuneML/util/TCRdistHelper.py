@@ -11,7 +11,7 @@ class TCRdistHelper:
 
     @staticmethod
     def compute_tcr_dist(dataset: ReceptorDataset, labels: list, cores: int = 1):
-        return CacheHandler.memo_by_params((('dataset_identifier', dataset.identifier), ("type", "TCRrep")),
+        return CacheHandler.memo_by_params((('dataset', dataset.get_fingerprint()), ("type", "TCRrep")),
                                            lambda: TCRdistHelper._compute_tcr_dist(dataset, labels, cores))
 
     @staticmethod
@@ -7,6 +7,8 @@ from immuneML.IO.dataset_export.PickleExporter import PickleExporter
 from immuneML.caching.CacheType import CacheType
 from immuneML.data_model.dataset.ReceptorDataset import ReceptorDataset
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
+from immuneML.data_model.repertoire.MaskedRepertoire import MaskedRepertoire
+from immuneML.data_model.repertoire.Repertoire import Repertoire
 from immuneML.environment.Constants import Constants
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.simulation.dataset_generation.RandomDatasetGenerator import RandomDatasetGenerator
@@ -51,3 +53,22 @@ class TestPickleExporter(TestCase):
         self.assertEqual(10, dataset2.get_example_count())
 
         shutil.rmtree(path)
+
+    def test_export_masked_repertoires(self):
+        path = EnvironmentSettings.tmp_test_path / "pickleexporter_masked/"
+        PathBuilder.build(path)
+
+        repertoires, metadata = RepertoireBuilder.build([["AA", "CC", "DD"], ["EE", "FF"]], path / "original")
+        masked = [Repertoire.build_like(repertoire, [0, 1], path / "filtered") for repertoire in repertoires]
+        dataset = RepertoireDataset(repertoires=masked, metadata_file=metadata, name="d1")
+        PickleExporter.export(dataset, path / "exported")
+        shutil.rmtree(path / "original")
+
+        with open(path / "exported/d1.iml_dataset", "rb") as file:
+            dataset2 = pickle.load(file)
+
+        self.assertFalse(any(isinstance(repertoire, MaskedRepertoire) for repertoire in dataset2.get_data()))
+        self.assertListEqual(["AA", "CC"], dataset2.get_data()[0].get_sequence_aas().tolist())
+        self.assertListEqual(["EE", "FF"], dataset2.get_data()[1].get_sequence_aas().tolist())
+
+        shutil.rmtree(path)
@@ -79,6 +79,97 @@ rep2.tsv,2""")
 
         shutil.rmtree(path)
 
+    def test_import_repertoire_dataset_with_arrow(self):
+        path = EnvironmentSettings.root_path / "test/tmp/ioairr_arrow/"
+        PathBuilder.build(path)
+        self.create_dummy_dataset(path, True)
+
+        params = {"is_repertoire": True, "path": path, "metadata_file": path / "metadata.csv",
+                  "import_out_of_frame": False, "import_with_stop_codon": False, "import_illegal_characters": False,
+                  "import_productive": True, "region_type": "IMGT_CDR3", "import_empty_nt_sequences": True, "import_empty_aa_sequences": False,
+                  "column_mapping": self.get_column_mapping(), "separator": "\t"}
+
+        datasets = [AIRRImport.import_dataset({**params, "result_path": path / engine, "import_engine": engine}, f"airr_dataset_{engine}")
+                    for engine in ["pandas", "arrow"]]
+
+        for pandas_repertoire, arrow_repertoire in zip(datasets[0].get_data(), datasets[1].get_data()):
+            for attribute in ["sequence_identifiers", "sequence_aas", "sequences", "v_genes", "j_alleles", "chains", "frame_types",
+                              "junction_length", "v_sequence_start", "rev_comp"]:
+                self.assertListEqual(list(pandas_repertoire.get_attribute(attribute)), list(arrow_repertoire.get_attribute(attribute)))
+            self.assertListEqual(list(pandas_repertoire.get_counts()), list(arrow_repertoire.get_counts()))
+
+        shutil.rmtree(path)
+
+    def test_import_repertoire_dataset_in_chunks(self):
+        path = EnvironmentSettings.root_path / "test/tmp/ioairr_chunks/"
+        PathBuilder.build(path)
+        self.create_dummy_dataset(path, True)
+
+        params = {"is_repertoire": True, "path": path, "metadata_file": path / "metadata.csv",
+                  "import_out_of_frame": False, "import_with_stop_codon": False, "import_illegal_characters": False,
+                  "import_productive": True, "region_type": "IMGT_CDR3", "import_empty_nt_sequences": True, "import_empty_aa_sequences": False,
+                  "column_mapping": self.get_column_mapping(), "separator": "\t"}
+
+        for engine in ["pandas", "arrow"]:
+            dataset = AIRRImport.import_dataset({**params, "result_path": path / engine, "import_engine": engine}, f"airr_dataset_{engine}")
+            chunked_dataset = AIRRImport.import_dataset({**params, "result_path": path / f"{engine}_chunks", "import_engine": engine,
+                                                         "import_chunk_size": 2}, f"airr_dataset_{engine}_chunks")
+
+            for repertoire, chunked_repertoire in zip(dataset.get_data(), chunked_dataset.get_data()):
+                self.assertListEqual(repertoire.fields, chunked_repertoire.fields)
+                for attribute in ["sequence_identifiers", "sequence_aas", "sequences", "v_genes", "j_alleles", "counts", "frame_types",
+                                  "junction_length", "v_sequence_start"]:
+                    self.assertListEqual(list(repertoire.get_attribute(attribute)), list(chunked_repertoire.get_attribute(attribute)))
+
+        shutil.rmtree(path)
+
+    def test_import_repertoire_dataset_incrementally(self):
+        path = EnvironmentSettings.root_path / "test/tmp/ioairr_incremental/"
+        PathBuilder.build(path)
+        self.create_dummy_dataset(path, True)
+
+        params = {"is_repertoire": True, "path": path, "metadata_file": path / "metadata.csv", "result_path": path / "result",
+                  "import_out_of_frame": False, "import_with_stop_codon": False, "import_illegal_characters": False,
+                  "import_productive": True, "region_type": "IMGT_CDR3", "import_empty_nt_sequences": True, "import_empty_aa_sequences": False,
+                  "column_mapping": self.get_column_mapping(), "separator": "\t", "incremental": True}
+
+        identifiers = [repertoire.identifier for repertoire in AIRRImport.import_dataset(dict(params), "airr_dataset").get_data()]
+        self.assertListEqual(identifiers, [repertoire.identifier for repertoire in AIRRImport.import_dataset(dict(params), "airr_dataset").get_data()])
+
+        shutil.copyfile(path / "rep1.tsv", path / "rep2.tsv")
+        with open(path / "metadata.csv", "a") as file:
+            file.writelines("\nrep3.tsv,3")
+        shutil.copyfile(path / "rep1.tsv", path / "rep3.tsv")
+
+        dataset = AIRRImport.import_dataset(dict(params), "airr_dataset")
+        repertoires = dataset.get_data()
+        self.assertEqual(3, dataset.get_example_count())
+        self.assertEqual(identifiers[0], repertoires[0].identifier)
+        self.assertNotEqual(identifiers[1], repertoires[1].identifier)
+        self.assertListEqual(list(repertoires[0].get_sequence_aas()), list(repertoires[1].get_sequence_aas()))
+        self.assertEqual(3, repertoires[2].metadata["subject_id"])
+
+        # an interrupted import: the last line of the manifest was cut off, so only that repertoire is imported again
+        manifest_file = path / "result" / "airr_dataset_import_manifest.jsonl"
+        lines = manifest_file.read_text().splitlines()
+        manifest_file.write_text("\n".join(lines[:2]) + "\n" + lines[2][:20])
+
+        repertoires = AIRRImport.import_dataset(dict(params), "airr_dataset").get_data()
+        self.assertListEqual([repertoire.identifier for repertoire in dataset.get_data()][:2], [repertoire.identifier for repertoire in repertoires][:2])
+        self.assertNotEqual(dataset.get_data()[2].identifier, repertoires[2].identifier)
+        self.assertEqual(3, len(manifest_file.read_text().splitlines()))
+
+        # the files of rep3.tsv are removed with it from the metadata, the files of the replaced rep2.tsv repertoire were removed before
+        metadata_lines = (path / "metadata.csv").read_text().splitlines()
+        (path / "metadata.csv").write_text("\n".join(metadata_lines[:3]))
+        repertoires = AIRRImport.import_dataset(dict(params), "airr_dataset").get_data()
+        self.assertEqual(2, len(repertoires))
+        repertoire_files = sorted(file.name for file in (path / "result" / "repertoires").iterdir())
+        self.assertListEqual(sorted(file.name for repertoire in repertoires for file in [repertoire.data_filename, repertoire.metadata_filename]),
+                             repertoire_files)
+
+        shutil.rmtree(path)
+
     def test_sequence_dataset(self):
         path = EnvironmentSettings.root_path / "test/tmp/ioairr/"
         PathBuilder.build(path)
@@ -375,3 +375,46 @@ mouse_subject0045,PA,1,TRAV16D/DV11*03,TRAJ53*01,CAMRGNSGGSNYKLTF,tgtgctatgagggg
         self.assertEqual("mouse", dataset.labels["organism"])
 
         shutil.rmtree(path)
+
+    def test_import_dataset_in_parallel(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "io_single_line_parallel/")
+        header = "subject,epitope,count,v_a_gene,j_a_gene,cdr3_a_aa,v_b_gene,j_b_gene,cdr3_b_aa,clone_id\n"
+        rows = [["mouse_subject0050,PA,2,TRAV7-3*01,TRAJ33*01,CAVSLDSNYQLIW,TRBV13-1*01,TRBJ2-3*01,CASSDFDWGGDAETLYF,mouse_tcr0072.clone",
+                 "mouse_subject0050,PA,6,TRAV6D-6*01,TRAJ56*01,CALGDRATGGNNKLTF,TRBV29*01,TRBJ1-1*01,CASSPDRGEVFF,mouse_tcr0096.clone",
+                 "mouse_subject0050,PA,1,TRAV6D-6*01,TRAJ49*01,CALGSNTGYQNFYF,TRBV29*01,TRBJ1-5*01,CASTGGGAPLF,mouse_tcr0276.clone"],
+                ["mouse_subject0020,PA,1,TRAV6D-6*01,TRAJ33*01,CALGRGSNYQLIW,TRBV29*01,TRBJ1-1*01,CASSTGSEVFF,mouse_tcr1668.clone",
+                 "mouse_subject0045,PA,1,TRAV6D-6*01,TRAJ22*01,CALGSGGSWQLIF,TRBV29*01,TRBJ1-1*01,CASSGPEVFF,mouse_tcr1919.clone"]]
+
+        for index, file_rows in enumerate(rows):
+            with open(PathBuilder.build(path / "data") / f"data{index}.csv", "w") as file:
+                file.writelines(header + "\n".join(file_rows) + "\n")
+
+        dataset = SingleLineReceptorImport.import_dataset({
+            "path": path / "data",
+            "result_path": path / "result/",
+            "separator": ",",
+            "columns_to_load": ["subject", "epitope", "count", "v_a_gene", "j_a_gene", "cdr3_a_aa", "v_b_gene", "j_b_gene", "cdr3_b_aa", "clone_id"],
+            "column_mapping": {
+                "cdr3_a_aa": "alpha_amino_acid_sequence",
+                "cdr3_b_aa": "beta_amino_acid_sequence",
+                "v_a_gene": "alpha_v_gene",
+                "v_b_gene": "beta_v_gene",
+                "j_a_gene": "alpha_j_gene",
+                "j_b_gene": "beta_j_gene",
+                "clone_id": "identifier"
+            },
+            "receptor_chains": "TRA_TRB",
+            "region_type": "IMGT_CDR3",
+            "sequence_file_size": 2,
+            "organism": "mouse",
+            "number_of_processes": 2
+        }, "parallel_dataset")
+
+        self.assertEqual(5, dataset.get_example_count())
+        self.assertEqual(3, len(dataset.get_filenames()))
+        self.assertEqual(sorted(row.split(",")[-1] for file_rows in rows for row in file_rows),
+                         sorted(receptor.identifier for receptor in dataset.get_data()))
+        self.assertTrue(os.path.isfile(path / "result/parallel_dataset.iml_dataset"))
+        self.assertEqual("mouse", dataset.labels["organism"])
+
+        shutil.rmtree(path)
@@ -82,3 +82,26 @@ rep1.tsv,TRA,1234e,no"""
         self.assertEqual('ASSSFWGSDTGELF', seqs[2].amino_acid_sequence)
 
         shutil.rmtree(path)
+
+    def test_import_sequence_dataset_in_parallel(self):
+        path = EnvironmentSettings.tmp_test_path / "generic_parallel/"
+        self.make_dummy_dataset(path / "data", False)
+
+        params = {"is_repertoire": False, "paired": False, "path": path / "data", "import_illegal_characters": False, "region_type": "IMGT_CDR3",
+                  "separator": "\t", "import_empty_nt_sequences": True, "sequence_file_size": 3,
+                  "column_mapping": {"CDR3B AA Sequence": "sequence_aas", "TRBV Gene": "v_genes", "TRBJ Gene": "j_genes"}}
+
+        serial_dataset = GenericImport.import_dataset({**params, "result_path": path / "serial"}, "serial_dataset")
+        dataset = GenericImport.import_dataset({**params, "result_path": path / "parallel", "number_of_processes": 2, "import_chunk_size": 4},
+                                               "parallel_dataset")
+
+        self.assertEqual(15, dataset.get_example_count())
+        # the part size is rounded up to 6 sequences, so the parts fill whole batch files of 3 sequences as with serial import
+        self.assertEqual(5, len(serial_dataset.get_filenames()))
+        self.assertEqual(5, len(dataset.get_filenames()))
+        self.assertListEqual([sequence.amino_acid_sequence for sequence in serial_dataset.get_data()],
+                             [sequence.amino_acid_sequence for sequence in dataset.get_data()])
+        self.assertListEqual([sequence.metadata.v_gene for sequence in serial_dataset.get_data()],
+                             [sequence.metadata.v_gene for sequence in dataset.get_data()])
+
+        shutil.rmtree(path)
@@ -506,6 +506,29 @@ person2	second_zip_rep2	samp2	5faf101103b9977a150a9eaa	PRJCA002413	Homo sapiens
 
         shutil.rmtree(base_path)
 
+    def test_import_repertoire_dataset_with_arrow(self):
+        base_path = EnvironmentSettings.root_path / "test/tmp/ireceptorimport_arrow/"
+        path = base_path / "repertoiredataset/"
+        PathBuilder.build(path)
+        self.create_dummy_dataset(path, zip_name="first_zip", disease_name="first_disease")
+        self.create_dummy_dataset(path, zip_name="second_zip", disease_name="second_disease")
+
+        params = DefaultParamsLoader.load(EnvironmentSettings.default_params_path / "datasets", "i_receptor")
+        params["result_path"] = path / "result"
+        params["path"] = path
+        params["import_engine"] = "arrow"
+        params["number_of_processes"] = 2
+
+        dataset = IReceptorImport.import_dataset(params, "ireceptor_repertoiredataset")
+
+        self.assertEqual(6, dataset.get_example_count())
+        self.assertListEqual(sorted(["first_zip_rep1", "first_zip_rep2", "first_zip_rep2", "second_zip_rep1", "second_zip_rep2", "second_zip_rep2"]),
+                             sorted(repertoire.metadata["repertoire_id"] for repertoire in dataset.get_data()))
+        self.assertTrue(all(repertoire.get_element_count() > 0 for repertoire in dataset.get_data()))
+        self.assertListEqual([], list((path / "result").rglob("*.tsv")))
+
+        shutil.rmtree(base_path)
+
     def test_safe_get_field(self):
         dict = {"field1": {"field2": {"field3": "field4"}}}
 
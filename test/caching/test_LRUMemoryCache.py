@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+import numpy as np
+
+from immuneML.caching.LRUMemoryCache import LRUMemoryCache
+
+
+class TestLRUMemoryCache(TestCase):
+
+    def test_put_get(self):
+        cache = LRUMemoryCache(max_bytes=100)
+
+        self.assertTrue(cache.put("a", 1, size=40))
+        self.assertTrue(cache.put("b", 2, size=40))
+        self.assertEqual(1, cache.get("a"))
+
+        self.assertTrue(cache.put("c", 3, size=40))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(1, cache.get("a"))
+        self.assertEqual(3, cache.get("c"))
+
+        self.assertFalse(cache.put("d", 4, size=200))
+        self.assertFalse(cache.contains("d"))
+
+        self.assertDictEqual({"hits": 3, "misses": 1, "evictions": 1, "entries": 2, "bytes": 80, "max_bytes": 100}, cache.get_stats())
+
+        cache.set_max_bytes(50)
+        self.assertFalse(cache.contains("a"))
+        self.assertTrue(cache.contains("c"))
+
+        cache.remove("c")
+        self.assertEqual(0, cache.get_stats()["bytes"])
+
+    def test_estimate_size(self):
+        values = np.empty(10, dtype=object)
+        values[:] = ["AAAAAAAAAA" for _ in range(10)]
+        data = np.zeros(10, dtype=[("sequence_aas", object), ("counts", object)])
+        data["sequence_aas"] = values
+
+        self.assertTrue(LRUMemoryCache.estimate_size(values) > values.nbytes)
+        self.assertTrue(LRUMemoryCache.estimate_size(data) > LRUMemoryCache.estimate_size(values))
+        self.assertEqual(800, LRUMemoryCache.estimate_size(np.zeros(100)))
@@ -1,13 +1,44 @@
-import hashlib
 import os
 import pickle
-from unittest import TestCase
-
+import shutil
+import sys
+import time
+from functools import partial
+from multiprocessing import Pool
+from unittest import TestCase, mock
+from uuid import uuid4
+
+import numpy as np
+from scipy import sparse
+
+from immuneML.caching.CacheCompression import CacheCompression
 from immuneML.caching.CacheHandler import CacheHandler
+from immuneML.caching.CacheMemoryPolicy import CacheMemoryPolicy
 from immuneML.caching.CacheObjectType import CacheObjectType
 from immuneML.caching.CacheType import CacheType
+from immuneML.caching.codec.LZ4PickleCacheCodec import LZ4PickleCacheCodec
+from immuneML.caching.codec.NumpyCacheCodec import NumpyCacheCodec
+from immuneML.caching.codec.SparseCacheCodec import SparseCacheCodec
 from immuneML.environment.Constants import Constants
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.PathBuilder import PathBuilder
+
+
+def compute_slowly(log_path, index):
+    with (log_path / f"{index}.txt").open("w") as file:
+        file.write(str(index))
+    time.sleep(0.5)
+    return list(range(100))
+
+
+def memo_slowly(log_path, index):
+    return CacheHandler.memo("single_flight_key", partial(compute_slowly, log_path, index))
+
+
+def square(log_path, value):
+    with (log_path / f"{value}.txt").open("w") as file:
+        file.write(str(value))
+    return [value * value]
 
 
 class TestCacheHandler(TestCase):
@@ -20,7 +51,7 @@ class TestCacheHandler(TestCase):
         obj = "object_example"
         object_type = CacheObjectType.OTHER
 
-        h = hashlib.sha256(str(params).encode('utf-8')).hexdigest()
+        h = CacheHandler.generate_cache_key(params)
         filename = EnvironmentSettings.get_cache_path() / "{}/{}.pickle".format(CacheObjectType.OTHER.name.lower(), h)
         with open(filename, "wb") as file:
             pickle.dump(obj, file)
@@ -85,3 +116,112 @@ class TestCacheHandler(TestCase):
         self.assertTrue(os.path.isfile(EnvironmentSettings.get_cache_path() / f"encoding/{cache_key}.pickle"))
 
         os.remove(CacheHandler._build_filename(cache_key, CacheObjectType.ENCODING))
+
+    def test_memory_tier(self):
+        EnvironmentSettings.set_cache_memory_policy(CacheObjectType.ENCODING_STEP, CacheMemoryPolicy.READ_WRITE)
+        EnvironmentSettings.set_cache_memory_policy(CacheObjectType.OTHER, CacheMemoryPolicy.READ)
+        CacheHandler.clear_memory()
+
+        obj = CacheHandler.memo("memory_key_1", lambda: {"a": [1, 2]}, CacheObjectType.ENCODING_STEP)
+        self.assertIs(obj, CacheHandler.get_by_key("memory_key_1", CacheObjectType.ENCODING_STEP))
+
+        CacheHandler.add_by_key("memory_key_2", {"b": 3})
+        loaded = CacheHandler.get_by_key("memory_key_2", CacheObjectType.OTHER)
+        self.assertEqual({"b": 3}, loaded)
+        self.assertIs(loaded, CacheHandler.get_by_key("memory_key_2", CacheObjectType.OTHER))
+        self.assertEqual(2, CacheHandler.get_memory_stats()["entries"])
+
+        EnvironmentSettings.set_cache_memory_policy(CacheObjectType.OTHER, CacheMemoryPolicy.NONE)
+        os.remove(CacheHandler._build_filename("memory_key_2", CacheObjectType.OTHER))
+        self.assertIsNone(CacheHandler.get_by_key("memory_key_2", CacheObjectType.OTHER))
+
+        os.remove(CacheHandler._build_filename("memory_key_1", CacheObjectType.ENCODING_STEP))
+        self.assertIs(obj, CacheHandler.get_by_key("memory_key_1", CacheObjectType.ENCODING_STEP))
+
+        del os.environ[f"{Constants.CACHE_MEMORY_POLICY}_{CacheObjectType.ENCODING_STEP.name.lower()}"]
+        del os.environ[f"{Constants.CACHE_MEMORY_POLICY}_{CacheObjectType.OTHER.name.lower()}"]
+        CacheHandler.clear_memory()
+
+    def test_codecs(self):
+        CacheHandler.add_by_key("codec_key_1", np.arange(10, dtype=float))
+        filename = CacheHandler._build_filename("codec_key_1", CacheObjectType.OTHER, codec=NumpyCacheCodec)
+        self.assertTrue(filename.is_file())
+
+        array = CacheHandler.get_by_key("codec_key_1", CacheObjectType.OTHER)
+        self.assertTrue(isinstance(array, np.memmap))
+        array[0] = 100
+        self.assertTrue(np.array_equal(np.arange(10, dtype=float), CacheHandler.get_by_key("codec_key_1", CacheObjectType.OTHER)))
+        del array
+        os.remove(filename)
+
+        matrix = sparse.random(20, 30, density=0.1, format="csr")
+        CacheHandler.add_by_key("codec_key_2", matrix)
+        filename = CacheHandler._build_filename("codec_key_2", CacheObjectType.OTHER, codec=SparseCacheCodec)
+        loaded = CacheHandler.get_by_key("codec_key_2", CacheObjectType.OTHER)
+        self.assertEqual("csr", loaded.format)
+        self.assertEqual(0, (loaded != matrix).nnz)
+        os.remove(filename)
+
+        CacheHandler.add_by_key("codec_key_3", np.array(["a", None], dtype=object))
+        filename = CacheHandler._build_filename("codec_key_3", CacheObjectType.OTHER)
+        self.assertEqual(["a", None], CacheHandler.get_by_key("codec_key_3", CacheObjectType.OTHER).tolist())
+        os.remove(filename)
+
+    def test_missing_compression_library(self):
+        with mock.patch.dict(sys.modules, {"lz4": None, "lz4.frame": None}):
+            with self.assertWarns(RuntimeWarning):
+                EnvironmentSettings.set_cache_compression(CacheCompression.LZ4)
+            self.assertEqual(CacheCompression.NONE, EnvironmentSettings.get_cache_compression())
+
+            os.environ[Constants.CACHE_COMPRESSION] = CacheCompression.LZ4.name
+            with self.assertWarns(RuntimeWarning):
+                self.assertEqual(list(range(5)), CacheHandler.memo("compression_key_1", lambda: list(range(5))))
+            self.assertTrue(CacheHandler._build_filename("compression_key_1", CacheObjectType.OTHER).is_file())
+
+            filename = CacheHandler._build_filename("compression_key_2", CacheObjectType.OTHER, codec=LZ4PickleCacheCodec)
+            filename.write_bytes(b"written with lz4")
+            self.assertIsNone(CacheHandler.get_by_key("compression_key_2", CacheObjectType.OTHER))
+            self.assertTrue(filename.is_file())
+
+        del os.environ[Constants.CACHE_COMPRESSION]
+        os.remove(filename)
+        os.remove(CacheHandler._build_filename("compression_key_1", CacheObjectType.OTHER))
+
+    def test_memo_in_pool(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "cache_handler_memo_in_pool/")
+        os.environ[f"{Constants.CACHE_MEMORY_POLICY}_{CacheObjectType.ENCODING_STEP.name.lower()}"] = CacheMemoryPolicy.READ.name
+        CacheHandler.clear_memory()
+
+        try:
+            run_id = uuid4().hex
+            params_list = [(("value", value), ("run", run_id)) for value in range(4)]
+            arguments = [(path, value) for value in range(4)]
+            self.assertEqual([[0], [1], [4], [9]], CacheHandler.memo_in_pool(params_list, square, arguments, 2, CacheObjectType.ENCODING_STEP))
+            self.assertEqual(4, len(list(path.glob("*.txt"))))
+
+            memory_hits = CacheHandler.get_memory_stats()["hits"]
+            self.assertEqual([[0], [1], [4], [9]], CacheHandler.memo_in_pool(params_list, square, arguments, 2, CacheObjectType.ENCODING_STEP))
+            self.assertEqual(memory_hits + 4, CacheHandler.get_memory_stats()["hits"])
+        finally:
+            del os.environ[f"{Constants.CACHE_MEMORY_POLICY}_{CacheObjectType.ENCODING_STEP.name.lower()}"]
+            CacheHandler.clear_memory()
+            shutil.rmtree(path)
+
+    def test_concurrent_memo(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "cache_handler_concurrent/")
+
+        with Pool(4) as pool:
+            results = pool.map(partial(memo_slowly, path), range(4))
+
+        self.assertTrue(all(result == list(range(100)) for result in results))
+        self.assertEqual(1, len(list(path.glob("*.txt"))))
+        self.assertEqual([], list(CacheHandler._build_filename("single_flight_key", CacheObjectType.OTHER).parent.glob("*.tmp")))
+        self.assertEqual([], list(CacheHandler._build_filename("single_flight_key", CacheObjectType.OTHER).parent.glob(".single_flight_key.lock")))
+
+        filename = CacheHandler._build_filename("single_flight_key", CacheObjectType.OTHER)
+        with filename.open("wb") as file:
+            file.write(b"corrupted")
+        self.assertIsNone(CacheHandler.get_by_key("single_flight_key", CacheObjectType.OTHER))
+        self.assertFalse(filename.is_file())
+
+        shutil.rmtree(path)
@@ -0,0 +1,63 @@
+from pathlib import Path
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from immuneML.caching.CacheKeyBuilder import CacheKeyBuilder
+from immuneML.data_model.receptor.TCABReceptor import TCABReceptor
+from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
+from immuneML.data_model.receptor.receptor_sequence.SequenceMetadata import SequenceMetadata
+from immuneML.environment.SequenceType import SequenceType
+
+
+class TestCacheKeyBuilder(TestCase):
+
+    def test_build(self):
+        array = np.zeros(10000)
+        changed_array = array.copy()
+        changed_array[5000] = 1
+        self.assertEqual(str(array), str(changed_array))
+        self.assertNotEqual(CacheKeyBuilder.build((("examples", array),)), CacheKeyBuilder.build((("examples", changed_array),)))
+        self.assertEqual(CacheKeyBuilder.build((("examples", array),)), CacheKeyBuilder.build((("examples", array.copy()),)))
+        self.assertNotEqual(CacheKeyBuilder.build(array.reshape(100, 100)), CacheKeyBuilder.build(array))
+
+        matrix = sparse.random(100, 200, density=0.05, format="csr", random_state=1)
+        self.assertEqual(CacheKeyBuilder.build(matrix), CacheKeyBuilder.build(matrix.tocoo()))
+        self.assertNotEqual(CacheKeyBuilder.build(matrix), CacheKeyBuilder.build(matrix * 2))
+
+        df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+        self.assertEqual(CacheKeyBuilder.build(df), CacheKeyBuilder.build(df.copy()))
+        self.assertNotEqual(CacheKeyBuilder.build(df), CacheKeyBuilder.build(df.rename(columns={"b": "c"})))
+
+        self.assertEqual(CacheKeyBuilder.build({"a": 1, "b": [2, 3]}), CacheKeyBuilder.build({"b": [2, 3], "a": 1}))
+        self.assertEqual(CacheKeyBuilder.build({"x", "y", "z"}), CacheKeyBuilder.build({"z", "y", "x"}))
+        self.assertEqual(len({CacheKeyBuilder.build(value) for value in [1, 1.0, "1", True, np.int64(1), (1,), [1]]}), 7)
+        self.assertNotEqual(CacheKeyBuilder.build(("a", "bc")), CacheKeyBuilder.build(("ab", "c")))
+        self.assertEqual(CacheKeyBuilder.build((SequenceType.AMINO_ACID, Path("a/b"))), CacheKeyBuilder.build((SequenceType.AMINO_ACID, Path("a/b"))))
+
+        class Params:
+            def __init__(self, value):
+                self.value = value
+                self.itself = self
+
+        self.assertEqual(CacheKeyBuilder.build(Params(1)), CacheKeyBuilder.build(Params(1)))
+        self.assertNotEqual(CacheKeyBuilder.build(Params(1)), CacheKeyBuilder.build(Params(2)))
+
+    def test_build_with_slots(self):
+        def make_sequences(v_gene):
+            return [ReceptorSequence(amino_acid_sequence="AAA", identifier="1", metadata=SequenceMetadata(v_gene=v_gene, chain="A")),
+                    ReceptorSequence(amino_acid_sequence="CCC", identifier="2", metadata=SequenceMetadata(v_gene="TRAV2", chain="A"))]
+
+        self.assertEqual(CacheKeyBuilder.build(make_sequences("TRAV1")), CacheKeyBuilder.build(make_sequences("TRAV1")))
+        self.assertNotEqual(CacheKeyBuilder.build(make_sequences("TRAV1")), CacheKeyBuilder.build(make_sequences("TRAV3")))
+
+        receptor = TCABReceptor(alpha=make_sequences("TRAV1")[0], beta=make_sequences("TRAV1")[1], identifier="r1")
+        self.assertEqual(CacheKeyBuilder.build(receptor),
+                         CacheKeyBuilder.build(TCABReceptor(alpha=make_sequences("TRAV1")[0], beta=make_sequences("TRAV1")[1], identifier="r1")))
+        self.assertNotEqual(CacheKeyBuilder.build(receptor),
+                            CacheKeyBuilder.build(TCABReceptor(alpha=make_sequences("TRAV3")[0], beta=make_sequences("TRAV1")[1], identifier="r1")))
+
+        with self.assertRaises(TypeError):
+            CacheKeyBuilder.build(object())
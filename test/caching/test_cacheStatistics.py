@@ -0,0 +1,87 @@
+import json
+import os
+import shutil
+from multiprocessing import Pool
+from unittest import TestCase
+
+from immuneML.caching.CacheHandler import CacheHandler
+from immuneML.caching.CacheObjectType import CacheObjectType
+from immuneML.caching.CacheStatistics import CacheStatistics
+from immuneML.caching.CacheType import CacheType
+from immuneML.environment.Constants import Constants
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.presentation.html.CacheStatisticsHTMLBuilder import CacheStatisticsHTMLBuilder
+from immuneML.util.PathBuilder import PathBuilder
+
+
+def look_up(index):
+    return CacheHandler.memo(f"statistics_key_{index % 2}", lambda: list(range(100)), CacheObjectType.ENCODING_STEP)
+
+
+class TestCacheStatistics(TestCase):
+
+    def test_statistics(self):
+        os.environ[Constants.CACHE_TYPE] = CacheType.TEST.name
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "cache_statistics/")
+        EnvironmentSettings.set_cache_statistics_path(path / "statistics")
+        EnvironmentSettings.set_cache_statistics_call_sites(True)
+        CacheStatistics.reset()
+        CacheHandler.clear_memory()
+
+        try:
+            look_up(0)
+            look_up(0)
+            with Pool(2) as pool:
+                pool.map(look_up, [1, 1, 0])
+
+            summary = CacheStatistics.get_summary()
+            counters = summary["object_types"]["ENCODING_STEP"]
+            self.assertEqual(2, counters["misses"])
+            self.assertEqual(2, counters["writes"])
+            self.assertEqual(3, counters["memory_hits"] + counters["disk_hits"])
+            self.assertEqual(0.6, counters["hit_rate"])
+            self.assertTrue(counters["bytes_written"] > 0)
+            self.assertEqual(["test_cacheStatistics.look_up"], [entry["call_site"] for entry in summary["call_sites"]])
+
+            CacheStatistics.export(path / "cache_statistics.json")
+            with (path / "cache_statistics.json").open("r") as file:
+                self.assertEqual(summary["total"]["writes"], json.load(file)["total"]["writes"])
+
+            html_path = CacheStatisticsHTMLBuilder.build(path)
+            self.assertTrue(html_path.is_file())
+            self.assertTrue("test_cacheStatistics.look_up" in html_path.read_text())
+        finally:
+            for index in range(2):
+                os.remove(CacheHandler._build_filename(f"statistics_key_{index}", CacheObjectType.ENCODING_STEP))
+            EnvironmentSettings.set_cache_statistics_path(None)
+            EnvironmentSettings.set_cache_statistics_call_sites(False)
+            CacheStatistics.reset()
+            CacheHandler.clear_memory()
+            shutil.rmtree(path)
+
+    def test_statistics_are_stored_in_batches(self):
+        os.environ[Constants.CACHE_TYPE] = CacheType.TEST.name
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "cache_statistics_batches/")
+        EnvironmentSettings.set_cache_statistics_path(path / "statistics")
+        CacheStatistics.reset()
+        CacheHandler.clear_memory()
+
+        try:
+            for _ in range(3):
+                look_up(0)
+
+            # the counters are kept in memory until FLUSH_COUNT operations or FLUSH_SECONDS seconds have passed or the process exits
+            self.assertEqual([], list((path / "statistics").glob("*.json")))
+
+            summary = CacheStatistics.get_summary()
+            self.assertEqual(3, sum(summary["total"][counter] for counter in ["memory_hits", "disk_hits", "misses"]))
+            self.assertEqual([CacheStatistics.UNKNOWN_CALL_SITE], [entry["call_site"] for entry in summary["call_sites"]])
+
+            CacheStatistics._flush()
+            self.assertEqual(1, len(list((path / "statistics").glob("*.json"))))
+        finally:
+            os.remove(CacheHandler._build_filename("statistics_key_0", CacheObjectType.ENCODING_STEP))
+            EnvironmentSettings.set_cache_statistics_path(None)
+            CacheStatistics.reset()
+            CacheHandler.clear_memory()
+            shutil.rmtree(path)
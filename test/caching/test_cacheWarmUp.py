@@ -0,0 +1,124 @@
+import os
+import shutil
+from unittest import TestCase, mock
+
+from immuneML.caching.CacheHandler import CacheHandler
+from immuneML.caching.CacheStatistics import CacheStatistics
+from immuneML.caching.CacheType import CacheType
+from immuneML.caching.CacheWarmUp import CacheWarmUp
+from immuneML.caching.PersistentCache import PersistentCache
+from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
+from immuneML.dsl.DefaultParamsLoader import DefaultParamsLoader
+from immuneML.encodings.kmer_frequency.KmerFrequencyEncoder import KmerFrequencyEncoder
+from immuneML.environment.Constants import Constants
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.environment.Label import Label
+from immuneML.environment.LabelConfiguration import LabelConfiguration
+from immuneML.environment.Metric import Metric
+from immuneML.hyperparameter_optimization.HPSetting import HPSetting
+from immuneML.hyperparameter_optimization.config.SplitConfig import SplitConfig
+from immuneML.hyperparameter_optimization.config.SplitType import SplitType
+from immuneML.hyperparameter_optimization.core.HPUtil import HPUtil
+from immuneML.hyperparameter_optimization.states.TrainMLModelState import TrainMLModelState
+from immuneML.hyperparameter_optimization.strategy.GridSearch import GridSearch
+from immuneML.ml_methods.LogisticRegression import LogisticRegression
+from immuneML.simulation.dataset_generation.RandomDatasetGenerator import RandomDatasetGenerator
+from immuneML.util.PathBuilder import PathBuilder
+from immuneML.util.RepertoireBuilder import RepertoireBuilder
+from immuneML.workflows.instructions.TrainMLModelInstruction import TrainMLModelInstruction
+
+
+class TestCacheWarmUp(TestCase):
+
+    def test_warm_up(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "cache_warm_up/")
+        cache_path = path / "persistent_cache"
+
+        dataset = RandomDatasetGenerator.generate_repertoire_dataset(20, {10: 1}, {4: 1}, {"cmv": {True: 0.5, False: 0.5},
+                                                                                         "ebv": {True: 0.5, False: 0.5}}, path / "dataset")
+        encoder_params = {**DefaultParamsLoader.load("encodings/", "KmerFrequency"), "scale_to_unit_variance": False}
+        hp_settings = [HPSetting(encoder=KmerFrequencyEncoder.build_object(dataset, **encoder_params), encoder_params=encoder_params,
+                                 ml_method=LogisticRegression(), ml_params={}, preproc_sequence=[], encoder_name="kmer_freq",
+                                 ml_method_name="lr")]
+        label_config = LabelConfiguration()
+        label_config.add_label("cmv", [True, False])
+        label_config.add_label("ebv", [True, False])
+        state = TrainMLModelState(dataset, None, hp_settings, None, None, set(), None, label_config, context={"dataset": dataset},
+                                  number_of_processes=2)
+
+        os.environ[Constants.CACHE_TYPE] = CacheType.PRODUCTION.name
+        EnvironmentSettings.set_cache_path(path / "cache")
+        EnvironmentSettings.set_persistent_cache(cache_path)
+
+        try:
+            reports = []
+            for index in range(2):
+                reports.append(CacheWarmUp.warm_up(state, path / f"result_{index}"))
+                CacheHandler.clear_memory()
+                shutil.rmtree(path / "cache")
+
+            first, second = reports[0]["encodings"][0]["cached_objects"], reports[1]["encodings"][0]["cached_objects"]
+            self.assertEqual(["cmv", "ebv"], reports[0]["encodings"][0]["labels"][0])
+            self.assertEqual(60, first["encoding_step"]["written"])
+            self.assertTrue(first["encoding_step"]["persistent"])
+            self.assertEqual(0, second["encoding_step"]["written"])
+            self.assertEqual(60, second["encoding_step"]["already_cached"])
+            self.assertEqual(60, sum(PersistentCache.get_entries(cache_path)["object_type"] == "ENCODING_STEP"))
+        finally:
+            os.environ[Constants.CACHE_TYPE] = CacheType.TEST.name
+            del os.environ[Constants.PERSISTENT_CACHE_PATH]
+            EnvironmentSettings.reset_cache_path()
+            CacheHandler.clear_memory()
+            shutil.rmtree(path)
+
+    def test_warm_up_before_train_ml_model(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "cache_warm_up_train_ml_model/")
+
+        repertoires, metadata = RepertoireBuilder.build([["AACC", "CCDD", "DDEE"][:index % 3 + 1] + ["ACDE" * (index + 1)] for index in range(20)],
+                                                        path / "dataset", labels={"cmv": [True, False] * 10})
+        dataset = RepertoireDataset(repertoires=repertoires, metadata_file=metadata, labels={"cmv": [True, False]})
+        encoder_params = {**DefaultParamsLoader.load("encodings/", "KmerFrequency"), "scale_to_unit_variance": False}
+        hp_settings = [HPSetting(encoder=KmerFrequencyEncoder.build_object(dataset, **encoder_params), encoder_params=encoder_params,
+                                 ml_method=LogisticRegression(), ml_params={"model_selection_cv": False, "model_selection_n_folds": -1},
+                                 preproc_sequence=[], encoder_name="kmer_freq", ml_method_name="lr")]
+        instruction = TrainMLModelInstruction(dataset, GridSearch(hp_settings), hp_settings, SplitConfig(SplitType.STRATIFIED_K_FOLD, 2),
+                                              SplitConfig(SplitType.STRATIFIED_K_FOLD, 2), {Metric.BALANCED_ACCURACY}, Metric.BALANCED_ACCURACY,
+                                              LabelConfiguration([Label("cmv", [True, False])]), path / "instruction", number_of_processes=2)
+
+        os.environ[Constants.CACHE_TYPE] = CacheType.PRODUCTION.name
+        EnvironmentSettings.set_cache_path(path / "cache")
+        EnvironmentSettings.set_persistent_cache(path / "persistent_cache")
+
+        test_fold_encodings = []
+        encode_dataset = HPUtil.encode_dataset
+
+        def encode_and_count(*args, **kwargs):
+            before = CacheStatistics.get_summary()["object_types"].get("ENCODING_STEP", {})
+            encoded_dataset = encode_dataset(*args, **kwargs)
+            if not kwargs["learn_model"]:
+                after = CacheStatistics.get_summary()["object_types"]["ENCODING_STEP"]
+                test_fold_encodings.append({"examples": args[0].get_example_count(),
+                                            **{counter: after[counter] - before.get(counter, 0) for counter in ["disk_hits", "memory_hits", "misses"]}})
+            return encoded_dataset
+
+        try:
+            CacheWarmUp.warm_up(instruction.state, path / "warm_up")
+            CacheHandler.clear_memory()
+            shutil.rmtree(path / "cache")
+
+            EnvironmentSettings.set_cache_statistics_path(path / "statistics")
+            CacheStatistics.reset()
+            with mock.patch.object(HPUtil, "encode_dataset", encode_and_count):
+                instruction.run(path / "instruction")
+
+            self.assertEqual(6, len(test_fold_encodings))
+            for counters in test_fold_encodings:
+                self.assertEqual(counters["examples"], counters["disk_hits"] + counters["memory_hits"])
+                self.assertEqual(0, counters["misses"])
+        finally:
+            os.environ[Constants.CACHE_TYPE] = CacheType.TEST.name
+            del os.environ[Constants.PERSISTENT_CACHE_PATH]
+            EnvironmentSettings.set_cache_statistics_path(None)
+            EnvironmentSettings.reset_cache_path()
+            CacheHandler.clear_memory()
+            shutil.rmtree(path)
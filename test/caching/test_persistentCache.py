@@ -0,0 +1,58 @@
+import os
+import shutil
+import time
+from unittest import TestCase
+
+from immuneML.caching.CacheHandler import CacheHandler
+from immuneML.caching.CacheLock import CacheLock
+from immuneML.caching.CacheObjectType import CacheObjectType
+from immuneML.caching.CacheType import CacheType
+from immuneML.caching.PersistentCache import PersistentCache
+from immuneML.environment.Constants import Constants
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+
+
+class TestPersistentCache(TestCase):
+
+    def test_persistent_cache(self):
+        path = EnvironmentSettings.tmp_test_path / "persistent_cache/"
+        shutil.rmtree(path, ignore_errors=True)
+
+        os.environ[Constants.CACHE_TYPE] = CacheType.PRODUCTION.name
+        EnvironmentSettings.set_persistent_cache(path, object_types=[CacheObjectType.ENCODING_STEP])
+
+        try:
+            for key in ["key1", "key2", "key3"]:
+                CacheHandler.memo(key, lambda: list(range(1000)), CacheObjectType.ENCODING_STEP)
+                time.sleep(0.01)
+            self.assertTrue((path / "encoding_step/key1.pickle").is_file())
+            self.assertEqual([], list((path / "encoding_step").glob(".*.lock")))
+
+            CacheHandler.clear_memory()
+            CacheHandler.get_by_key("key1", CacheObjectType.ENCODING_STEP)
+
+            entries = PersistentCache.get_entries(path)
+            self.assertEqual(["encoding_step/key2.pickle", "encoding_step/key3.pickle", "encoding_step/key1.pickle"], entries["key"].tolist())
+            self.assertEqual([0, 0, 1], entries["access_count"].tolist())
+
+            result = PersistentCache.prune(path, max_bytes=int(entries["size"].sum()) - 1)
+            self.assertEqual(1, result["removed_files"])
+            self.assertFalse((path / "encoding_step/key2.pickle").is_file())
+            self.assertEqual(["encoding_step/key3.pickle", "encoding_step/key1.pickle"], PersistentCache.get_entries(path)["key"].tolist())
+
+            (path / "encoding_step/key3.pickle").unlink()
+            shutil.copy(path / "encoding_step/key1.pickle", path / "encoding_step/key4.pickle")
+            self.assertEqual({"encoding_step/key1.pickle", "encoding_step/key4.pickle"}, set(PersistentCache.get_entries(path)["key"]))
+
+            (path / "encoding_step/.key5.lock").touch()
+            with CacheLock(path / "encoding_step/.key6.lock"):
+                self.assertEqual(2, PersistentCache.clear(path)["removed_files"])
+                self.assertEqual([".key6.lock"], [filename.name for filename in (path / "encoding_step").glob(".*.lock")])
+            self.assertEqual([], list((path / "encoding_step").glob(".*.lock")))
+            self.assertEqual(0, len(list((path / "encoding_step").glob("*.pickle"))))
+        finally:
+            os.environ[Constants.CACHE_TYPE] = CacheType.TEST.name
+            del os.environ[Constants.PERSISTENT_CACHE_PATH]
+            del os.environ[Constants.PERSISTENT_CACHE_OBJECT_TYPES]
+            CacheHandler.clear_memory()
+            shutil.rmtree(path)
@@ -1,6 +1,10 @@
+import os
 import shutil
 from unittest import TestCase
 
+import pandas as pd
+
+from immuneML.data_model.dataset.Dataset import Dataset
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.util.PathBuilder import PathBuilder
@@ -21,3 +25,83 @@ class TestRepertoireDataset(TestCase):
         self.assertTrue("subject_id" in dataset.get_metadata_fields())
 
         shutil.rmtree(path)
+
+    def test_iterate_repertoires_with_prefetch(self):
+
+        path = EnvironmentSettings.tmp_test_path / "repertoire_dataset_prefetch/"
+        PathBuilder.build(path)
+
+        repertoires, metadata = RepertoireBuilder.build([["AA", "CC"], ["DD"], ["EE", "FF", "GG"]], path, {"l1": [1, 2, 1]})
+        dataset = RepertoireDataset(repertoires=repertoires, metadata_file=metadata)
+
+        prefetched = list(dataset.iterate_repertoires(prefetch_count=2))
+
+        self.assertEqual([repertoire.identifier for repertoire in repertoires], [repertoire.identifier for repertoire in prefetched])
+        self.assertTrue(all(repertoire._is_loaded() for repertoire in prefetched))
+        self.assertEqual(["EE", "FF", "GG"], list(prefetched[2].get_sequence_aas()))
+        self.assertEqual(repertoires, list(dataset.iterate_repertoires(prefetch_count=0)))
+
+        EnvironmentSettings.set_prefetch_count(2)
+        try:
+            self.assertEqual(repertoires, dataset.get_data())  # get_data() always returns the list, also when prefetching is enabled
+            self.assertEqual(repertoires[1], dataset.get_data()[1])
+        finally:
+            EnvironmentSettings.set_prefetch_count(0)
+
+        shutil.rmtree(path)
+
+    def test_make_subset(self):
+
+        path = EnvironmentSettings.tmp_test_path / "repertoire_dataset_subset/"
+        PathBuilder.build(path)
+
+        repertoires, metadata = RepertoireBuilder.build([["AA"], ["BB"], ["CC"], ["DD"]], path, {"l1": [1, 2, 1, 2], "hla": ["A", "B", "C", "D"]},
+                                                        subject_ids=["d1", "d2", "d3", "d4"])
+        dataset = RepertoireDataset(repertoires=repertoires, metadata_file=metadata)
+
+        subset = dataset.make_subset([3, 1], path / "subset", Dataset.TRAIN)
+
+        self.assertEqual([repertoires[3], repertoires[1]], subset.get_data())
+        self.assertEqual({"l1": [2, 2], "hla": ["D", "B"]}, subset.get_metadata(["hla", "l1"]))
+        self.assertTrue("hla" in subset.get_label_names())
+        self.assertEqual(path / "subset/train_metadata.csv", subset.metadata_path)
+        self.assertFalse(subset.metadata_path.is_file())
+
+        clone = subset.clone()
+        self.assertEqual(["d4", "d2"], clone.get_metadata(["subject_id"])["subject_id"])
+        self.assertFalse(subset.metadata_path.is_file())
+
+        nested_subset = subset.make_subset([1], path / "nested", Dataset.TEST)
+        self.assertEqual(["B"], nested_subset.get_metadata(["hla"])["hla"])
+
+        self.assertTrue(subset.metadata_file.is_file())
+        self.assertEqual(["d4", "d2"], pd.read_csv(subset.metadata_file)["subject_id"].tolist())
+
+        shutil.rmtree(path)
+
+    def test_metadata_cache(self):
+
+        path = EnvironmentSettings.tmp_test_path / "repertoire_dataset_metadata_cache/"
+        PathBuilder.build(path)
+
+        repertoires, metadata = RepertoireBuilder.build([["AA"], ["BB"], ["CC"]], path, {"l1": [1, 2, 1]}, subject_ids=["d1", "d2", "d3"])
+        dataset = RepertoireDataset(repertoires=repertoires, metadata_file=metadata)
+
+        self.assertEqual([1, 2, 1], dataset.get_metadata(["l1"])["l1"])
+        frame = dataset._get_metadata_frame()
+        dataset.get_metadata(["l1"], return_df=True)["l1"] = 5
+        self.assertTrue(frame is dataset._get_metadata_frame())
+        self.assertEqual([1, 2, 1], dataset.get_metadata(["l1"])["l1"])
+
+        df = pd.read_csv(metadata)
+        df["l1"] = [3, 3, 4]
+        df.to_csv(metadata, index=False)
+        os.utime(metadata, ns=(os.stat(metadata).st_atime_ns, os.stat(metadata).st_mtime_ns + 10 ** 9))
+        self.assertEqual([3, 3, 4], dataset.get_metadata(["l1"])["l1"])
+
+        self.assertEqual(repertoires[2], dataset.get_repertoire(repertoire_identifier=repertoires[2].identifier))
+        dataset.repertoires = repertoires[:2]
+        with self.assertRaises(KeyError):
+            dataset.get_repertoire(repertoire_identifier=repertoires[2].identifier)
+
+        shutil.rmtree(path)
@@ -1,6 +1,10 @@
+import pickle
 from unittest import TestCase
 
+from immuneML.data_model.receptor.TCABReceptor import TCABReceptor
+from immuneML.data_model.receptor.receptor_sequence.Chain import Chain
 from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
+from immuneML.data_model.receptor.receptor_sequence.SequenceMetadata import SequenceMetadata
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.environment.SequenceType import SequenceType
 
@@ -14,3 +18,30 @@ class TestSequence(TestCase):
         EnvironmentSettings.set_sequence_type(SequenceType.AMINO_ACID)
 
         self.assertEqual(sequence.get_sequence(), "CAS")
+
+    def test_pickle(self):
+        sequence = ReceptorSequence(amino_acid_sequence="CAS", identifier="1",
+                                    metadata=SequenceMetadata(v_gene="TRBV1", chain="TRB", custom_params={"epitope": "E1"}))
+
+        unpickled = pickle.loads(pickle.dumps(TCABReceptor(beta=sequence, metadata={"epitope": "E1"}, identifier="r1")))
+
+        self.assertFalse(hasattr(unpickled, "__dict__"))
+        self.assertEqual("r1", unpickled.identifier)
+        self.assertEqual("CAS", unpickled.beta.amino_acid_sequence)
+        self.assertEqual(Chain.BETA, unpickled.beta.metadata.chain)
+        self.assertIs(sequence.metadata.v_gene, unpickled.beta.metadata.v_gene)
+        self.assertDictEqual({"epitope": "E1"}, unpickled.beta.metadata.custom_params)
+        self.assertListEqual([], unpickled.beta.annotation.implants)
+
+    def test_unpickle_dict_state(self):
+        # state of the objects pickled before __slots__ were introduced
+        metadata = SequenceMetadata.__new__(SequenceMetadata)
+        metadata.__setstate__({"v_gene": "TRBV1", "chain": Chain.BETA, "custom_params": {"epitope": "E1"}})
+        sequence = ReceptorSequence.__new__(ReceptorSequence)
+        sequence.__setstate__({"amino_acid_sequence": "CAS", "identifier": "1", "annotation": None, "metadata": metadata})
+
+        self.assertEqual("CAS", sequence.get_sequence(SequenceType.AMINO_ACID))
+        self.assertIsNone(sequence.nucleotide_sequence)
+        self.assertEqual("TRBV1", sequence.get_attribute("v_gene"))
+        self.assertEqual("E1", sequence.get_attribute("epitope"))
+        self.assertIsNone(sequence.metadata.j_gene)
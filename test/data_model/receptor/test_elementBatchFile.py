@@ -0,0 +1,57 @@
+import pickle
+import shutil
+from unittest import TestCase
+
+from immuneML.data_model.receptor.ElementBatchFile import ElementBatchFile
+from immuneML.data_model.receptor.TCABReceptor import TCABReceptor
+from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.PathBuilder import PathBuilder
+
+
+class TestElementBatchFile(TestCase):
+    def test_write_and_read(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "element_batch_file/")
+        receptors = [TCABReceptor(alpha=ReceptorSequence(amino_acid_sequence="AAA" + "C" * i), beta=ReceptorSequence(amino_acid_sequence="GGG"),
+                                  metadata={"l1": i % 2}, identifier=str(i)) for i in range(25)]
+        receptors[3].identifier = None
+
+        filename = path / "batch1.pickle"
+        ElementBatchFile.write(filename, receptors)
+
+        self.assertTrue(ElementBatchFile.is_indexed(filename))
+        self.assertEqual(25, ElementBatchFile.get_element_count(filename))
+        self.assertEqual([receptor.identifier for receptor in receptors], ElementBatchFile.get_identifiers(filename))
+
+        loaded = ElementBatchFile.read(filename)
+        self.assertEqual(25, len(loaded))
+        self.assertEqual("AAACCCC", loaded[4].alpha.amino_acid_sequence)
+        self.assertEqual(0, loaded[4].metadata["l1"])
+
+        subset = ElementBatchFile.read_elements(filename, [24, 0, 7])
+        self.assertEqual(["24", "0", "7"], [receptor.identifier for receptor in subset])
+        self.assertEqual("AAA" + "C" * 24, subset[0].alpha.amino_acid_sequence)
+
+        ElementBatchFile.write(path / "batch2.pickle", receptors)
+        self.assertEqual(ElementBatchFile.get_fingerprint(filename), ElementBatchFile.get_fingerprint(path / "batch2.pickle"))
+        ElementBatchFile.write(path / "batch3.pickle", receptors[:-1])
+        self.assertNotEqual(ElementBatchFile.get_fingerprint(filename), ElementBatchFile.get_fingerprint(path / "batch3.pickle"))
+
+        shutil.rmtree(path)
+
+    def test_read_legacy_file(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "element_batch_file_legacy/")
+        sequences = [ReceptorSequence(amino_acid_sequence="AAA", identifier=str(i)) for i in range(10)]
+
+        filename = path / "batch1.pickle"
+        with filename.open("wb") as file:
+            pickle.dump(sequences, file)
+
+        self.assertFalse(ElementBatchFile.is_indexed(filename))
+        self.assertEqual(10, ElementBatchFile.get_element_count(filename))
+        self.assertEqual([str(i) for i in range(10)], ElementBatchFile.get_identifiers(filename))
+        self.assertEqual(["2", "5"], [sequence.identifier for sequence in ElementBatchFile.read_elements(filename, [2, 5])])
+        self.assertEqual(10, len(ElementBatchFile.read(filename)))
+        self.assertEqual(ElementBatchFile.get_fingerprint(filename), ElementBatchFile.get_fingerprint(filename))
+
+        shutil.rmtree(path)
@@ -76,4 +76,31 @@ class TestElementGenerator(TestCase):
 
         shutil.rmtree(path)
 
+    def test_make_subset_from_indexed_files(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "element_generator_indexed_subset/")
+        sequences = [ReceptorSequence(amino_acid_sequence="AAA", identifier=str(i)) for i in range(100)]
 
+        d = SequenceDataset.build(sequences, 30, path)
+
+        self.assertEqual(100, d.get_example_count())
+        self.assertEqual([str(i) for i in range(100)], d.get_example_ids())
+
+        indices = [1, 29, 30, 31, 59, 60, 99]
+        d2 = d.make_subset(indices, PathBuilder.build(path / "subset"), SequenceDataset.TRAIN)
+
+        self.assertEqual([str(i) for i in indices], d2.get_example_ids())
+        self.assertEqual([str(i) for i in indices], [sequence.identifier for sequence in d2.get_data()])
+        self.assertEqual(7, d2.get_example_count())
+
+        shutil.rmtree(path)
+
+    def test_build_element_generator_with_prefetch(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "element_generator_prefetch/")
+        sequences = [ReceptorSequence(amino_acid_sequence="AAA", identifier=str(i)) for i in range(95)]
+
+        d = SequenceDataset.build(sequences, 10, path)
+
+        self.assertEqual([str(i) for i in range(95)], [sequence.identifier for sequence in d.get_data(prefetch_count=3)])
+        self.assertEqual([10] * 9 + [5], [len(batch) for batch in d.get_batch(prefetch_count=2)])
+
+        shutil.rmtree(path)
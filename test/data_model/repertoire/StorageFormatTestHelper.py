@@ -0,0 +1,17 @@
+from immuneML.data_model.repertoire.storage.RepertoireStorageFormat import RepertoireStorageFormat
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+
+
+class StorageFormatTestHelper:
+
+    @staticmethod
+    def build_with_storage_format(storage_format: RepertoireStorageFormat, build_function):
+        """
+        Calls build_function with the given repertoire storage format set and returns its result; the default format (NUMPY) is set again
+        even if building fails, so that the format does not change for the tests which run later
+        """
+        EnvironmentSettings.set_repertoire_storage_format(storage_format)
+        try:
+            return build_function()
+        finally:
+            EnvironmentSettings.set_repertoire_storage_format(RepertoireStorageFormat.NUMPY)
@@ -0,0 +1,34 @@
+import shutil
+from unittest import TestCase
+
+import numpy as np
+
+from immuneML.data_model.receptor.receptor_sequence.Chain import Chain
+from immuneML.data_model.repertoire.storage.ArrowRepertoireStorage import ArrowRepertoireStorage
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.PathBuilder import PathBuilder
+
+
+class TestArrowRepertoireStorage(TestCase):
+    def test_write_and_read(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "arrow_repertoire_storage/")
+        filename = path / "rep.arrow"
+
+        ArrowRepertoireStorage.write(filename, {"sequence_aas": ["AAA", "CCC", None], "counts": [1, 5, 3], "v_genes": ["V1", None, "V2"],
+                                                "chains": [Chain.ALPHA, Chain.BETA, None], "duplicates": [1, None, 2]})
+
+        self.assertEqual(3, ArrowRepertoireStorage.get_element_count(filename))
+
+        columns = ArrowRepertoireStorage.read_columns(filename, ["counts", "sequence_aas", "missing_column"])
+        self.assertEqual(2, len(columns))
+        self.assertTrue(np.issubdtype(columns["counts"].dtype, np.integer))
+        self.assertTrue(np.array_equal(np.array([1, 5, 3]), columns["counts"]))
+        self.assertListEqual(["AAA", "CCC", None], columns["sequence_aas"].tolist())
+
+        data = ArrowRepertoireStorage.read(filename)
+        self.assertEqual(("sequence_aas", "counts", "v_genes", "chains", "duplicates"), data.dtype.names)
+        self.assertListEqual(["V1", None, "V2"], data["v_genes"].tolist())
+        self.assertListEqual([Chain.ALPHA, Chain.BETA, None], data["chains"].tolist())
+        self.assertListEqual([1, None, 2], data["duplicates"].tolist())
+
+        shutil.rmtree(path)
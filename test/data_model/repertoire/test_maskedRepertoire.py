@@ -0,0 +1,50 @@
+import pickle
+import shutil
+from unittest import TestCase
+
+import numpy as np
+import pandas as pd
+
+from immuneML.data_model.repertoire.MaskedRepertoire import MaskedRepertoire
+from immuneML.data_model.repertoire.Repertoire import Repertoire
+from immuneML.data_model.repertoire.storage.RepertoireStorageFormat import RepertoireStorageFormat
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.PathBuilder import PathBuilder
+from test.data_model.repertoire.StorageFormatTestHelper import StorageFormatTestHelper
+
+
+class TestMaskedRepertoire(TestCase):
+    def test_build_like(self):
+        path = EnvironmentSettings.tmp_test_path / "masked_repertoire/"
+
+        df = pd.DataFrame({"sequence_aas": ["AAA", "CCC", "DDD", "EEE", "FFF"], "v_genes": ["V1", "V2", None, "V3", "V1"],
+                           "counts": [1, 5, 2, 7, 3]})
+
+        for storage_format in RepertoireStorageFormat:
+            with self.subTest(storage_format=storage_format.name):
+                repertoire = StorageFormatTestHelper.build_with_storage_format(
+                    storage_format, lambda: Repertoire.build_from_dataframe(df, PathBuilder.build(path / storage_format.name), {"subject_id": "1"}))
+
+                masked = Repertoire.build_like(repertoire, np.array([False, True, True, False, True]), path / storage_format.name / "filter1")
+                self.assertTrue(isinstance(masked, MaskedRepertoire))
+                self.assertEqual(3, masked.get_element_count())
+                self.assertListEqual(["CCC", "DDD", "FFF"], masked.get_sequence_aas().tolist())
+                self.assertListEqual(["V1", "V2"], sorted(masked.get_unique_values("v_genes")))
+                self.assertEqual("1", masked.metadata["subject_id"])
+
+                masked_twice = Repertoire.build_like(masked, [0, 2], path / storage_format.name / "filter2")
+                self.assertEqual(repertoire.data_filename, masked_twice.parent_filename)
+                self.assertListEqual(["CCC", "FFF"], masked_twice.get_sequence_aas().tolist())
+                self.assertListEqual([5, 3], masked_twice.get_counts().tolist())
+                self.assertListEqual(["CCC", "FFF"], [sequence.amino_acid_sequence for sequence in masked_twice.sequences])
+
+                unpickled = pickle.loads(pickle.dumps(masked_twice))
+                self.assertListEqual(["V2", "V1"], unpickled.get_v_genes().tolist())
+
+                materialized = masked_twice.materialize(path / storage_format.name / "materialized")
+                self.assertFalse(isinstance(materialized, MaskedRepertoire))
+                self.assertEqual(f".{storage_format.value}", materialized.data_filename.suffix)
+                self.assertListEqual(["CCC", "FFF"], materialized.get_sequence_aas().tolist())
+                self.assertEqual("1", materialized.metadata["subject_id"])
+
+        shutil.rmtree(path)
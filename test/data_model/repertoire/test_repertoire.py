@@ -3,13 +3,18 @@ import shutil
 from unittest import TestCase
 
 import numpy as np
+import pandas as pd
 
+from immuneML.caching.RepertoireDataCache import RepertoireDataCache
 from immuneML.data_model.receptor.receptor_sequence.Chain import Chain
 from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
 from immuneML.data_model.receptor.receptor_sequence.SequenceMetadata import SequenceMetadata
+from immuneML.data_model.repertoire.CategoricalVocabulary import CategoricalVocabulary
 from immuneML.data_model.repertoire.Repertoire import Repertoire
+from immuneML.data_model.repertoire.storage.RepertoireStorageFormat import RepertoireStorageFormat
 from immuneML.environment.EnvironmentSettings import EnvironmentSettings
 from immuneML.util.PathBuilder import PathBuilder
+from test.data_model.repertoire.StorageFormatTestHelper import StorageFormatTestHelper
 
 
 class TestRepertoire(TestCase):
@@ -50,8 +55,170 @@ class TestRepertoire(TestCase):
 
         obj.free_memory()
 
-        self.assertTrue(key in obj.data for key in Repertoire.FIELDS)
-        self.assertTrue(obj.data[key] is None for key in Repertoire.FIELDS)
+        self.assertFalse(RepertoireDataCache.contains(obj.data_filename))
+
+        shutil.rmtree(path)
+
+    def test_repertoire_arrow_storage(self):
+        path = EnvironmentSettings.tmp_test_path / "sequencerepertoire_arrow/"
+        PathBuilder.build(path)
+
+        sequences = [ReceptorSequence(amino_acid_sequence="AAA", identifier="1",
+                                      metadata=SequenceMetadata(v_gene="V1", count=3, custom_params={"cmv": "no"})),
+                     ReceptorSequence(amino_acid_sequence="CCC", identifier="2",
+                                      metadata=SequenceMetadata(j_gene="J1", count=4, custom_params={"cmv": "yes"}))]
+
+        obj = StorageFormatTestHelper.build_with_storage_format(RepertoireStorageFormat.ARROW,
+                                                                lambda: Repertoire.build_from_sequence_objects(sequences, path, {"subject_id": "1"}))
+
+        self.assertEqual(".arrow", obj.data_filename.suffix)
+        self.assertEqual(2, obj.get_element_count())
+        self.assertTrue(np.array_equal(np.array(["AAA", "CCC"]), obj.get_sequence_aas()))
+        self.assertTrue(np.array_equal(np.array([3, 4]), obj.get_counts()))
+        self.assertListEqual([None, "J1"], obj.get_j_genes().tolist())
+        self.assertListEqual(["cmv", "v_genes"], sorted(obj.get_attributes(["cmv", "v_genes", "missing"]).keys()))
+        self.assertEqual("yes", obj.sequences[1].metadata.custom_params["cmv"])
+
+        filtered = Repertoire.build_like(obj, [1], path / "filtered")
+        self.assertListEqual(["CCC"], filtered.get_sequence_aas().tolist())
+        self.assertListEqual(["J1"], filtered.get_unique_values("j_genes"))
+
+        materialized = filtered.materialize(path / "materialized")
+        self.assertEqual(".arrow", materialized.data_filename.suffix)
+        self.assertListEqual(["CCC"], materialized.get_sequence_aas().tolist())
+
+        shutil.rmtree(path)
+
+    def test_build_from_dataframe(self):
+        path = EnvironmentSettings.tmp_test_path / "sequencerepertoire_dataframe/"
+
+        df = pd.DataFrame({"sequence_aas": ["AAA", "CCC", "DDD"], "v_genes": ["V1", None, "V1"], "counts": [1, 5, 2],
+                           "j_genes": [None, None, None], "cmv": ["yes", "no", "yes"]})
+
+        for storage_format in RepertoireStorageFormat:
+            with self.subTest(storage_format=storage_format.name):
+                repertoire = StorageFormatTestHelper.build_with_storage_format(
+                    storage_format, lambda: Repertoire.build_from_dataframe(df, PathBuilder.build(path / storage_format.name), {"subject_id": "1"}))
+
+                self.assertListEqual(["sequence_aas", "v_genes", "counts", "cmv", "sequence_identifiers"], repertoire.fields)
+                self.assertListEqual(["AAA", "CCC", "DDD"], repertoire.get_sequence_aas().tolist())
+                self.assertListEqual(["V1", None, "V1"], repertoire.get_v_genes().tolist())
+                self.assertListEqual([1, 5, 2], repertoire.get_counts().tolist())
+                self.assertListEqual([0, 1, 2], repertoire.get_sequence_identifiers().tolist())
+                self.assertIsNone(repertoire.get_j_genes())
+                self.assertEqual("no", repertoire.sequences[1].metadata.custom_params["cmv"])
+
+        shutil.rmtree(path)
+
+    def test_build_from_chunks(self):
+        path = EnvironmentSettings.tmp_test_path / "sequencerepertoire_chunks/"
+
+        columns = {"sequence_aas": np.array(["AAA", "CCC", "DDD", "EEE", "FFF"], dtype=object),
+                   "v_genes": np.array(["V1", None, "V1", "V2", None], dtype=object), "counts": np.array([1, 5, 2, 3, 4]),
+                   "j_genes": np.array([None] * 5, dtype=object)}
+        chunks = [{name: values[:2] for name, values in columns.items()}, {name: values[2:3] for name, values in columns.items() if name != "v_genes"},
+                  {name: values[3:] for name, values in columns.items()}]
+
+        for storage_format in RepertoireStorageFormat:
+            with self.subTest(storage_format=storage_format.name):
+                repertoire, expected = StorageFormatTestHelper.build_with_storage_format(storage_format, lambda: (
+                    Repertoire.build_from_chunks(chunks, PathBuilder.build(path / storage_format.name), {"subject_id": "1"}),
+                    Repertoire.build_from_arrays(dict(columns), path / storage_format.name, {"subject_id": "1"})))
+
+                self.assertListEqual(["sequence_aas", "v_genes", "counts", "sequence_identifiers"], repertoire.fields)
+                self.assertListEqual(columns["sequence_aas"].tolist(), repertoire.get_sequence_aas().tolist())
+                self.assertListEqual(["V1", None, None, "V2", None], repertoire.get_v_genes().tolist())
+                self.assertListEqual([1, 5, 2, 3, 4], repertoire.get_counts().tolist())
+                self.assertListEqual([0, 1, 2, 3, 4], repertoire.get_sequence_identifiers().tolist())
+                self.assertIsNone(repertoire.get_j_genes())
+                self.assertEqual(expected.get_fingerprint(), Repertoire.build_from_chunks([columns], path / storage_format.name,
+                                                                                          {"subject_id": "1"}).get_fingerprint())
+                self.assertFalse(any(file.name.startswith(".spool_") for file in (path / storage_format.name).iterdir()))
+
+        shutil.rmtree(path)
+
+    def test_iter_batches(self):
+        path = EnvironmentSettings.tmp_test_path / "sequencerepertoire_batches/"
+        PathBuilder.build(path)
+
+        repertoire = Repertoire.build_from_dataframe(pd.DataFrame({"sequence_aas": ["AAA", "CCC", "DDD", "EEE", "FFF"], "counts": [1, 2, 3, 4, 5]}),
+                                                     path, {"subject_id": "1"})
+
+        batches = list(repertoire.iter_batches(["sequence_aas", "v_genes"], batch_size=2))
+
+        self.assertEqual(3, len(batches))
+        self.assertListEqual([["sequence_aas"]] * 3, [list(batch.keys()) for batch in batches])
+        self.assertListEqual(["AAA", "CCC", "DDD", "EEE", "FFF"], np.concatenate([batch["sequence_aas"] for batch in batches]).tolist())
+        self.assertListEqual(["sequence_aas", "counts", "sequence_identifiers"], list(next(repertoire.iter_batches()).keys()))
+
+        shutil.rmtree(path)
+
+    def test_get_fingerprint(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "sequencerepertoire_fingerprint/")
+
+        df = pd.DataFrame({"sequence_aas": ["AAA", "CCC", "DDD"], "v_genes": ["V1", None, "V1"], "counts": [1, 5, 2]})
+
+        repertoire1 = Repertoire.build_from_dataframe(df, path, {"subject_id": "1", "cmv": True})
+        repertoire2 = Repertoire.build_from_dataframe(df, path, {"subject_id": "1", "cmv": True})
+        self.assertNotEqual(repertoire1.identifier, repertoire2.identifier)
+        self.assertEqual(repertoire1.get_fingerprint(), repertoire2.get_fingerprint())
+
+        self.assertNotEqual(repertoire1.get_fingerprint(), Repertoire.build_from_dataframe(df, path, {"subject_id": "1", "cmv": False}).get_fingerprint())
+        self.assertNotEqual(repertoire1.get_fingerprint(), Repertoire.build_from_dataframe(df.iloc[:2], path, {"subject_id": "1", "cmv": True})
+                            .get_fingerprint())
+
+        masked = Repertoire.build_like(repertoire1, [0, 2], path / "masked")
+        self.assertEqual(masked.get_fingerprint(), Repertoire.build_like(repertoire2, [0, 2], path / "masked").get_fingerprint())
+        self.assertNotEqual(masked.get_fingerprint(), Repertoire.build_like(repertoire1, [0, 1], path / "masked").get_fingerprint())
+
+        shutil.rmtree(path)
+
+    def test_repertoire_data_cache(self):
+        path = EnvironmentSettings.tmp_test_path / "sequencerepertoire_cache/"
+        PathBuilder.build(path)
+
+        sequences = [ReceptorSequence(amino_acid_sequence="AAA", identifier="1", metadata=SequenceMetadata(v_gene="V1", count=3)),
+                     ReceptorSequence(amino_acid_sequence="CCC", identifier="2", metadata=SequenceMetadata(v_gene="V2", count=4))]
+
+        repertoire = Repertoire.build_from_sequence_objects(sequences, path, {"subject_id": "1"})
+
+        RepertoireDataCache.clear()
+        RepertoireDataCache.reset_stats()
+
+        repertoire.get_sequence_identifiers()
+        repertoire.get_sequence_objects()
+        self.assertEqual(1, RepertoireDataCache.get_stats()["misses"])
+        self.assertEqual(2, RepertoireDataCache.get_stats()["hits"])
+        self.assertFalse(repertoire.get_sequence_aas().flags.writeable)
+
+        EnvironmentSettings.set_repertoire_cache_size(0)
+        self.assertEqual(0, RepertoireDataCache.get_stats()["entries"])
+        self.assertListEqual(["AAA", "CCC"], repertoire.get_sequence_aas().tolist())
+        self.assertFalse(RepertoireDataCache.contains(repertoire.data_filename))
+        EnvironmentSettings.set_repertoire_cache_size(EnvironmentSettings.default_repertoire_cache_size)
+
+        shutil.rmtree(path)
+
+    def test_get_categorical_codes(self):
+        path = EnvironmentSettings.tmp_test_path / "sequencerepertoire_categorical/"
+        PathBuilder.build(path)
+
+        sequences = [ReceptorSequence(amino_acid_sequence="AAA", identifier="1", metadata=SequenceMetadata(v_gene="V2", chain=Chain.ALPHA)),
+                     ReceptorSequence(amino_acid_sequence="CCC", identifier="2", metadata=SequenceMetadata(v_gene="V1", chain=Chain.BETA)),
+                     ReceptorSequence(amino_acid_sequence="DDD", identifier="3", metadata=SequenceMetadata(chain=Chain.ALPHA))]
+
+        for storage_format in RepertoireStorageFormat:
+            with self.subTest(storage_format=storage_format.name):
+                repertoire = StorageFormatTestHelper.build_with_storage_format(
+                    storage_format, lambda: Repertoire.build_from_sequence_objects(sequences, PathBuilder.build(path / storage_format.name),
+                                                                                   {"subject_id": "1"}))
+
+                vocabulary = CategoricalVocabulary("v_genes", ["V3", "V1", "V2"])
+                codes = repertoire.get_categorical_codes("v_genes", vocabulary)
+                self.assertListEqual([1, 0, CategoricalVocabulary.MISSING_CODE], codes.tolist())
+                self.assertListEqual(["V2", "V1", None], vocabulary.decode(codes).tolist())
+                self.assertListEqual(["TRA", "TRB"], CategoricalVocabulary("chains", repertoire.get_unique_values("chains")).values.tolist())
+                self.assertListEqual([Chain.ALPHA, Chain.BETA, Chain.ALPHA], repertoire.get_chains().tolist())
 
         shutil.rmtree(path)
 
@@ -5,6 +5,7 @@ from unittest import TestCase
 import numpy as np
 
 from immuneML.analysis.data_manipulation.NormalizationType import NormalizationType
+from immuneML.caching.CacheStatistics import CacheStatistics
 from immuneML.caching.CacheType import CacheType
 from immuneML.data_model.dataset.RepertoireDataset import RepertoireDataset
 from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
@@ -102,3 +103,38 @@ class TestKmerFrequencyEncoder(TestCase):
         self.assertEqual(0.67, np.round(d2.encoded_data.examples[0, 2], 2))
         self.assertEqual(0.0, np.round(d3.encoded_data.examples[0, 1], 2))
         self.assertTrue(isinstance(encoder, KmerFrequencyEncoder))
+
+    def test_encode_reuses_repertoire_encodings(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "kmerfreqenc_reuse/")
+        EnvironmentSettings.set_cache_statistics_path(path / "statistics")
+        CacheStatistics.reset()
+
+        try:
+            repertoires = [Repertoire.build_from_sequence_objects([ReceptorSequence(sequence, identifier=str(index))
+                                                                   for index, sequence in enumerate(["CASSLG", "CASSQD", sequences])],
+                                                                  metadata={"l1": index % 2, "subject_id": f"reuse_{index}"}, path=path)
+                           for index, sequences in enumerate(["CAWSVG", "CATSRD", "CASRPG", "CSARDG", "CASSYE", "CAISES"])]
+            dataset = RepertoireDataset(repertoires=repertoires)
+            lc = LabelConfiguration()
+            lc.add_label("l1", [0, 1])
+
+            encoder = KmerFrequencyEncoder.build_object(dataset, **{"normalization_type": NormalizationType.RELATIVE_FREQUENCY.name,
+                                                                    "reads": ReadsType.UNIQUE.name, "k": 3,
+                                                                    "sequence_encoding": SequenceEncodingType.CONTINUOUS_KMER.name,
+                                                                    "sequence_type": SequenceType.AMINO_ACID.name})
+
+            encoder.encode(dataset, EncoderParams(result_path=path / "train/", label_config=lc, learn_model=True, pool_size=2))
+            before = CacheStatistics.get_summary()["object_types"]["ENCODING_STEP"]
+
+            # the fitted encoder now has the vectorizer path set, which must not change the keys of the per-repertoire k-mer counts
+            encoder.encode(dataset, EncoderParams(result_path=path / "test/", label_config=lc, learn_model=False, pool_size=2))
+            after = CacheStatistics.get_summary()["object_types"]["ENCODING_STEP"]
+
+            # the counts computed by the pool workers are kept in the memory tier of this process
+            self.assertEqual(6, after["memory_hits"] - before["memory_hits"])
+            self.assertEqual(0, after["disk_hits"] - before["disk_hits"])
+            self.assertEqual(0, after["misses"] - before["misses"])
+        finally:
+            EnvironmentSettings.set_cache_statistics_path(None)
+            CacheStatistics.reset()
+            shutil.rmtree(path)
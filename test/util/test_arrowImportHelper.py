@@ -0,0 +1,44 @@
+import shutil
+from unittest import TestCase
+
+import numpy as np
+
+from immuneML.IO.dataset_import.DatasetImportParams import DatasetImportParams
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.util.ArrowImportHelper import ArrowImportHelper
+from immuneML.util.PathBuilder import PathBuilder
+
+
+class TestArrowImportHelper(TestCase):
+
+    def test_load_dataframe(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "arrow_import_helper/")
+
+        with open(path / "rep1.tsv", "w") as file:
+            file.writelines("""amino_acid	rearrangement	v_gene	templates	score	productive	extra
+CASSLGF	TGTGCC	TRBV1-1*01	10.0	0.5	T	a
+CASSPGF	NA	unresolved	3	NA	F	b
+CASSAGF		TRBV2	4	1.5	NA	c""")
+
+        params = DatasetImportParams(separator="\t", columns_to_load=["amino_acid", "rearrangement", "v_gene", "templates", "score", "productive",
+                                                                      "j_gene"],
+                                     column_mapping={"amino_acid": "sequence_aas", "templates": "counts"})
+
+        with self.assertWarns(UserWarning):
+            df = ArrowImportHelper.load_dataframe(path / "rep1.tsv", params, column_types={"score": float, "productive": bool})
+
+        self.assertListEqual(["amino_acid", "rearrangement", "v_gene", "templates", "score", "productive"], list(df.columns))
+        self.assertListEqual(["CASSLGF", "CASSPGF", "CASSAGF"], df["amino_acid"].tolist())
+        self.assertListEqual(["TGTGCC", None, None], df["rearrangement"].tolist())
+        self.assertListEqual(["TRBV1-1*01", None, "TRBV2"], df["v_gene"].tolist())
+        self.assertEqual(np.int64, df["templates"].dtype)
+        self.assertListEqual([10, 3, 4], df["templates"].tolist())
+        self.assertListEqual([0.5, None, 1.5], df["score"].tolist())
+        self.assertListEqual([True, False, None], df["productive"].tolist())
+
+        params.columns_to_load = None
+        df = ArrowImportHelper.load_dataframe(path / "rep1.tsv", params)
+        self.assertListEqual(["amino_acid", "rearrangement", "v_gene", "templates", "score", "productive", "extra"], list(df.columns))
+        self.assertListEqual(["T", "F", None], df["productive"].tolist())
+
+        shutil.rmtree(path)
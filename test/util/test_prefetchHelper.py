@@ -0,0 +1,47 @@
+import threading
+from unittest import TestCase
+
+from immuneML.util.PrefetchHelper import PrefetchHelper
+
+
+class TestPrefetchHelper(TestCase):
+
+    def test_iterate(self):
+        loading_threads = set()
+
+        def load(item):
+            loading_threads.add(threading.current_thread().name)
+            return item * 2
+
+        self.assertEqual([0, 2, 4, 6, 8], list(PrefetchHelper.iterate(range(5), load, 2)))
+        self.assertEqual({"immuneML-prefetch"}, loading_threads)
+
+        loading_threads.clear()
+        self.assertEqual([0, 2, 4], list(PrefetchHelper.iterate(range(3), load, 0)))
+        self.assertEqual({threading.current_thread().name}, loading_threads)
+
+    def test_iterate_error(self):
+        def load(item):
+            if item == 3:
+                raise ValueError("cannot load item 3")
+            return item
+
+        loaded = []
+        with self.assertRaises(ValueError):
+            for item in PrefetchHelper.iterate(range(5), load, 2):
+                loaded.append(item)
+        self.assertEqual([0, 1, 2], loaded)
+
+    def test_iterate_stop_early(self):
+        loaded = []
+
+        def load(item):
+            loaded.append(item)
+            return item
+
+        generator = PrefetchHelper.iterate(range(100), load, 3)
+        self.assertEqual(0, next(generator))
+        generator.close()
+
+        self.assertTrue(len(loaded) < 100)
+        self.assertFalse(any(thread.name == "immuneML-prefetch" for thread in threading.enumerate()))
@@ -0,0 +1,49 @@
+import shutil
+from unittest import TestCase
+
+import numpy as np
+
+from immuneML.data_model.dataset.SequenceDataset import SequenceDataset
+from immuneML.data_model.receptor.receptor_sequence.ReceptorSequence import ReceptorSequence
+from immuneML.environment.EnvironmentSettings import EnvironmentSettings
+from immuneML.environment.SequenceType import SequenceType
+from immuneML.util.PathBuilder import PathBuilder
+from immuneML.util.RepertoireBuilder import RepertoireBuilder
+from immuneML.util.SequenceMatrixHelper import SequenceMatrixHelper
+
+
+class TestSequenceMatrixHelper(TestCase):
+
+    def test_encode_decode(self):
+        matrix, lengths = SequenceMatrixHelper.encode(["ACD", "Y", None, "AC*"], SequenceType.AMINO_ACID)
+
+        self.assertEqual(np.uint8, matrix.dtype)
+        self.assertEqual((4, 3), matrix.shape)
+        self.assertListEqual([3, 1, 0, 3], lengths.tolist())
+        self.assertListEqual([0, 1, 2], matrix[0].tolist())
+        self.assertListEqual([19, SequenceMatrixHelper.PADDING_CODE, SequenceMatrixHelper.PADDING_CODE], matrix[1].tolist())
+        self.assertEqual(SequenceMatrixHelper.UNKNOWN_CODE, matrix[3, 2])
+
+        self.assertListEqual(["ACD", "Y", "", "ACX"], SequenceMatrixHelper.decode(matrix, lengths, SequenceType.AMINO_ACID).tolist())
+
+    def test_persisted_matrices(self):
+        path = PathBuilder.build(EnvironmentSettings.tmp_test_path / "sequence_matrix_helper/")
+        EnvironmentSettings.persist_sequence_matrix = True
+
+        repertoires, _ = RepertoireBuilder.build([["AAC", "CDEFG"], ["W"]], path)
+        dataset = SequenceDataset.build([ReceptorSequence(amino_acid_sequence=seq, identifier=str(i)) for i, seq in enumerate(["AC", "CCCC", "D"])],
+                                        file_size=2, path=path)
+
+        EnvironmentSettings.persist_sequence_matrix = False
+
+        self.assertEqual(2, len(repertoires[0].get_sequence_matrix_filenames()))
+        matrix, lengths = repertoires[0].get_sequence_matrix(SequenceType.AMINO_ACID)
+        self.assertTrue(isinstance(matrix, np.memmap))
+        self.assertListEqual([3, 5], lengths.tolist())
+        self.assertListEqual(["AAC", "CDEFG"], SequenceMatrixHelper.decode(matrix, lengths).tolist())
+
+        matrix, lengths = dataset.get_sequence_matrix(SequenceType.AMINO_ACID)
+        self.assertEqual((3, 4), matrix.shape)
+        self.assertListEqual(["AC", "CCCC", "D"], SequenceMatrixHelper.decode(matrix, lengths).tolist())
+
+        shutil.rmtree(path)
@@ -0,0 +1,18 @@
+from unittest import TestCase
+
+from immuneML.util.SizeHelper import SizeHelper
+
+
+class TestSizeHelper(TestCase):
+
+    def test_parse_size(self):
+        self.assertEqual(500, SizeHelper.parse_size("500"))
+        self.assertEqual(500 * 1024 ** 2, SizeHelper.parse_size("500M"))
+        self.assertEqual(int(1.5 * 1024 ** 3), SizeHelper.parse_size(" 1.5gb "))
+        self.assertRaises(ValueError, SizeHelper.parse_size, "20X")
+
+    def test_format_size(self):
+        self.assertEqual("100B", SizeHelper.format_size(100))
+        self.assertEqual("1.5KB", SizeHelper.format_size(1536))
+        self.assertEqual("20.0GB", SizeHelper.format_size(20 * 1024 ** 3))
+        self.assertEqual("2.0TB", SizeHelper.format_size(2 * 1024 ** 4))